@@ -0,0 +1,103 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+"""Overhead of the encrypted store compared with passwords.json.
+
+Usage:
+    python benchmarks/encrypted_store.py [--records 10000] [--updates 200]
+
+Reports, per backend: time to open and load every record, median latency of
+a single-record update, a cold single-record lookup, and the file size; then
+raw cipher throughput. The KDF runs with cheap parameters so only the
+storage overhead is measured; the one-off key derivation cost is printed
+separately.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smartpasslib.generators.kdf import KdfParams  # noqa: E402
+from smartpasslib.smart_passwords.smart_password import SmartPassword  # noqa: E402
+from smartpasslib.storage.encrypted import EncryptedFileStorage  # noqa: E402
+from smartpasslib.storage.json_file import JsonFileStorage  # noqa: E402
+from smartpasslib.utils.aead import Aead, available_ciphers  # noqa: E402
+
+PASSPHRASE = "benchmark passphrase 2026"
+FAST_KDF = KdfParams(n=16, r=1)
+
+
+def records(count):
+    return {
+        f"{i:064x}"[::-1]: SmartPassword(f"{i:064x}"[::-1], f"account {i} at service-{i % 97}.example", 16)
+        for i in range(count)
+    }
+
+
+def measure(name, open_storage, data, updates):
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "store")
+    open_storage(path).save(data)
+
+    start = time.perf_counter()
+    storage = open_storage(path)
+    storage.load()
+    load = time.perf_counter() - start
+
+    keys = list(data)
+    latencies = []
+    for i in range(updates):
+        password = data[keys[i * 7919 % len(keys)]]
+        password.update(description=f"updated {i}")
+        start = time.perf_counter()
+        storage.put(password)
+        latencies.append(time.perf_counter() - start)
+
+    cold = open_storage(path)
+    start = time.perf_counter()
+    cold.get(keys[len(keys) // 2])
+    lookup = time.perf_counter() - start
+
+    print(f"{name:<28}{load * 1000:>10.1f}{statistics.median(latencies) * 1000:>12.3f}"
+          f"{lookup * 1000:>12.3f}{os.path.getsize(path) / 1024:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--updates", type=int, default=200)
+    args = parser.parse_args()
+    data = records(args.records)
+
+    kdf = KdfParams()
+    start = time.perf_counter()
+    kdf.derive_key(PASSPHRASE, EncryptedFileStorage.KEY_PURPOSE)
+    print(f"Key derivation ({kdf.algorithm}, n={kdf.n}): {(time.perf_counter() - start) * 1000:.0f} ms per open\n")
+
+    print(f"{'backend':<28}{'load ms':>10}{'update ms':>12}{'lookup ms':>12}{'size KiB':>10}")
+    measure("json", JsonFileStorage, data, args.updates)
+    for cipher in available_ciphers():
+        measure(f"encrypted {cipher}",
+                lambda path, cipher=cipher: EncryptedFileStorage(path, PASSPHRASE, kdf=FAST_KDF, cipher=cipher),
+                data, args.updates)
+
+    print(f"\n{'cipher':<28}{'encrypt MB/s':>14}{'decrypt MB/s':>14}")
+    payload = os.urandom(64 * 1024)
+    for cipher in available_ciphers():
+        aead = Aead(bytes(32), cipher)
+        rounds = 200
+        start = time.perf_counter()
+        messages = [aead.encrypt(payload, b"chunk") for _ in range(rounds)]
+        encrypt = time.perf_counter() - start
+        start = time.perf_counter()
+        for message in messages:
+            aead.decrypt(message, b"chunk")
+        decrypt = time.perf_counter() - start
+        megabytes = rounds * len(payload) / 1e6
+        print(f"{cipher:<28}{megabytes / encrypt:>14.0f}{megabytes / decrypt:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+"""Batch size at which thread and process pools beat inline derivation.
+
+Usage:
+    python benchmarks/executor_crossover.py [--workers N] [--sizes 1,10,100,1000,10000]
+
+Each cell is the wall time of deriving that many smart passwords with a
+fresh DerivationExecutor, pool startup included, since that is what a
+one-off batch pays. On a standard CPython build threads cannot overlap
+the hashing (hashlib keeps the GIL for short inputs), so only processes
+cross over; on a free-threaded build (3.13t+, GIL disabled) threads
+usually cross over earlier because they skip pickling and interpreter
+startup.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smartpasslib.generators.smart import SmartPasswordGenerator  # noqa: E402
+from smartpasslib.utils.parallel import PROCESS, THREAD, DerivationExecutor, gil_enabled  # noqa: E402
+
+
+def timed(size, workers, backend):
+    items = [(f"crossover-secret-{i:06d}", 16) for i in range(size)]
+    chunk_size = max(1, min(256, size // (workers * 4) or 1))
+    start = time.perf_counter()
+    with DerivationExecutor(workers, chunk_size=chunk_size, backend=backend) as executor:
+        for _ in executor.starmap(SmartPasswordGenerator.generate, items):
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--sizes", default="1,10,100,1000,10000")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    workers = max(2, args.workers)
+
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled() else 'disabled'}, {workers} workers\n")
+    print(f"{'batch':>8}{'inline ms':>12}{'thread ms':>12}{'process ms':>12}")
+    crossover = {THREAD: None, PROCESS: None}
+    for size in sizes:
+        inline = timed(size, 1, PROCESS)
+        thread = timed(size, workers, THREAD)
+        process = timed(size, workers, PROCESS)
+        print(f"{size:>8}{inline * 1000:>12.1f}{thread * 1000:>12.1f}{process * 1000:>12.1f}")
+        for backend, elapsed in ((THREAD, thread), (PROCESS, process)):
+            if crossover[backend] is None and elapsed < inline:
+                crossover[backend] = size
+    print()
+    for backend, size in crossover.items():
+        print(f"{backend} pool faster than inline from: {size if size is not None else 'never in this range'}")
+
+
+if __name__ == "__main__":
+    main()
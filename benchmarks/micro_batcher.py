@@ -0,0 +1,74 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+"""Throughput of MicroBatcher against direct SmartPasswordMaster calls.
+
+Usage:
+    python benchmarks/micro_batcher.py [--threads 32] [--calls 200] [--workers N] [--kdf]
+
+Caller threads each verify public keys, either by calling
+SmartPasswordMaster.check_public_key themselves or through a MicroBatcher,
+with its default (inline) executor and with a process pool passed in.
+A plain public key costs tens of microseconds, less than handing the call
+to another thread, so direct calls win. With --kdf every check runs
+scrypt: the batcher runs a bounded number at once instead of one per
+caller, and a process pool spreads them over all cores.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smartpasslib.generators.kdf import KdfParams  # noqa: E402
+from smartpasslib.masters.batcher import MicroBatcher  # noqa: E402
+from smartpasslib.masters.smart_password_master import SmartPasswordMaster  # noqa: E402
+from smartpasslib.utils.parallel import PROCESS, DerivationExecutor  # noqa: E402
+
+
+def run(threads, calls, check, kdf):
+    """Calls per second of check(secret, public_key, kdf) from concurrent threads."""
+    pairs = [(f"batcher-secret-{i:04d}", SmartPasswordMaster.generate_public_key(f"batcher-secret-{i:04d}", kdf))
+             for i in range(16)]
+    start = threading.Barrier(threads + 1)
+
+    def caller(offset):
+        start.wait()
+        for number in range(calls):
+            secret, public_key = pairs[(offset + number) % len(pairs)]
+            assert check(secret, public_key, kdf)
+
+    workers = [threading.Thread(target=caller, args=(offset,)) for offset in range(threads)]
+    for worker in workers:
+        worker.start()
+    start.wait()
+    began = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * calls / (time.perf_counter() - began)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--kdf", action="store_true", help="memory-hard public keys (scrypt)")
+    args = parser.parse_args()
+    kdf = KdfParams(n=1 << 12, r=8) if args.kdf else None
+    calls = args.calls if kdf is None else max(1, args.calls // 50)
+
+    print(f"{args.threads} caller threads x {calls} checks, kdf {'scrypt' if kdf else 'none'}\n")
+    results = [("direct calls", run(args.threads, calls, SmartPasswordMaster.check_public_key, kdf))]
+    with MicroBatcher() as batcher:
+        results.append(("batcher, default executor", run(args.threads, calls, batcher.check_public_key, kdf)))
+    with DerivationExecutor(args.workers, backend=PROCESS) as executor, MicroBatcher(executor) as batcher:
+        batcher.check_public_key("warm-up-secret", "0" * 64)
+        results.append((f"batcher, {args.workers} processes",
+                        run(args.threads, calls, batcher.check_public_key, kdf)))
+    for name, rate in results:
+        print(f"{name:<28}{rate:>12,.0f} checks/s")
+
+
+if __name__ == "__main__":
+    main()
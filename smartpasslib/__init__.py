@@ -52,18 +52,29 @@ Decentralized by design — no central servers, no cloud dependency, no third-pa
 
 from smartpasslib.generators.base import BasePasswordGenerator
 from smartpasslib.generators.hash import HashGenerator
+from smartpasslib.generators.kdf import KdfParams
 from smartpasslib.generators.key import SmartKeyGenerator
 from smartpasslib.generators.smart import SmartPasswordGenerator
 from smartpasslib.generators.strong import StrongPasswordGenerator
 from smartpasslib.generators.urandom import UrandomGenerator
 from smartpasslib.generators.code import CodeGenerator
+from smartpasslib.managers.events import ChangeEvent
 from smartpasslib.managers.smart_password_manager import SmartPasswordManager
 from smartpasslib.masters.smart_password_master import SmartPasswordMaster
 from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.base import StorageBackend
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.storage.encrypted import EncryptedFileStorage
+from smartpasslib.storage.json_file import JsonFileStorage
+from smartpasslib.storage.memory import MemoryStorage
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
+from smartpasslib.utils.profiling import install_from_env, profile
 
 __version__ = '4.0.0'
 __author__ = 'Alexander Suvorov'
 
+install_from_env()
+
 __all__ = [
     "SmartPasswordMaster",
     "HashGenerator",
@@ -75,4 +86,13 @@ __all__ = [
     "SmartPasswordManager",
     "SmartPassword",
     "CodeGenerator",
+    "KdfParams",
+    "StorageBackend",
+    "JsonFileStorage",
+    "MemoryStorage",
+    "ShardedDirectoryStorage",
+    "EncryptedFileStorage",
+    "CompressedFileStorage",
+    "ChangeEvent",
+    "profile",
 ]
\ No newline at end of file
@@ -0,0 +1,185 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import binascii
+import hashlib
+from typing import List, Optional, Tuple
+
+from smartpasslib.utils.secure_memory import Buffer, as_view
+
+
+class HashChain:
+    """
+    Fast SHA-256 hash-chain engine for key derivation.
+
+    Produces byte-for-byte the same keys as the reference
+    SmartKeyGenerator._create_key chain used by all ports (C#, JS, Go, Kotlin):
+
+        h0 = sha256("{secret}:{salt}")
+        steps = min_steps + int(hex(h0)[:8], 16) % (max_steps - min_steps + 1)
+        h(i+1) = sha256("{hex(h(i))}:{i}")
+
+    The seed digest is computed once and shared between step selection and
+    the chain, rounds feed the hex digest and a precomputed ":{i}" suffix
+    into the hash state without concatenating them, and no intermediate
+    str objects are created.
+    """
+
+    _SUFFIX_CACHE_SIZE = 128
+    _SUFFIXES: Tuple[bytes, ...] = tuple(f":{i}".encode('ascii') for i in range(_SUFFIX_CACHE_SIZE))
+
+    @classmethod
+    def suffix(cls, index: int) -> bytes:
+        """
+        Get the ":{index}" round suffix.
+
+        Args:
+            index: Round or block counter
+
+        Returns:
+            bytes: ASCII encoded suffix
+        """
+        if index < cls._SUFFIX_CACHE_SIZE:
+            return cls._SUFFIXES[index]
+        return f":{index}".encode('ascii')
+
+    @staticmethod
+    def seed_digest(secret: str, salt: str = "") -> bytes:
+        """
+        Hash the "{secret}:{salt}" seed.
+
+        Args:
+            secret: Secret phrase
+            salt: Domain separation salt ("public" or "private")
+
+        Returns:
+            bytes: Raw SHA-256 digest of the seed
+        """
+        return hashlib.sha256(f"{secret}:{salt}".encode('utf-8')).digest()
+
+    @staticmethod
+    def steps_from_digest(digest: bytes, min_steps: int, max_steps: int) -> int:
+        """
+        Get deterministic steps count from a seed digest.
+
+        Equivalent to int(hexdigest[:8], 16) on the hex form.
+
+        Args:
+            digest: Raw seed digest
+            min_steps: Minimum steps
+            max_steps: Maximum steps
+
+        Returns:
+            int: Steps count between min_steps and max_steps
+        """
+        return min_steps + int.from_bytes(digest[:4], 'big') % (max_steps - min_steps + 1)
+
+    @classmethod
+    def run(cls, digest: bytes, steps: int) -> bytes:
+        """
+        Run the chain rounds starting from a raw digest.
+
+        Args:
+            digest: Raw digest of the previous round (or the seed)
+            steps: Number of rounds
+
+        Returns:
+            bytes: Raw digest after the last round
+        """
+        sha256 = hashlib.sha256
+        hexlify = binascii.hexlify
+        suffixes = cls._SUFFIXES
+        cached = min(steps, cls._SUFFIX_CACHE_SIZE)
+        for i in range(cached):
+            state = sha256(hexlify(digest))
+            state.update(suffixes[i])
+            digest = state.digest()
+        for i in range(cached, steps):
+            state = sha256(hexlify(digest))
+            state.update(cls.suffix(i))
+            digest = state.digest()
+        return digest
+
+    @classmethod
+    def derive_digest(cls, secret: str, min_steps: int, max_steps: int, salt: str = "") -> bytes:
+        """
+        Derive a raw key digest from a secret phrase.
+
+        Args:
+            secret: Secret phrase
+            min_steps: Minimum chain rounds
+            max_steps: Maximum chain rounds
+            salt: Domain separation salt
+
+        Returns:
+            bytes: Raw 32-byte key digest
+        """
+        digest = cls.seed_digest(secret, salt)
+        return cls.run(digest, cls.steps_from_digest(digest, min_steps, max_steps))
+
+    @classmethod
+    def derive(cls, secret: str, min_steps: int, max_steps: int, salt: str = "") -> str:
+        """
+        Derive a hex key from a secret phrase.
+
+        Args:
+            secret: Secret phrase
+            min_steps: Minimum chain rounds
+            max_steps: Maximum chain rounds
+            salt: Domain separation salt
+
+        Returns:
+            str: Hexadecimal key (64 characters)
+        """
+        return cls.derive_digest(secret, min_steps, max_steps, salt).hex()
+
+    @classmethod
+    def derive_buffer(cls, secret: Buffer, min_steps: int, max_steps: int, salt: str = "",
+                      out: Optional[bytearray] = None) -> bytearray:
+        """
+        Derive a hex key from a UTF-8 secret buffer into a bytearray.
+
+        Same result as derive(secret.decode(), ...).encode(), but the secret is
+        hashed straight from the caller's buffer and no str copies of the
+        secret or the chain are created.
+
+        Args:
+            secret: UTF-8 encoded secret phrase (bytes, bytearray or memoryview)
+            min_steps: Minimum chain rounds
+            max_steps: Maximum chain rounds
+            salt: Domain separation salt
+            out: Buffer receiving the key in its first 64 bytes (default: new bytearray)
+
+        Returns:
+            bytearray: ASCII hex key (out if given)
+        """
+        seed = hashlib.sha256(as_view(secret))
+        seed.update(b":" + salt.encode('utf-8'))
+        digest = seed.digest()
+        digest = cls.run(digest, cls.steps_from_digest(digest, min_steps, max_steps))
+        if out is None:
+            out = bytearray(64)
+        out[:64] = binascii.hexlify(digest)
+        return out
+
+    @classmethod
+    def blocks(cls, key: bytes, count: int) -> List[bytes]:
+        """
+        Expand a hex key into sha256("{key}:{counter}") blocks.
+
+        The "{key}:" prefix is fed once and each block hashes a copy of
+        that state, so the key bytes are not rehashed per block.
+
+        Args:
+            key: ASCII hex key
+            count: Number of 32-byte blocks
+
+        Returns:
+            List[bytes]: Raw block digests for counters 0..count-1
+        """
+        prefix = hashlib.sha256(key)
+        prefix.update(b":")
+        result = []
+        for counter in range(count):
+            block = prefix.copy()
+            block.update(cls.suffix(counter)[1:])
+            result.append(block.digest())
+        return result
@@ -1,7 +1,8 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-import secrets
+from typing import Dict, Optional, Tuple
 
 from smartpasslib.core.chars import PasswordChars
+from smartpasslib.generators.compiled import CompiledCodeGenerator
 
 
 class CodeGenerator(PasswordChars):
@@ -9,6 +10,25 @@ class CodeGenerator(PasswordChars):
     Generator for secure codes with guaranteed character sets.
     """
 
+    _plans: Dict[Tuple[type, int], CompiledCodeGenerator] = {}
+
+    @classmethod
+    def compile(cls, length: int = 6, alphabet: Optional[str] = None) -> CompiledCodeGenerator:
+        """
+        Precompute a reusable generator for one length and alphabet.
+
+        Args:
+            length: Code length, minimum 4, maximum 100
+            alphabet: Custom alphabet (default: all())
+
+        Returns:
+            CompiledCodeGenerator: Immutable callable, generator() -> value
+
+        Raises:
+            ValueError: If length is out of range or the alphabet is invalid
+        """
+        return CompiledCodeGenerator(length, cls.all() if alphabet is None else alphabet)
+
     @classmethod
     def generate(cls, length: int = 6) -> str:
         """
@@ -23,21 +43,7 @@ class CodeGenerator(PasswordChars):
         Raises:
             ValueError: If length is less than 4 or greater than 100
         """
-        if length < 4:
-            raise ValueError("The code length must be at least 4 characters")
-
-        if length > 100:
-            raise ValueError("The code length cannot exceed 100 characters")
-
-        code = [
-            secrets.choice(cls.lowercase),
-            secrets.choice(cls.uppercase),
-            secrets.choice(cls.digits),
-            secrets.choice(cls.symbols)
-        ]
-
-        code += [secrets.choice(cls.all()) for _ in range(length - 4)]
-
-        secrets.SystemRandom().shuffle(code)
-
-        return ''.join(code)
+        plan = cls._plans.get((cls, length))
+        if plan is None:
+            plan = cls._plans[(cls, length)] = cls.compile(length)
+        return plan()
@@ -0,0 +1,269 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+import secrets
+from typing import Optional, Tuple
+
+from smartpasslib.core.chars import PasswordChars
+from smartpasslib.generators.chain import HashChain
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.utils.secure_memory import Buffer, as_view, wipe
+
+
+def _validate_alphabet(alphabet: str) -> str:
+    """
+    Validate a custom alphabet.
+
+    Args:
+        alphabet: Characters to draw from
+
+    Returns:
+        str: The alphabet as str
+
+    Raises:
+        ValueError: If the alphabet has fewer than 2 characters or repeats a character
+    """
+    alphabet = str(alphabet)
+    if len(alphabet) < 2:
+        raise ValueError("Alphabet must contain at least 2 characters")
+    if len(set(alphabet)) != len(alphabet):
+        raise ValueError("Alphabet must not contain duplicate characters")
+    return alphabet
+
+
+class _Compiled:
+    """
+    Base for immutable compiled generators.
+
+    Subclasses declare __slots__ and set them once in __init__ through object.__setattr__.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _set(self, **attributes) -> None:
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def length(self) -> int:
+        """Length of every generated value."""
+        return self._length
+
+    @property
+    def alphabet(self) -> str:
+        """Characters values are drawn from."""
+        return self._alphabet
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(length={self._length}, alphabet={self._alphabet!r})"
+
+
+class CompiledSmartPasswordGenerator(_Compiled):
+    """
+    Deterministic smart password generator with a precomputed per-length plan.
+
+    Length validation, the byte-to-character table and the number of
+    sha256("{key}:{counter}") blocks are computed once; each call only
+    derives the private key and expands the blocks.
+    """
+
+    __slots__ = ('_length', '_alphabet', '_blocks', '_table', '_ascii_table')
+
+    def __init__(self, length: int = 12, alphabet: Optional[str] = None):
+        """
+        Compile a smart password generator.
+
+        Args:
+            length: Password length (default: 12, minimum: 12, maximum: 100)
+            alphabet: Custom alphabet (default: PasswordChars.all(), the cross-platform set)
+
+        Raises:
+            ValueError: If length is outside 12-100 or the alphabet is invalid
+        """
+        if length < 12:
+            raise ValueError("Password length must be at least 12 characters")
+        if length > 100:
+            raise ValueError("Password length cannot exceed 100 characters")
+        alphabet = PasswordChars.all() if alphabet is None else _validate_alphabet(alphabet)
+        table = tuple(alphabet[byte % len(alphabet)] for byte in range(256))
+        ascii_table = bytes(ord(c) for c in table) if all(ord(c) < 128 for c in alphabet) else None
+        self._set(
+            _length=length,
+            _alphabet=alphabet,
+            _blocks=-(-length // 32),
+            _table=table,
+            _ascii_table=ascii_table,
+        )
+
+    def derive(self, private_key: str) -> str:
+        """
+        Expand an already derived private key into a password.
+
+        Args:
+            private_key: Hex private key from SmartKeyGenerator.generate_private_key
+
+        Returns:
+            str: Smart password
+        """
+        data = b''.join(HashChain.blocks(private_key.encode('ascii'), self._blocks))[:self._length]
+        if self._ascii_table is not None:
+            return data.translate(self._ascii_table).decode('ascii')
+        return ''.join(map(self._table.__getitem__, data))
+
+    def derive_buffer(self, private_key: Buffer, out: Optional[bytearray] = None) -> bytearray:
+        """
+        Expand a private key buffer into a password buffer.
+
+        Block digests are copied into the output and mapped to characters in place.
+
+        Args:
+            private_key: ASCII hex private key from SmartKeyGenerator.generate_private_key_buffer
+            out: Buffer receiving the password in its first length bytes (default: new bytearray)
+
+        Returns:
+            bytearray: ASCII smart password (out if given)
+
+        Raises:
+            ValueError: If the alphabet is not ASCII
+        """
+        table = self._ascii_table
+        if table is None:
+            raise ValueError("Buffer output requires an ASCII alphabet")
+        length = self._length
+        if out is None:
+            out = bytearray(length)
+        prefix = hashlib.sha256(as_view(private_key))
+        prefix.update(b":")
+        position = 0
+        for counter in range(self._blocks):
+            block = prefix.copy()
+            block.update(HashChain.suffix(counter)[1:])
+            take = min(32, length - position)
+            out[position:position + take] = memoryview(block.digest())[:take]
+            position += take
+        for i in range(length):
+            out[i] = table[out[i]]
+        return out
+
+    def generate_buffer(self, seed: Buffer, out: Optional[bytearray] = None) -> bytearray:
+        """
+        Generate the smart password for a UTF-8 seed buffer.
+
+        The intermediate private key is wiped before returning.
+
+        Args:
+            seed: UTF-8 encoded secret phrase (bytes, bytearray or memoryview)
+            out: Buffer receiving the password in its first length bytes (default: new bytearray)
+
+        Returns:
+            bytearray: ASCII smart password; wipe it when no longer needed
+        """
+        private_key = SmartKeyGenerator.generate_private_key_buffer(seed)
+        try:
+            return self.derive_buffer(private_key, out=out)
+        finally:
+            wipe(private_key)
+
+    def __call__(self, seed: str) -> str:
+        """
+        Generate the smart password for a seed.
+
+        Args:
+            seed: Secret phrase (minimum 12 characters)
+
+        Returns:
+            str: Deterministically generated smart password
+        """
+        return self.derive(SmartKeyGenerator.generate_private_key(secret=seed))
+
+
+class CompiledStrongPasswordGenerator(_Compiled):
+    """
+    Random password generator with precomputed alphabet and required character groups.
+
+    Every call guarantees one character from each standard group
+    (lowercase, uppercase, digits, symbols) present in the alphabet.
+    """
+
+    __slots__ = ('_length', '_alphabet', '_groups', '_random')
+
+    def __init__(self, length: int = 12, alphabet: Optional[str] = None):
+        """
+        Compile a strong password generator.
+
+        Args:
+            length: Password length, minimum 12, maximum 100
+            alphabet: Custom alphabet (default: PasswordChars.all())
+
+        Raises:
+            ValueError: If length is out of range or the alphabet is invalid
+        """
+        self._validate_length(length)
+        alphabet = PasswordChars.all() if alphabet is None else _validate_alphabet(alphabet)
+        self._set(
+            _length=length,
+            _alphabet=alphabet,
+            _groups=self._required_groups(alphabet),
+            _random=secrets.SystemRandom(),
+        )
+
+    @classmethod
+    def _validate_length(cls, length: int) -> None:
+        if length < 12:
+            raise ValueError("Password length must be at least 12 characters")
+        if length > 100:
+            raise ValueError("Password length cannot exceed 100 characters")
+
+    @staticmethod
+    def _required_groups(alphabet: str) -> Tuple[str, ...]:
+        """Standard character groups restricted to the alphabet, empty ones dropped."""
+        groups = (PasswordChars.lowercase, PasswordChars.uppercase, PasswordChars.digits, PasswordChars.symbols)
+        restricted = (''.join(c for c in group if c in alphabet) for group in groups)
+        return tuple(group for group in restricted if group)
+
+    def __call__(self) -> str:
+        """
+        Generate a password.
+
+        Returns:
+            str: Cryptographically strong password
+        """
+        choice = self._random.choice
+        alphabet = self._alphabet
+        result = [choice(group) for group in self._groups]
+        result += [choice(alphabet) for _ in range(self._length - len(result))]
+        self._random.shuffle(result)
+        return ''.join(result)
+
+
+class CompiledCodeGenerator(CompiledStrongPasswordGenerator):
+    """
+    Secure code generator with precomputed alphabet and required character groups.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, length: int = 6, alphabet: Optional[str] = None):
+        """
+        Compile a code generator.
+
+        Args:
+            length: Code length, minimum 4, maximum 100
+            alphabet: Custom alphabet (default: PasswordChars.all())
+
+        Raises:
+            ValueError: If length is out of range or the alphabet is invalid
+        """
+        super().__init__(length, alphabet)
+
+    @classmethod
+    def _validate_length(cls, length: int) -> None:
+        if length < 4:
+            raise ValueError("The code length must be at least 4 characters")
+        if length > 100:
+            raise ValueError("The code length cannot exceed 100 characters")
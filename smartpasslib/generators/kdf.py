@@ -0,0 +1,282 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import binascii
+import hashlib
+import os
+import time
+from typing import Dict, Optional, Union
+
+from smartpasslib.utils.secure_memory import Buffer, as_view, wipe
+
+
+class KdfParams:
+    """
+    Parameters of the opt-in memory-hard public key derivation mode.
+
+    The default v4 public key is a short SHA-256 chain, which is cheap to
+    brute-force offline from a stored passwords.json. KDF mode derives the
+    public key with scrypt (or PBKDF2-HMAC-SHA256 where scrypt is missing)
+    and a random per-entry salt. Parameters are stored next to the public key,
+    so each entry can carry its own cost.
+
+    Private keys and smart passwords are not affected.
+    """
+
+    VERSION = 1
+    SCRYPT = "scrypt"
+    PBKDF2 = "pbkdf2-sha256"
+    ALGORITHMS = (SCRYPT, PBKDF2)
+    SALT_BYTES = 16
+    KEY_BYTES = 32
+
+    def __init__(self, algorithm: str = SCRYPT, salt: Optional[str] = None,
+                 n: int = 2 ** 14, r: int = 8, p: int = 1, iterations: int = 600_000):
+        """
+        Initialize KDF parameters.
+
+        Args:
+            algorithm: "scrypt" or "pbkdf2-sha256"
+            salt: Hex encoded salt (default: 16 random bytes)
+            n: scrypt CPU/memory cost, power of 2
+            r: scrypt block size
+            p: scrypt parallelization
+            iterations: PBKDF2 iteration count
+
+        Raises:
+            ValueError: If the algorithm is unknown or a cost parameter is invalid
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unsupported KDF algorithm: {algorithm}")
+        if algorithm == self.SCRYPT:
+            if not hasattr(hashlib, 'scrypt'):
+                raise ValueError("scrypt is not available in this Python build")
+            if n < 2 or n & (n - 1):
+                raise ValueError("scrypt n must be a power of 2 greater than 1")
+            if r < 1 or p < 1:
+                raise ValueError("scrypt r and p must be at least 1")
+        elif iterations < 1:
+            raise ValueError("PBKDF2 iterations must be at least 1")
+        self._algorithm = algorithm
+        self._salt = salt if salt is not None else os.urandom(self.SALT_BYTES).hex()
+        self._n = n
+        self._r = r
+        self._p = p
+        self._iterations = iterations
+
+    @property
+    def algorithm(self) -> str:
+        """KDF algorithm name."""
+        return self._algorithm
+
+    @property
+    def salt(self) -> str:
+        """Hex encoded salt."""
+        return self._salt
+
+    @property
+    def n(self) -> int:
+        """scrypt CPU/memory cost."""
+        return self._n
+
+    @property
+    def r(self) -> int:
+        """scrypt block size."""
+        return self._r
+
+    @property
+    def p(self) -> int:
+        """scrypt parallelization."""
+        return self._p
+
+    @property
+    def iterations(self) -> int:
+        """PBKDF2 iteration count."""
+        return self._iterations
+
+    @property
+    def memory(self) -> int:
+        """
+        Approximate memory needed by one derivation.
+
+        Returns:
+            int: Bytes (0 for PBKDF2)
+        """
+        if self._algorithm == self.SCRYPT:
+            return 128 * self._r * (self._n + self._p + 2)
+        return 0
+
+    def derive(self, secret: str) -> str:
+        """
+        Derive a public key with these parameters.
+
+        Args:
+            secret: Secret phrase
+
+        Returns:
+            str: Hexadecimal public key (64 characters)
+        """
+        return self._derive_raw(f"{secret}:public".encode('utf-8')).hex()
+
+    def derive_buffer(self, secret: Buffer, out: Optional[bytearray] = None) -> bytearray:
+        """
+        Derive a public key from a UTF-8 secret buffer.
+
+        The "{secret}:public" input is assembled in a bytearray that is wiped
+        after use.
+
+        Args:
+            secret: UTF-8 encoded secret phrase
+            out: Buffer receiving the hex key in its first 64 bytes (default: new bytearray)
+
+        Returns:
+            bytearray: ASCII hex public key (out if given)
+        """
+        password = bytearray(as_view(secret))
+        password += b":public"
+        try:
+            key = self._derive_raw(password)
+        finally:
+            wipe(password)
+        if out is None:
+            out = bytearray(2 * self.KEY_BYTES)
+        out[:2 * self.KEY_BYTES] = binascii.hexlify(key)
+        return out
+
+    def derive_key(self, secret: Union[str, Buffer], purpose: str) -> bytes:
+        """
+        Derive a raw 32-byte key for a purpose other than public keys.
+
+        The purpose is appended the way ":public" is for public keys, so
+        keys for different purposes are independent.
+
+        Args:
+            secret: Secret phrase, or its UTF-8 encoding in a buffer
+            purpose: Domain separation label (e.g. "storage")
+
+        Returns:
+            bytes: Derived key
+        """
+        if isinstance(secret, str):
+            secret = secret.encode('utf-8')
+        password = bytearray(as_view(secret))
+        password += f":{purpose}".encode('utf-8')
+        try:
+            return self._derive_raw(password)
+        finally:
+            wipe(password)
+
+    def _derive_raw(self, password: Buffer) -> bytes:
+        """Run the configured KDF over an encoded password."""
+        salt = bytes.fromhex(self._salt)
+        if self._algorithm == self.SCRYPT:
+            return hashlib.scrypt(
+                password, salt=salt, n=self._n, r=self._r, p=self._p,
+                maxmem=self.memory + (1 << 20), dklen=self.KEY_BYTES
+            )
+        return hashlib.pbkdf2_hmac('sha256', password, salt, self._iterations, dklen=self.KEY_BYTES)
+
+    def with_new_salt(self) -> 'KdfParams':
+        """
+        Copy these parameters with a fresh random salt.
+
+        Returns:
+            KdfParams: Same algorithm and cost, new salt
+        """
+        return KdfParams(self._algorithm, None, self._n, self._r, self._p, self._iterations)
+
+    def to_dict(self) -> Dict[str, Union[str, int]]:
+        """
+        Convert to dictionary for serialization.
+
+        Returns:
+            Dict[str, Union[str, int]]: Versioned dictionary representation
+        """
+        data = {"version": self.VERSION, "algorithm": self._algorithm, "salt": self._salt}
+        if self._algorithm == self.SCRYPT:
+            data.update(n=self._n, r=self._r, p=self._p)
+        else:
+            data.update(iterations=self._iterations)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Union[str, int]]) -> 'KdfParams':
+        """
+        Create instance from dictionary.
+
+        Args:
+            data: Dictionary produced by to_dict
+
+        Returns:
+            KdfParams: Reconstructed parameters
+
+        Raises:
+            ValueError: If the parameter version is not supported
+        """
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported KDF parameters version: {data.get('version')}")
+        return cls(
+            algorithm=data["algorithm"],
+            salt=data["salt"],
+            n=data.get("n", 2 ** 14),
+            r=data.get("r", 8),
+            p=data.get("p", 1),
+            iterations=data.get("iterations", 600_000),
+        )
+
+    @classmethod
+    def calibrate(cls, target_ms: float = 250.0, algorithm: Optional[str] = None,
+                  max_memory: int = 64 * 1024 * 1024, r: int = 8, p: int = 1) -> 'KdfParams':
+        """
+        Benchmark this host and pick the cost that takes about target_ms per derivation.
+
+        For scrypt, n is doubled until a derivation takes at least target_ms
+        or the next step would exceed max_memory. For PBKDF2, iterations
+        are scaled linearly from a timed probe.
+
+        Args:
+            target_ms: Target derivation latency in milliseconds
+            algorithm: "scrypt" or "pbkdf2-sha256" (default: scrypt if available)
+            max_memory: Upper bound for scrypt memory in bytes
+            r: scrypt block size
+            p: scrypt parallelization
+
+        Returns:
+            KdfParams: Calibrated parameters with a fresh salt
+
+        Raises:
+            ValueError: If target_ms is not positive
+        """
+        if target_ms <= 0:
+            raise ValueError("Target latency must be positive")
+        if algorithm is None:
+            algorithm = cls.SCRYPT if hasattr(hashlib, 'scrypt') else cls.PBKDF2
+        probe_secret = "calibration-secret"
+
+        if algorithm == cls.PBKDF2:
+            probe = cls(cls.PBKDF2, iterations=10_000)
+            elapsed = cls._time(probe, probe_secret)
+            iterations = max(1_000, int(probe.iterations * target_ms / max(elapsed, 1e-3)))
+            return cls(cls.PBKDF2, iterations=iterations)
+
+        n = 2 ** 10
+        while True:
+            params = cls(cls.SCRYPT, n=n, r=r, p=p)
+            next_params = cls(cls.SCRYPT, n=n * 2, r=r, p=p)
+            if next_params.memory > max_memory or cls._time(params, probe_secret) >= target_ms:
+                return params
+            n *= 2
+
+    @staticmethod
+    def _time(params: 'KdfParams', secret: str) -> float:
+        """Time one derivation in milliseconds."""
+        start = time.perf_counter()
+        params.derive(secret)
+        return (time.perf_counter() - start) * 1000
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, KdfParams) and self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.to_dict().items()))
+
+    def __repr__(self) -> str:
+        return f"KdfParams({self.to_dict()!r})"
@@ -1,13 +1,25 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 import hashlib
+import hmac
+from typing import Optional
+
+from smartpasslib.generators.chain import HashChain
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.utils.secure_memory import Buffer, as_view, utf8_length, wipe
 
 
 class SmartKeyGenerator:
     """
     Generator for cryptographic keys from secret phrases.
     Uses SHA-256 for cross-platform compatibility.
+
+    Public methods run on the HashChain engine; _get_steps_from_secret and
+    _create_key are kept as the reference implementation of the algorithm.
     """
 
+    PUBLIC_STEPS = (45, 60)
+    PRIVATE_STEPS = (15, 30)
+
     @staticmethod
     def _validate_secret(secret: str) -> None:
         """
@@ -22,6 +34,21 @@ class SmartKeyGenerator:
         if len(str(secret)) < 12:
             raise ValueError("Secret phrase must be at least 12 characters")
 
+    @staticmethod
+    def _validate_secret_buffer(secret: Buffer) -> None:
+        """
+        Validate the length of a UTF-8 secret buffer without decoding it.
+
+        Characters are only counted when the byte length is ambiguous
+        (a UTF-8 character takes 1 to 4 bytes).
+
+        Raises:
+            ValueError: If secret is less than 12 characters
+        """
+        size = as_view(secret).nbytes
+        if size < 12 or (size < 48 and utf8_length(secret) < 12):
+            raise ValueError("Secret phrase must be at least 12 characters")
+
     @classmethod
     def _get_steps_from_secret(cls, secret: str, min_steps: int, max_steps: int, salt: str = "") -> int:
         """
@@ -53,26 +80,89 @@ class SmartKeyGenerator:
         return all_hash
 
     @classmethod
-    def generate_public_key(cls, secret: str) -> str:
-        """Generate a public verification key from secret phrase."""
+    def generate_public_key(cls, secret: str, kdf: Optional[KdfParams] = None) -> str:
+        """
+        Generate a public verification key from secret phrase.
+
+        Args:
+            secret: Secret phrase
+            kdf: Memory-hard KDF parameters (default: None, the cross-platform v4 chain)
+        """
         cls._validate_secret(secret)
-        steps = cls._get_steps_from_secret(secret, 45, 60, salt="public")
-        return cls._create_key(secret=secret, steps=steps, salt="public")
+        if kdf is not None:
+            return kdf.derive(secret)
+        return HashChain.derive(secret, *cls.PUBLIC_STEPS, salt="public")
 
     @classmethod
     def generate_private_key(cls, secret: str) -> str:
         """Generate a private key from secret phrase."""
         cls._validate_secret(secret)
-        steps = cls._get_steps_from_secret(secret, 15, 30, salt="private")
-        return cls._create_key(secret=secret, steps=steps, salt="private")
+        return HashChain.derive(secret, *cls.PRIVATE_STEPS, salt="private")
 
     @classmethod
-    def check_key(cls, secret: str, key: str) -> bool:
+    def check_key(cls, secret: str, key: str, kdf: Optional[KdfParams] = None) -> bool:
         """
         Verify if a key matches the secret phrase.
+
+        Args:
+            secret: Secret phrase
+            key: Public key to check
+            kdf: KDF parameters the key was derived with (None for the v4 chain)
         """
         cls._validate_secret(secret)
-        return cls.generate_public_key(secret=secret) == key
+        return cls.generate_public_key(secret=secret, kdf=kdf) == key
+
+    @classmethod
+    def generate_public_key_buffer(cls, secret: Buffer, kdf: Optional[KdfParams] = None,
+                                   out: Optional[bytearray] = None) -> bytearray:
+        """
+        Generate a public key from a UTF-8 secret buffer.
+
+        Args:
+            secret: UTF-8 encoded secret phrase (bytes, bytearray or memoryview)
+            kdf: Memory-hard KDF parameters (default: None, the cross-platform v4 chain)
+            out: Buffer receiving the key in its first 64 bytes (default: new bytearray)
+
+        Returns:
+            bytearray: ASCII hex public key; wipe it when no longer needed
+        """
+        cls._validate_secret_buffer(secret)
+        if kdf is not None:
+            return kdf.derive_buffer(secret, out=out)
+        return HashChain.derive_buffer(secret, *cls.PUBLIC_STEPS, salt="public", out=out)
+
+    @classmethod
+    def generate_private_key_buffer(cls, secret: Buffer, out: Optional[bytearray] = None) -> bytearray:
+        """
+        Generate a private key from a UTF-8 secret buffer.
+
+        Args:
+            secret: UTF-8 encoded secret phrase (bytes, bytearray or memoryview)
+            out: Buffer receiving the key in its first 64 bytes (default: new bytearray)
+
+        Returns:
+            bytearray: ASCII hex private key; wipe it when no longer needed
+        """
+        cls._validate_secret_buffer(secret)
+        return HashChain.derive_buffer(secret, *cls.PRIVATE_STEPS, salt="private", out=out)
+
+    @classmethod
+    def check_key_buffer(cls, secret: Buffer, key: str, kdf: Optional[KdfParams] = None) -> bool:
+        """
+        Verify if a key matches a UTF-8 secret buffer.
+
+        The derived key is compared in constant time and wiped.
+
+        Args:
+            secret: UTF-8 encoded secret phrase
+            key: Public key to check
+            kdf: KDF parameters the key was derived with (None for the v4 chain)
+        """
+        derived = cls.generate_public_key_buffer(secret, kdf=kdf)
+        try:
+            return hmac.compare_digest(derived, str(key).encode('utf-8'))
+        finally:
+            wipe(derived)
 
     @classmethod
     def get_hash(cls, text: str = '') -> str:
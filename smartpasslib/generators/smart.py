@@ -1,8 +1,9 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-import hashlib
+from typing import Dict, Iterable, Optional, Tuple
 
-from smartpasslib import SmartKeyGenerator
 from smartpasslib.core.chars import PasswordChars
+from smartpasslib.generators.compiled import CompiledSmartPasswordGenerator
+from smartpasslib.utils.secure_memory import Buffer
 
 
 class SmartPasswordGenerator(PasswordChars):
@@ -14,6 +15,26 @@ class SmartPasswordGenerator(PasswordChars):
     that implements SHA-256.
     """
 
+    _plans: Dict[Tuple[type, int], CompiledSmartPasswordGenerator] = {}
+
+    @classmethod
+    def compile(cls, length: int = 12, alphabet: Optional[str] = None) -> CompiledSmartPasswordGenerator:
+        """
+        Precompute a reusable generator for one password length.
+
+        Args:
+            length: Password length (default: 12, minimum: 12, maximum: 100)
+            alphabet: Custom alphabet (default: all(), the cross-platform set).
+                      Passwords from a custom alphabet are not reproducible by other ports.
+
+        Returns:
+            CompiledSmartPasswordGenerator: Immutable callable, generator(seed) -> password
+
+        Raises:
+            ValueError: If length is less than 12 or greater than 100, or the alphabet is invalid
+        """
+        return CompiledSmartPasswordGenerator(length, cls.all() if alphabet is None else alphabet)
+
     @classmethod
     def generate(cls, seed: str, length: int = 12) -> str:
         """
@@ -33,23 +54,72 @@ class SmartPasswordGenerator(PasswordChars):
             ValueError: If length is less than 12 or greater than 100
         """
 
-        if length < 12:
-            raise ValueError("Password length must be at least 12 characters")
+        return cls._plan(length)(seed)
 
-        if length > 100:
-            raise ValueError("Password length cannot exceed 100 characters")
+    @classmethod
+    def generate_max(cls, seed: str) -> str:
+        """
+        Generate the longest (100 character) smart password for a seed.
 
-        seed = SmartKeyGenerator.generate_private_key(secret=seed)
-        result = []
-        counter = 0
+        Passwords are filled in order from the same block stream, so the
+        password of any shorter length is a prefix: generate(seed, n) ==
+        generate_max(seed)[:n] for every n from 12 to 100.
+
+        Args:
+            seed: String that determines the password
 
-        while len(result) < length:
-            data = f"{seed}:{counter}".encode()
-            hash_bytes = hashlib.sha256(data).digest()
+        Returns:
+            str: 100 character smart password
+        """
+        return cls._plan(100)(seed)
 
-            for byte in hash_bytes:
-                if len(result) < length:
-                    result.append(cls.all()[byte % len(cls.all())])
-            counter += 1
+    @classmethod
+    def generate_prefixes(cls, seed: str, lengths: Iterable[int]) -> Dict[int, str]:
+        """
+        Generate the smart passwords of several lengths with one private key derivation.
 
-        return ''.join(result)
+        Args:
+            seed: String that determines the passwords
+            lengths: Password lengths (each 12-100)
+
+        Returns:
+            Dict[int, str]: Password by length, equal to generate(seed, length) for each
+
+        Raises:
+            ValueError: If any length is less than 12 or greater than 100
+        """
+        lengths = sorted(set(lengths))
+        if not lengths:
+            return {}
+        cls._plan(lengths[0])  # validates the shortest length; the longest is validated below
+        password = cls._plan(lengths[-1])(seed)
+        return {length: password[:length] for length in lengths}
+
+    @classmethod
+    def generate_buffer(cls, seed: Buffer, length: int = 12) -> bytearray:
+        """
+        Generate a smart password from a UTF-8 seed buffer.
+
+        Same password as generate(seed.decode(), length), returned in a
+        bytearray. No str copies of the seed, the private key or the password
+        are created, and intermediates are wiped before returning.
+
+        Args:
+            seed: UTF-8 encoded secret phrase (bytes, bytearray or memoryview)
+            length: Password length (default: 12, minimum: 12, maximum: 100)
+
+        Returns:
+            bytearray: ASCII smart password; wipe it when no longer needed
+
+        Raises:
+            ValueError: If length is less than 12 or greater than 100
+        """
+        return cls._plan(length).generate_buffer(seed)
+
+    @classmethod
+    def _plan(cls, length: int) -> CompiledSmartPasswordGenerator:
+        """Get the cached default-alphabet plan for a length."""
+        plan = cls._plans.get((cls, length))
+        if plan is None:
+            plan = cls._plans[(cls, length)] = cls.compile(length)
+        return plan
@@ -1,7 +1,8 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-import secrets
+from typing import Dict, Optional, Tuple
 
 from smartpasslib.core.chars import PasswordChars
+from smartpasslib.generators.compiled import CompiledStrongPasswordGenerator
 
 
 class StrongPasswordGenerator(PasswordChars):
@@ -11,6 +12,25 @@ class StrongPasswordGenerator(PasswordChars):
     Guarantees at least one character from each character class.
     """
 
+    _plans: Dict[Tuple[type, int], CompiledStrongPasswordGenerator] = {}
+
+    @classmethod
+    def compile(cls, length: int = 12, alphabet: Optional[str] = None) -> CompiledStrongPasswordGenerator:
+        """
+        Precompute a reusable generator for one length and alphabet.
+
+        Args:
+            length: Password length, minimum 12, maximum 100
+            alphabet: Custom alphabet (default: all())
+
+        Returns:
+            CompiledStrongPasswordGenerator: Immutable callable, generator() -> value
+
+        Raises:
+            ValueError: If length is out of range or the alphabet is invalid
+        """
+        return CompiledStrongPasswordGenerator(length, cls.all() if alphabet is None else alphabet)
+
     @classmethod
     def generate(cls, length: int = 12) -> str:
         """
@@ -25,20 +45,7 @@ class StrongPasswordGenerator(PasswordChars):
         Raises:
             ValueError: If length is less than 12 or greater than 100
         """
-        if length < 12:
-            raise ValueError("Password length must be at least 12 characters")
-        if length > 100:
-            raise ValueError("Password length cannot exceed 100 characters")
-
-        result = [
-            secrets.choice(cls.lowercase),
-            secrets.choice(cls.uppercase),
-            secrets.choice(cls.digits),
-            secrets.choice(cls.symbols),
-        ]
-        result += [
-            secrets.choice(cls.all())
-            for _ in range(length - 4)
-        ]
-        secrets.SystemRandom().shuffle(result)
-        return ''.join(result)
+        plan = cls._plans.get((cls, length))
+        if plan is None:
+            plan = cls._plans[(cls, length)] = cls.compile(length)
+        return plan()
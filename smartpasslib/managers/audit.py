@@ -0,0 +1,318 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+import re
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, IO, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.storage.base import StorageBackend
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.storage.encrypted import EncryptedFileStorage
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
+from smartpasslib.utils.bloom import BloomFilter
+from smartpasslib.utils.json_stream import JsonStreamError, iter_object_items
+from smartpasslib.utils.parallel import DerivationExecutor
+
+REPORT_FORMAT = "smartpasslib-audit"
+REPORT_VERSION = 1
+
+PUBLIC_KEY_PATTERN = re.compile(r'[0-9a-f]{64}')
+
+# Estimated bytes per record in passwords.json, used to size the duplicate filter
+_RECORD_BYTES = 160
+
+
+class AuditIssue(NamedTuple):
+    """
+    One problem found by the audit.
+
+    Attributes:
+        source: File the record was read from
+        line: 1-based line of the record key
+        key: JSON key of the record (None for file-level problems)
+        code: Machine-readable issue code
+        message: Human-readable description
+    """
+
+    source: str
+    line: int
+    key: Optional[str]
+    code: str
+    message: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "issue", **self._asdict()}
+
+
+class AuditReport:
+    """
+    Result of a store audit.
+
+    Counters cover the whole store; only the first max_issues issues are
+    kept in memory. The report file, when requested, lists every issue.
+    """
+
+    def __init__(self, path: str, max_issues: int = 1000, stream: Optional[IO[str]] = None):
+        self.path = path
+        self.records = 0
+        self.sources = 0
+        self.counts: Counter = Counter()
+        self.issues: List[AuditIssue] = []
+        self.max_issues = max_issues
+        self._stream = stream
+
+    @property
+    def issue_count(self) -> int:
+        """Total number of issues found."""
+        return sum(self.counts.values())
+
+    @property
+    def ok(self) -> bool:
+        """True if the store has no issues."""
+        return not self.counts
+
+    def add(self, issue: AuditIssue) -> None:
+        """Record an issue."""
+        self.counts[issue.code] += 1
+        if len(self.issues) < self.max_issues:
+            self.issues.append(issue)
+        if self._stream is not None:
+            self._stream.write(json.dumps(issue.to_dict()) + '\n')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary as a JSON-serializable dictionary."""
+        return {
+            "type": "summary",
+            "format": REPORT_FORMAT,
+            "version": REPORT_VERSION,
+            "store": self.path,
+            "sources": self.sources,
+            "records": self.records,
+            "issues": self.issue_count,
+            "counts": dict(sorted(self.counts.items())),
+            "ok": self.ok,
+        }
+
+
+def check_record(key: str, value: Any) -> Optional[List[Tuple[str, str]]]:
+    """
+    Validate one raw store record (runs in a worker process).
+
+    Args:
+        key: JSON key the record is stored under
+        value: Decoded record
+
+    Returns:
+        Optional[List[Tuple[str, str]]]: (code, message) pairs, or None if the record is valid
+    """
+    if not isinstance(value, dict):
+        return [("not_object", f"Record must be a JSON object, got {type(value).__name__}")]
+    problems = []
+    missing = [field for field in ("public_key", "description", "length") if field not in value]
+    if missing:
+        problems.append(("missing_field", f"Missing field(s): {', '.join(missing)}"))
+    public_key = value.get("public_key")
+    if "public_key" in value:
+        if not isinstance(public_key, str) or not PUBLIC_KEY_PATTERN.fullmatch(public_key):
+            problems.append(("invalid_public_key", "Public key must be 64 lowercase hex characters"))
+        if public_key != key:
+            problems.append(("key_mismatch", "JSON key does not match public_key"))
+    if "description" in value and not isinstance(value["description"], str):
+        problems.append(("invalid_description", "Description must be a string"))
+    if "length" in value:
+        length = value["length"]
+        if not isinstance(length, int) or isinstance(length, bool) or not 12 <= length <= 100:
+            problems.append(("invalid_length", f"Length must be an integer between 12 and 100, got {length!r}"))
+    if value.get("kdf") is not None:
+        try:
+            KdfParams.from_dict(value["kdf"])
+        except (KeyError, TypeError, ValueError) as e:
+            problems.append(("invalid_kdf", f"Invalid KDF parameters: {e}"))
+    return problems or None
+
+
+def store_sources(path: Union[str, Path]) -> Tuple[List[str], Optional[ShardedDirectoryStorage]]:
+    """
+    List the files of a store.
+
+    Args:
+        path: passwords.json file or sharded store directory
+
+    Returns:
+        Tuple[List[str], Optional[ShardedDirectoryStorage]]: File paths, and the
+        sharded layout when path is a directory
+    """
+    path = str(Path(path).expanduser())
+    if not os.path.isdir(path):
+        return [path], None
+    storage = ShardedDirectoryStorage(path)
+    names = list(storage.shard_names())
+    prefixes = {len(name) for name in names if name != storage.OTHER_SHARD and 1 <= len(name) <= 4}
+    if len(prefixes) == 1:
+        storage.prefix_length = prefixes.pop()
+    return [storage.shard_path(name) for name in names], storage
+
+
+def _check_encrypted(sources: List[str], storage: Optional[StorageBackend]) -> None:
+    """Refuse to read an encrypted store without its backend (its lines are not records)."""
+    for source in sources:
+        if EncryptedFileStorage.detect(source) and not (
+                isinstance(storage, EncryptedFileStorage) and storage.path == source):
+            raise ValueError(f"{source} is an encrypted store; audit it with SmartPasswordManager.audit() "
+                             f"on a manager opened with its passphrase")
+
+
+def iter_store_records(path: Union[str, Path], report: Optional[AuditReport] = None,
+                       storage: Optional[StorageBackend] = None) -> Iterator[Tuple[str, int, str, Any]]:
+    """
+    Stream every raw record of a store without loading it.
+
+    Args:
+        path: passwords.json file, compressed or encrypted store, or sharded store directory
+        report: Report receiving unreadable-file and misplaced-record issues
+                (default: None, errors are raised)
+        storage: Backend of the store, required to decrypt an encrypted store
+
+    Returns:
+        Iterator[Tuple[str, int, str, Any]]: (source file, line, key, decoded record);
+        for a compressed store the line is the 1-based block number
+
+    Raises:
+        ValueError: If the store is encrypted and its backend is not given
+    """
+    sources, sharded = store_sources(path)
+    _check_encrypted(sources, storage)
+    for source in sources:
+        if sharded is None and not os.path.exists(source):
+            return
+        if report is not None:
+            report.sources += 1
+        if sharded is None and CompressedFileStorage.detect(source):
+            yield from _iter_raw_records(source, CompressedFileStorage(source), report)
+            continue
+        if sharded is None and EncryptedFileStorage.detect(source):
+            yield from _iter_raw_records(source, storage, report)
+            continue
+        expected_shard = Path(source).stem if sharded is not None else None
+        try:
+            with open(source, 'r', encoding='utf-8') as f:
+                for key, value, line in iter_object_items(f):
+                    if report is not None and expected_shard is not None \
+                            and sharded.shard_name(key) != expected_shard:
+                        report.add(AuditIssue(source, line, key, "wrong_shard",
+                                              f"Record belongs in shard {sharded.shard_name(key)!r}"))
+                    yield source, line, key, value
+        except JsonStreamError as e:
+            if report is None:
+                raise
+            report.add(AuditIssue(source, e.line, None, "invalid_json", str(e)))
+        except (OSError, UnicodeDecodeError) as e:
+            if report is None:
+                raise
+            report.add(AuditIssue(source, 0, None, "unreadable", str(e)))
+
+
+def _iter_raw_records(source: str, storage: Union[CompressedFileStorage, EncryptedFileStorage],
+                     report: Optional[AuditReport]) -> Iterator[Tuple[str, int, str, Any]]:
+    """Stream the decoded records of a compressed or encrypted store through its backend."""
+    try:
+        for line, key, value in storage.iter_raw():
+            yield source, line, key, value
+    except ValueError as e:
+        if report is None:
+            raise
+        report.add(AuditIssue(source, 0, None, "unreadable", str(e)))
+
+
+def _estimate_records(source: str) -> int:
+    """Record count estimate of one store file, for sizing the duplicate filter."""
+    if not os.path.isfile(source):
+        return 0
+    if CompressedFileStorage.detect(source):
+        try:
+            return CompressedFileStorage(source).count()
+        except ValueError:
+            return 0
+    return os.path.getsize(source) // _RECORD_BYTES
+
+
+def audit_store(path: Union[str, Path], report_path: Optional[Union[str, Path]] = None,
+                executor: Optional[DerivationExecutor] = None, expected_records: Optional[int] = None,
+                max_issues: int = 1000, storage: Optional[StorageBackend] = None) -> AuditReport:
+    """
+    Audit every record of a store in bounded memory.
+
+    Records are streamed from disk and validated across worker processes.
+    Duplicate keys are found with a fixed-size Bloom filter; possible
+    duplicates are confirmed exactly in a second pass over the store, which
+    only runs when the filter reports any.
+
+    Args:
+        path: passwords.json file, compressed or encrypted store, or sharded store directory
+        report_path: Write an NDJSON report here (one line per issue, then a summary line)
+        executor: Validation executor (default: one worker per CPU)
+        expected_records: Expected record count for sizing the duplicate filter
+                          (default: estimated from the store size)
+        max_issues: Issues kept in the returned report
+        storage: Backend of the store, required to decrypt an encrypted store
+
+    Returns:
+        AuditReport: Counters and the first max_issues issues
+
+    Raises:
+        ValueError: If the store is encrypted and its backend is not given
+    """
+    path = str(Path(path).expanduser())
+    sources, _ = store_sources(path)
+    _check_encrypted(sources, storage)
+    if expected_records is None:
+        expected_records = max(1024, sum(_estimate_records(source) for source in sources))
+    stream = open(report_path, 'w', encoding='utf-8') if report_path is not None else None
+    own_executor = executor is None
+    executor = executor or DerivationExecutor(chunk_size=512)
+    try:
+        report = AuditReport(path, max_issues, stream)
+        seen = BloomFilter(expected_records)
+        candidates: Set[str] = set()
+        meta: Deque[Tuple[str, int, str]] = deque()
+
+        def tasks():
+            for source, line, key, value in iter_store_records(path, report, storage):
+                report.records += 1
+                if seen.add(key):
+                    candidates.add(key)
+                meta.append((source, line, key))
+                yield key, value
+
+        for problems in executor.starmap(check_record, tasks()):
+            source, line, key = meta.popleft()
+            for code, message in problems or ():
+                report.add(AuditIssue(source, line, key, code, message))
+
+        if candidates:
+            _report_duplicates(path, candidates, report, storage)
+        if stream is not None:
+            stream.write(json.dumps(report.to_dict()) + '\n')
+        return report
+    finally:
+        if own_executor:
+            executor.shutdown()
+        if stream is not None:
+            stream.close()
+
+
+def _report_duplicates(path: str, candidates: Set[str], report: AuditReport,
+                       storage: Optional[StorageBackend]) -> None:
+    """Second pass: confirm possible duplicates and report every repeated occurrence."""
+    first: Dict[str, Tuple[str, int]] = {}
+    for source, line, key, _ in iter_store_records(path, AuditReport(path, max_issues=0), storage):
+        if key not in candidates:
+            continue
+        if key in first:
+            first_source, first_line = first[key]
+            report.add(AuditIssue(source, line, key, "duplicate",
+                                  f"Duplicate key (first seen at {first_source}:{first_line})"))
+        else:
+            first[key] = (source, line)
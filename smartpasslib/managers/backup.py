@@ -0,0 +1,425 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Union
+
+from smartpasslib.storage.base import atomic_write_bytes, atomic_write_text
+
+BACKUP_FORMAT = "smartpasslib-backup"
+BACKUP_VERSION = 1
+
+FileEntry = Dict[str, Any]
+
+
+def split_chunks(data: bytes, min_size: int = 4096, max_size: int = 65536, mask: int = 0x3F) -> Iterator[bytes]:
+    """
+    Split data into content-defined chunks.
+
+    Chunks end after a line whose CRC-32 has the low mask bits clear, once
+    the chunk holds at least min_size bytes. Because boundaries depend on
+    the content around them, an inserted or deleted record changes only
+    the chunk it falls in; the chunks after it keep their boundaries and
+    are shared with earlier snapshots. Lines longer than max_size (or data
+    without newlines) are cut at max_size.
+
+    Args:
+        data: Serialized store file
+        min_size: Minimum chunk size in bytes
+        max_size: Maximum chunk size in bytes
+        mask: Boundary mask (about one line in mask + 1 is a candidate boundary)
+
+    Returns:
+        Iterator[bytes]: Chunks that concatenate to data
+    """
+    size = len(data)
+    start = pos = 0
+    while pos < size:
+        end = data.find(b'\n', pos, start + max_size)
+        if end < 0:
+            pos = min(size, start + max_size)
+            yield data[start:pos]
+            start = pos
+            continue
+        line_start, pos = pos, end + 1
+        if pos - start >= min_size and not zlib.crc32(data[line_start:pos]) & mask:
+            yield data[start:pos]
+            start = pos
+    if start < size:
+        yield data[start:]
+
+
+class Snapshot(NamedTuple):
+    """
+    One point-in-time backup of a store.
+
+    Attributes:
+        id: Snapshot id (sorts by creation time)
+        created: Creation time as a Unix timestamp
+        label: Optional user label
+        directory: True if the store is a directory (sharded store), False for a single file
+        files: Store files by relative path, each with size, mtime_ns, sha256 and chunk hashes
+        size: Total size of the store files in bytes
+        new_chunks: Chunks this snapshot added to the repository
+        new_bytes: Compressed bytes this snapshot added to the repository
+    """
+
+    id: str
+    created: float
+    label: Optional[str]
+    directory: bool
+    files: Dict[str, FileEntry]
+    size: int
+    new_chunks: int
+    new_bytes: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._asdict(), format=BACKUP_FORMAT, version=BACKUP_VERSION)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Snapshot':
+        if data.get("format") != BACKUP_FORMAT or data.get("version") != BACKUP_VERSION:
+            raise ValueError(f"Unsupported backup snapshot: {data.get('format')} {data.get('version')}")
+        return cls(*(data[field] for field in cls._fields))
+
+
+class StoreBackup:
+    """
+    Incremental, deduplicated backups of a store.
+
+    Each snapshot splits the store files into content-defined chunks
+    (see split_chunks) kept in a repository directory under their SHA-256,
+    zlib-compressed. Chunks already in the repository are not written
+    again, and files whose size and modification time match the previous
+    snapshot are not even read, so an hourly snapshot of a large store
+    costs space and I/O in proportion to what changed since the last one.
+
+    Every snapshot lists all of its chunks, so any snapshot is restored
+    directly, without replaying a chain of increments. Retention rules drop
+    old snapshots; chunks no other snapshot uses are then deleted.
+
+    Repository layout::
+
+        snapshots/<id>.json    snapshot manifests
+        chunks/<xx>/<sha256>   compressed chunks
+    """
+
+    def __init__(self, repository: Union[str, Path], source: Any, min_chunk: int = 4096,
+                 max_chunk: int = 65536):
+        """
+        Open or create a backup repository.
+
+        Args:
+            repository: Backup repository directory
+            source: Store file or directory, or a SmartPasswordManager (flushed before each snapshot)
+            min_chunk: Minimum chunk size in bytes
+            max_chunk: Maximum chunk size in bytes
+
+        Raises:
+            ValueError: If the source has no files or the chunk sizes are invalid
+        """
+        if not 0 < min_chunk <= max_chunk:
+            raise ValueError("Chunk sizes must satisfy 0 < min_chunk <= max_chunk")
+        self.manager = source if hasattr(source, 'storage') else None
+        path = self.manager.storage.path if self.manager is not None else source
+        if path is None:
+            raise ValueError("Storage backend has no files to back up")
+        self.source = str(Path(path).expanduser())
+        self.repository = str(Path(repository).expanduser())
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self._lock = threading.Lock()
+
+    def _snapshot_path(self, snapshot_id: str) -> str:
+        return os.path.join(self.repository, "snapshots", snapshot_id + ".json")
+
+    def _chunk_path(self, digest: str) -> str:
+        return os.path.join(self.repository, "chunks", digest[:2], digest)
+
+    # Reading the source
+
+    def _source_files(self) -> Dict[str, str]:
+        """Store files by relative path (temporary files of interrupted writes are skipped)."""
+        if os.path.isfile(self.source):
+            return {os.path.basename(self.source): self.source}
+        files = {}
+        if os.path.isdir(self.source):
+            for directory, _, names in os.walk(self.source):
+                for name in names:
+                    if not name.endswith('.tmp'):
+                        path = os.path.join(directory, name)
+                        files[Path(os.path.relpath(path, self.source)).as_posix()] = path
+        return dict(sorted(files.items()))
+
+    def _store_chunks(self, data: bytes) -> Dict[str, Any]:
+        """Write the chunks of one file that the repository does not have yet."""
+        chunks = []
+        new_chunks = new_bytes = 0
+        for chunk in split_chunks(data, self.min_chunk, self.max_chunk):
+            digest = hashlib.sha256(chunk).hexdigest()
+            path = self._chunk_path(digest)
+            if not os.path.exists(path):
+                compressed = zlib.compress(chunk, 6)
+                atomic_write_bytes(path, compressed)
+                new_chunks += 1
+                new_bytes += len(compressed)
+            chunks.append(digest)
+        return {"chunks": chunks, "new_chunks": new_chunks, "new_bytes": new_bytes}
+
+    # Snapshots
+
+    def snapshots(self) -> List[Snapshot]:
+        """
+        List snapshots, oldest first.
+
+        Returns:
+            List[Snapshot]: Snapshots in the repository
+        """
+        directory = os.path.join(self.repository, "snapshots")
+        if not os.path.isdir(directory):
+            return []
+        snapshots = []
+        for name in os.listdir(directory):
+            if name.endswith('.json'):
+                with open(os.path.join(directory, name), 'r') as f:
+                    snapshots.append(Snapshot.from_dict(json.load(f)))
+        return sorted(snapshots, key=lambda snapshot: (snapshot.created, snapshot.id))
+
+    def get(self, snapshot_id: str) -> Snapshot:
+        """
+        Load one snapshot.
+
+        Raises:
+            KeyError: If the snapshot does not exist
+        """
+        try:
+            with open(self._snapshot_path(snapshot_id), 'r') as f:
+                return Snapshot.from_dict(json.load(f))
+        except FileNotFoundError:
+            raise KeyError(f"Snapshot not found: {snapshot_id}") from None
+
+    def snapshot(self, label: Optional[str] = None) -> Snapshot:
+        """
+        Back up the store.
+
+        Args:
+            label: Optional label stored with the snapshot
+
+        Returns:
+            Snapshot: New snapshot, with the chunks and bytes it added
+        """
+        with self._lock:
+            snapshots = self.snapshots()
+            previous = snapshots[-1] if snapshots else None
+            if self.manager is not None:
+                with self.manager._lock:
+                    self.manager.flush()
+                    created, files, new_chunks, new_bytes = self._read_source(previous)
+            else:
+                created, files, new_chunks, new_bytes = self._read_source(previous)
+            snapshot_id = time.strftime('%Y%m%dT%H%M%S', time.gmtime(created))
+            snapshot_id += f"{created % 1:.6f}"[1:] + 'Z-' + os.urandom(3).hex()
+            if os.path.exists(self.source):
+                directory = os.path.isdir(self.source)
+            else:
+                directory = previous is not None and previous.directory
+            snapshot = Snapshot(snapshot_id, created, label, directory, files,
+                                sum(f["size"] for f in files.values()), new_chunks, new_bytes)
+            atomic_write_text(self._snapshot_path(snapshot_id), json.dumps(snapshot.to_dict()))
+            return snapshot
+
+    def _read_source(self, previous: Optional[Snapshot]):
+        """Chunk the store files, reusing unchanged files of the previous snapshot."""
+        created = time.time()
+        files: Dict[str, FileEntry] = {}
+        new_chunks = new_bytes = 0
+        for name, path in self._source_files().items():
+            stat = os.stat(path)
+            old = previous.files.get(name) if previous is not None else None
+            # A file modified in the second before the previous snapshot may have changed
+            # again within the same mtime tick, so only older files are trusted unread.
+            if (old is not None and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns
+                    and stat.st_mtime < previous.created - 1.0
+                    and all(os.path.exists(self._chunk_path(digest)) for digest in old["chunks"])):
+                files[name] = old
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            stored = self._store_chunks(data)
+            new_chunks += stored["new_chunks"]
+            new_bytes += stored["new_bytes"]
+            files[name] = {"size": len(data), "mtime_ns": stat.st_mtime_ns,
+                           "sha256": hashlib.sha256(data).hexdigest(), "chunks": stored["chunks"]}
+        return created, files, new_chunks, new_bytes
+
+    # Restore
+
+    def _read_file(self, entry: FileEntry) -> bytes:
+        data = b''.join(zlib.decompress(Path(self._chunk_path(digest)).read_bytes()) for digest in entry["chunks"])
+        if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            raise ValueError("Backup chunk data does not match the snapshot checksum")
+        return data
+
+    def restore(self, snapshot_id: Optional[str] = None, destination: Optional[Union[str, Path]] = None) -> Snapshot:
+        """
+        Restore a snapshot.
+
+        Files are checked against their checksums and written atomically.
+        When restoring a store directory, files that are not in the snapshot
+        are removed, so the directory matches the snapshot exactly; another
+        destination directory must therefore be empty or missing. A
+        manager given as the source is reloaded afterwards.
+
+        Args:
+            snapshot_id: Snapshot to restore (default: the latest)
+            destination: Target file or directory (default: the source store)
+
+        Returns:
+            Snapshot: Restored snapshot
+
+        Raises:
+            KeyError: If there is no such snapshot
+            ValueError: If chunk data is missing or corrupt, or a directory snapshot
+                        would be restored into another non-empty directory
+        """
+        with self._lock:
+            if snapshot_id is None:
+                snapshots = self.snapshots()
+                if not snapshots:
+                    raise KeyError("No snapshots to restore")
+                snapshot = snapshots[-1]
+            else:
+                snapshot = self.get(snapshot_id)
+            target = self.source if destination is None else str(Path(destination).expanduser())
+            if snapshot.directory and os.path.isdir(target) and os.listdir(target) \
+                    and os.path.realpath(target) != os.path.realpath(self.source):
+                raise ValueError(f"Refusing to restore into non-empty directory {target}")
+            try:
+                contents = {name: self._read_file(entry) for name, entry in snapshot.files.items()}
+            except FileNotFoundError as e:
+                raise ValueError(f"Backup chunk missing: {e.filename}") from None
+            if self.manager is not None and destination is None:
+                with self.manager._lock:
+                    self._write_target(snapshot, target, contents)
+                    self.manager.reload()
+            else:
+                self._write_target(snapshot, target, contents)
+        return snapshot
+
+    @staticmethod
+    def _write_target(snapshot: Snapshot, target: str, contents: Dict[str, bytes]) -> None:
+        """Replace the target file or directory with the snapshot content."""
+        if not snapshot.directory:
+            if contents:
+                atomic_write_bytes(target, next(iter(contents.values())))
+            elif os.path.isfile(target):
+                os.remove(target)
+            return
+        os.makedirs(target, exist_ok=True)
+        for directory, _, names in os.walk(target):
+            for name in names:
+                path = os.path.join(directory, name)
+                if Path(os.path.relpath(path, target)).as_posix() not in contents:
+                    os.remove(path)
+        for name, data in contents.items():
+            atomic_write_bytes(os.path.join(target, *name.split('/')), data)
+
+    def verify(self, snapshot_id: Optional[str] = None) -> List[str]:
+        """
+        Check that snapshots can be restored.
+
+        Args:
+            snapshot_id: Snapshot to check (default: all)
+
+        Returns:
+            List[str]: Problems found (empty if every file restores intact)
+        """
+        snapshots = [self.get(snapshot_id)] if snapshot_id is not None else self.snapshots()
+        problems = []
+        for snapshot in snapshots:
+            for name, entry in snapshot.files.items():
+                try:
+                    self._read_file(entry)
+                except (OSError, ValueError, zlib.error) as e:
+                    problems.append(f"{snapshot.id}: {name}: {e}")
+        return problems
+
+    # Retention
+
+    def prune(self, keep_last: int = 0, keep_hourly: int = 0, keep_daily: int = 0,
+              keep_weekly: int = 0) -> List[str]:
+        """
+        Drop snapshots outside the retention rules and delete unused chunks.
+
+        A snapshot is kept if it is one of the keep_last newest, or the
+        newest snapshot of one of the keep_hourly / keep_daily / keep_weekly
+        most recent hours / days / ISO weeks (UTC) that have snapshots.
+
+        Args:
+            keep_last: Newest snapshots to keep
+            keep_hourly: Hours to keep one snapshot for
+            keep_daily: Days to keep one snapshot for
+            keep_weekly: Weeks to keep one snapshot for
+
+        Returns:
+            List[str]: Ids of the removed snapshots
+
+        Raises:
+            ValueError: If no rule keeps anything
+        """
+        if min(keep_last, keep_hourly, keep_daily, keep_weekly) < 0:
+            raise ValueError("Retention counts cannot be negative")
+        if not (keep_last or keep_hourly or keep_daily or keep_weekly):
+            raise ValueError("Specify at least one retention rule")
+        with self._lock:
+            snapshots = self.snapshots()[::-1]
+            keep: Set[str] = {snapshot.id for snapshot in snapshots[:keep_last]}
+            for count, period in ((keep_hourly, '%Y%m%d%H'), (keep_daily, '%Y%m%d'), (keep_weekly, '%G%V')):
+                seen: Set[str] = set()
+                for snapshot in snapshots:
+                    bucket = time.strftime(period, time.gmtime(snapshot.created))
+                    if len(seen) >= count:
+                        break
+                    if bucket not in seen:
+                        seen.add(bucket)
+                        keep.add(snapshot.id)
+            removed = [snapshot.id for snapshot in snapshots if snapshot.id not in keep]
+            for snapshot_id in removed:
+                os.remove(self._snapshot_path(snapshot_id))
+            self._collect_garbage()
+        return removed
+
+    def _collect_garbage(self) -> int:
+        """Delete chunks that no snapshot references."""
+        used = {digest for snapshot in self.snapshots() for entry in snapshot.files.values()
+                for digest in entry["chunks"]}
+        directory = os.path.join(self.repository, "chunks")
+        deleted = 0
+        if not os.path.isdir(directory):
+            return deleted
+        for prefix in os.listdir(directory):
+            for name in os.listdir(os.path.join(directory, prefix)):
+                if name not in used:
+                    os.remove(os.path.join(directory, prefix, name))
+                    deleted += 1
+            if not os.listdir(os.path.join(directory, prefix)):
+                shutil.rmtree(os.path.join(directory, prefix), ignore_errors=True)
+        return deleted
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshots, chunks, logical bytes of all snapshots and compressed bytes stored."""
+        directory = os.path.join(self.repository, "chunks")
+        chunks = stored = 0
+        if os.path.isdir(directory):
+            for prefix in os.listdir(directory):
+                for name in os.listdir(os.path.join(directory, prefix)):
+                    chunks += 1
+                    stored += os.path.getsize(os.path.join(directory, prefix, name))
+        snapshots = self.snapshots()
+        return {"snapshots": len(snapshots), "chunks": chunks,
+                "logical_bytes": sum(snapshot.size for snapshot in snapshots), "stored_bytes": stored}
@@ -0,0 +1,146 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import threading
+import warnings
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+
+ADDED = "added"
+UPDATED = "updated"
+DELETED = "deleted"
+CLEARED = "cleared"
+RELOADED = "reloaded"
+
+EVENT_TYPES = (ADDED, UPDATED, DELETED, CLEARED, RELOADED)
+
+LOCAL = "local"
+EXTERNAL = "external"
+
+
+class ChangeEvent(NamedTuple):
+    """
+    One change to a manager's metadata.
+
+    Record events (added, updated, deleted) carry snapshots of the entry
+    before and after the change. A cleared event is emitted once after all
+    entries were removed; a reloaded event closes a batch of record events
+    produced by re-reading the store.
+
+    Attributes:
+        type: "added", "updated", "deleted", "cleared" or "reloaded"
+        public_key: Public key of the entry (None for cleared and reloaded)
+        old: Entry before the change (None when added)
+        new: Entry after the change (None when deleted)
+        origin: "local" for manager calls, "external" for changes found on disk
+    """
+
+    type: str
+    public_key: Optional[str]
+    old: Optional[SmartPassword]
+    new: Optional[SmartPassword]
+    origin: str = LOCAL
+
+
+Subscriber = Callable[[ChangeEvent], None]
+
+
+class Subscription:
+    """
+    Handle returned by subscribe(); call unsubscribe() to stop receiving events.
+    """
+
+    def __init__(self, feed: 'EventFeed', callback: Subscriber, types: Optional[frozenset]):
+        self.callback = callback
+        self.types = types
+        self._feed = feed
+
+    def unsubscribe(self) -> None:
+        """Stop delivering events to the callback."""
+        self._feed.unsubscribe(self)
+
+    def __enter__(self) -> 'Subscription':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.unsubscribe()
+
+
+class EventFeed:
+    """
+    Synchronous observer list.
+
+    Events are delivered in order on the thread that made the change (the
+    watcher thread for external changes). A failing subscriber does not stop
+    delivery to the others or the change itself; its error is reported as a
+    warning.
+    """
+
+    def __init__(self):
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Subscriber, types: Optional[Iterable[str]] = None) -> Subscription:
+        """
+        Register a callback.
+
+        Args:
+            callback: Function called with each ChangeEvent
+            types: Event types to deliver (default: all)
+
+        Returns:
+            Subscription: Handle for unsubscribing
+
+        Raises:
+            ValueError: If an unknown event type is requested
+        """
+        if types is not None:
+            types = frozenset(types)
+            unknown = types - set(EVENT_TYPES)
+            if unknown:
+                raise ValueError(f"Unknown event type: {', '.join(sorted(unknown))}")
+        subscription = Subscription(self, callback, types)
+        with self._lock:
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription (no-op if already removed)."""
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s is not subscription]
+
+    def __bool__(self) -> bool:
+        return bool(self._subscriptions)
+
+    def emit(self, event: ChangeEvent) -> None:
+        """Deliver an event to matching subscribers."""
+        for subscription in self._subscriptions:
+            if subscription.types is not None and event.type not in subscription.types:
+                continue
+            try:
+                subscription.callback(event)
+            except Exception as e:
+                warnings.warn(f"Event subscriber {subscription.callback!r} failed: {e}")
+
+
+def diff_records(old: Dict[str, SmartPassword], new: Dict[str, SmartPassword],
+                 origin: str = EXTERNAL) -> Iterator[ChangeEvent]:
+    """
+    Compute record events turning one snapshot into another.
+
+    Args:
+        old: Records before
+        new: Records after
+        origin: Origin stamped on the events
+
+    Returns:
+        Iterator[ChangeEvent]: Deleted, then updated and added events
+    """
+    for public_key, password in old.items():
+        if public_key not in new:
+            yield ChangeEvent(DELETED, public_key, password, None, origin)
+    for public_key, password in new.items():
+        previous = old.get(public_key)
+        if previous is None:
+            yield ChangeEvent(ADDED, public_key, None, password, origin)
+        elif previous.to_dict() != password.to_dict():
+            yield ChangeEvent(UPDATED, public_key, previous, password, origin)
@@ -0,0 +1,304 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+import threading
+import time
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from smartpasslib.managers.events import ADDED, DELETED, UPDATED, ChangeEvent
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.base import atomic_write_text
+
+HISTORY_FORMAT = "smartpasslib-history"
+HISTORY_VERSION = 1
+
+Record = Dict[str, Any]
+_STAMP_FIELDS = ("public_key", "version", "modified")
+
+
+def _fields(password: SmartPassword) -> Record:
+    """Entry content without its key and version stamps."""
+    data = password.to_dict()
+    for field in _STAMP_FIELDS:
+        data.pop(field, None)
+    return data
+
+
+class HistoryEntry(NamedTuple):
+    """
+    One recorded state of an entry.
+
+    Attributes:
+        public_key: Public key of the entry
+        version: Entry version after the change
+        modified: Change time as a Unix timestamp (None for entries older than the log)
+        record: Entry fields (description, length, kdf) after the change, None if deleted
+    """
+
+    public_key: str
+    version: int
+    modified: Optional[float]
+    record: Optional[Record]
+
+    @property
+    def deleted(self) -> bool:
+        return self.record is None
+
+    def to_smart_password(self) -> SmartPassword:
+        """Rebuild the entry as it was at this version."""
+        return SmartPassword.from_dict(dict(self.record, public_key=self.public_key,
+                                            version=self.version, modified=self.modified))
+
+
+def _encode(entry: HistoryEntry, previous: Optional[Record]) -> Record:
+    """Log line for a state, storing only the fields that differ from the previous one."""
+    line: Record = {"public_key": entry.public_key, "version": entry.version, "modified": entry.modified}
+    if entry.record is None:
+        line["deleted"] = True
+        return line
+    base = previous or {}
+    line["set"] = {k: v for k, v in entry.record.items() if base.get(k) != v}
+    unset = [k for k in base if k not in entry.record]
+    if unset:
+        line["unset"] = unset
+    return line
+
+
+def _decode(line: Record, previous: Optional[Record]) -> HistoryEntry:
+    """Rebuild the full state from a log line and the previous state of the entry."""
+    if line.get("deleted"):
+        record = None
+    else:
+        record = dict(previous or {})
+        record.update(line["set"])
+        for field in line.get("unset", ()):
+            record.pop(field, None)
+    return HistoryEntry(line["public_key"], line["version"], line["modified"], record)
+
+
+class EntryHistory:
+    """
+    Change history of a SmartPasswordManager.
+
+    Every change the manager reports (local edits, rotations, reloads and
+    sync merges) is appended to an NDJSON log next to the store, so the
+    store itself stays small. Each line holds only the fields that changed
+    since the previous version of the entry; an entry's first line (or the
+    state it had when the log was started) holds all of them.
+
+    Entries can be listed and rolled back by version or by time, one at a
+    time or the whole store at once. A rollback is itself a new change, so
+    it gets a new version and can be undone.
+    """
+
+    def __init__(self, manager, path: Optional[str] = None):
+        """
+        Start recording a manager's changes.
+
+        Args:
+            manager: SmartPasswordManager to record
+            path: History log file (default: store path + '.history')
+
+        Raises:
+            ValueError: If no path is given for a store without files,
+                        or the log has an unsupported format
+        """
+        if path is None:
+            if manager.storage.path is None:
+                raise ValueError("History requires a log path for stores without files")
+            path = manager.storage.path.rstrip(os.sep) + '.history'
+        self.manager = manager
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = None
+        self._heads: Dict[str, HistoryEntry] = {}
+        for entry in self._replay():
+            self._heads[entry.public_key] = entry
+        self._subscription = manager.subscribe(self._on_change, types=(ADDED, UPDATED, DELETED))
+
+    def _lines(self) -> Iterator[Record]:
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, 'r') as f:
+            header = json.loads(f.readline() or '{}')
+            if header.get("format") != HISTORY_FORMAT or header.get("version") != HISTORY_VERSION:
+                raise ValueError(f"Unsupported history log version: {header.get('version')}")
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return  # torn final line after a crash
+
+    def _replay(self) -> Iterator[HistoryEntry]:
+        """Full states of all recorded changes, in log order."""
+        states: Dict[str, Optional[Record]] = {}
+        for line in self._lines():
+            entry = _decode(line, states.get(line["public_key"]))
+            states[entry.public_key] = entry.record
+            yield entry
+
+    def _append(self, entries: List[HistoryEntry]) -> None:
+        with self._lock:
+            if self._file is None:
+                if not os.path.isfile(self.path):
+                    header = json.dumps({"format": HISTORY_FORMAT, "version": HISTORY_VERSION})
+                    atomic_write_text(self.path, header + '\n')
+                self._file = open(self.path, 'a')
+            for entry in entries:
+                head = self._heads.get(entry.public_key)
+                self._file.write(json.dumps(_encode(entry, head and head.record)) + '\n')
+                self._heads[entry.public_key] = entry
+            self._file.flush()
+
+    def _on_change(self, event: ChangeEvent) -> None:
+        entries = []
+        if event.public_key not in self._heads and event.old is not None:
+            # First change since the log was started: keep the state it replaces
+            old = event.old
+            entries.append(HistoryEntry(old.public_key, old.version, old.modified, _fields(old)))
+        if event.new is not None:
+            new = event.new
+            entries.append(HistoryEntry(new.public_key, new.version, new.modified, _fields(new)))
+        else:
+            entries.append(HistoryEntry(event.public_key, event.old.version + 1, time.time(), None))
+        self._append(entries)
+
+    def entries(self, public_key: str) -> List[HistoryEntry]:
+        """
+        List the recorded states of an entry.
+
+        Args:
+            public_key: Public key of the entry
+
+        Returns:
+            List[HistoryEntry]: States in the order they were recorded
+        """
+        return [entry for entry in self._replay() if entry.public_key == public_key]
+
+    def states_at(self, as_of: float) -> Dict[str, Optional[Record]]:
+        """
+        Get the state of every recorded entry at a point in time.
+
+        Args:
+            as_of: Unix timestamp
+
+        Returns:
+            Dict[str, Optional[Record]]: Entry fields by public key; None for
+            entries that were deleted or not yet added at that time
+        """
+        states: Dict[str, Optional[Record]] = {}
+        for entry in self._replay():
+            if (entry.modified or 0.0) <= as_of:
+                states[entry.public_key] = entry.record
+            else:
+                states.setdefault(entry.public_key, None)
+        return states
+
+    def _restore(self, targets: Dict[str, Optional[Record]]) -> Tuple[List[SmartPassword], List[str]]:
+        """Puts and deletes that bring current entries to the target states."""
+        puts: List[SmartPassword] = []
+        deletes: List[str] = []
+        for public_key, record in targets.items():
+            current = self.manager.get_smart_password(public_key)
+            if record is None:
+                if current is not None:
+                    deletes.append(public_key)
+                continue
+            if current is not None and _fields(current) == record:
+                continue
+            head = self._heads.get(public_key)
+            password = SmartPassword.from_dict(dict(record, public_key=public_key))
+            password.touch(base_version=max(head.version if head else 0, current.version if current else 0))
+            puts.append(password)
+        return puts, deletes
+
+    def rollback(self, public_key: str, version: Optional[int] = None,
+                 as_of: Optional[float] = None) -> Optional[SmartPassword]:
+        """
+        Restore one entry to an earlier version or to its state at a time.
+
+        Args:
+            public_key: Public key of the entry
+            version: Version to restore
+            as_of: Unix timestamp to restore the entry's state at
+
+        Returns:
+            Optional[SmartPassword]: Restored entry, or None if the entry did
+            not exist at that point and was deleted
+
+        Raises:
+            ValueError: If neither or both of version and as_of are given,
+                        or the version was not recorded
+        """
+        if (version is None) == (as_of is None):
+            raise ValueError("Specify either version or as_of")
+        if version is not None:
+            matches = [e for e in self.entries(public_key) if e.version == version]
+            if not matches:
+                raise ValueError(f"Version {version} of entry {public_key} is not in the history")
+            record = matches[-1].record
+        else:
+            record = self.states_at(as_of).get(public_key)
+        puts, deletes = self._restore({public_key: record})
+        if puts or deletes:
+            self.manager._commit_batch(puts, deletes)
+        return self.manager.get_smart_password(public_key)
+
+    def rollback_store(self, as_of: float) -> int:
+        """
+        Restore every recorded entry to its state at a time, in one store write.
+
+        Entries that were never changed since the log was started are left as they are.
+
+        Args:
+            as_of: Unix timestamp
+
+        Returns:
+            int: Number of entries restored or deleted
+        """
+        puts, deletes = self._restore(self.states_at(as_of))
+        if puts or deletes:
+            self.manager._commit_batch(puts, deletes)
+        return len(puts) + len(deletes)
+
+    def prune(self, older_than: float) -> int:
+        """
+        Drop history before a time, keeping each entry's state at that time.
+
+        Args:
+            older_than: Unix timestamp
+
+        Returns:
+            int: Number of log lines removed
+        """
+        with self._lock:
+            baseline: Dict[str, HistoryEntry] = {}
+            recent: List[HistoryEntry] = []
+            total = 0
+            for entry in self._replay():
+                total += 1
+                if (entry.modified or 0.0) < older_than:
+                    baseline[entry.public_key] = entry
+                else:
+                    recent.append(entry)
+            kept = [entry for entry in baseline.values() if not entry.deleted] + recent
+            heads: Dict[str, HistoryEntry] = {}
+            lines = [json.dumps({"format": HISTORY_FORMAT, "version": HISTORY_VERSION}) + '\n']
+            for entry in kept:
+                head = heads.get(entry.public_key)
+                lines.append(json.dumps(_encode(entry, head and head.record)) + '\n')
+                heads[entry.public_key] = entry
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            atomic_write_text(self.path, ''.join(lines))
+            self._heads = heads
+            return total - len(kept)
+
+    def close(self) -> None:
+        """Stop recording and close the log."""
+        self._subscription.unsubscribe()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
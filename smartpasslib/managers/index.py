@@ -0,0 +1,155 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import base64
+import binascii
+import json
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+
+DESCRIPTION = "description"
+LENGTH = "length"
+ORDERS = (DESCRIPTION, LENGTH)
+# Element types of the keys sort_key() builds for each order
+_KEY_TYPES = {DESCRIPTION: (str, str, str), LENGTH: (int, str, str, str)}
+
+
+class EntryStats(NamedTuple):
+    """
+    Aggregate counts over stored entries.
+
+    Attributes:
+        total: Number of entries
+        by_length: Entry count per length bucket, keyed by the bucket's lower bound
+    """
+
+    total: int
+    by_length: Dict[int, int]
+
+
+def sort_key(order_by: str, smart_password: SmartPassword) -> tuple:
+    """
+    Position of an entry in an ordered index.
+
+    Descriptions compare case-insensitively; the public key makes every key unique.
+
+    Args:
+        order_by: "description" or "length"
+        smart_password: Entry
+
+    Returns:
+        tuple: Sort key
+    """
+    description = smart_password.description
+    if order_by == DESCRIPTION:
+        return description.casefold(), description, smart_password.public_key
+    return smart_password.length, description.casefold(), description, smart_password.public_key
+
+
+def encode_cursor(order_by: str, key: tuple) -> str:
+    """Opaque cursor pointing just past an index key."""
+    return base64.urlsafe_b64encode(json.dumps([order_by, list(key)]).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(order_by: str, cursor: str) -> tuple:
+    """
+    Index key encoded in a cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another order
+    """
+    try:
+        order, key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError, AttributeError, binascii.Error):
+        raise ValueError("Invalid cursor") from None
+    if order != order_by:
+        raise ValueError(f"Cursor belongs to order {order!r}, not {order_by!r}")
+    if not isinstance(key, list) or [type(part) for part in key] != list(_KEY_TYPES[order_by]):
+        raise ValueError("Invalid cursor")
+    return tuple(key)
+
+
+class EntryIndex:
+    """
+    Ordered indexes and aggregate counts over a manager's entries.
+
+    Each order keeps a sorted list of keys, so a page is found by binary
+    search and costs O(log n + page size) instead of sorting every entry.
+    The key each entry was indexed under is remembered, so entries that
+    were changed in place can still be found and moved.
+    """
+
+    def __init__(self, entries: Iterable[SmartPassword] = ()):
+        entries = list(entries)
+        self._keys: Dict[str, Dict[str, tuple]] = {}
+        self._sorted: Dict[str, List[tuple]] = {}
+        for order_by in ORDERS:
+            keys = {sp.public_key: sort_key(order_by, sp) for sp in entries}
+            self._keys[order_by] = keys
+            self._sorted[order_by] = sorted(keys.values())
+        self._lengths = Counter(sp.length for sp in entries)
+
+    def __len__(self) -> int:
+        return len(self._keys[DESCRIPTION])
+
+    def put(self, smart_password: SmartPassword) -> None:
+        """Index a new entry or move a changed one."""
+        self.remove(smart_password.public_key)
+        for order_by in ORDERS:
+            key = self._keys[order_by][smart_password.public_key] = sort_key(order_by, smart_password)
+            insort(self._sorted[order_by], key)
+        self._lengths[smart_password.length] += 1
+
+    def remove(self, public_key: str) -> None:
+        """Drop an entry (no-op if it is not indexed)."""
+        for order_by in ORDERS:
+            key = self._keys[order_by].pop(public_key, None)
+            if key is None:
+                return
+            keys = self._sorted[order_by]
+            del keys[bisect_left(keys, key)]
+            if order_by == LENGTH:
+                length = key[0]
+                self._lengths[length] -= 1
+                if not self._lengths[length]:
+                    del self._lengths[length]
+
+    def page(self, order_by: str, cursor: Optional[str], limit: int,
+             descending: bool = False) -> List[Tuple[str, str]]:
+        """
+        Public keys of one page in index order.
+
+        Args:
+            order_by: "description" or "length"
+            cursor: Cursor of the last entry already seen (None for the first page)
+            limit: Maximum entries
+            descending: Walk the index backwards
+
+        Returns:
+            List[Tuple[str, str]]: (cursor, public_key) pairs
+        """
+        keys = self._sorted[order_by]
+        if descending:
+            end = len(keys) if cursor is None else bisect_left(keys, decode_cursor(order_by, cursor))
+            selected = keys[max(0, end - limit):end][::-1]
+        else:
+            start = 0 if cursor is None else bisect_right(keys, decode_cursor(order_by, cursor))
+            selected = keys[start:start + limit]
+        return [(encode_cursor(order_by, key), key[-1]) for key in selected]
+
+    def stats(self, bucket: int = 1) -> EntryStats:
+        """
+        Entry counts by length bucket.
+
+        Args:
+            bucket: Bucket width in characters (buckets start at multiples of it)
+
+        Returns:
+            EntryStats: Total and per-bucket counts
+        """
+        by_length: Dict[int, int] = {}
+        for length in sorted(self._lengths):
+            start = length - length % bucket
+            by_length[start] = by_length.get(start, 0) + self._lengths[length]
+        return EntryStats(len(self), by_length)
@@ -0,0 +1,363 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import fnmatch
+import json
+import os
+import threading
+import time
+import warnings
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from smartpasslib.storage.base import atomic_write_bytes
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.storage.json_file import JsonFileStorage
+from smartpasslib.utils.bloom import BloomFilter
+from smartpasslib.utils.parallel import DerivationExecutor
+
+# (st_mtime_ns, st_size) of a store file when it was indexed
+Signature = Tuple[int, int]
+
+
+class RefreshResult(NamedTuple):
+    """
+    Outcome of a locator refresh.
+
+    Attributes:
+        stores: Store files found in the directory
+        added: Stores indexed for the first time
+        updated: Changed stores re-read
+        removed: Stores dropped because the file is gone
+    """
+
+    stores: int
+    added: int
+    updated: int
+    removed: int
+
+
+def read_store_keys(path: str) -> List[str]:
+    """
+    Public keys held by a store file (JSON or compressed; runs in a worker).
+
+    Args:
+        path: Store file
+
+    Returns:
+        List[str]: Public keys
+    """
+    if CompressedFileStorage.detect(path):
+        return list(CompressedFileStorage(path).load())
+    return list(JsonFileStorage(path).load())
+
+
+class StoreLocator:
+    """
+    Persistent public key -> store file index over a directory of stores.
+
+    Answers "which store holds this public key?" without opening every
+    SmartPasswordManager. A Bloom filter sits in front of the key map and
+    is kept in the index file ahead of it, so a key held by no store is
+    usually rejected without loading the map at all.
+
+    The index records each store's modification time and size. refresh()
+    only stats the directory and re-reads the stores whose signature
+    changed (in parallel when there are many); a located store is
+    re-checked with one stat, so a stale answer is corrected on the spot.
+    Removed keys stay in the Bloom filter until it is rebuilt, which
+    happens once they make up a quarter of its capacity.
+
+    One locator should maintain an index file at a time.
+    """
+
+    FORMAT = "smartpasslib-locator"
+    VERSION = 1
+
+    def __init__(self, root: Union[str, Path], index_path: Optional[Union[str, Path]] = None,
+                 pattern: str = "*.json", recursive: bool = False, refresh_interval: Optional[float] = 1.0,
+                 error_rate: float = 0.001, reader: Callable[[str], Iterable[str]] = read_store_keys,
+                 executor: Optional[DerivationExecutor] = None, parallel_threshold: int = 64):
+        """
+        Open (or start) the index of a store directory.
+
+        Args:
+            root: Directory holding the store files
+            index_path: Index file (default: root/.locator)
+            pattern: File name pattern of store files
+            recursive: Also index stores in subdirectories
+            refresh_interval: Seconds after which locate() refreshes first (None: only on refresh())
+            error_rate: Bloom filter false positive rate
+            reader: Function returning the public keys of a store file
+                    (must be picklable for a process executor)
+            executor: Executor for re-reading many stores (default: one created per large refresh)
+            parallel_threshold: Changed stores from which reading runs on the executor
+
+        Raises:
+            ValueError: If error_rate is out of range
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1")
+        self.root = str(Path(root).expanduser())
+        self.index_path = str(Path(index_path).expanduser()) if index_path else os.path.join(self.root, '.locator')
+        self.pattern = pattern
+        self.recursive = recursive
+        self.refresh_interval = refresh_interval
+        self.error_rate = error_rate
+        self.reader = reader
+        self.executor = executor
+        self.parallel_threshold = parallel_threshold
+        self._lock = threading.RLock()
+        self._stores: Dict[str, Signature] = {}
+        self._keys: Optional[Dict[str, List[str]]] = {}
+        self._keys_offset = 0
+        self._owners: Optional[Dict[str, List[str]]] = None
+        self._capacity = 1024
+        self._bloom = BloomFilter(self._capacity, error_rate)
+        self._stale = 0
+        self._dirty = False
+        self._last_refresh: Optional[float] = None
+        self.lookups = 0
+        self.rejected = 0
+        self.false_positives = 0
+        self._open()
+
+    # Index file
+
+    def _open(self) -> None:
+        """Read the header, Bloom filter and store table; the key map is read on first use."""
+        if not os.path.isfile(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = json.loads(f.readline())
+                if header.get("format") != self.FORMAT or header.get("version") != self.VERSION:
+                    raise ValueError(f"Not a locator index (version {self.VERSION})")
+                bloom = BloomFilter.from_bytes(f.read(header["bloom_size"]))
+                stores = json.loads(f.read(header["stores_size"]))
+                offset = f.tell()
+        except (ValueError, KeyError, TypeError, OSError) as e:
+            warnings.warn(f"Failed to load store locator {self.index_path}: {e}")
+            return
+        self._stores = {path: tuple(signature) for path, signature in stores.items()}
+        self._bloom = bloom
+        self._capacity = header["capacity"]
+        self._stale = header.get("stale", 0)
+        self._keys = None
+        self._keys_offset = offset
+
+    def _key_map(self) -> Dict[str, List[str]]:
+        """Store -> public keys (read from the index file on first use; rebuilt from the stores if unreadable)."""
+        if self._keys is None:
+            try:
+                with open(self.index_path, 'rb') as f:
+                    f.seek(self._keys_offset)
+                    keys = json.loads(f.read())
+                if set(keys) != set(self._stores):
+                    raise ValueError("key map does not match the store table")
+                self._keys = keys
+            except (ValueError, OSError) as e:
+                warnings.warn(f"Failed to load store locator {self.index_path}: {e}")
+                self.rebuild()
+        return self._keys
+
+    def _owner_map(self) -> Dict[str, List[str]]:
+        """Public key -> stores holding it."""
+        if self._owners is None:
+            owners: Dict[str, List[str]] = {}
+            for store, keys in self._key_map().items():
+                for public_key in keys:
+                    owners.setdefault(public_key, []).append(store)
+            self._owners = owners
+        return self._owners
+
+    def save(self) -> None:
+        """Write the index file (also done after every refresh that changed it)."""
+        with self._lock:
+            keys = self._key_map()
+            bloom = self._bloom.to_bytes()
+            stores = json.dumps(self._stores, separators=(',', ':')).encode('utf-8')
+            header = json.dumps({"format": self.FORMAT, "version": self.VERSION, "capacity": self._capacity,
+                                 "stale": self._stale, "bloom_size": len(bloom), "stores_size": len(stores)})
+            head = header.encode('utf-8') + b'\n' + bloom + stores
+            try:
+                atomic_write_bytes(self.index_path, head + json.dumps(keys, separators=(',', ':')).encode('utf-8'))
+            except IOError as e:
+                warnings.warn(f"Failed to save store locator {self.index_path}: {e}")
+                return
+            self._keys_offset = len(head)
+            self._dirty = False
+
+    # Maintenance
+
+    def _scan(self) -> Dict[str, Signature]:
+        """Signatures of the store files currently in the directory."""
+        found = {}
+        index_path = os.path.abspath(self.index_path)
+        for directory, subdirectories, files in os.walk(self.root):
+            if not self.recursive:
+                subdirectories.clear()
+            for name in fnmatch.filter(files, self.pattern):
+                path = os.path.join(directory, name)
+                if os.path.abspath(path) == index_path:
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found[os.path.relpath(path, self.root)] = (stat.st_mtime_ns, stat.st_size)
+        return found
+
+    def _signature(self, store: str) -> Optional[Signature]:
+        try:
+            stat = os.stat(os.path.join(self.root, store))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self, stores: List[str]) -> Iterable[Tuple[str, List[str]]]:
+        """Read the public keys of stores, on the executor when there are many."""
+        paths = [os.path.join(self.root, store) for store in stores]
+        if len(stores) < self.parallel_threshold:
+            results = []
+            for path in paths:
+                try:
+                    results.append(list(self.reader(path)))
+                except Exception as e:
+                    results.append(e)
+        elif self.executor is not None:
+            results = list(self.executor.map(self.reader, paths, return_exceptions=True))
+        else:
+            with DerivationExecutor() as executor:
+                results = list(executor.map(self.reader, paths, return_exceptions=True))
+        for store, result in zip(stores, results):
+            if isinstance(result, BaseException):
+                warnings.warn(f"Failed to index store {store}: {result}")
+                result = []
+            yield store, list(result)
+
+    def _set(self, store: str, signature: Optional[Signature], keys: List[str]) -> None:
+        """Replace a store's keys in the index (signature None: drop the store)."""
+        key_map = self._key_map()
+        owners = self._owner_map()
+        for public_key in key_map.pop(store, ()):
+            holders = owners.get(public_key)
+            if holders and store in holders:
+                holders.remove(store)
+                if not holders:
+                    del owners[public_key]
+                    self._stale += 1
+        self._stores.pop(store, None)
+        if signature is not None:
+            self._stores[store] = signature
+            key_map[store] = keys
+            for public_key in keys:
+                owners.setdefault(public_key, []).append(store)
+                self._bloom.add(public_key)
+        self._dirty = True
+        if len(owners) > self._capacity or self._stale > self._capacity // 4:
+            self._rebuild_bloom()
+
+    def _rebuild_bloom(self) -> None:
+        """Size a new Bloom filter for the current keys (drops removed keys)."""
+        owners = self._owner_map()
+        self._capacity = max(1024, 2 * len(owners))
+        self._bloom = BloomFilter(self._capacity, self.error_rate)
+        for public_key in owners:
+            self._bloom.add(public_key)
+        self._stale = 0
+
+    def refresh(self) -> RefreshResult:
+        """
+        Bring the index up to date with the store directory.
+
+        Only stores whose modification time or size changed are re-read.
+
+        Returns:
+            RefreshResult: Counts of stores found, added, updated and removed
+        """
+        with self._lock:
+            self._key_map()  # a corrupt key map triggers a rebuild before the store table is compared
+            current = self._scan()
+            removed = [store for store in self._stores if store not in current]
+            changed = sorted(store for store, signature in current.items() if self._stores.get(store) != signature)
+            added = sum(1 for store in changed if store not in self._stores)
+            for store in removed:
+                self._set(store, None, [])
+            for store, keys in self._read(changed):
+                self._set(store, current[store], keys)
+            self._last_refresh = time.monotonic()
+            if self._dirty or not os.path.isfile(self.index_path):
+                self.save()
+            return RefreshResult(len(current), added, len(changed) - added, len(removed))
+
+    def rebuild(self) -> RefreshResult:
+        """
+        Re-read every store and rewrite the index from scratch.
+
+        Returns:
+            RefreshResult: Counts of stores found and indexed
+        """
+        with self._lock:
+            self._stores = {}
+            self._keys = {}
+            self._owners = None
+            self._rebuild_bloom()
+            return self.refresh()
+
+    def update(self, path: Union[str, Path]) -> None:
+        """
+        Re-index one store right away (e.g. after writing it).
+
+        Args:
+            path: Store file inside root (a missing file is dropped from the index)
+        """
+        with self._lock:
+            store = os.path.relpath(str(Path(path).expanduser()), self.root)
+            signature = self._signature(store)
+            keys = next(iter(self._read([store])))[1] if signature is not None else []
+            self._set(store, signature, keys)
+            self.save()
+
+    # Lookup
+
+    def locate(self, public_key: str) -> List[str]:
+        """
+        Store files holding a public key.
+
+        Args:
+            public_key: Public key to find
+
+        Returns:
+            List[str]: Paths of the stores holding it (empty if none)
+        """
+        with self._lock:
+            if self.refresh_interval is not None and (
+                    self._last_refresh is None or time.monotonic() - self._last_refresh >= self.refresh_interval):
+                self.refresh()
+            self.lookups += 1
+            if public_key not in self._bloom:
+                self.rejected += 1
+                return []
+            for store in list(self._owner_map().get(public_key, ())):
+                signature = self._signature(store)
+                if signature != self._stores.get(store):
+                    keys = next(iter(self._read([store])))[1] if signature is not None else []
+                    self._set(store, signature, keys)
+            if self._dirty:
+                self.save()
+            stores = self._owner_map().get(public_key, [])
+            if not stores:
+                self.false_positives += 1
+            return [os.path.join(self.root, store) for store in stores]
+
+    def __contains__(self, public_key: str) -> bool:
+        return bool(self.locate(public_key))
+
+    def __len__(self) -> int:
+        return len(self._stores)
+
+    def stats(self) -> Dict[str, int]:
+        """Indexed stores, Bloom filter size, lookups, Bloom rejections and false positives."""
+        with self._lock:
+            return {"stores": len(self._stores), "bloom_bits": self._bloom.size, "bloom_hashes": self._bloom.hashes,
+                    "bloom_capacity": self._capacity, "lookups": self.lookups, "rejected": self.rejected,
+                    "false_positives": self.false_positives}
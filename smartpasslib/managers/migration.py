@@ -0,0 +1,262 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.storage.encrypted import EncryptedFileStorage
+from smartpasslib.storage.json_file import JsonFileStorage
+from smartpasslib.utils.json_stream import JsonStreamError, iter_object_items
+from smartpasslib.utils.parallel import DerivationExecutor
+
+Record = Dict[str, Any]
+SecretProvider = Callable[[str, Record], Optional[str]]
+LegacyVerifier = Callable[[str, str], bool]
+
+
+class MigrationFailure(NamedTuple):
+    """
+    One legacy entry that was not migrated.
+
+    Attributes:
+        source: Legacy store file
+        line: 1-based line of the entry (0 for store-level failures)
+        public_key: Legacy public key (JSON key of the entry)
+        description: Entry description, if readable
+        code: Machine-readable failure code
+        message: Human-readable description
+    """
+
+    source: str
+    line: int
+    public_key: Optional[str]
+    description: Optional[str]
+    code: str
+    message: str
+
+
+class MigrationReport:
+    """
+    Result of migrating one legacy store.
+
+    The destination is written only if the source could be read completely;
+    entries that failed are listed and left out.
+    """
+
+    def __init__(self, source: str, destination: Any):
+        self.source = source
+        self.destination = destination
+        self.migrated = 0
+        self.skipped = 0
+        self.failures: List[MigrationFailure] = []
+        self.written = False
+
+    @property
+    def ok(self) -> bool:
+        """True if every entry was migrated or deliberately skipped."""
+        return not self.failures
+
+    def fail(self, line: int, public_key: Optional[str], description: Optional[str], code: str, message: str) -> None:
+        self.failures.append(MigrationFailure(self.source, line, public_key, description, code, message))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary as a JSON-serializable dictionary."""
+        return {
+            "source": self.source,
+            "destination": os.fspath(self.destination) if isinstance(self.destination, (str, os.PathLike)) else None,
+            "migrated": self.migrated,
+            "skipped": self.skipped,
+            "written": self.written,
+            "ok": self.ok,
+            "failures": [failure._asdict() for failure in self.failures],
+        }
+
+
+def derive_v4_key(secret: str, kdf: Optional[KdfParams]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Derive the v4 public key of one entry (runs in a worker process).
+
+    Args:
+        secret: Secret phrase
+        kdf: KDF parameters for memory-hard keys (None for the v4 chain)
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (public key, error)
+    """
+    try:
+        return SmartKeyGenerator.generate_public_key(secret, kdf=kdf), None
+    except ValueError as e:
+        return None, str(e)
+
+
+class _Job:
+    """Migration state of one legacy store while its entries are in flight."""
+
+    def __init__(self, source: str, destination: Any):
+        self.report = MigrationReport(source, destination)
+        self.puts: Dict[str, SmartPassword] = {}
+        self.submitted = 0
+        self.received = 0
+        self.read = False
+        self.broken = False
+
+
+def _check_legacy(value: Any) -> Optional[Tuple[str, str]]:
+    """Validate a legacy record; v1 stores named the description "login"."""
+    if not isinstance(value, dict):
+        return "not_object", f"Record must be a JSON object, got {type(value).__name__}"
+    description = value.get("description", value.get("login"))
+    if not isinstance(description, str):
+        return "missing_field", "Missing or invalid description"
+    length = value.get("length")
+    if not isinstance(length, int) or isinstance(length, bool):
+        return "missing_field", "Missing or invalid length"
+    if not 12 <= length <= 100:
+        return "invalid_length", f"v4 passwords must be 12-100 characters long, got {length}"
+    return None
+
+
+def migrate_stores(jobs: Iterable[Tuple[str, Any]], secret_provider: SecretProvider,
+                   executor: Optional[DerivationExecutor] = None, kdf: Optional[KdfParams] = None,
+                   legacy_verifier: Optional[LegacyVerifier] = None) -> Iterator[MigrationReport]:
+    """
+    Migrate many legacy (v1-v3) stores to v4 through one derivation pipeline.
+
+    Legacy stores are streamed entry by entry and every entry's v4 public
+    key is derived on the shared executor, so small stores are batched
+    together rather than each paying for its own pool. Descriptions and
+    lengths are kept. Each store is written in one atomic batch as soon as
+    its last entry is derived, and reports are yielded in job order.
+
+    Args:
+        jobs: (legacy store path, destination) pairs; a destination is a
+              passwords.json path (merged with existing content) or a SmartPasswordManager
+        secret_provider: Returns the secret for (source, legacy record), or None to skip the entry
+        executor: Derivation executor (default: a new one for this migration)
+        kdf: KDF parameters for memory-hard public keys (a fresh salt per entry)
+        legacy_verifier: Optional check (secret, legacy public key) -> bool using the
+                         old algorithm, to catch wrong secrets before migrating
+
+    Returns:
+        Iterator[MigrationReport]: One report per job
+    """
+    own_executor = executor is None
+    executor = executor or DerivationExecutor()
+    order: Deque[_Job] = deque()
+    pending: Deque[Tuple[_Job, int, str, Record, Optional[KdfParams]]] = deque()
+
+    def tasks():
+        for source, destination in jobs:
+            job = _Job(source, destination)
+            order.append(job)
+            report = job.report
+            try:
+                with open(source, 'r') as f:
+                    for key, value, line in iter_object_items(f):
+                        problem = _check_legacy(value)
+                        description = value.get("description", value.get("login")) if isinstance(value, dict) else None
+                        if problem is not None:
+                            report.fail(line, key, description, *problem)
+                            continue
+                        try:
+                            secret = secret_provider(source, value)
+                        except Exception as e:
+                            report.fail(line, key, description, "provider_error", f"Secret provider failed: {e}")
+                            continue
+                        if secret is None:
+                            report.skipped += 1
+                            continue
+                        if legacy_verifier is not None and not legacy_verifier(secret, key):
+                            report.fail(line, key, description, "secret_mismatch",
+                                        "Secret does not match the legacy public key")
+                            continue
+                        entry_kdf = kdf.with_new_salt() if kdf is not None else None
+                        pending.append((job, line, key, value, entry_kdf))
+                        job.submitted += 1
+                        yield secret, entry_kdf
+            except (OSError, JsonStreamError) as e:
+                job.broken = True
+                report.fail(getattr(e, 'line', 0), None, None, "unreadable", f"Cannot read legacy store: {e}")
+            job.read = True
+
+    def completed() -> Iterator[MigrationReport]:
+        while order and order[0].read and order[0].received == order[0].submitted:
+            job = order.popleft()
+            _commit(job)
+            yield job.report
+
+    try:
+        for public_key, error in executor.starmap(derive_v4_key, tasks()):
+            job, line, key, value, entry_kdf = pending.popleft()
+            job.received += 1
+            description = value.get("description", value.get("login"))
+            if error is not None:
+                job.report.fail(line, key, description, "invalid_secret", error)
+            elif public_key in job.puts:
+                job.report.fail(line, key, description, "duplicate_key",
+                                "Another entry of this store has the same secret")
+            else:
+                job.puts[public_key] = SmartPassword(public_key, description, value["length"], entry_kdf)
+            yield from completed()
+        yield from completed()
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+
+def _commit(job: _Job) -> None:
+    """
+    Write a migrated store in one batch.
+
+    Nothing is written if the source was unreadable. A destination path is
+    opened with the backend matching its format; an encrypted or corrupt
+    destination is reported as a failure and left as it is.
+    """
+    report = job.report
+    if job.broken:
+        return
+    for password in job.puts.values():
+        password.touch()
+    destination = report.destination
+    if isinstance(destination, (str, os.PathLike)):
+        if EncryptedFileStorage.detect(destination):
+            report.fail(0, None, None, "destination_unreadable",
+                        f"{os.fspath(destination)} is an encrypted store; pass a SmartPasswordManager instead")
+            return
+        storage_class = CompressedFileStorage if CompressedFileStorage.detect(destination) else JsonFileStorage
+        storage = storage_class(destination)
+        try:
+            storage.reload()
+        except (OSError, ValueError) as e:
+            report.fail(0, None, None, "destination_unreadable", f"Cannot read destination store: {e}")
+            return
+        storage.apply_batch(puts=job.puts.values())
+    else:
+        destination._commit_batch(list(job.puts.values()), [])
+    report.migrated = len(job.puts)
+    report.written = True
+
+
+def migrate_store(source: str, destination: Union[str, Any], secret_provider: Callable[[Record], Optional[str]],
+                  executor: Optional[DerivationExecutor] = None, kdf: Optional[KdfParams] = None,
+                  legacy_verifier: Optional[LegacyVerifier] = None) -> MigrationReport:
+    """
+    Migrate one legacy (v1-v3) store to v4.
+
+    Args:
+        source: Legacy passwords.json
+        destination: New store path (JSON or compressed) or SmartPasswordManager
+        secret_provider: Returns the secret for a legacy record, or None to skip it
+        executor: Derivation executor (default: a new one for this migration)
+        kdf: KDF parameters for memory-hard public keys
+        legacy_verifier: Optional (secret, legacy public key) -> bool check
+
+    Returns:
+        MigrationReport: Migrated, skipped and failed entries
+    """
+    reports = migrate_stores([(source, destination)], lambda _, record: secret_provider(record),
+                             executor=executor, kdf=kdf, legacy_verifier=legacy_verifier)
+    return list(reports)[0]
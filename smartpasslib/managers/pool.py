@@ -0,0 +1,269 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from smartpasslib.managers.rotation import RotationResult
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.utils.parallel import DerivationExecutor
+
+# Rough resident size of an open store, used for the memory budget
+STORE_BYTES = 16 * 1024
+RECORD_BYTES = 640
+
+
+class _Slot:
+    """One open (or opening) tenant store."""
+
+    def __init__(self, max_concurrency: int):
+        self.manager: Optional[SmartPasswordManager] = None
+        self.error: Optional[BaseException] = None
+        self.ready = threading.Event()
+        self.gate = threading.BoundedSemaphore(max_concurrency)
+        self.pins = 0
+        self.size = STORE_BYTES
+        self.last_used = time.monotonic()
+
+
+class StorePool:
+    """
+    Open SmartPasswordManager stores for many tenants.
+
+    Managers are kept open in least-recently-used order and reused across
+    requests, so a hot tenant's store is parsed once rather than per
+    request. When the estimated memory of the open stores exceeds the
+    budget, or a store has been idle longer than idle_timeout, the least
+    recently used stores that are not in use are flushed and closed.
+
+    Each tenant admits at most max_concurrency sessions at a time, so one
+    busy tenant cannot occupy every request thread; all tenants share one
+    DerivationExecutor for bulk derivation work.
+    """
+
+    def __init__(self, root: Optional[str] = None,
+                 factory: Optional[Callable[[str], SmartPasswordManager]] = None,
+                 memory_budget: int = 256 * 1024 * 1024, max_stores: Optional[int] = None,
+                 idle_timeout: Optional[float] = None, max_concurrency: int = 4,
+                 acquire_timeout: Optional[float] = None, executor: Optional[DerivationExecutor] = None):
+        """
+        Initialize pool.
+
+        Args:
+            root: Directory holding one <tenant>.json store per tenant
+            factory: Function opening a tenant's manager (used instead of root)
+            memory_budget: Estimated bytes of open stores to keep before evicting
+            max_stores: Maximum open stores (default: limited by memory only)
+            idle_timeout: Close stores unused for this many seconds
+            max_concurrency: Concurrent sessions per tenant
+            acquire_timeout: Seconds to wait for a tenant session slot (default: wait forever)
+            executor: Shared derivation executor (default: one created on first use)
+
+        Raises:
+            ValueError: If neither root nor factory is given, or a limit is invalid
+        """
+        if (root is None) == (factory is None):
+            raise ValueError("Specify either root or factory")
+        if memory_budget < 1:
+            raise ValueError("Memory budget must be positive")
+        if max_stores is not None and max_stores < 1:
+            raise ValueError("Max stores must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+        self.root = root
+        self._factory = factory or self._open_file
+        self.memory_budget = memory_budget
+        self.max_stores = max_stores
+        self.idle_timeout = idle_timeout
+        self.max_concurrency = max_concurrency
+        self.acquire_timeout = acquire_timeout
+        self._executor = executor
+        self._own_executor = executor is None
+        self._slots: 'OrderedDict[str, _Slot]' = OrderedDict()
+        self._closing: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _open_file(self, tenant: str) -> SmartPasswordManager:
+        if not tenant or tenant in ('.', '..') or os.sep in tenant or (os.altsep and os.altsep in tenant):
+            raise ValueError(f"Invalid tenant id: {tenant!r}")
+        return SmartPasswordManager(filename=os.path.join(self.root, tenant + '.json'))
+
+    @property
+    def executor(self) -> DerivationExecutor:
+        """Derivation executor shared by all tenants."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = DerivationExecutor()
+            return self._executor
+
+    @property
+    def memory(self) -> int:
+        """Estimated bytes held by open stores."""
+        return self._memory
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, tenant: str) -> bool:
+        return tenant in self._slots
+
+    def stats(self) -> Dict[str, int]:
+        """Open stores, estimated memory, cache hits and misses, evictions."""
+        return {"stores": len(self._slots), "memory": self._memory, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+    @contextmanager
+    def session(self, tenant: str) -> Iterator[SmartPasswordManager]:
+        """
+        Use a tenant's manager.
+
+        The store is opened on first use and kept open afterwards; it is not
+        evicted while a session is active.
+
+        Args:
+            tenant: Tenant id
+
+        Returns:
+            Iterator[SmartPasswordManager]: Context manager yielding the tenant's manager
+
+        Raises:
+            TimeoutError: If the tenant stays at its concurrency limit for acquire_timeout
+        """
+        with self._lock:
+            slot = self._slots.get(tenant)
+            opener = slot is None
+            if opener:
+                slot = self._slots[tenant] = _Slot(self.max_concurrency)
+                self._memory += slot.size
+                self.misses += 1
+            else:
+                self._slots.move_to_end(tenant)
+                self.hits += 1
+            slot.pins += 1
+            closing = self._closing.get(tenant)
+        try:
+            if opener:
+                self._open(tenant, slot, closing)
+            if not slot.gate.acquire(timeout=self.acquire_timeout):
+                raise TimeoutError(f"Tenant {tenant} is at its concurrency limit ({self.max_concurrency})")
+            try:
+                slot.ready.wait()
+                if slot.error is not None:
+                    raise slot.error
+                yield slot.manager
+            finally:
+                slot.gate.release()
+        finally:
+            self._release(tenant, slot)
+
+    def _open(self, tenant: str, slot: _Slot, closing: Optional[threading.Event]) -> None:
+        """Open a tenant's store outside the pool lock (after a pending close of the same store)."""
+        try:
+            if closing is not None:
+                closing.wait()
+            slot.manager = self._factory(tenant)
+        except BaseException as e:
+            slot.error = e
+            with self._lock:
+                if self._slots.get(tenant) is slot:
+                    del self._slots[tenant]
+                    self._memory -= slot.size
+            raise
+        finally:
+            slot.ready.set()
+
+    def _release(self, tenant: str, slot: _Slot) -> None:
+        with self._lock:
+            slot.pins -= 1
+            slot.last_used = time.monotonic()
+            if slot.manager is not None and self._slots.get(tenant) is slot:
+                size = STORE_BYTES + RECORD_BYTES * slot.manager.password_count
+                self._memory += size - slot.size
+                slot.size = size
+            evicted = self._select_evictions()
+        self._close(evicted)
+
+    def _select_evictions(self) -> List[tuple]:
+        """Remove least recently used idle slots over the limits (called with the lock held)."""
+        evicted = []
+        now = time.monotonic()
+        for tenant, slot in list(self._slots.items()):
+            over = self._memory > self.memory_budget or (
+                self.max_stores is not None and len(self._slots) > self.max_stores
+            )
+            idle = self.idle_timeout is not None and now - slot.last_used >= self.idle_timeout
+            if not over and not idle:
+                break
+            if slot.pins or slot.manager is None:
+                continue
+            del self._slots[tenant]
+            self._memory -= slot.size
+            self._closing[tenant] = threading.Event()
+            evicted.append((tenant, slot))
+        self.evictions += len(evicted)
+        return evicted
+
+    def _close(self, evicted: List[tuple]) -> None:
+        """Flush and close evicted stores outside the pool lock."""
+        for tenant, slot in evicted:
+            try:
+                slot.manager.close()
+            finally:
+                with self._lock:
+                    self._closing.pop(tenant).set()
+
+    def evict_idle(self) -> int:
+        """
+        Close stores over the limits or idle longer than idle_timeout.
+
+        Eviction also runs after every session; call this periodically to
+        release stores of tenants that stopped sending requests.
+
+        Returns:
+            int: Number of stores closed
+        """
+        with self._lock:
+            evicted = self._select_evictions()
+        self._close(evicted)
+        return len(evicted)
+
+    def rotate(self, tenant: str, selector, **kwargs) -> List[RotationResult]:
+        """
+        Rotate a tenant's entries on the shared executor.
+
+        Args:
+            tenant: Tenant id
+            selector: Predicate choosing entries to rotate
+            **kwargs: Further SmartPasswordManager.rotate() arguments
+
+        Returns:
+            List[RotationResult]: One result per matching entry
+        """
+        with self.session(tenant) as manager:
+            return list(manager.rotate(selector, executor=self.executor, **kwargs))
+
+    def close(self) -> None:
+        """Flush and close every idle store and stop the shared executor if the pool created it."""
+        with self._lock:
+            evicted = [(tenant, slot) for tenant, slot in self._slots.items()
+                       if not slot.pins and slot.manager is not None]
+            for tenant, slot in evicted:
+                del self._slots[tenant]
+                self._memory -= slot.size
+                self._closing[tenant] = threading.Event()
+        self._close(evicted)
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'StorePool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
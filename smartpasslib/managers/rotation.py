@@ -0,0 +1,63 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from typing import NamedTuple, Optional, Tuple, Union
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.generators.smart import SmartPasswordGenerator
+
+SecretSpec = Union[str, Tuple[str, str]]
+
+
+class RotationResult(NamedTuple):
+    """
+    Outcome of rotating one smart password entry.
+
+    Attributes:
+        public_key: Public key of the entry before rotation
+        new_public_key: Public key after rotation (same unless the secret changed)
+        description: Entry description
+        old_length: Password length before rotation
+        length: Password length after rotation
+        password: Newly derived smart password (None on failure)
+        error: Failure reason (None on success)
+    """
+
+    public_key: str
+    new_public_key: Optional[str]
+    description: str
+    old_length: int
+    length: int
+    password: Optional[str]
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        """True if the entry was verified and rotated."""
+        return self.error is None
+
+
+def rotate_entry(secret: str, public_key: str, kdf: Optional[KdfParams], new_secret: Optional[str],
+                 new_kdf: Optional[KdfParams], length: int) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Verify and rotate one entry (runs in a worker process).
+
+    Args:
+        secret: Current secret phrase
+        public_key: Stored public key
+        kdf: KDF parameters stored with the entry
+        new_secret: Replacement secret phrase (None keeps the current one)
+        new_kdf: KDF parameters for the new public key
+        length: New password length
+
+    Returns:
+        Tuple[Optional[str], Optional[str], Optional[str]]: New public key, new password, error
+    """
+    try:
+        if not SmartKeyGenerator.check_key(secret, public_key, kdf=kdf):
+            return None, None, "Secret does not match public key"
+        if new_secret is None:
+            return public_key, SmartPasswordGenerator.generate(secret, length), None
+        new_public_key = SmartKeyGenerator.generate_public_key(new_secret, kdf=new_kdf)
+        return new_public_key, SmartPasswordGenerator.generate(new_secret, length), None
+    except ValueError as e:
+        return None, None, str(e)
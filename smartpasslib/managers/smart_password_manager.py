@@ -1,11 +1,25 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-import json
-import os
-from typing import Dict, Optional, Union
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.managers.audit import AuditReport, audit_store
+from smartpasslib.managers.events import (
+    ADDED, CLEARED, DELETED, EXTERNAL, LOCAL, RELOADED, UPDATED,
+    ChangeEvent, EventFeed, Subscriber, Subscription, diff_records,
+)
+from smartpasslib.managers.index import ORDERS, EntryIndex, EntryStats
+from smartpasslib.managers.rotation import RotationResult, SecretSpec, rotate_entry
+from smartpasslib.managers.watcher import StoreWatcher
 from smartpasslib.masters.smart_password_master import SmartPasswordMaster
 from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.base import StorageBackend
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.storage.encrypted import EncryptedFileStorage
+from smartpasslib.storage.json_file import JsonFileStorage
+from smartpasslib.utils.parallel import DerivationExecutor
 
 
 class SmartPasswordManager:
@@ -29,15 +43,19 @@ class SmartPasswordManager:
         if length > 100:
             raise ValueError("Password length cannot exceed 100 characters")
 
-    def __init__(self, filename: Optional[Union[str, Path]] = None):
+    def __init__(self, filename: Optional[Union[str, Path]] = None, storage: Optional[StorageBackend] = None):
         """
-        Initialize manager with storage file.
+        Initialize manager with storage file or storage backend.
 
         Args:
             filename: Path to JSON storage file.
                      If None, uses: ~/.config/smart_password_manager/passwords.json
+            storage: Storage backend to delegate persistence to.
+                     If given, filename is ignored.
         """
-        if filename is None:
+        if storage is not None:
+            self.filename = storage.path
+        elif filename is None:
             home = Path.home()
             config_dir = home / '.config' / 'smart_password_manager'
             config_dir.mkdir(parents=True, exist_ok=True)
@@ -55,6 +73,10 @@ class SmartPasswordManager:
         else:
             self.filename = str(Path(filename).expanduser())
 
+        self._storage = storage if storage is not None else JsonFileStorage(self.filename)
+        self._events = EventFeed()
+        self._lock = threading.RLock()
+        self._index: Optional[EntryIndex] = None
         self.smart_passwords = self._load_data()
 
     @property
@@ -67,6 +89,11 @@ class SmartPasswordManager:
         """Get the current configuration file path."""
         return self.filename
 
+    @property
+    def storage(self) -> StorageBackend:
+        """Get the configured storage backend."""
+        return self._storage
+
     @staticmethod
     def generate_base_password(length: int = 12) -> str:
         """Generate random base password."""
@@ -81,21 +108,60 @@ class SmartPasswordManager:
         return SmartPasswordMaster.generate_smart_password(secret, length)
 
     @classmethod
-    def generate_public_key(cls, secret: str) -> str:
-        """Generate public verification key from secret."""
+    def generate_public_key(cls, secret: str, kdf: Optional[KdfParams] = None) -> str:
+        """Generate public verification key from secret, optionally with a memory-hard KDF."""
         cls._validate_secret(secret)
-        return SmartPasswordMaster.generate_public_key(secret)
+        return SmartPasswordMaster.generate_public_key(secret, kdf=kdf)
 
     @classmethod
-    def check_public_key(cls, secret: str, public_key: str) -> bool:
+    def check_public_key(cls, secret: str, public_key: str, kdf: Optional[KdfParams] = None) -> bool:
         """Verify if public key matches secret phrase."""
         cls._validate_secret(secret)
-        return SmartPasswordMaster.check_public_key(secret, public_key)
+        return SmartPasswordMaster.check_public_key(secret, public_key, kdf=kdf)
+
+    def verify_secret(self, public_key: str, secret: str) -> bool:
+        """Verify a secret against a stored entry, using the KDF parameters stored with it."""
+        self._validate_secret(secret)
+        password = self.get_smart_password(public_key)
+        if password is None:
+            return False
+        return SmartPasswordMaster.check_public_key(secret, public_key, kdf=password.kdf)
+
+    def subscribe(self, callback: Subscriber, types: Optional[Iterable[str]] = None) -> Subscription:
+        """
+        Subscribe to metadata changes.
+
+        The callback receives a ChangeEvent after each change is stored:
+        "added", "updated" and "deleted" carry snapshots of the entry before
+        and after; clear() emits "deleted" for every entry, then "cleared";
+        reload() and watch() emit the record events found on disk, then "reloaded".
+
+        Args:
+            callback: Function called with each ChangeEvent
+            types: Event types to deliver (default: all)
+
+        Returns:
+            Subscription: Handle with unsubscribe()
+        """
+        return self._events.subscribe(callback, types)
+
+    def _emit(self, event_type: str, public_key: Optional[str], old: Optional[SmartPassword],
+              new: Optional[SmartPassword], origin: str = LOCAL) -> None:
+        """Emit a change event with snapshots of mutable entries."""
+        if self._events:
+            self._events.emit(ChangeEvent(
+                event_type, public_key, old and old.copy(), new and new.copy(), origin
+            ))
 
     def add_smart_password(self, smart_password: SmartPassword):
         """Add smart password metadata to storage."""
-        self.smart_passwords[smart_password.public_key] = smart_password
-        self._write_data()
+        with self._lock:
+            previous = self.smart_passwords.get(smart_password.public_key)
+            smart_password.touch(base_version=previous.version if previous is not None else 0)
+            self.smart_passwords[smart_password.public_key] = smart_password
+            self._storage.put(smart_password)
+            self._index_put(smart_password)
+            self._emit(ADDED if previous is None else UPDATED, smart_password.public_key, previous, smart_password)
 
     def get_smart_password(self, public_key: str) -> Optional[SmartPassword]:
         """Retrieve smart password metadata by public key."""
@@ -110,51 +176,325 @@ class SmartPasswordManager:
         if length is not None:
             self._validate_password_length(length)
 
-        password.update(description=description, length=length)
-        self._write_data()
+        with self._lock:
+            old = password.copy()
+            password.update(description=description, length=length)
+            changed = old.to_dict() != password.to_dict()
+            if changed:
+                password.touch()
+            self._storage.put(password)
+            if changed:
+                self._index_put(password)
+                self._emit(UPDATED, public_key, old, password)
         return True
 
     def delete_smart_password(self, public_key: str):
         """Delete smart password metadata by public key."""
-        if public_key in self.smart_passwords:
-            del self.smart_passwords[public_key]
-            self._write_data()
-        else:
-            raise KeyError(f"Public key not found: {public_key}")
+        with self._lock:
+            if public_key in self.smart_passwords:
+                old = self.smart_passwords.pop(public_key)
+                self._storage.delete(public_key)
+                self._index_remove(public_key)
+                self._emit(DELETED, public_key, old, None)
+            else:
+                raise KeyError(f"Public key not found: {public_key}")
 
     def clear(self):
         """Clear all stored password metadata."""
-        self.smart_passwords = {}
-        self._write_data()
+        with self._lock:
+            old = self.smart_passwords
+            self.smart_passwords = {}
+            self._storage.clear()
+            self._index = None
+            for public_key, password in old.items():
+                self._emit(DELETED, public_key, password, None)
+            self._emit(CLEARED, None, None, None)
+
+    def reload(self) -> int:
+        """
+        Re-read the store from the storage backend.
+
+        Differences from the in-memory state are emitted as "external"
+        record events followed by one "reloaded" event; nothing is emitted
+        when the store is unchanged.
+
+        Returns:
+            int: Number of entries added, updated or deleted
+
+        Raises:
+            ValueError: If the store cannot be parsed (for example while another
+                        process is writing it); in-memory state is kept
+            OSError: If the store cannot be read
+        """
+        with self._lock:
+            new = self._storage.reload()
+            events = list(diff_records(self.smart_passwords, new))
+            self.smart_passwords = new
+            for event in events:
+                if event.type == DELETED:
+                    self._index_remove(event.public_key)
+                else:
+                    self._index_put(new[event.public_key])
+            if events and self._events:
+                for event in events:
+                    self._events.emit(event)
+                self._events.emit(ChangeEvent(RELOADED, None, None, None, EXTERNAL))
+            return len(events)
+
+    def watch(self, interval: float = 1.0, use_inotify: bool = True) -> 'StoreWatcher':
+        """
+        Start watching the store files for external changes.
+
+        Changes made by other processes are picked up with reload(), so
+        subscribers receive only the differences. Events are delivered on
+        the watcher thread.
+
+        Args:
+            interval: Polling interval in seconds (also the inotify wake-up period)
+            use_inotify: Use Linux inotify when available, polling otherwise
+
+        Returns:
+            StoreWatcher: Running watcher; call stop() or use it as a context manager
+
+        Raises:
+            ValueError: If the storage backend has no files
+        """
+        if self._storage.path is None:
+            raise ValueError("Storage backend has no files to watch")
+        return StoreWatcher(self, interval=interval, use_inotify=use_inotify).start()
+
+    def rotate(self, selector: Callable[[SmartPassword], bool], *, new_length: Optional[int] = None,
+               secret_provider: Callable[[SmartPassword], SecretSpec],
+               executor: Optional[DerivationExecutor] = None) -> Iterator[RotationResult]:
+        """
+        Rotate all entries matching a selector.
+
+        Matching entries are streamed to the derivation executor, each secret
+        is verified against the stored public key and the new password is
+        derived in parallel. Results are yielded lazily in store order; all
+        metadata changes are committed in one batched write once the
+        iterator is exhausted or closed.
+
+        Args:
+            selector: Predicate choosing entries to rotate
+            new_length: New password length (default: keep each entry's length)
+            secret_provider: Returns the entry's secret, or a (current, new) tuple to change the secret
+            executor: Shared derivation executor (default: a new one for this rotation)
+
+        Returns:
+            Iterator[RotationResult]: One result per matching entry
+
+        Raises:
+            ValueError: If new_length is less than 12 or greater than 100
+        """
+        if new_length is not None:
+            self._validate_password_length(new_length)
+        return self._rotate(selector, new_length, secret_provider, executor)
+
+    def _rotate(self, selector, new_length, secret_provider, executor) -> Iterator[RotationResult]:
+        """Rotation pipeline behind rotate()."""
+        own_executor = executor is None
+        executor = executor or DerivationExecutor()
+        pending = deque()
+
+        def tasks():
+            for password in list(self.smart_passwords.values()):
+                if not selector(password):
+                    continue
+                spec = secret_provider(password)
+                secret, new_secret = spec if isinstance(spec, tuple) else (spec, None)
+                new_kdf = password.kdf.with_new_salt() if new_secret is not None and password.kdf else None
+                length = new_length if new_length is not None else password.length
+                pending.append((password, new_kdf, length))
+                yield secret, password.public_key, password.kdf, new_secret, new_kdf, length
+
+        puts: List[SmartPassword] = []
+        deletes: List[str] = []
+        claimed = set()
+        try:
+            for new_public_key, new_password, error in executor.starmap(rotate_entry, tasks()):
+                password, new_kdf, length = pending.popleft()
+                if error is None and new_public_key != password.public_key and (
+                        new_public_key in claimed
+                        or (new_public_key in self.smart_passwords and new_public_key not in deletes)):
+                    # the new secret belongs to another entry; replacing it would lose that entry
+                    new_public_key, new_password, error = None, None, "New public key is already used by another entry"
+                if error is None:
+                    claimed.add(new_public_key)
+                    if new_public_key == password.public_key:
+                        rotated = SmartPassword(password.public_key, password.description, length, password.kdf)
+                        rotated.touch(base_version=password.version)
+                    else:
+                        rotated = SmartPassword(new_public_key, password.description, length, new_kdf)
+                        rotated.touch()
+                        deletes.append(password.public_key)
+                    puts.append(rotated)
+                yield RotationResult(
+                    public_key=password.public_key,
+                    new_public_key=new_public_key,
+                    description=password.description,
+                    old_length=password.length,
+                    length=length,
+                    password=new_password,
+                    error=error,
+                )
+        finally:
+            if own_executor:
+                executor.shutdown()
+            if puts or deletes:
+                self._commit_batch(puts, deletes)
+
+    def _commit_batch(self, puts: List[SmartPassword], deletes: List[str], origin: str = LOCAL) -> None:
+        """Apply a batch of metadata changes in memory and in one storage write."""
+        with self._lock:
+            removed = [(key, self.smart_passwords.pop(key, None)) for key in deletes]
+            replaced = [(password, self.smart_passwords.get(password.public_key)) for password in puts]
+            for password in puts:
+                self.smart_passwords[password.public_key] = password
+            self._storage.apply_batch(puts=puts, deletes=deletes)
+            for public_key in deletes:
+                self._index_remove(public_key)
+            for password in puts:
+                self._index_put(password)
+            for public_key, old in removed:
+                if old is not None:
+                    self._emit(DELETED, public_key, old, None, origin)
+            for password, old in replaced:
+                self._emit(ADDED if old is None else UPDATED, password.public_key, old, password, origin)
+
+    def _index_put(self, smart_password: SmartPassword) -> None:
+        if self._index is not None:
+            self._index.put(smart_password)
+
+    def _index_remove(self, public_key: str) -> None:
+        if self._index is not None:
+            self._index.remove(public_key)
+
+    def _get_index(self) -> EntryIndex:
+        """Build the ordered indexes on first use (called with the lock held)."""
+        if self._index is None:
+            self._index = EntryIndex(self.smart_passwords.values())
+        return self._index
+
+    def iter_entries(self, order_by: str = "description", cursor: Optional[str] = None,
+                     limit: Optional[int] = None, descending: bool = False) -> Iterator[Tuple[str, SmartPassword]]:
+        """
+        Iterate over entries in description or length order, one page at a time.
+
+        Entries come from ordered indexes that are built on first use and
+        then kept up to date by every mutation, so a page costs
+        O(log n + limit) however large the store is. Descriptions compare
+        case-insensitively; length order breaks ties by description.
+
+        Each entry comes with a cursor; pass the last one back to continue
+        after it. Cursors stay valid when entries are added or deleted in
+        between, so concurrent changes do not shift or repeat a page.
+
+        Args:
+            order_by: "description" or "length"
+            cursor: Cursor of the last entry already seen (None to start at the beginning)
+            limit: Maximum number of entries (default: all remaining)
+            descending: Iterate in reverse order
+
+        Returns:
+            Iterator[Tuple[str, SmartPassword]]: (cursor, entry) pairs
+
+        Raises:
+            ValueError: If order_by, cursor or limit is invalid
+        """
+        if order_by not in ORDERS:
+            raise ValueError(f"Unknown order: {order_by}")
+        if limit is not None and limit < 0:
+            raise ValueError("Limit cannot be negative")
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = 256 if remaining is None else min(remaining, 256)
+            with self._lock:
+                page = [(entry_cursor, self.smart_passwords[public_key]) for entry_cursor, public_key
+                        in self._get_index().page(order_by, cursor, size, descending)]
+            yield from page
+            if len(page) < size:
+                return
+            cursor = page[-1][0]
+            if remaining is not None:
+                remaining -= len(page)
+
+    def entry_stats(self, bucket: int = 1) -> EntryStats:
+        """
+        Count entries in total and by password length.
+
+        The counts are maintained by every mutation, so this does not
+        visit the entries.
+
+        Args:
+            bucket: Length bucket width (e.g. 10 groups 12-19, 20-29, ...)
+
+        Returns:
+            EntryStats: Total and per-bucket counts
+
+        Raises:
+            ValueError: If bucket is less than 1
+        """
+        if bucket < 1:
+            raise ValueError("Bucket width must be at least 1")
+        with self._lock:
+            return self._get_index().stats(bucket)
+
+    def audit(self, report_path: Optional[str] = None, executor: Optional[DerivationExecutor] = None,
+              max_issues: int = 1000) -> AuditReport:
+        """
+        Audit the on-disk store record by record.
+
+        Buffered changes are flushed first, then the store files are streamed
+        and validated without loading them (see audit_store).
+
+        Args:
+            report_path: Write an NDJSON report here
+            executor: Validation executor (default: one worker per CPU)
+            max_issues: Issues kept in the returned report
+
+        Returns:
+            AuditReport: Audit result
+
+        Raises:
+            ValueError: If the storage backend has no files
+        """
+        if self._storage.path is None:
+            raise ValueError("Storage backend has no files to audit")
+        self._storage.flush()
+        return audit_store(self._storage.path, report_path=report_path, executor=executor, max_issues=max_issues,
+                           storage=self._storage)
 
     @property
     def password_count(self) -> int:
         """Get number of stored password metadata entries."""
         return len(self.smart_passwords)
 
+    def flush(self):
+        """Write any changes buffered by the storage backend."""
+        self._storage.flush()
+
+    def close(self):
+        """Flush and release the storage backend."""
+        self._storage.close()
+
     def _load_data(self) -> Dict[str, SmartPassword]:
-        """Load passwords metadata from storage file."""
-        if os.path.isfile(self.filename):
-            try:
-                with open(self.filename, 'r') as f:
-                    data = json.load(f)
-                    return {public_key: SmartPassword.from_dict(item) for public_key, item in data.items()}
-            except (json.JSONDecodeError, IOError) as e:
-                import warnings
-                warnings.warn(f"Failed to load passwords from {self.filename}: {e}")
-                return {}
-        return {}
+        """
+        Load passwords metadata from the storage backend (a compressed store file is detected).
+
+        Raises:
+            ValueError: If the file is an encrypted store, which needs a storage with its passphrase
+        """
+        if type(self._storage) is JsonFileStorage:
+            if CompressedFileStorage.detect(self.filename):
+                self._storage = CompressedFileStorage(self.filename)
+            elif EncryptedFileStorage.detect(self.filename):
+                raise ValueError(f"{self.filename} is an encrypted store; open it with "
+                                 f"SmartPasswordManager(storage=EncryptedFileStorage(path, passphrase))")
+        return self._storage.load()
 
     def _write_data(self):
-        """Write passwords metadata to storage file."""
-        Path(self.filename).parent.mkdir(parents=True, exist_ok=True)
-        try:
-            with open(self.filename, 'w') as f:
-                json.dump(
-                    {public_key: sp.to_dict() for public_key, sp in self.smart_passwords.items()},
-                    f,
-                    indent=4
-                )
-        except IOError as e:
-            import warnings
-            warnings.warn(f"Failed to save passwords to {self.filename}: {e}")
+        """Write all passwords metadata to the storage backend."""
+        with self._lock:
+            self._index = None  # the mapping may have been changed directly
+            self._storage.save(self.smart_passwords)
@@ -0,0 +1,182 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import warnings
+from typing import Optional, Tuple
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Completed writes, atomic replaces and removals; IN_MODIFY would fire mid-write
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class _Inotify:
+    """Minimal ctypes binding for one inotify directory watch."""
+
+    def __init__(self, directory: str):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def read_names(self):
+        """Read pending events and return the file names they refer to."""
+        names = set()
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return names
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                names.add(os.fsdecode(data[offset:offset + length].rstrip(b'\0')))
+                offset += length
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class StoreWatcher:
+    """
+    Background watcher that reloads a manager when its store changes on disk.
+
+    Uses Linux inotify on the store directory when available and falls back
+    to polling file signatures (inode, size, mtime). Every detected change
+    calls manager.reload(), which emits only the records that differ from
+    memory, so the manager's own writes produce no events.
+    """
+
+    def __init__(self, manager, interval: float = 1.0, use_inotify: bool = True, debounce: float = 0.05):
+        """
+        Initialize watcher.
+
+        Args:
+            manager: SmartPasswordManager to reload
+            interval: Polling interval in seconds (also the inotify wake-up period)
+            use_inotify: Use inotify when available
+            debounce: Delay after a change event so bursts of writes trigger one reload
+
+        Raises:
+            ValueError: If interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError("Watch interval must be positive")
+        self.manager = manager
+        self.interval = interval
+        self.debounce = debounce
+        self.path = manager.storage.path
+        self.is_directory = os.path.isdir(self.path)
+        self._directory = self.path if self.is_directory else os.path.dirname(os.path.abspath(self.path))
+        self._inotify: Optional[_Inotify] = None
+        if use_inotify and sys.platform.startswith('linux') and os.path.isdir(self._directory):
+            try:
+                self._inotify = _Inotify(self._directory)
+            except (OSError, AttributeError):
+                self._inotify = None
+        self._signature = self.signature()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def mode(self) -> str:
+        """"inotify" or "polling"."""
+        return "inotify" if self._inotify is not None else "polling"
+
+    def signature(self) -> Tuple:
+        """Current (name, inode, size, mtime) signature of the store files."""
+        if self.is_directory:
+            try:
+                names = sorted(name for name in os.listdir(self.path) if name.endswith('.json'))
+            except OSError:
+                return ()
+            paths = [os.path.join(self.path, name) for name in names]
+        else:
+            paths = [self.path]
+        result = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            result.append((path, stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        return tuple(result)
+
+    def _relevant(self, name: str) -> bool:
+        if self.is_directory:
+            return name.endswith('.json')
+        return name == os.path.basename(self.path)
+
+    def check(self, force: bool = False) -> int:
+        """
+        Check the store once and reload it if its files changed.
+
+        Args:
+            force: Reload even if the file signatures look unchanged
+                   (writes within one timestamp tick keep the same mtime)
+
+        Returns:
+            int: Number of entries that changed
+        """
+        signature = self.signature()
+        if signature == self._signature and not force:
+            return 0
+        changed = self.manager.reload()
+        self._signature = signature
+        return changed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self._inotify is None:
+                    if not self._stop.wait(self.interval):
+                        self.check()
+                    continue
+                readable, _, _ = select.select([self._inotify.fd], [], [], self.interval)
+                if not readable or not any(map(self._relevant, self._inotify.read_names())):
+                    continue
+                if not self._stop.wait(self.debounce):
+                    self._inotify.read_names()
+                    self.check(force=True)
+            except Exception as e:
+                warnings.warn(f"Store watcher failed to reload {self.path}: {e}")
+
+    def start(self) -> 'StoreWatcher':
+        """Start the watcher thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="smartpasslib-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release the inotify descriptor."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self) -> 'StoreWatcher':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
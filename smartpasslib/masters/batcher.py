@@ -0,0 +1,274 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.masters.smart_password_master import SmartPasswordMaster
+from smartpasslib.utils.metrics import percentile
+from smartpasslib.utils.parallel import THREAD, DerivationExecutor, gil_enabled
+
+CHECK_PUBLIC_KEY = "check_public_key"
+GENERATE_PUBLIC_KEY = "generate_public_key"
+GENERATE_SMART_PASSWORD = "generate_smart_password"
+OPERATIONS = (CHECK_PUBLIC_KEY, GENERATE_PUBLIC_KEY, GENERATE_SMART_PASSWORD)
+
+_STOP = object()
+
+
+def run_operation(operation: str, args: tuple) -> Any:
+    """
+    Run one batched SmartPasswordMaster call (runs in a worker).
+
+    Args:
+        operation: Method name, one of OPERATIONS
+        args: Positional arguments
+
+    Returns:
+        Any: Method result
+    """
+    return getattr(SmartPasswordMaster, operation)(*args)
+
+
+class _Request:
+    __slots__ = ('future', 'operation', 'args', 'queued', 'dispatched')
+
+    def __init__(self, operation: str, args: tuple):
+        self.future: Future = Future()
+        self.operation = operation
+        self.args = args
+        self.queued = time.perf_counter()
+        self.dispatched = 0.0
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent derivation calls into batches.
+
+    Calls from many threads or coroutines are queued. A dispatcher thread
+    takes the first waiting call, collects more for up to window seconds or
+    until max_batch calls are waiting, and sends them to the
+    DerivationExecutor as one batch; each caller's future is resolved with
+    its own result or exception. At most max_in_flight batches run at once,
+    so while the workers are busy new calls accumulate and the next batch
+    is taken as soon as a slot frees up: batches grow with load, and an idle
+    batcher adds at most one window of latency.
+
+    By default batches run inline in the batcher's own threads (in a
+    thread pool on free-threaded builds): without a kdf a derivation costs
+    tens of microseconds, less than shipping it to a worker process. Pass a
+    process-backed DerivationExecutor for memory-hard (kdf) keys.
+
+    Metrics (batch sizes, queue wait and end-to-end latency percentiles)
+    cover the last sample_size requests.
+    """
+
+    def __init__(self, executor: Optional[DerivationExecutor] = None, window: float = 0.001,
+                 max_batch: int = 256, max_in_flight: int = 2, sample_size: int = 10000):
+        """
+        Start a batcher.
+
+        Args:
+            executor: Derivation executor (default: inline, or threads without a GIL; shut down by close())
+            window: Seconds to wait for more calls after the first one of a batch
+            max_batch: Maximum calls per batch
+            max_in_flight: Batches running concurrently
+            sample_size: Recent requests kept for latency metrics
+
+        Raises:
+            ValueError: If a limit is invalid
+        """
+        if window < 0:
+            raise ValueError("Window cannot be negative")
+        if max_batch < 1:
+            raise ValueError("Max batch size must be at least 1")
+        if max_in_flight < 1:
+            raise ValueError("Max in-flight batches must be at least 1")
+        self.window = window
+        self.max_batch = max_batch
+        self.max_in_flight = max_in_flight
+        self._own_executor = executor is None
+        if executor is None:
+            executor = DerivationExecutor(workers=1) if gil_enabled() else DerivationExecutor(backend=THREAD)
+        self.executor = executor
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._runners = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="smartpasslib-batch")
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._requests = 0
+        self._batches = 0
+        self._errors = 0
+        self._batch_sizes: Deque[int] = deque(maxlen=sample_size)
+        self._waits: Deque[float] = deque(maxlen=sample_size)
+        self._latencies: Deque[float] = deque(maxlen=sample_size)
+        self._dispatcher = threading.Thread(target=self._dispatch, name="smartpasslib-batcher", daemon=True)
+        self._dispatcher.start()
+
+    # Submitting
+
+    def submit(self, operation: str, *args) -> Future:
+        """
+        Queue one SmartPasswordMaster call.
+
+        Args:
+            operation: "check_public_key", "generate_public_key" or "generate_smart_password"
+            *args: Arguments of the call
+
+        Returns:
+            Future: Resolved with the call's result or exception
+
+        Raises:
+            ValueError: If the operation is unknown
+            RuntimeError: If the batcher is closed
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}")
+        request = _Request(operation, args)
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("Batcher is closed")
+            self._queue.put(request)
+        return request.future
+
+    def check_public_key(self, secret: str, public_key: str, kdf: Optional[KdfParams] = None) -> bool:
+        """Batched SmartPasswordMaster.check_public_key (blocks until the batch completes)."""
+        return self.submit(CHECK_PUBLIC_KEY, secret, public_key, kdf).result()
+
+    def generate_public_key(self, secret: str, kdf: Optional[KdfParams] = None) -> str:
+        """Batched SmartPasswordMaster.generate_public_key."""
+        return self.submit(GENERATE_PUBLIC_KEY, secret, kdf).result()
+
+    def generate_smart_password(self, secret: str, length: int = 12) -> str:
+        """Batched SmartPasswordMaster.generate_smart_password."""
+        return self.submit(GENERATE_SMART_PASSWORD, secret, length).result()
+
+    async def check_public_key_async(self, secret: str, public_key: str, kdf: Optional[KdfParams] = None) -> bool:
+        """Batched check_public_key for asyncio callers (does not block the event loop)."""
+        return await asyncio.wrap_future(self.submit(CHECK_PUBLIC_KEY, secret, public_key, kdf))
+
+    async def generate_public_key_async(self, secret: str, kdf: Optional[KdfParams] = None) -> str:
+        """Batched generate_public_key for asyncio callers."""
+        return await asyncio.wrap_future(self.submit(GENERATE_PUBLIC_KEY, secret, kdf))
+
+    async def generate_smart_password_async(self, secret: str, length: int = 12) -> str:
+        """Batched generate_smart_password for asyncio callers."""
+        return await asyncio.wrap_future(self.submit(GENERATE_SMART_PASSWORD, secret, length))
+
+    # Dispatching
+
+    def _collect(self, first: _Request) -> Tuple[List[_Request], bool]:
+        """Gather a batch after its first request; also report whether close() was requested."""
+        batch = [first]
+        deadline = time.perf_counter() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is _STOP:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _dispatch(self) -> None:
+        stopping = False
+        while not stopping:
+            self._slots.acquire()
+            first = self._queue.get()
+            if first is _STOP:
+                self._slots.release()
+                break
+            batch, stopping = self._collect(first)
+            batch = [request for request in batch if request.future.set_running_or_notify_cancel()]
+            if not batch:
+                self._slots.release()
+                continue
+            now = time.perf_counter()
+            for request in batch:
+                request.dispatched = now
+            self._runners.submit(self._run, batch)
+        # drain calls queued before close()
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is not _STOP and request.future.set_running_or_notify_cancel():
+                request.dispatched = time.perf_counter()
+                self._slots.acquire()
+                self._runners.submit(self._run, [request])
+
+    def _run(self, batch: List[_Request]) -> None:
+        try:
+            try:
+                results = list(self.executor.starmap(
+                    run_operation, [(request.operation, request.args) for request in batch], return_exceptions=True
+                ))
+            except BaseException as e:
+                results = [e] * len(batch)
+        finally:
+            self._slots.release()
+        done = time.perf_counter()
+        errors = 0
+        for request, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                errors += 1
+                request.future.set_exception(result)
+            else:
+                request.future.set_result(result)
+        with self._metrics_lock:
+            self._requests += len(batch)
+            self._batches += 1
+            self._errors += errors
+            self._batch_sizes.append(len(batch))
+            for request in batch:
+                self._waits.append(request.dispatched - request.queued)
+                self._latencies.append(done - request.queued)
+
+    # Metrics and lifecycle
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Throughput and latency statistics.
+
+        Returns:
+            Dict[str, float]: Request, batch and error counts, mean and maximum batch size,
+                              and p50/p95/p99 queue wait and latency in milliseconds
+        """
+        with self._metrics_lock:
+            sizes = list(self._batch_sizes)
+            waits = sorted(self._waits)
+            latencies = sorted(self._latencies)
+            stats = {"requests": self._requests, "batches": self._batches, "errors": self._errors,
+                     "queued": self._queue.qsize()}
+        stats["mean_batch_size"] = sum(sizes) / len(sizes) if sizes else 0.0
+        stats["max_batch_size"] = max(sizes, default=0)
+        for name, values in (("wait", waits), ("latency", latencies)):
+            for fraction in (0.50, 0.95, 0.99):
+                stats[f"{name}_p{int(fraction * 100)}_ms"] = percentile(values, fraction) * 1000
+        return stats
+
+    def close(self) -> None:
+        """Finish queued calls, stop the dispatcher and shut down the executor if the batcher created it."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._dispatcher.join()
+        self._runners.shutdown(wait=True)
+        if self._own_executor:
+            self.executor.shutdown()
+
+    def __enter__(self) -> 'MicroBatcher':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -1,6 +1,9 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from typing import Optional
+
 from smartpasslib import CodeGenerator
 from smartpasslib.generators.base import BasePasswordGenerator
+from smartpasslib.generators.kdf import KdfParams
 from smartpasslib.generators.key import SmartKeyGenerator
 from smartpasslib.generators.smart import SmartPasswordGenerator
 from smartpasslib.generators.strong import StrongPasswordGenerator
@@ -65,17 +68,18 @@ class SmartPasswordMaster:
         return SmartPasswordGenerator.generate(secret, length=length)
 
     @classmethod
-    def generate_public_key(cls, secret: str) -> str:
+    def generate_public_key(cls, secret: str, kdf: Optional[KdfParams] = None) -> str:
         """
         Generate public verification key from secret.
 
         Args:
             secret: Secret phrase
+            kdf: Memory-hard KDF parameters (default: None, the cross-platform v4 chain)
 
         Returns:
             str: Public key for verification
         """
-        return SmartKeyGenerator.generate_public_key(secret=secret)
+        return SmartKeyGenerator.generate_public_key(secret=secret, kdf=kdf)
 
     @classmethod
     def generate_private_key(cls, secret: str) -> str:
@@ -91,15 +95,30 @@ class SmartPasswordMaster:
         return SmartKeyGenerator.generate_private_key(secret=secret)
 
     @classmethod
-    def check_public_key(cls, secret: str, public_key: str) -> bool:
+    def check_public_key(cls, secret: str, public_key: str, kdf: Optional[KdfParams] = None) -> bool:
         """
         Verify if public key matches secret phrase.
 
         Args:
             secret: Secret phrase to verify
             public_key: Public key to check
+            kdf: KDF parameters the key was derived with (None for the v4 chain)
 
         Returns:
             bool: True if key was generated from this secret
         """
-        return SmartKeyGenerator.check_key(secret, public_key)
+        return SmartKeyGenerator.check_key(secret, public_key, kdf=kdf)
+
+    @staticmethod
+    def calibrate_kdf(target_ms: float = 250.0, algorithm: Optional[str] = None) -> KdfParams:
+        """
+        Benchmark this host and pick KDF parameters for a target latency.
+
+        Args:
+            target_ms: Target public key derivation time in milliseconds
+            algorithm: "scrypt" or "pbkdf2-sha256" (default: scrypt if available)
+
+        Returns:
+            KdfParams: Calibrated parameters with a fresh salt
+        """
+        return KdfParams.calibrate(target_ms=target_ms, algorithm=algorithm)
@@ -1,5 +1,8 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-from typing import Dict
+import time
+from typing import Dict, Optional, Tuple
+
+from smartpasslib.generators.kdf import KdfParams
 
 
 class SmartPassword:
@@ -9,7 +12,8 @@ class SmartPassword:
     Stores only verification data, not actual passwords or secrets.
     """
 
-    def __init__(self, public_key: str, description: str, length: int = 12):
+    def __init__(self, public_key: str, description: str, length: int = 12, kdf: Optional[KdfParams] = None,
+                 version: int = 0, modified: Optional[float] = None):
         """
         Initialize smart password metadata.
 
@@ -17,6 +21,9 @@ class SmartPassword:
             public_key: Public verification key for secret phrase
             description: Service/account description
             length: Password length to generate (default: 12)
+            kdf: KDF parameters the public key was derived with (None for the v4 chain)
+            version: Number of times the entry was modified (0 for unversioned entries)
+            modified: Last modification time as a Unix timestamp (None if unknown)
 
         Raises:
             ValueError: If length is less than 12 or greater than 100
@@ -28,6 +35,10 @@ class SmartPassword:
         self._public_key = public_key
         self._description = description
         self._length = length
+        self._kdf = kdf
+        self._version = version
+        self._modified = modified
+        self._revision = 0
 
     @property
     def public_key(self) -> str:
@@ -59,6 +70,71 @@ class SmartPassword:
         """
         return self._length
 
+    @property
+    def kdf(self) -> Optional[KdfParams]:
+        """
+        Public key derivation parameters.
+
+        Returns:
+            Optional[KdfParams]: Memory-hard KDF parameters, or None for the v4 chain
+        """
+        return self._kdf
+
+    @property
+    def version(self) -> int:
+        """
+        Modification counter.
+
+        Returns:
+            int: Number of recorded modifications (0 for unversioned entries)
+        """
+        return self._version
+
+    @property
+    def modified(self) -> Optional[float]:
+        """
+        Last modification time.
+
+        Returns:
+            Optional[float]: Unix timestamp, or None if unknown
+        """
+        return self._modified
+
+    @property
+    def revision(self) -> int:
+        """
+        In-memory change counter.
+
+        Bumped by every update() and touch(), so serializers can tell whether
+        an encoding cached for this object is stale. Not stored.
+
+        Returns:
+            int: Number of in-place changes since the object was created
+        """
+        return self._revision
+
+    @property
+    def stamp(self) -> Tuple[float, int]:
+        """
+        Version stamp used to order concurrent edits (last writer wins).
+
+        Returns:
+            Tuple[float, int]: (modified, version), with 0.0 for unknown times
+        """
+        return (self._modified or 0.0, self._version)
+
+    def touch(self, modified: Optional[float] = None, base_version: int = 0) -> None:
+        """
+        Record a modification: bump the version and set the modification time.
+
+        Args:
+            modified: Unix timestamp (default: now)
+            base_version: Version of the entry this one replaces
+        """
+        self._version = max(self._version, base_version) + 1
+        self._modified = time.time() if modified is None else modified
+        self._revision += 1
+
     def update(self, description: str = None, length: int = None) -> None:
         """
         Update password metadata (description and/or length).
@@ -80,6 +156,19 @@ class SmartPassword:
                 raise ValueError("Password length cannot exceed 100 characters")
             self._length = length
 
+        if description is not None or length is not None:
+            self._revision += 1
+
+    def copy(self) -> 'SmartPassword':
+        """
+        Create an independent copy.
+
+        Returns:
+            SmartPassword: Copy that is not affected by later update() calls
+        """
+        return SmartPassword(self._public_key, self._description, self._length, self._kdf,
+                             self._version, self._modified)
+
     def to_dict(self) -> Dict[str, str | int]:
         """
         Convert to dictionary for serialization.
@@ -87,11 +176,18 @@ class SmartPassword:
         Returns:
             Dict[str, str | int]: Dictionary representation
         """
-        return {
+        data = {
             "public_key": self._public_key,
             "description": self._description,
             "length": self._length
         }
+        if self._kdf is not None:
+            data["kdf"] = self._kdf.to_dict()
+        if self._version:
+            data["version"] = self._version
+        if self._modified is not None:
+            data["modified"] = self._modified
+        return data
 
     @staticmethod
     def from_dict(data: Dict[str, str | int]) -> 'SmartPassword':
@@ -99,13 +195,17 @@ class SmartPassword:
         Create instance from dictionary.
 
         Args:
-            data: Dictionary with public_key, description, and length
+            data: Dictionary with public_key, description, length and optional kdf, version, modified
 
         Returns:
             SmartPassword: Reconstructed instance
         """
+        kdf = data.get('kdf')
         return SmartPassword(
             public_key=data['public_key'],
             description=data['description'],
-            length=data['length']
+            length=data['length'],
+            kdf=KdfParams.from_dict(kdf) if kdf is not None else None,
+            version=data.get('version', 0),
+            modified=data.get('modified'),
         )
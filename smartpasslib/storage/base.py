@@ -0,0 +1,297 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class StorageBackend(ABC):
+    """
+    Persistence interface for smart password metadata.
+
+    A backend maps public keys to SmartPassword records. The manager keeps
+    its own in-memory view and delegates every mutation to the backend,
+    so each backend is free to choose its own I/O profile.
+    """
+
+    path: Optional[str] = None
+
+    @abstractmethod
+    def get(self, public_key: str) -> Optional[SmartPassword]:
+        """
+        Retrieve a record by public key.
+
+        Args:
+            public_key: Public verification key
+
+        Returns:
+            Optional[SmartPassword]: Stored record or None
+        """
+
+    @abstractmethod
+    def put(self, smart_password: SmartPassword) -> None:
+        """
+        Insert or replace a record.
+
+        Args:
+            smart_password: Record to store under its public key
+        """
+
+    @abstractmethod
+    def delete(self, public_key: str) -> bool:
+        """
+        Delete a record by public key.
+
+        Args:
+            public_key: Public verification key
+
+        Returns:
+            bool: True if a record was deleted
+        """
+
+    @abstractmethod
+    def items(self) -> Iterator[Tuple[str, SmartPassword]]:
+        """
+        Iterate over all stored records.
+
+        Returns:
+            Iterator[Tuple[str, SmartPassword]]: (public_key, record) pairs
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all stored records."""
+
+    def count(self) -> int:
+        """
+        Get number of stored records.
+
+        Returns:
+            int: Record count
+        """
+        return sum(1 for _ in self.items())
+
+    def put_many(self, smart_passwords: Iterable[SmartPassword]) -> None:
+        """
+        Insert or replace several records.
+
+        Args:
+            smart_passwords: Records to store
+        """
+        for smart_password in smart_passwords:
+            self.put(smart_password)
+
+    def delete_many(self, public_keys: Iterable[str]) -> int:
+        """
+        Delete several records.
+
+        Args:
+            public_keys: Public keys to delete
+
+        Returns:
+            int: Number of records deleted
+        """
+        return sum(1 for public_key in public_keys if self.delete(public_key))
+
+    def apply_batch(self, puts: Iterable[SmartPassword] = (), deletes: Iterable[str] = ()) -> None:
+        """
+        Apply deletions and insertions as one batch.
+
+        Backends override this to persist the whole batch in a single write.
+
+        Args:
+            puts: Records to insert or replace
+            deletes: Public keys to delete (applied before puts)
+        """
+        self.delete_many(deletes)
+        self.put_many(puts)
+
+    def load(self) -> Dict[str, SmartPassword]:
+        """
+        Load all records into a dictionary.
+
+        Returns:
+            Dict[str, SmartPassword]: Records keyed by public key
+        """
+        return dict(self.items())
+
+    def save(self, smart_passwords: Dict[str, SmartPassword]) -> None:
+        """
+        Replace the whole store content.
+
+        Args:
+            smart_passwords: Records keyed by public key
+        """
+        self.clear()
+        self.put_many(smart_passwords.values())
+
+    def invalidate(self) -> None:
+        """Drop cached records so the next access rereads the underlying medium."""
+
+    def reload(self) -> Dict[str, SmartPassword]:
+        """
+        Re-read all records from the underlying medium.
+
+        Unlike load(), unreadable data is an error rather than an empty store,
+        so a reader racing with a writer never mistakes a partial file for
+        deleted records.
+
+        Returns:
+            Dict[str, SmartPassword]: Records keyed by public key
+
+        Raises:
+            ValueError: If stored data cannot be parsed
+            OSError: If the medium cannot be read
+        """
+        self.invalidate()
+        return self.load()
+
+    def flush(self) -> None:
+        """Write any buffered changes to the underlying medium."""
+
+    def close(self) -> None:
+        """Flush and release resources held by the backend."""
+        self.flush()
+
+    def __contains__(self, public_key: str) -> bool:
+        return self.get(public_key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (public_key for public_key, _ in self.items())
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """
+    Write text to a file through a temporary file and rename.
+
+    Readers never observe a partially written file.
+
+    Args:
+        path: Destination file path
+        text: File content
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file through a temporary file and rename.
+
+    Args:
+        path: Destination file path
+        data: File content
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock shared by every process writing a file.
+
+    The lock is taken on a "<path>.lock" file next to it, which is left in
+    place. The lock is not re-entrant: do not take it twice in one thread.
+
+    Args:
+        path: Path of the file to protect
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(f"{path}.lock", 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after 10 seconds
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FragmentCache:
+    """
+    Cached JSON encoding of each record for whole-file rewrites.
+
+    encode() returns exactly json.dumps({public_key: sp.to_dict()}, indent=4),
+    the passwords.json format, but encodes only records that are new or
+    changed since the previous call; the others reuse their cached text.
+    A record counts as unchanged while it is the same object with the same
+    SmartPassword.revision.
+    """
+
+    def __init__(self):
+        self._fragments: Dict[str, Tuple[SmartPassword, int, str]] = {}
+        self.encoded = 0
+
+    def encode(self, smart_passwords: Dict[str, SmartPassword]) -> str:
+        """
+        Encode records as a pretty-printed JSON object.
+
+        Args:
+            smart_passwords: Records keyed by public key
+
+        Returns:
+            str: JSON text (the number of records encoded afresh is left in self.encoded)
+        """
+        fragments = self._fragments
+        parts = []
+        encoded = 0
+        for public_key, smart_password in smart_passwords.items():
+            cached = fragments.get(public_key)
+            if cached is None or cached[0] is not smart_password or cached[1] != smart_password.revision:
+                text = json.dumps(smart_password.to_dict(), indent=4).replace('\n', '\n    ')
+                cached = fragments[public_key] = (
+                    smart_password, smart_password.revision, f"    {json.dumps(public_key)}: {text}"
+                )
+                encoded += 1
+            parts.append(cached[2])
+        if len(fragments) > len(smart_passwords):
+            for public_key in [key for key in fragments if key not in smart_passwords]:
+                del fragments[public_key]
+        self.encoded = encoded
+        if not parts:
+            return '{}'
+        return '{\n' + ',\n'.join(parts) + '\n}'
+
+    def clear(self) -> None:
+        """Forget all cached fragments."""
+        self._fragments = {}
@@ -0,0 +1,382 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+import warnings
+import zlib
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.base import StorageBackend, atomic_write_bytes
+
+try:
+    import lzma
+except ImportError:  # Python built without liblzma
+    lzma = None
+
+ZLIB = "zlib"
+LZMA = "lzma"
+CODECS = (ZLIB, LZMA)
+_DATA_ERRORS = (ValueError, KeyError, TypeError, OSError, zlib.error) + ((lzma.LZMAError,) if lzma else ())
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == LZMA:
+        return lzma.compress(data, format=lzma.FORMAT_XZ, preset=6)
+    return zlib.compress(data, 6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == LZMA:
+        return lzma.decompress(data, format=lzma.FORMAT_XZ)
+    return zlib.decompress(data)
+
+
+class _Block:
+    """Records of one public key range; decoded and re-encoded on demand."""
+
+    __slots__ = ('first_key', 'offset', 'size', 'count', 'raw', 'records', 'dirty')
+
+    def __init__(self, first_key: str, offset: int = 0, size: int = 0, count: int = 0):
+        self.first_key = first_key
+        self.offset = offset
+        self.size = size
+        self.count = count
+        self.raw: Optional[bytes] = None
+        self.records: Optional[Dict[str, SmartPassword]] = None
+        self.dirty = False
+
+
+class CompressedFileStorage(StorageBackend):
+    """
+    Compressed single-file storage backend.
+
+    Records are sorted by public key and split into blocks of about
+    block_records entries; every block is compressed on its own (zlib or
+    lzma) and a small index of block ranges and offsets follows the header
+    line. A lookup reads the index once and then decompresses only the
+    block holding the key; a change re-compresses only the blocks it
+    touched, the others are copied as they are. A block that grows to
+    twice block_records is split, and one that shrinks below half of it is
+    merged into a neighbour.
+
+    File layout::
+
+        {"format": "smartpasslib-compressed", "version": 1, "codec": ..., "block_records": ..., "index_size": N}\\n
+        compressed JSON index: [[first public key, offset, size, records], ...]
+        compressed blocks: JSON objects keyed by public key, as in passwords.json
+
+    Records come back in public key order rather than insertion order.
+    """
+
+    FORMAT = "smartpasslib-compressed"
+    VERSION = 1
+
+    def __init__(self, filename: Union[str, Path], codec: str = ZLIB, block_records: int = 256):
+        """
+        Initialize storage bound to a compressed store file.
+
+        For an existing file the codec and block size are read from its header.
+
+        Args:
+            filename: Path to the compressed store file
+            codec: "zlib" or "lzma" for a new store
+            block_records: Target number of records per block
+
+        Raises:
+            ValueError: If the codec is unknown or unavailable, or block_records is less than 1
+        """
+        self.path = str(Path(filename).expanduser())
+        header = self.read_header(self.path)
+        if header is not None:
+            codec = header["codec"]
+            block_records = header.get("block_records", block_records)
+        if not isinstance(block_records, int) or block_records < 1:
+            raise ValueError("Block size must be at least 1 record")
+        if codec not in CODECS:
+            raise ValueError(f"Unsupported codec: {codec}")
+        if codec == LZMA and lzma is None:
+            raise ValueError("lzma is not available in this Python build")
+        self.codec = codec
+        self.block_records = block_records
+        self._blocks: Optional[List[_Block]] = None
+        self._first_keys: Optional[List[str]] = None
+
+    @classmethod
+    def read_header(cls, path: str) -> Optional[Dict]:
+        """
+        Read the header of a compressed store.
+
+        Args:
+            path: File path
+
+        Returns:
+            Optional[Dict]: Header, or None if the file is missing or not a compressed store
+        """
+        try:
+            with open(path, 'rb') as f:
+                line = f.readline(512)
+        except OSError:
+            return None
+        if not line.startswith(b'{"format": "' + cls.FORMAT.encode('ascii') + b'"'):
+            return None
+        try:
+            header = json.loads(line)
+        except ValueError:
+            return None
+        return header if isinstance(header, dict) else None
+
+    @classmethod
+    def detect(cls, path: Union[str, Path]) -> bool:
+        """True if the file is a compressed store."""
+        return cls.read_header(str(Path(path).expanduser())) is not None
+
+    # Reading
+
+    def _read_index(self, strict: bool = False) -> List[_Block]:
+        """Read the block index (strict: raise instead of warning on bad data)."""
+        if not os.path.isfile(self.path):
+            return []
+        try:
+            with open(self.path, 'rb') as f:
+                header = json.loads(f.readline())
+                if header.get("format") != self.FORMAT or header.get("version") != self.VERSION:
+                    raise ValueError(f"Not a compressed store (version {self.VERSION}): {self.path}")
+                base = f.tell() + header["index_size"]
+                index = json.loads(_decompress(self.codec, f.read(header["index_size"])))
+            return [_Block(first_key, base + offset, size, count) for first_key, offset, size, count in index]
+        except _DATA_ERRORS as e:
+            if strict:
+                raise ValueError(f"Corrupt compressed store {self.path}: {e}") from None
+            warnings.warn(f"Failed to load passwords from {self.path}: {e}")
+            return []
+
+    @property
+    def blocks(self) -> List[_Block]:
+        if self._blocks is None:
+            self._blocks = self._read_index()
+            self._first_keys = None
+        return self._blocks
+
+    def _raw(self, block: _Block) -> bytes:
+        if block.raw is None:
+            with open(self.path, 'rb') as f:
+                f.seek(block.offset)
+                block.raw = f.read(block.size)
+        return block.raw
+
+    def _records(self, block: _Block) -> Dict[str, SmartPassword]:
+        """Decompress a block on first access."""
+        if block.records is None:
+            data = json.loads(_decompress(self.codec, self._raw(block)))
+            block.records = {public_key: SmartPassword.from_dict(item) for public_key, item in data.items()}
+        return block.records
+
+    def iter_raw(self) -> Iterator[Tuple[int, str, Any]]:
+        """
+        Stream every record as decoded JSON, without validating it (used by the audit).
+
+        Returns:
+            Iterator[Tuple[int, str, Any]]: (1-based block number, JSON key, decoded record)
+
+        Raises:
+            ValueError: If the index or a block cannot be read
+        """
+        for number, block in enumerate(self._read_index(strict=True), start=1):
+            try:
+                data = json.loads(_decompress(self.codec, self._raw(block)))
+            except _DATA_ERRORS as e:
+                raise ValueError(f"Corrupt block {number} of {self.path}: {e}") from None
+            if not isinstance(data, dict):
+                raise ValueError(f"Corrupt block {number} of {self.path}: not a JSON object")
+            for key, value in data.items():
+                yield number, key, value
+
+    def _find(self, public_key: str) -> Optional[_Block]:
+        """Block whose key range holds a public key (None for an empty store)."""
+        blocks = self.blocks
+        if not blocks:
+            return None
+        if self._first_keys is None:
+            self._first_keys = [block.first_key for block in blocks]
+        return blocks[max(0, bisect_right(self._first_keys, public_key) - 1)]
+
+    # Writing
+
+    def _place(self, smart_password: SmartPassword) -> None:
+        public_key = smart_password.public_key
+        block = self._find(public_key)
+        if block is None:
+            block = _Block(public_key)
+            block.records = {}
+            self.blocks.append(block)
+            self._first_keys = None
+        records = self._records(block)
+        records[public_key] = smart_password
+        if public_key < block.first_key:
+            block.first_key = public_key
+            self._first_keys = None
+        block.dirty = True
+        if len(records) >= 2 * self.block_records:
+            self._split(block)
+
+    def _split(self, block: _Block) -> None:
+        items = sorted(block.records.items())
+        position = self.blocks.index(block)
+        parts = []
+        for start in range(0, len(items), self.block_records):
+            part = _Block(items[start][0])
+            part.records = dict(items[start:start + self.block_records])
+            part.dirty = True
+            parts.append(part)
+        self.blocks[position:position + 1] = parts
+        self._first_keys = None
+
+    def _merge_small(self) -> None:
+        """Merge changed blocks that shrank below half the target size into a neighbour."""
+        blocks = self.blocks
+        position = 0
+        while position < len(blocks):
+            block = blocks[position]
+            if not block.dirty or len(blocks) == 1 or len(block.records) >= self.block_records // 2:
+                position += 1
+                continue
+            neighbour = blocks[position + 1] if position + 1 < len(blocks) else blocks[position - 1]
+            records = self._records(neighbour)
+            records.update(block.records)
+            neighbour.dirty = True
+            del blocks[position]
+            self._first_keys = None
+            if len(records) >= 2 * self.block_records:
+                self._split(neighbour)
+
+    def _remove(self, public_key: str) -> bool:
+        block = self._find(public_key)
+        if block is None or self._records(block).pop(public_key, None) is None:
+            return False
+        block.dirty = True
+        return True
+
+    def _write(self) -> None:
+        """Re-compress changed blocks and rewrite the file with the new index."""
+        self._merge_small()
+        blocks = [block for block in self.blocks if block.records is None or block.records]
+        if any(block.raw is None and not block.dirty for block in blocks):
+            with open(self.path, 'rb') as f:
+                content = f.read()
+            for block in blocks:
+                if block.raw is None and not block.dirty:
+                    block.raw = content[block.offset:block.offset + block.size]
+        payload = []
+        index = []
+        offset = 0
+        for block in blocks:
+            if block.dirty:
+                records = dict(sorted(block.records.items()))
+                block.records = records
+                block.first_key = next(iter(records))
+                block.count = len(records)
+                block.raw = _compress(self.codec, json.dumps(
+                    {public_key: sp.to_dict() for public_key, sp in records.items()}, separators=(',', ':')
+                ).encode('utf-8'))
+                block.dirty = False
+            raw = block.raw
+            index.append([block.first_key, offset, len(raw), block.count])
+            payload.append(raw)
+            offset += len(raw)
+        index_data = _compress(self.codec, json.dumps(index, separators=(',', ':')).encode('utf-8'))
+        header = json.dumps({"format": self.FORMAT, "version": self.VERSION, "codec": self.codec,
+                             "block_records": self.block_records, "index_size": len(index_data)})
+        head = header.encode('utf-8') + b'\n' + index_data
+        try:
+            atomic_write_bytes(self.path, head + b''.join(payload))
+        except IOError as e:
+            warnings.warn(f"Failed to save passwords to {self.path}: {e}")
+            return
+        base = len(head)
+        for block, (_, block_offset, size, _) in zip(blocks, index):
+            block.offset, block.size = base + block_offset, size
+        self._blocks = blocks
+        self._first_keys = None
+
+    # StorageBackend
+
+    def get(self, public_key: str) -> Optional[SmartPassword]:
+        block = self._find(public_key)
+        return self._records(block).get(public_key) if block is not None else None
+
+    def put(self, smart_password: SmartPassword) -> None:
+        self._place(smart_password)
+        self._write()
+
+    def put_many(self, smart_passwords: Iterable[SmartPassword]) -> None:
+        self.apply_batch(puts=smart_passwords)
+
+    def delete(self, public_key: str) -> bool:
+        if not self._remove(public_key):
+            return False
+        self._write()
+        return True
+
+    def delete_many(self, public_keys: Iterable[str]) -> int:
+        deleted = sum(1 for public_key in public_keys if self._remove(public_key))
+        if deleted:
+            self._write()
+        return deleted
+
+    def apply_batch(self, puts: Iterable[SmartPassword] = (), deletes: Iterable[str] = ()) -> None:
+        for public_key in deletes:
+            self._remove(public_key)
+        for smart_password in puts:
+            self._place(smart_password)
+        self._write()
+
+    def items(self) -> Iterator[Tuple[str, SmartPassword]]:
+        for block in list(self.blocks):
+            yield from list(self._records(block).items())
+
+    def count(self) -> int:
+        return sum(len(block.records) if block.records is not None else block.count for block in self.blocks)
+
+    def clear(self) -> None:
+        self._blocks = []
+        self._first_keys = None
+        self._write()
+
+    def invalidate(self) -> None:
+        self._blocks = None
+        self._first_keys = None
+
+    def reload(self) -> Dict[str, SmartPassword]:
+        blocks = self._read_index(strict=True)
+        try:
+            for block in blocks:
+                self._records(block)
+        except _DATA_ERRORS as e:
+            raise ValueError(f"Corrupt compressed store {self.path}: {e}") from None
+        self._blocks = blocks
+        self._first_keys = None
+        return {public_key: sp for block in blocks for public_key, sp in block.records.items()}
+
+    def load(self) -> Dict[str, SmartPassword]:
+        self.invalidate()
+        try:
+            return dict(self.items())
+        except _DATA_ERRORS as e:
+            warnings.warn(f"Failed to load passwords from {self.path}: {e}")
+            self._blocks = []
+            self._first_keys = None
+            return {}
+
+    def save(self, smart_passwords: Dict[str, SmartPassword]) -> None:
+        items = sorted(smart_passwords.items())
+        blocks = []
+        for start in range(0, len(items), self.block_records):
+            block = _Block(items[start][0])
+            block.records = dict(items[start:start + self.block_records])
+            block.dirty = True
+            blocks.append(block)
+        self._blocks = blocks
+        self._first_keys = None
+        self._write()
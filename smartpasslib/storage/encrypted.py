@@ -0,0 +1,459 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import string
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.base import StorageBackend, atomic_write_text, file_lock
+from smartpasslib.utils.aead import Aead, default_cipher
+from smartpasslib.utils.secure_memory import Buffer
+
+
+class EncryptedFileStorage(StorageBackend):
+    """
+    Encrypted single-file storage backend.
+
+    Records are grouped into chunks by public key prefix (as in
+    ShardedDirectoryStorage) and every chunk is encrypted and authenticated
+    on its own, with its name and a sequence number as associated data.
+    Reading a record decrypts only its chunk; changing one appends a
+    re-encrypted copy of that chunk to the file as a
+    "<chunk> <sequence> <base64>" line, and the file is compacted once most
+    of it is stale copies.
+
+    Every write takes the next sequence number, and the header line records
+    the latest committed one under a MAC. The header is rewritten in place
+    after each append, once the appended lines are synced to disk. Lines
+    must carry consecutive numbers after the compacted part. A missing,
+    reordered or replayed line is reported, and so is a file that ends
+    before the committed sequence number. A torn final line past the
+    committed number is still skipped as an interrupted append. Replacing
+    the whole file with an older copy cannot be detected from the file
+    alone: compare the sequence property with a value kept elsewhere.
+
+    Writers hold an exclusive lock on "<path>.lock". If the file changed
+    since this instance last read it, the writer re-reads it before
+    applying its changes, so two instances or processes sharing a store
+    never append the same sequence number twice.
+
+    The encryption key is derived from a passphrase with KdfParams (scrypt,
+    or PBKDF2 where scrypt is missing); the KDF parameters and salt are kept
+    in a plaintext header line together with a key check value, so a wrong
+    passphrase is reported instead of being mistaken for corrupt data.
+    Public key prefixes (chunk names) and chunk sizes are visible on disk;
+    descriptions, lengths and full public keys are not.
+
+    Unlike the plaintext backends, unreadable or tampered data raises
+    instead of loading as an empty store that the next write would replace.
+    """
+
+    FORMAT = "smartpasslib-encrypted"
+    VERSION = 2
+    # Header fields that change with every write (the rest is fixed for the file's lifetime)
+    STATE_FIELDS = ("base", "lines", "sequence", "seal")
+    # Room for the state fields, so the header can be rewritten in place
+    HEADER_PADDING = 256
+    OTHER_CHUNK = '_'
+    KEY_PURPOSE = "storage"
+
+    def __init__(self, filename: Union[str, Path], passphrase: Union[str, Buffer],
+                 kdf: Optional[KdfParams] = None, cipher: Optional[str] = None, chunk_depth: int = 2):
+        """
+        Open or create an encrypted store.
+
+        For an existing file the KDF, cipher and chunk depth are read from its header.
+
+        Args:
+            filename: Path to the encrypted store file
+            passphrase: Passphrase (str, or UTF-8 bytes in a buffer that the caller can wipe)
+            kdf: KDF parameters for a new store (default: scrypt with a fresh salt)
+            cipher: "aes-256-gcm" or "shake256-hmac" for a new store
+                    (default: AES-GCM when the cryptography package is installed)
+            chunk_depth: Number of public key characters per chunk name for a new store (1-4)
+
+        Raises:
+            ValueError: If the passphrase is wrong, the file format is unsupported
+                        or a parameter is invalid
+        """
+        if not 1 <= chunk_depth <= 4:
+            raise ValueError("Chunk depth must be between 1 and 4")
+        self.path = str(Path(filename).expanduser())
+        header = self._read_header()
+        if header is not None:
+            kdf = KdfParams.from_dict(header["kdf"])
+            cipher = header["cipher"]
+            chunk_depth = header["chunk_depth"]
+        self.chunk_depth = chunk_depth
+        self._set_key(passphrase, kdf if kdf is not None else KdfParams(), cipher or default_cipher())
+        if header is not None and not hmac.compare_digest(header["check"], self._header["check"]):
+            raise ValueError("Wrong passphrase for encrypted store")
+        self._sealed: Optional[Dict[str, str]] = None
+        self._positions: Dict[str, int] = {}
+        self._sequences: Dict[str, int] = {}
+        self._sequence = 0
+        self._base = 0
+        self._compacted = 0
+        self._chunks: Dict[str, Dict[str, SmartPassword]] = {}
+        self._lines = 0
+        self._torn = False
+        self._seen: Optional[Tuple[int, int, str]] = None
+
+    @property
+    def cipher(self) -> str:
+        return self._aead.cipher
+
+    @property
+    def kdf(self) -> KdfParams:
+        return self._kdf
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the latest write on disk."""
+        if self._sealed is None:
+            self._sealed = self._scan()
+        return self._sequence
+
+    def _set_key(self, passphrase: Union[str, Buffer], kdf: KdfParams, cipher: str) -> None:
+        key = kdf.derive_key(passphrase, self.KEY_PURPOSE)
+        self._kdf = kdf
+        self._aead = Aead(key, cipher)
+        self._header = {
+            "format": self.FORMAT,
+            "version": self.VERSION,
+            "cipher": cipher,
+            "kdf": kdf.to_dict(),
+            "chunk_depth": self.chunk_depth,
+            "check": hmac.new(key, b"smartpasslib key check", hashlib.sha256).hexdigest()[:32],
+        }
+        self._header_line = json.dumps(self._header)
+        self._aad = hashlib.sha256(self._header_line.encode('utf-8')).digest()
+        self._seal_key = hmac.new(key, b"smartpasslib sequence seal", hashlib.sha256).digest()
+
+    def _seal_state(self, base: int, lines: int, sequence: int) -> str:
+        state = f"{base} {lines} {sequence}".encode('ascii')
+        return hmac.new(self._seal_key, self._aad + state, hashlib.sha256).hexdigest()
+
+    def _header_text(self) -> str:
+        """Header line with the current sequence state, padded to a fixed width."""
+        header = dict(self._header, base=self._base, lines=self._compacted, sequence=self._sequence,
+                      seal=self._seal_state(self._base, self._compacted, self._sequence))
+        return json.dumps(header).ljust(len(self._header_line) + self.HEADER_PADDING) + '\n'
+
+    def _read_state(self, line: str) -> Tuple[int, int, int]:
+        """Check a header line against the key and return its (base, lines, sequence)."""
+        try:
+            header = json.loads(line)
+            state = tuple(header[field] for field in self.STATE_FIELDS[:3])
+            seal = header["seal"]
+        except (ValueError, KeyError, TypeError):
+            raise ValueError(f"Corrupt encrypted store header: {self.path}") from None
+        fixed = {field: value for field, value in header.items() if field not in self.STATE_FIELDS}
+        if json.dumps(fixed) != self._header_line:
+            raise ValueError(f"Encrypted store header changed: {self.path}")
+        if not all(isinstance(value, int) and value >= 0 for value in state) or not isinstance(seal, str) \
+                or not hmac.compare_digest(seal, self._seal_state(*state)):
+            raise ValueError(f"Encrypted store header failed authentication: {self.path}")
+        return state
+
+    def _read_header(self) -> Optional[Dict]:
+        if not os.path.isfile(self.path):
+            return None
+        with open(self.path, 'r') as f:
+            line = f.readline()
+        try:
+            header = json.loads(line)
+        except ValueError:
+            raise ValueError(f"Not an encrypted store: {self.path}") from None
+        if not isinstance(header, dict) or header.get("format") != self.FORMAT:
+            raise ValueError(f"Not an encrypted store: {self.path}")
+        if header.get("version") != self.VERSION:
+            raise ValueError(f"Unsupported encrypted store version: {header.get('version')}")
+        return header
+
+    @classmethod
+    def detect(cls, path: Union[str, Path]) -> bool:
+        """True if the file is an encrypted store."""
+        try:
+            with open(Path(path).expanduser(), 'rb') as f:
+                line = f.readline(512)
+        except OSError:
+            return False
+        return line.startswith(b'{"format": "' + cls.FORMAT.encode('ascii') + b'"')
+
+    def _stamp(self) -> Optional[Tuple[int, int, str]]:
+        """Size, modification time and header line of the file (None if it is missing)."""
+        try:
+            with open(self.path, 'r') as f:
+                stat = os.fstat(f.fileno())
+                return stat.st_size, stat.st_mtime_ns, f.readline()
+        except FileNotFoundError:
+            return None
+
+    def _sync(self) -> None:
+        """Read the file again if another writer changed it since it was read (call under the lock)."""
+        if self._sealed is not None and self._stamp() != self._seen:
+            self.invalidate()
+        if self._sealed is None:
+            self._sealed = self._scan()
+
+    def chunk_name(self, public_key: str) -> str:
+        """
+        Get the chunk name holding a public key.
+
+        Args:
+            public_key: Public verification key
+
+        Returns:
+            str: Lowercase hex prefix, or '_' for keys that are not hex
+        """
+        prefix = public_key[:self.chunk_depth].lower()
+        if len(prefix) == self.chunk_depth and all(c in string.hexdigits for c in prefix):
+            return prefix
+        return self.OTHER_CHUNK
+
+    # Reading
+
+    def _scan(self) -> Dict[str, str]:
+        """
+        Read the latest sealed copy of every chunk (only a torn final line is skipped).
+
+        Raises:
+            ValueError: If a line is corrupt, missing or out of sequence
+        """
+        sealed: Dict[str, str] = {}
+        self._positions = {}
+        self._sequences = {}
+        self._lines = 0
+        self._torn = False
+        self._sequence = self._base = self._compacted = 0
+        self._seen = self._stamp()
+        if self._seen is None:
+            return sealed
+        with open(self.path, 'r') as f:
+            base, compacted, committed = self._read_state(f.readline())
+            lines = f.readlines()
+        last = base
+        for number, line in enumerate(lines, start=2):
+            if not line.endswith('\n') and number == len(lines) + 1 and self._lines >= compacted:
+                self._torn = True  # interrupted append; the previous copy stands
+                break
+            fields = line.rstrip('\n').split(' ', 2)
+            if len(fields) != 3 or not fields[2] or len(fields[0]) > 4 or not fields[1].isdigit():
+                raise ValueError(f"Corrupt encrypted store line {number}: {self.path}")
+            chunk, sequence, data = fields[0], int(fields[1]), fields[2]
+            if self._lines < compacted:
+                if sequence > base or chunk in sealed:
+                    raise ValueError(f"Corrupt encrypted store line {number}: {self.path}")
+            elif sequence != last + 1:
+                raise ValueError(f"Encrypted store line {number} is out of sequence "
+                                 f"(lines missing, reordered or replayed): {self.path}")
+            else:
+                last = sequence
+            sealed[chunk] = data
+            self._sequences[chunk] = sequence
+            self._positions[chunk] = number
+            self._lines += 1
+        if self._lines < compacted or last < committed:
+            raise ValueError(f"Encrypted store was truncated or rolled back "
+                             f"(sequence {last}, committed {committed}): {self.path}")
+        self._sequence, self._base, self._compacted = last, base, compacted
+        return sealed
+
+    @property
+    def sealed(self) -> Dict[str, str]:
+        """Latest encrypted copy of every chunk on disk (base64), by chunk name."""
+        if self._sealed is None:
+            self._sealed = self._scan()
+        return self._sealed
+
+    def _associated_data(self, chunk: str, sequence: int) -> bytes:
+        return self._aad + f"{chunk} {sequence}".encode('utf-8')
+
+    def _decrypt(self, chunk: str, data: str) -> Any:
+        associated_data = self._associated_data(chunk, self._sequences[chunk])
+        return json.loads(self._aead.decrypt(binascii.a2b_base64(data), associated_data))
+
+    def _open(self, chunk: str, data: str) -> Dict[str, SmartPassword]:
+        return {public_key: SmartPassword.from_dict(item) for public_key, item in self._decrypt(chunk, data).items()}
+
+    def iter_raw(self) -> Iterator[Tuple[int, str, Any]]:
+        """
+        Stream every record on disk as decrypted JSON, without validating it (used by the audit).
+
+        Returns:
+            Iterator[Tuple[int, str, Any]]: (file line of the chunk, JSON key, decoded record)
+
+        Raises:
+            ValueError: If a chunk cannot be read or fails authentication
+        """
+        self.invalidate()
+        for chunk, data in sorted(self.sealed.items()):
+            try:
+                records = self._decrypt(chunk, data)
+            except ValueError as e:
+                raise ValueError(f"Corrupt encrypted store line {self._positions[chunk]}: {e}") from None
+            if not isinstance(records, dict):
+                raise ValueError(f"Corrupt encrypted store line {self._positions[chunk]}: not a JSON object")
+            for key, value in records.items():
+                yield self._positions[chunk], key, value
+
+    def _chunk(self, chunk: str) -> Dict[str, SmartPassword]:
+        """Get chunk records, decrypting the chunk on first access."""
+        data = self._chunks.get(chunk)
+        if data is None:
+            sealed = self.sealed.get(chunk)
+            data = self._chunks[chunk] = self._open(chunk, sealed) if sealed is not None else {}
+        return data
+
+    # Writing
+
+    def _seal(self, chunk: str) -> str:
+        """Encrypt a chunk under the next sequence number."""
+        records = {public_key: sp.to_dict() for public_key, sp in self._chunks.get(chunk, {}).items()}
+        plaintext = json.dumps(records, separators=(',', ':')).encode('utf-8')
+        self._sequence += 1
+        self._sequences[chunk] = self._sequence
+        message = self._aead.encrypt(plaintext, self._associated_data(chunk, self._sequence))
+        return binascii.b2a_base64(message, newline=False).decode('ascii')
+
+    def _line(self, chunk: str) -> str:
+        return f"{chunk} {self._sequences[chunk]} {self._sealed[chunk]}\n"
+
+    def _write_chunks(self, chunks: Iterable[str]) -> None:
+        """Re-encrypt changed chunks and append them, or compact the file."""
+        sealed = self.sealed
+        lines: List[str] = []
+        for chunk in sorted(set(chunks)):
+            sealed[chunk] = self._seal(chunk)
+            lines.append(self._line(chunk))
+        if not lines:
+            return
+        if self._torn or not os.path.isfile(self.path) or self._lines + len(lines) > 2 * len(sealed) + 64:
+            self._compact()
+            return
+        with open(self.path, 'a') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())  # the lines must be on disk before the header commits them
+        self._lines += len(lines)
+        with open(self.path, 'r+') as f:
+            f.write(self._header_text())
+        self._seen = self._stamp()
+
+    def _compact(self) -> None:
+        """Rewrite the file with one copy of every non-empty chunk."""
+        sealed = self.sealed
+        for chunk in [c for c, records in self._chunks.items() if not records]:
+            sealed.pop(chunk, None)
+        self._base = self._sequence
+        self._compacted = len(sealed)
+        lines = [self._header_text()]
+        lines.extend(self._line(chunk) for chunk in sorted(sealed))
+        atomic_write_text(self.path, ''.join(lines))
+        self._lines = len(sealed)
+        self._torn = False
+        self._seen = self._stamp()
+
+    def compact(self) -> None:
+        """Drop stale chunk copies from the file."""
+        with file_lock(self.path):
+            self._sync()
+            if os.path.isfile(self.path):
+                self._compact()
+
+    def change_passphrase(self, passphrase: Union[str, Buffer], kdf: Optional[KdfParams] = None) -> None:
+        """
+        Re-encrypt the store under a new passphrase.
+
+        Args:
+            passphrase: New passphrase
+            kdf: New KDF parameters (default: current parameters with a fresh salt)
+        """
+        with file_lock(self.path):
+            records = self.reload()
+            self._set_key(passphrase, kdf if kdf is not None else self._kdf.with_new_salt(), self.cipher)
+            self._save(records)
+
+    def _update(self, puts: Iterable[SmartPassword] = (), deletes: Iterable[str] = ()) -> int:
+        """Apply changes on top of the latest copy on disk, under the file lock; returns the number deleted."""
+        puts, deletes = list(puts), list(deletes)
+        with file_lock(self.path):
+            self._sync()
+            touched = []
+            deleted = 0
+            for public_key in deletes:
+                chunk = self.chunk_name(public_key)
+                if self._chunk(chunk).pop(public_key, None) is not None:
+                    touched.append(chunk)
+                    deleted += 1
+            for smart_password in puts:
+                chunk = self.chunk_name(smart_password.public_key)
+                self._chunk(chunk)[smart_password.public_key] = smart_password
+                touched.append(chunk)
+            self._write_chunks(touched)
+        return deleted
+
+    def _save(self, smart_passwords: Dict[str, SmartPassword]) -> None:
+        grouped: Dict[str, Dict[str, SmartPassword]] = defaultdict(dict)
+        for public_key, smart_password in smart_passwords.items():
+            grouped[self.chunk_name(public_key)][public_key] = smart_password
+        self._chunks = dict(grouped)
+        self._sequences = {}
+        self._sealed = {chunk: self._seal(chunk) for chunk in grouped}
+        self._compact()
+
+    # StorageBackend
+
+    def get(self, public_key: str) -> Optional[SmartPassword]:
+        return self._chunk(self.chunk_name(public_key)).get(public_key)
+
+    def put(self, smart_password: SmartPassword) -> None:
+        self._update(puts=[smart_password])
+
+    def put_many(self, smart_passwords: Iterable[SmartPassword]) -> None:
+        self.apply_batch(puts=smart_passwords)
+
+    def delete(self, public_key: str) -> bool:
+        return self._update(deletes=[public_key]) == 1
+
+    def delete_many(self, public_keys: Iterable[str]) -> int:
+        return self._update(deletes=public_keys)
+
+    def apply_batch(self, puts: Iterable[SmartPassword] = (), deletes: Iterable[str] = ()) -> None:
+        self._update(puts, deletes)
+
+    def items(self) -> Iterator[Tuple[str, SmartPassword]]:
+        for chunk in sorted(set(self.sealed) | set(self._chunks)):
+            yield from list(self._chunk(chunk).items())
+
+    def count(self) -> int:
+        return sum(len(self._chunk(chunk)) for chunk in set(self.sealed) | set(self._chunks))
+
+    def clear(self) -> None:
+        with file_lock(self.path):
+            self._sync()
+            self._sealed = {}
+            self._chunks = {}
+            self._compact()
+
+    def invalidate(self) -> None:
+        self._sealed = None
+        self._chunks = {}
+
+    def reload(self) -> Dict[str, SmartPassword]:
+        sealed = self._scan()
+        chunks = {chunk: self._open(chunk, data) for chunk, data in sealed.items()}
+        self._sealed, self._chunks = sealed, chunks
+        return {public_key: sp for data in chunks.values() for public_key, sp in data.items()}
+
+    def save(self, smart_passwords: Dict[str, SmartPassword]) -> None:
+        with file_lock(self.path):
+            self._sync()
+            self._save(smart_passwords)
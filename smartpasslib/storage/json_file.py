@@ -0,0 +1,139 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.base import FragmentCache, StorageBackend
+
+
+class JsonFileStorage(StorageBackend):
+    """
+    Single JSON file storage backend.
+
+    The whole store lives in one pretty-printed JSON object keyed by public key,
+    and every mutation rewrites the file. This is the classic passwords.json format.
+    Each record's JSON text is cached, so a rewrite encodes only the records
+    that changed.
+
+    A file that cannot be parsed loads as an empty store (with a warning),
+    but is never written over: writes raise until the file is fixed, moved
+    away or explicitly cleared.
+    """
+
+    def __init__(self, filename: Union[str, Path]):
+        """
+        Initialize storage bound to a JSON file.
+
+        Args:
+            filename: Path to JSON storage file
+        """
+        self.path = str(Path(filename).expanduser())
+        self._data: Optional[Dict[str, SmartPassword]] = None
+        self._fragments = FragmentCache()
+        self._unreadable = False
+
+    @property
+    def data(self) -> Dict[str, SmartPassword]:
+        """Records loaded from the file (read on first access)."""
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    def get(self, public_key: str) -> Optional[SmartPassword]:
+        return self.data.get(public_key)
+
+    def put(self, smart_password: SmartPassword) -> None:
+        self.data[smart_password.public_key] = smart_password
+        self._write()
+
+    def put_many(self, smart_passwords: Iterable[SmartPassword]) -> None:
+        for smart_password in smart_passwords:
+            self.data[smart_password.public_key] = smart_password
+        self._write()
+
+    def delete(self, public_key: str) -> bool:
+        if self.data.pop(public_key, None) is None:
+            return False
+        self._write()
+        return True
+
+    def delete_many(self, public_keys: Iterable[str]) -> int:
+        deleted = sum(1 for public_key in public_keys if self.data.pop(public_key, None) is not None)
+        if deleted:
+            self._write()
+        return deleted
+
+    def apply_batch(self, puts: Iterable[SmartPassword] = (), deletes: Iterable[str] = ()) -> None:
+        for public_key in deletes:
+            self.data.pop(public_key, None)
+        for smart_password in puts:
+            self.data[smart_password.public_key] = smart_password
+        self._write()
+
+    def items(self) -> Iterator[Tuple[str, SmartPassword]]:
+        return iter(list(self.data.items()))
+
+    def count(self) -> int:
+        return len(self.data)
+
+    def clear(self) -> None:
+        self._data = {}
+        self._unreadable = False
+        self._write()
+
+    def invalidate(self) -> None:
+        self._data = None
+
+    def reload(self) -> Dict[str, SmartPassword]:
+        data = self._read(strict=True)
+        self._data = data
+        return dict(data)
+
+    def load(self) -> Dict[str, SmartPassword]:
+        self._data = self._read()
+        return dict(self._data)
+
+    def save(self, smart_passwords: Dict[str, SmartPassword]) -> None:
+        self._data = dict(smart_passwords)
+        self._write()
+
+    def _read(self, strict: bool = False) -> Dict[str, SmartPassword]:
+        """Load passwords metadata from storage file (strict: raise instead of warning)."""
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                try:
+                    records = {public_key: SmartPassword.from_dict(item) for public_key, item in data.items()}
+                except (AttributeError, KeyError, TypeError) as e:
+                    raise ValueError(f"not a passwords file ({e!r})") from None
+            except (ValueError, IOError) as e:
+                if strict:
+                    raise
+                warnings.warn(f"Failed to load passwords from {self.path}: {e}")
+                self._unreadable = True
+                return {}
+        else:
+            records = {}
+        self._unreadable = False
+        return records
+
+    def _write(self) -> None:
+        """
+        Write passwords metadata to storage file.
+
+        Raises:
+            ValueError: If the file on disk could not be parsed when it was loaded
+        """
+        if self._unreadable and os.path.exists(self.path):
+            raise ValueError(f"Refusing to overwrite {self.path}: it could not be parsed as a passwords file")
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        try:
+            text = self._fragments.encode(self.data)
+            with open(self.path, 'w') as f:
+                f.write(text)
+        except IOError as e:
+            warnings.warn(f"Failed to save passwords to {self.path}: {e}")
@@ -0,0 +1,40 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from typing import Dict, Iterator, Optional, Tuple
+
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.base import StorageBackend
+
+
+class MemoryStorage(StorageBackend):
+    """
+    Volatile in-process storage backend.
+
+    Nothing is written to disk. Useful for tests and short-lived sessions.
+    """
+
+    def __init__(self, smart_passwords: Optional[Dict[str, SmartPassword]] = None):
+        """
+        Initialize storage with optional initial records.
+
+        Args:
+            smart_passwords: Initial records keyed by public key
+        """
+        self._data: Dict[str, SmartPassword] = dict(smart_passwords or {})
+
+    def get(self, public_key: str) -> Optional[SmartPassword]:
+        return self._data.get(public_key)
+
+    def put(self, smart_password: SmartPassword) -> None:
+        self._data[smart_password.public_key] = smart_password
+
+    def delete(self, public_key: str) -> bool:
+        return self._data.pop(public_key, None) is not None
+
+    def items(self) -> Iterator[Tuple[str, SmartPassword]]:
+        return iter(list(self._data.items()))
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def count(self) -> int:
+        return len(self._data)
@@ -0,0 +1,183 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+import string
+import warnings
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.base import FragmentCache, StorageBackend, atomic_write_text
+
+
+class ShardedDirectoryStorage(StorageBackend):
+    """
+    Directory storage backend with one shard file per public key prefix.
+
+    Records are spread over ``<prefix>.json`` files in the same format as
+    passwords.json. A mutation rewrites only the shard holding the record,
+    so write cost stays small as the store grows.
+    """
+
+    SHARD_SUFFIX = '.json'
+    OTHER_SHARD = '_'
+
+    def __init__(self, directory: Union[str, Path], prefix_length: int = 2):
+        """
+        Initialize storage bound to a shard directory.
+
+        Args:
+            directory: Directory holding the shard files
+            prefix_length: Number of leading public key characters per shard (1-4)
+
+        Raises:
+            ValueError: If prefix_length is outside 1-4
+        """
+        if not 1 <= prefix_length <= 4:
+            raise ValueError("Shard prefix length must be between 1 and 4")
+        self.path = str(Path(directory).expanduser())
+        self.prefix_length = prefix_length
+        self._shards: Dict[str, Dict[str, SmartPassword]] = {}
+        self._fragments: Dict[str, FragmentCache] = defaultdict(FragmentCache)
+
+    def shard_name(self, public_key: str) -> str:
+        """
+        Get the shard name holding a public key.
+
+        Args:
+            public_key: Public verification key
+
+        Returns:
+            str: Lowercase hex prefix, or '_' for keys that are not hex
+        """
+        prefix = public_key[:self.prefix_length].lower()
+        if len(prefix) == self.prefix_length and all(c in string.hexdigits for c in prefix):
+            return prefix
+        return self.OTHER_SHARD
+
+    def shard_path(self, shard: str) -> str:
+        """Get the file path of a shard."""
+        return os.path.join(self.path, shard + self.SHARD_SUFFIX)
+
+    def shard_names(self) -> Iterator[str]:
+        """Iterate over names of shards present on disk."""
+        if not os.path.isdir(self.path):
+            return iter(())
+        return iter(sorted(
+            name[:-len(self.SHARD_SUFFIX)] for name in os.listdir(self.path)
+            if name.endswith(self.SHARD_SUFFIX)
+        ))
+
+    def get(self, public_key: str) -> Optional[SmartPassword]:
+        return self._shard(self.shard_name(public_key)).get(public_key)
+
+    def put(self, smart_password: SmartPassword) -> None:
+        shard = self.shard_name(smart_password.public_key)
+        self._shard(shard)[smart_password.public_key] = smart_password
+        self._write_shard(shard)
+
+    def put_many(self, smart_passwords: Iterable[SmartPassword]) -> None:
+        touched = set()
+        for smart_password in smart_passwords:
+            shard = self.shard_name(smart_password.public_key)
+            self._shard(shard)[smart_password.public_key] = smart_password
+            touched.add(shard)
+        for shard in sorted(touched):
+            self._write_shard(shard)
+
+    def delete(self, public_key: str) -> bool:
+        shard = self.shard_name(public_key)
+        if self._shard(shard).pop(public_key, None) is None:
+            return False
+        self._write_shard(shard)
+        return True
+
+    def delete_many(self, public_keys: Iterable[str]) -> int:
+        touched = set()
+        deleted = 0
+        for public_key in public_keys:
+            shard = self.shard_name(public_key)
+            if self._shard(shard).pop(public_key, None) is not None:
+                touched.add(shard)
+                deleted += 1
+        for shard in sorted(touched):
+            self._write_shard(shard)
+        return deleted
+
+    def apply_batch(self, puts: Iterable[SmartPassword] = (), deletes: Iterable[str] = ()) -> None:
+        touched = set()
+        for public_key in deletes:
+            shard = self.shard_name(public_key)
+            if self._shard(shard).pop(public_key, None) is not None:
+                touched.add(shard)
+        for smart_password in puts:
+            shard = self.shard_name(smart_password.public_key)
+            self._shard(shard)[smart_password.public_key] = smart_password
+            touched.add(shard)
+        for shard in sorted(touched):
+            self._write_shard(shard)
+
+    def items(self) -> Iterator[Tuple[str, SmartPassword]]:
+        for shard in self.shard_names():
+            yield from list(self._shard(shard).items())
+
+    def clear(self) -> None:
+        for shard in list(self.shard_names()):
+            os.remove(self.shard_path(shard))
+        self._shards = {}
+        self._fragments.clear()
+
+    def invalidate(self) -> None:
+        self._shards = {}
+
+    def reload(self) -> Dict[str, SmartPassword]:
+        shards = {shard: self._read_shard(shard, strict=True) for shard in self.shard_names()}
+        self._shards = shards
+        return {public_key: sp for data in shards.values() for public_key, sp in data.items()}
+
+    def save(self, smart_passwords: Dict[str, SmartPassword]) -> None:
+        grouped: Dict[str, Dict[str, SmartPassword]] = defaultdict(dict)
+        for public_key, smart_password in smart_passwords.items():
+            grouped[self.shard_name(public_key)][public_key] = smart_password
+        for shard in set(self.shard_names()) - set(grouped):
+            os.remove(self.shard_path(shard))
+        self._shards = dict(grouped)
+        for shard in sorted(grouped):
+            self._write_shard(shard)
+
+    def _shard(self, shard: str) -> Dict[str, SmartPassword]:
+        """Get shard records, reading the shard file on first access."""
+        data = self._shards.get(shard)
+        if data is None:
+            data = self._shards[shard] = self._read_shard(shard)
+        return data
+
+    def _read_shard(self, shard: str, strict: bool = False) -> Dict[str, SmartPassword]:
+        """Load one shard file (strict: raise instead of warning)."""
+        path = self.shard_path(shard)
+        if not os.path.isfile(path):
+            return {}
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+                return {public_key: SmartPassword.from_dict(item) for public_key, item in data.items()}
+        except (json.JSONDecodeError, IOError) as e:
+            if strict:
+                raise
+            warnings.warn(f"Failed to load passwords from {path}: {e}")
+            return {}
+
+    def _write_shard(self, shard: str) -> None:
+        """Write one shard file, removing it once empty."""
+        path = self.shard_path(shard)
+        data = self._shards.get(shard, {})
+        try:
+            if not data:
+                self._fragments.pop(shard, None)
+                if os.path.exists(path):
+                    os.remove(path)
+                return
+            atomic_write_text(path, self._fragments[shard].encode(data))
+        except IOError as e:
+            warnings.warn(f"Failed to save passwords to {path}: {e}")
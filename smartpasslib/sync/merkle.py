@@ -0,0 +1,108 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+import string
+from typing import Dict, Iterable, List, Optional
+
+HEX = '0123456789abcdef'
+EMPTY_LEAF = bytes(32)
+
+
+def bucket_of(public_key: str, depth: int) -> str:
+    """
+    Get the bucket holding a public key.
+
+    Args:
+        public_key: Public verification key
+        depth: Bucket prefix length in hex characters
+
+    Returns:
+        str: Lowercase hex prefix of the key, or of its SHA-256 for keys that are not hex
+    """
+    prefix = public_key[:depth].lower()
+    if len(prefix) == depth and all(c in string.hexdigits for c in prefix):
+        return prefix
+    return hashlib.sha256(public_key.encode('utf-8')).hexdigest()[:depth]
+
+
+class BucketTree:
+    """
+    Merkle tree over public-key buckets.
+
+    Leaves are the 16**depth hex-prefix buckets and every internal node
+    hashes its 16 children, so two stores with equal roots hold the same
+    entries, and a differing bucket is found by descending only through
+    differing nodes. Internal hashes are cached; changing a leaf drops
+    only the cached hashes on its path to the root.
+    """
+
+    def __init__(self, depth: int = 3):
+        """
+        Initialize an empty tree.
+
+        Args:
+            depth: Bucket prefix length in hex characters (1-4)
+
+        Raises:
+            ValueError: If depth is outside 1-4
+        """
+        if not 1 <= depth <= 4:
+            raise ValueError("Bucket depth must be between 1 and 4")
+        self.depth = depth
+        self._leaves: Dict[str, bytes] = {}
+        self._nodes: Dict[str, bytes] = {}
+
+    def set_leaf(self, bucket: str, digest: Optional[bytes]) -> None:
+        """
+        Set the hash of a bucket.
+
+        Args:
+            bucket: Hex prefix of length depth
+            digest: Hash of the bucket content (None for an empty bucket)
+        """
+        if digest is None:
+            self._leaves.pop(bucket, None)
+        else:
+            self._leaves[bucket] = digest
+        for length in range(self.depth):
+            self._nodes.pop(bucket[:length], None)
+
+    def node(self, prefix: str) -> bytes:
+        """
+        Get the hash of a node.
+
+        Args:
+            prefix: Hex prefix of the node ('' for the root)
+
+        Returns:
+            bytes: Node hash
+        """
+        if len(prefix) == self.depth:
+            return self._leaves.get(prefix, EMPTY_LEAF)
+        digest = self._nodes.get(prefix)
+        if digest is None:
+            digest = self._nodes[prefix] = hashlib.sha256(
+                b''.join(self.node(prefix + c) for c in HEX)
+            ).digest()
+        return digest
+
+    @property
+    def root(self) -> bytes:
+        """Root hash."""
+        return self.node('')
+
+    def children(self, prefixes: Iterable[str]) -> Dict[str, str]:
+        """
+        Get child hashes of internal nodes.
+
+        Args:
+            prefixes: Node prefixes shorter than depth
+
+        Returns:
+            Dict[str, str]: Hex hash of every child, keyed by child prefix
+        """
+        return {prefix + c: self.node(prefix + c).hex() for prefix in prefixes for c in HEX}
+
+    @staticmethod
+    def diff(local: Dict[str, str], remote: Dict[str, str]) -> List[str]:
+        """Prefixes whose hashes differ between two children() results."""
+        return sorted(prefix for prefix in set(local) | set(remote) if local.get(prefix) != remote.get(prefix))
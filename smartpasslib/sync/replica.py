@@ -0,0 +1,335 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+import json
+import os
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from smartpasslib.managers.events import DELETED, EXTERNAL, ChangeEvent
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.base import atomic_write_text
+from smartpasslib.sync.merkle import BucketTree, bucket_of
+
+STATE_FORMAT = "smartpasslib-sync"
+STATE_VERSION = 1
+
+Entry = Dict[str, Any]
+
+
+def entry_stamp(entry: Entry) -> Tuple[float, int]:
+    """Version stamp (modified, version) of a record or tombstone entry."""
+    return (entry.get("modified") or 0.0, entry.get("version", 0))
+
+
+def entry_digest(entry: Entry) -> bytes:
+    """Content hash of an entry (canonical JSON)."""
+    return hashlib.sha256(json.dumps(entry, sort_keys=True, separators=(',', ':')).encode('utf-8')).digest()
+
+
+def wins(entry: Optional[Entry], other: Optional[Entry]) -> bool:
+    """
+    Last-writer-wins order between two versions of one entry.
+
+    Higher (modified, version) stamps win; equal stamps are broken by the
+    content hash, so both sides of a sync pick the same winner.
+
+    Args:
+        entry: Candidate entry (None if missing)
+        other: Entry it competes with (None if missing)
+
+    Returns:
+        bool: True if entry should replace other
+    """
+    if entry is None:
+        return False
+    if other is None:
+        return True
+    return (entry_stamp(entry), entry_digest(entry)) > (entry_stamp(other), entry_digest(other))
+
+
+class SyncResult(NamedTuple):
+    """
+    Outcome of one synchronization.
+
+    Attributes:
+        pulled: Entries applied locally (records and deletions)
+        pushed: Entries sent to the remote store
+        buckets: Buckets whose content was exchanged
+        round_trips: Requests made to the transport
+    """
+
+    pulled: int
+    pushed: int
+    buckets: int
+    round_trips: int
+
+
+class SyncReplica:
+    """
+    Synchronization endpoint for one SmartPasswordManager.
+
+    Keeps a Merkle tree over public-key buckets that is updated from the
+    manager's change events, so only buckets touched since the last sync
+    are rehashed, and records deletions as tombstones in a state file next
+    to the store (deleted entries must win over older copies on the peer).
+    The tombstone file is an append-only NDJSON log, compacted on close().
+
+    Entries are ordered by their (modified, version) stamps; the newest copy
+    of each entry wins on both sides. Stamps rely on reasonably synchronized
+    clocks; the version counter orders edits made within one clock tick.
+
+    A replica serves as the remote side through a transport as well as
+    driving sync() locally.
+    """
+
+    def __init__(self, manager, depth: int = 3, state_path: Optional[str] = None):
+        """
+        Attach a replica to a manager.
+
+        Args:
+            manager: SmartPasswordManager to synchronize
+            depth: Bucket prefix length in hex characters (1-4, must match the peer)
+            state_path: Tombstone log file (default: store path + '.sync', None for in-memory stores)
+        """
+        self.manager = manager
+        self.tree = BucketTree(depth)
+        if state_path is None and manager.storage.path is not None:
+            state_path = manager.storage.path.rstrip(os.sep) + '.sync'
+        self.state_path = state_path
+        self._log_lines = 0
+        self._tombstones: Dict[str, Entry] = self._load_state()
+        self._buckets: Dict[str, Set[str]] = defaultdict(set)
+        self._dirty: Set[str] = set()
+        self._applying = False
+        for public_key in list(manager.passwords) + list(self._tombstones):
+            self._index(public_key)
+        self._subscription = manager.subscribe(self._on_change)
+
+    @property
+    def depth(self) -> int:
+        return self.tree.depth
+
+    @property
+    def tombstones(self) -> Dict[str, Entry]:
+        """Deletion markers keyed by public key."""
+        return dict(self._tombstones)
+
+    def _load_state(self) -> Dict[str, Entry]:
+        """Replay the tombstone log: a header line, then tombstones and {"public_key", "restored"} markers."""
+        tombstones: Dict[str, Entry] = {}
+        if self.state_path is None or not os.path.isfile(self.state_path):
+            return tombstones
+        with open(self.state_path, 'r') as f:
+            header = json.loads(f.readline() or '{}')
+            if header.get("format") != STATE_FORMAT or header.get("version") != STATE_VERSION:
+                raise ValueError(f"Unsupported sync state version: {header.get('version')}")
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # torn final line after a crash
+                self._log_lines += 1
+                if entry.get("restored"):
+                    tombstones.pop(entry["public_key"], None)
+                else:
+                    tombstones[entry["public_key"]] = entry
+        return tombstones
+
+    def _append_state(self, entries: Iterable[Entry]) -> None:
+        """Append tombstone changes to the log, compacting it once it is mostly stale."""
+        if self.state_path is None:
+            return
+        lines = [json.dumps(entry) + '\n' for entry in entries]
+        if not lines:
+            return
+        if not os.path.isfile(self.state_path):
+            self.compact()  # writes the current tombstones, including these changes
+            return
+        with open(self.state_path, 'a') as f:
+            f.writelines(lines)
+        self._log_lines += len(lines)
+        if self._log_lines > 2 * len(self._tombstones) + 1024:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the tombstone log with live tombstones only."""
+        if self.state_path is None:
+            return
+        header = json.dumps({"format": STATE_FORMAT, "version": STATE_VERSION})
+        atomic_write_text(self.state_path, ''.join(
+            [header + '\n'] + [json.dumps(entry) + '\n' for entry in self._tombstones.values()]
+        ))
+        self._log_lines = len(self._tombstones)
+
+    def _index(self, public_key: str) -> None:
+        bucket = bucket_of(public_key, self.depth)
+        self._buckets[bucket].add(public_key)
+        self._dirty.add(bucket)
+
+    def _on_change(self, event: ChangeEvent) -> None:
+        """Track local changes: mark buckets dirty and record deletions."""
+        if self._applying or event.public_key is None:
+            return
+        if event.type == DELETED:
+            tombstone = self._tombstones[event.public_key] = {
+                "public_key": event.public_key,
+                "deleted": True,
+                "version": event.old.version + 1,
+                "modified": time.time(),
+            }
+            self._append_state([tombstone])
+        elif self._tombstones.pop(event.public_key, None) is not None:
+            self._append_state([{"public_key": event.public_key, "restored": True}])
+        self._index(event.public_key)
+
+    def _refresh(self) -> None:
+        """Rehash buckets changed since the last tree query."""
+        passwords = self.manager.passwords
+        for bucket in self._dirty:
+            keys = self._buckets[bucket]
+            for public_key in [k for k in keys if k not in passwords and k not in self._tombstones]:
+                keys.discard(public_key)
+            if not keys:
+                self.tree.set_leaf(bucket, None)
+                continue
+            state = hashlib.sha256()
+            for public_key in sorted(keys):
+                state.update(public_key.encode('utf-8') + b'\0' + entry_digest(self._entry(public_key)))
+            self.tree.set_leaf(bucket, state.digest())
+        self._dirty.clear()
+
+    def _entry(self, public_key: str) -> Optional[Entry]:
+        password = self.manager.get_smart_password(public_key)
+        if password is not None:
+            return password.to_dict()
+        return self._tombstones.get(public_key)
+
+    # Peer protocol (called locally or through a transport)
+
+    def info(self) -> Dict[str, Any]:
+        """Replica parameters and root hash."""
+        self._refresh()
+        return {"depth": self.depth, "root": self.tree.root.hex()}
+
+    def children(self, prefixes: List[str]) -> Dict[str, str]:
+        """Child hashes of the given tree nodes."""
+        self._refresh()
+        return self.tree.children(prefixes)
+
+    def entries(self, buckets: List[str]) -> Dict[str, Entry]:
+        """All records and tombstones in the given buckets."""
+        self._refresh()
+        result = {}
+        for bucket in buckets:
+            for public_key in self._buckets.get(bucket, ()):
+                entry = self._entry(public_key)
+                if entry is not None:
+                    result[public_key] = entry
+        return result
+
+    def apply(self, entries: Dict[str, Entry]) -> int:
+        """
+        Merge entries from a peer, keeping the newer copy of each.
+
+        Args:
+            entries: Records and tombstones keyed by public key
+
+        Returns:
+            int: Number of entries that replaced the local copy
+        """
+        puts: List[SmartPassword] = []
+        deletes: List[str] = []
+        log: List[Entry] = []
+        for public_key, entry in entries.items():
+            if not wins(entry, self._entry(public_key)):
+                continue
+            if entry.get("deleted"):
+                self._tombstones[public_key] = entry
+                log.append(entry)
+                if self.manager.get_smart_password(public_key) is not None:
+                    deletes.append(public_key)
+            else:
+                if self._tombstones.pop(public_key, None) is not None:
+                    log.append({"public_key": public_key, "restored": True})
+                puts.append(SmartPassword.from_dict(entry))
+            self._index(public_key)
+        self._append_state(log)
+        self._applying = True
+        try:
+            if puts or deletes:
+                self.manager._commit_batch(puts, deletes, origin=EXTERNAL)
+        finally:
+            self._applying = False
+        return len(puts) + sum(1 for entry in log if entry.get("deleted"))
+
+    # Driver
+
+    def sync(self, transport) -> SyncResult:
+        """
+        Synchronize with a peer in both directions.
+
+        Compares Merkle roots, descends through differing nodes to the
+        differing buckets, exchanges only those buckets and applies the
+        newer copy of every entry on each side.
+
+        Args:
+            transport: SyncTransport connected to the peer replica
+
+        Returns:
+            SyncResult: Transfer statistics
+
+        Raises:
+            ValueError: If the peer uses a different bucket depth
+        """
+        remote = transport.info()
+        round_trips = 1
+        if remote["depth"] != self.depth:
+            raise ValueError(f"Bucket depth mismatch: local {self.depth}, remote {remote['depth']}")
+        if remote["root"] == self.info()["root"]:
+            return SyncResult(0, 0, 0, round_trips)
+
+        frontier = ['']
+        while frontier and len(frontier[0]) < self.depth:
+            remote_children = transport.children(frontier)
+            round_trips += 1
+            frontier = BucketTree.diff(self.children(frontier), remote_children)
+
+        remote_entries = transport.entries(frontier)
+        round_trips += 1
+        local_entries = self.entries(frontier)
+        pull = {k: e for k, e in remote_entries.items() if wins(e, local_entries.get(k))}
+        push = {k: e for k, e in local_entries.items() if wins(e, remote_entries.get(k))}
+        if pull:
+            self.apply(pull)
+        if push:
+            transport.apply(push)
+            round_trips += 1
+        return SyncResult(len(pull), len(push), len(frontier), round_trips)
+
+    def prune_tombstones(self, older_than: float) -> int:
+        """
+        Forget deletions made before a time.
+
+        Only prune once every peer has synced past that time, or deleted
+        entries may come back from a stale peer.
+
+        Args:
+            older_than: Unix timestamp
+
+        Returns:
+            int: Number of tombstones removed
+        """
+        stale = [k for k, entry in self._tombstones.items() if entry_stamp(entry)[0] < older_than]
+        for public_key in stale:
+            del self._tombstones[public_key]
+            self._index(public_key)
+        if stale:
+            self.compact()
+        return len(stale)
+
+    def close(self) -> None:
+        """Stop tracking manager changes and compact the tombstone log."""
+        self._subscription.unsubscribe()
+        if self.state_path is not None and os.path.isfile(self.state_path):
+            self.compact()
@@ -0,0 +1,111 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
+from smartpasslib.sync.replica import Entry, SyncReplica
+
+
+class SyncTransport(ABC):
+    """
+    Connection to a remote SyncReplica.
+
+    The four requests mirror the replica's peer protocol and carry only
+    JSON-compatible payloads, so a transport can forward them over any
+    channel (HTTP, SSH, a message queue).
+    """
+
+    @abstractmethod
+    def info(self) -> Dict[str, Any]:
+        """Remote {"depth", "root"}."""
+
+    @abstractmethod
+    def children(self, prefixes: List[str]) -> Dict[str, str]:
+        """Remote child hashes of the given nodes."""
+
+    @abstractmethod
+    def entries(self, buckets: List[str]) -> Dict[str, Entry]:
+        """Remote records and tombstones in the given buckets."""
+
+    @abstractmethod
+    def apply(self, entries: Dict[str, Entry]) -> int:
+        """Merge entries into the remote store."""
+
+    def close(self) -> None:
+        """Release the connection."""
+
+    def __enter__(self) -> 'SyncTransport':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class LocalTransport(SyncTransport):
+    """
+    In-process transport to a replica.
+
+    Payloads are round-tripped through JSON as a network transport would,
+    and request and transfer counters are kept for inspection.
+    """
+
+    def __init__(self, replica: SyncReplica):
+        self.replica = replica
+        self.requests = 0
+        self.records_sent = 0
+        self.records_received = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def _call(self, method: str, payload: Any) -> Any:
+        request = json.dumps(payload)
+        self.requests += 1
+        self.bytes_sent += len(request)
+        response = json.dumps(getattr(self.replica, method)(*json.loads(request)))
+        self.bytes_received += len(response)
+        return json.loads(response)
+
+    def info(self) -> Dict[str, Any]:
+        return self._call('info', [])
+
+    def children(self, prefixes: List[str]) -> Dict[str, str]:
+        return self._call('children', [prefixes])
+
+    def entries(self, buckets: List[str]) -> Dict[str, Entry]:
+        result = self._call('entries', [buckets])
+        self.records_received += len(result)
+        return result
+
+    def apply(self, entries: Dict[str, Entry]) -> int:
+        self.records_sent += len(entries)
+        return self._call('apply', [entries])
+
+
+class FileTransport(LocalTransport):
+    """
+    Transport to another store on a local or mounted file system.
+
+    Opens the store (a JSON file, or a shard directory) with its own
+    manager and replica, e.g. to sync with a copy on a USB drive.
+    """
+
+    def __init__(self, path: str, depth: int = 3):
+        """
+        Open a store as the remote side.
+
+        Args:
+            path: passwords.json file or ShardedDirectoryStorage directory
+            depth: Bucket depth (must match the local replica)
+        """
+        if os.path.isdir(path):
+            self.manager = SmartPasswordManager(storage=ShardedDirectoryStorage(path))
+        else:
+            self.manager = SmartPasswordManager(filename=path)
+        super().__init__(SyncReplica(self.manager, depth=depth))
+
+    def close(self) -> None:
+        self.replica.close()
+        self.manager.close()
@@ -0,0 +1,48 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+"""Store integrity audit from the command line.
+
+Streams a passwords.json file, compressed store or sharded store directory,
+validates every record and writes an NDJSON report: one line per issue, then
+a summary line.
+
+Usage:
+    python -m smartpasslib.tools.audit ~/.config/smart_password_manager/passwords.json
+    python -m smartpasslib.tools.audit ./store --report audit.ndjson --workers 4
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from smartpasslib.managers.audit import audit_store
+from smartpasslib.utils.parallel import DerivationExecutor
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m smartpasslib.tools.audit",
+        description="Check every record of a smart password store.",
+    )
+    parser.add_argument("store", help="passwords.json file, compressed store or sharded store directory")
+    parser.add_argument("--report", default=None, help="write an NDJSON report to this file")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--expected-records", type=int, default=None,
+                        help="expected record count for the duplicate filter (default: from store size)")
+    parser.add_argument("--max-issues", type=int, default=20, help="issues printed to stderr")
+    args = parser.parse_args(argv)
+
+    try:
+        with DerivationExecutor(args.workers, chunk_size=512) as executor:
+            report = audit_store(args.store, args.report, executor, args.expected_records, args.max_issues)
+    except ValueError as e:
+        parser.error(str(e))
+    for issue in report.issues:
+        location = f"{issue.source}:{issue.line}"
+        print(f"{location}: {issue.code}: {issue.message}" + (f" [{issue.key}]" if issue.key else ""),
+              file=sys.stderr)
+    print(f"Audited {report.records} records in {report.sources} file(s), {report.issue_count} issue(s)")
+    return 0 if report.ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,228 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+"""High-throughput batch derivation for shell pipelines.
+
+Reads secrets from stdin or a file as a stream, derives smart passwords,
+public keys or verification results across worker processes, and writes
+NDJSON or CSV in input order. Memory use is bounded by the executor's
+in-flight window, not by the input size.
+
+Input formats:
+    tsv     secret[<TAB>length]          (password mode)
+            secret                       (public-key mode)
+            secret<TAB>public_key        (verify mode)
+    ndjson  {"secret": ..., "length": ..., "public_key": ..., "id": ...}
+    csv     header row with secret, length, public_key and optional id columns
+
+Usage:
+    smartpass-batch --mode password --length 20 < secrets.tsv > passwords.ndjson
+    smartpass-batch --mode verify --input-format csv --output-format csv --input pairs.csv
+"""
+import argparse
+import csv
+import json
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, IO, Iterator, List, Optional, Tuple
+
+from smartpasslib.masters.smart_password_master import SmartPasswordMaster
+from smartpasslib.utils.parallel import AUTO, BACKENDS, DerivationExecutor
+
+MODES = ("password", "public-key", "verify")
+INPUT_FORMATS = ("tsv", "ndjson", "csv")
+OUTPUT_FORMATS = ("ndjson", "csv")
+OUTPUT_FIELDS = {
+    "password": ["line", "id", "length", "password", "error"],
+    "public-key": ["line", "id", "public_key", "error"],
+    "verify": ["line", "id", "public_key", "valid", "error"],
+}
+
+Task = Tuple[str, Optional[str], int, Optional[str], Optional[str]]
+
+
+def derive(mode: str, secret: Optional[str], length: int, public_key: Optional[str],
+           error: Optional[str]) -> Dict[str, Any]:
+    """
+    Process one input record (runs in a worker process).
+
+    Args:
+        mode: "password", "public-key" or "verify"
+        secret: Secret phrase
+        length: Password length (password mode)
+        public_key: Public key to check (verify mode)
+        error: Parse error found while reading the record
+
+    Returns:
+        Dict[str, Any]: Output fields for the record
+    """
+    if error is not None:
+        return {"error": error}
+    try:
+        if mode == "password":
+            return {"length": length, "password": SmartPasswordMaster.generate_smart_password(secret, length)}
+        if mode == "public-key":
+            return {"public_key": SmartPasswordMaster.generate_public_key(secret)}
+        return {"public_key": public_key, "valid": SmartPasswordMaster.check_public_key(secret, public_key)}
+    except ValueError as e:
+        return {"error": str(e)}
+
+
+def read_records(stream: IO[str], input_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream raw records from the input.
+
+    Args:
+        stream: Text input
+        input_format: "tsv", "ndjson" or "csv"
+
+    Returns:
+        Iterator[Dict[str, Any]]: Records with secret, length, public_key and id keys when present
+    """
+    if input_format == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        line = line.rstrip('\r\n')
+        if not line:
+            continue
+        if input_format == "ndjson":
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                record = {"_error": f"Invalid JSON: {e}"}
+            yield record if isinstance(record, dict) else {"_error": "Record must be a JSON object"}
+        else:
+            yield dict(zip(("secret", "second"), line.split('\t', 1)))
+
+
+def build_tasks(records: Iterator[Dict[str, Any]], mode: str, default_length: int,
+                meta: Deque[Tuple[int, Any]]) -> Iterator[Task]:
+    """
+    Turn raw records into executor tasks, remembering line numbers and ids in meta.
+
+    Args:
+        records: Raw records
+        mode: Batch mode
+        default_length: Length used when a record does not specify one
+        meta: Queue receiving (line, id) for every produced task
+    """
+    for line, record in enumerate(records, 1):
+        meta.append((line, record.get("id")))
+        if "_error" in record:
+            yield mode, None, default_length, None, record["_error"]
+            continue
+        secret = record.get("secret")
+        public_key = record.get("public_key")
+        length = record.get("length")
+        if "second" in record:
+            if mode == "verify":
+                public_key = record["second"]
+            else:
+                length = record["second"]
+        if secret is None:
+            yield mode, None, default_length, None, "Missing secret"
+            continue
+        if mode == "verify" and not public_key:
+            yield mode, secret, default_length, None, "Missing public_key"
+            continue
+        try:
+            length = default_length if length in (None, "") else int(length)
+        except (TypeError, ValueError):
+            yield mode, secret, default_length, public_key, f"Invalid length: {length}"
+            continue
+        yield mode, secret, length, public_key, None
+
+
+class OutputWriter:
+    """
+    NDJSON or CSV result writer.
+    """
+
+    def __init__(self, stream: IO[str], output_format: str, mode: str):
+        self._stream = stream
+        self._fields = OUTPUT_FIELDS[mode]
+        self._csv = None
+        if output_format == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=self._fields, extrasaction='ignore', lineterminator='\n')
+            self._csv.writeheader()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Write one result row."""
+        if self._csv is not None:
+            self._csv.writerow(row)
+        else:
+            self._stream.write(json.dumps({k: row[k] for k in self._fields if row.get(k) is not None}) + '\n')
+
+
+def run(stream_in: IO[str], stream_out: IO[str], mode: str = "password", input_format: str = "tsv",
+        output_format: str = "ndjson", length: int = 12, executor: Optional[DerivationExecutor] = None) -> int:
+    """
+    Run a batch from an input stream to an output stream.
+
+    Args:
+        stream_in: Text input
+        stream_out: Text output
+        mode: "password", "public-key" or "verify"
+        input_format: "tsv", "ndjson" or "csv"
+        output_format: "ndjson" or "csv"
+        length: Default password length
+        executor: Derivation executor (default: one worker per CPU)
+
+    Returns:
+        int: Number of records that failed
+    """
+    own_executor = executor is None
+    executor = executor or DerivationExecutor()
+    writer = OutputWriter(stream_out, output_format, mode)
+    meta: Deque[Tuple[int, Any]] = deque()
+    failures = 0
+    try:
+        tasks = build_tasks(read_records(stream_in, input_format), mode, length, meta)
+        for result in executor.starmap(derive, tasks):
+            line, record_id = meta.popleft()
+            if "error" in result:
+                failures += 1
+            writer.write(dict(result, line=line, id=record_id))
+    finally:
+        if own_executor:
+            executor.shutdown()
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Console entry point for smartpass-batch."""
+    parser = argparse.ArgumentParser(
+        prog="smartpass-batch",
+        description="Derive smart passwords, public keys or verification results in bulk.",
+    )
+    parser.add_argument("--mode", choices=MODES, default="password")
+    parser.add_argument("--input", default="-", help="input file (default: stdin)")
+    parser.add_argument("--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS, default="tsv")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="ndjson")
+    parser.add_argument("--length", type=int, default=12, help="default password length (default: 12)")
+    parser.add_argument("--workers", type=int, default=None, help="workers (default: CPU count)")
+    parser.add_argument("--backend", choices=BACKENDS, default=AUTO,
+                        help="worker pool: processes, threads, or auto (threads when the GIL is disabled)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="records per worker task")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="pending chunks (default: 2 per worker)")
+    args = parser.parse_args(argv)
+
+    stream_in = sys.stdin if args.input == "-" else open(args.input, 'r', encoding='utf-8', newline='')
+    stream_out = sys.stdout if args.output == "-" else open(args.output, 'w', encoding='utf-8', newline='')
+    try:
+        executor = DerivationExecutor(args.workers, args.chunk_size, args.max_in_flight, backend=args.backend)
+        with executor:
+            failures = run(stream_in, stream_out, args.mode, args.input_format, args.output_format,
+                           args.length, executor)
+    finally:
+        if stream_in is not sys.stdin:
+            stream_in.close()
+        if stream_out is not sys.stdout:
+            stream_out.close()
+    if failures:
+        print(f"{failures} record(s) failed", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
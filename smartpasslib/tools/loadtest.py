@@ -0,0 +1,428 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+"""Concurrent load test for SmartPasswordManager.
+
+Runs a mix of reader, writer and deriver threads against one store, in one
+or several processes, then checks the store that is left on disk.
+
+- Readers look up seeded entries and occasionally reload() the store.
+- Writers add, update and delete entries of their own and remember the
+  state each entry should end in.
+- Derivers verify seeded secrets and generate their passwords.
+
+Every operation is timed. Unreadable stores, missing or malformed seed
+entries and failed verifications count as corruption; any other exception
+counts as an error. The final check reopens the store and compares it with
+the seeds and with every writer's expected state, so lost writes show up
+even when each operation succeeded on its own.
+
+Usage:
+    python -m smartpasslib.tools.loadtest --readers 8 --writers 2 --derivers 2 --duration 10
+    python -m smartpasslib.tools.loadtest --processes 4 --storage sharded --json report.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.json_file import JsonFileStorage
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
+from smartpasslib.utils.metrics import percentile
+
+READER = "reader"
+WRITER = "writer"
+DERIVER = "deriver"
+KINDS = (READER, WRITER, DERIVER)
+STORAGES = ("json", "sharded")
+MAX_MESSAGES = 10
+
+Expected = Dict[str, Optional[Tuple[str, int]]]
+
+
+def seed_secret(index: int) -> str:
+    """Secret of the index-th seeded entry."""
+    return f"loadtest-seed-{index:08d}"
+
+
+def open_manager(path: str, storage: str) -> SmartPasswordManager:
+    """Open a manager on a load-test store."""
+    if storage == "sharded":
+        return SmartPasswordManager(storage=ShardedDirectoryStorage(path))
+    return SmartPasswordManager(storage=JsonFileStorage(path))
+
+
+class OperationStats:
+    """Counters and latencies of one worker kind."""
+
+    def __init__(self):
+        self.operations = 0
+        self.errors = 0
+        self.corruption = 0
+        self.latencies: List[float] = []
+        self.messages: List[str] = []
+
+    def record(self, elapsed: float) -> None:
+        self.operations += 1
+        self.latencies.append(elapsed)
+
+    def fail(self, corrupt: bool, message: str) -> None:
+        if corrupt:
+            self.corruption += 1
+        else:
+            self.errors += 1
+        if len(self.messages) < MAX_MESSAGES:
+            self.messages.append(message)
+
+    def merge(self, other: 'OperationStats') -> None:
+        self.operations += other.operations
+        self.errors += other.errors
+        self.corruption += other.corruption
+        self.latencies.extend(other.latencies)
+        self.messages.extend(other.messages[:MAX_MESSAGES - len(self.messages)])
+
+    def summary(self, duration: float) -> Dict[str, Any]:
+        """Throughput, latency percentiles (ms) and failure counts."""
+        latencies = sorted(self.latencies)
+        return {
+            "operations": self.operations,
+            "throughput": self.operations / duration if duration > 0 else 0.0,
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p95_ms": percentile(latencies, 0.95) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+            "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+            "errors": self.errors,
+            "corruption": self.corruption,
+            "messages": list(self.messages),
+        }
+
+
+class LoadTestReport:
+    """Result of a load test run."""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.duration = 0.0
+        self.stats = {kind: OperationStats() for kind in KINDS}
+        self.expected: Expected = {}
+        self.records = 0
+        self.issues: List[str] = []
+        self.issue_count = 0
+
+    @property
+    def errors(self) -> int:
+        return sum(stats.errors for stats in self.stats.values())
+
+    @property
+    def corruption(self) -> int:
+        return sum(stats.corruption for stats in self.stats.values())
+
+    @property
+    def ok(self) -> bool:
+        """True if no operation failed and the final store is consistent."""
+        return not self.errors and not self.corruption and not self.issue_count
+
+    def issue(self, message: str) -> None:
+        self.issue_count += 1
+        if len(self.issues) < MAX_MESSAGES:
+            self.issues.append(message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary as a JSON-serializable dictionary."""
+        return {
+            "config": self.config,
+            "duration": self.duration,
+            "workers": {kind: stats.summary(self.duration) for kind, stats in self.stats.items()},
+            "records": self.records,
+            "consistency_issues": self.issue_count,
+            "issues": list(self.issues),
+            "ok": self.ok,
+        }
+
+    def format(self) -> str:
+        """Human-readable results table."""
+        lines = [f"{'worker':<8}{'ops':>10}{'ops/s':>11}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+                 f"{'errors':>8}{'corrupt':>9}"]
+        for kind, stats in self.stats.items():
+            s = stats.summary(self.duration)
+            lines.append(f"{kind:<8}{s['operations']:>10}{s['throughput']:>11.0f}{s['p50_ms']:>9.3f}"
+                         f"{s['p95_ms']:>9.3f}{s['p99_ms']:>9.3f}{s['errors']:>8}{s['corruption']:>9}")
+            lines.extend(f"  {kind}: {message}" for message in s["messages"])
+        lines.append(f"Final store: {self.records} records, {self.issue_count} consistency issue(s)")
+        lines.extend(f"  {issue}" for issue in self.issues)
+        lines.append("OK" if self.ok else "FAILED")
+        return '\n'.join(lines)
+
+
+def _check_seed(password: Optional[SmartPassword], public_key: str) -> Optional[str]:
+    if password is None:
+        return f"seed entry {public_key[:16]} missing"
+    if password.public_key != public_key or not 12 <= password.length <= 100:
+        return f"seed entry {public_key[:16]} malformed"
+    return None
+
+
+def _reader(manager, stats, seeds, rng, reload_ratio, next_op):
+    while next_op():
+        try:
+            start = time.perf_counter()
+            if reload_ratio and rng.random() < reload_ratio:
+                manager.reload()
+                problem = None
+            else:
+                public_key = rng.choice(seeds)[1]
+                problem = _check_seed(manager.get_smart_password(public_key), public_key)
+            stats.record(time.perf_counter() - start)
+            if problem:
+                stats.fail(True, problem)
+        except ValueError as e:
+            stats.fail(True, f"unreadable store on reload: {e}")
+        except Exception as e:
+            stats.fail(False, f"{type(e).__name__}: {e}")
+
+
+def _writer(manager, stats, expected, rng, tag, next_op):
+    live: List[str] = []
+    created = 0
+    while next_op():
+        try:
+            choice = rng.random()
+            if not live or choice < 0.4:
+                public_key = SmartKeyGenerator.generate_public_key(f"loadtest-{tag}-{created:08d}")
+                created += 1
+                state = (f"{tag} entry {created}", rng.randint(12, 100))
+                start = time.perf_counter()
+                manager.add_smart_password(SmartPassword(public_key, *state))
+                live.append(public_key)
+            elif choice < 0.8:
+                public_key = rng.choice(live)
+                state = (f"{tag} update {rng.random():.6f}", rng.randint(12, 100))
+                start = time.perf_counter()
+                if not manager.update_smart_password(public_key, *state):
+                    raise KeyError(f"own entry {public_key[:16]} vanished before update")
+            else:
+                public_key = live.pop(rng.randrange(len(live)))
+                state = None
+                start = time.perf_counter()
+                manager.delete_smart_password(public_key)
+            stats.record(time.perf_counter() - start)
+            expected[public_key] = state
+        except Exception as e:
+            stats.fail(False, f"{type(e).__name__}: {e}")
+
+
+def _deriver(manager, stats, seeds, rng, next_op):
+    while next_op():
+        try:
+            secret, public_key = rng.choice(seeds)
+            start = time.perf_counter()
+            verified = manager.verify_secret(public_key, secret)
+            manager.generate_smart_password(secret, 16)
+            stats.record(time.perf_counter() - start)
+            if not verified:
+                stats.fail(True, f"seed secret does not verify against {public_key[:16]}")
+        except Exception as e:
+            stats.fail(False, f"{type(e).__name__}: {e}")
+
+
+def _run_process(config: Dict[str, Any], process: int, seeds: List[Tuple[str, str]],
+                 start_at: float) -> Tuple[Dict[str, OperationStats], Expected]:
+    """Run one process worth of worker threads (also used in-process for a single process)."""
+    manager = open_manager(config["path"], config["storage"])
+    stats = {kind: OperationStats() for kind in KINDS}
+    expected: Expected = {}
+    threads = []
+    deadline = start_at + config["duration"]
+    budget = config["operations"]
+
+    def counter():
+        done = [0]
+
+        def next_op():
+            if budget is not None:
+                done[0] += 1
+                return done[0] <= budget
+            return time.monotonic() < deadline
+        return next_op
+
+    for index in range(config["readers"]):
+        rng = random.Random(f"{config['seed']}-{process}-r{index}")
+        thread_stats = OperationStats()
+        threads.append((READER, thread_stats, threading.Thread(
+            target=_reader,
+            args=(manager, thread_stats, seeds, rng, config["reload_ratio"], counter()))))
+    for index in range(config["writers"]):
+        rng = random.Random(f"{config['seed']}-{process}-w{index}")
+        thread_stats = OperationStats()
+        threads.append((WRITER, thread_stats, threading.Thread(
+            target=_writer, args=(manager, thread_stats, expected, rng, f"p{process}w{index}", counter()))))
+    for index in range(config["derivers"]):
+        rng = random.Random(f"{config['seed']}-{process}-d{index}")
+        thread_stats = OperationStats()
+        threads.append((DERIVER, thread_stats, threading.Thread(
+            target=_deriver, args=(manager, thread_stats, seeds, rng, counter()))))
+
+    time.sleep(max(0.0, start_at - time.monotonic()))
+    for _, _, thread in threads:
+        thread.start()
+    for kind, thread_stats, thread in threads:
+        thread.join()
+        stats[kind].merge(thread_stats)
+    manager.close()
+    return stats, expected
+
+
+def _check_store(report: LoadTestReport, path: str, storage: str, seeds: List[Tuple[str, str]]) -> None:
+    """Reopen the store and compare it with the seeds and the writers' expected state."""
+    manager = open_manager(path, storage)
+    try:
+        records = manager.storage.reload()
+    except ValueError as e:
+        report.issue(f"store unreadable after the run: {e}")
+        return
+    report.records = len(records)
+    for public_key, password in records.items():
+        if password.public_key != public_key or not 12 <= password.length <= 100:
+            report.issue(f"record {public_key[:16]} malformed")
+    for _, public_key in seeds:
+        problem = _check_seed(records.get(public_key), public_key)
+        if problem:
+            report.issue(problem)
+    known = {public_key for _, public_key in seeds} | set(report.expected)
+    for public_key, state in report.expected.items():
+        password = records.get(public_key)
+        if state is None and password is not None:
+            report.issue(f"deleted entry {public_key[:16]} is back (lost delete)")
+        elif state is not None and password is None:
+            report.issue(f"entry {public_key[:16]} missing (lost write)")
+        elif state is not None and (password.description, password.length) != state:
+            report.issue(f"entry {public_key[:16]} has a stale value (lost update)")
+    for public_key in records.keys() - known:
+        report.issue(f"unexpected entry {public_key[:16]}")
+
+
+def run_load_test(path: Optional[str] = None, readers: int = 4, writers: int = 2, derivers: int = 2,
+                  processes: int = 1, duration: float = 5.0, operations: Optional[int] = None,
+                  seed_records: int = 1000, storage: str = "json", reload_ratio: float = 0.05,
+                  seed: int = 0) -> LoadTestReport:
+    """
+    Run a concurrent load test against a store.
+
+    Args:
+        path: New or empty store file (json) or directory (sharded); the seed and writer
+              entries are left in it for inspection (default: a temporary store removed afterwards)
+        readers: Reader threads per process
+        writers: Writer threads per process
+        derivers: Deriver threads per process
+        processes: Processes, each with its own manager on the same store
+        duration: Seconds to run (ignored when operations is given)
+        operations: Operations per worker thread instead of a fixed duration
+        seed_records: Entries created before the run for readers and derivers
+        storage: "json" (one passwords.json) or "sharded" (shard directory)
+        reload_ratio: Fraction of reader operations that reload() the store
+        seed: Random seed of the operation mix
+
+    Returns:
+        LoadTestReport: Per-kind statistics and the final consistency check
+
+    Raises:
+        ValueError: If a worker count or option is invalid, or the store at path is not empty
+    """
+    if storage not in STORAGES:
+        raise ValueError(f"Unknown storage: {storage}")
+    if min(readers, writers, derivers) < 0 or readers + writers + derivers < 1:
+        raise ValueError("At least one worker is required")
+    if processes < 1:
+        raise ValueError("Processes must be at least 1")
+    if seed_records < 1:
+        raise ValueError("At least one seed record is required")
+    if not 0.0 <= reload_ratio <= 1.0:
+        raise ValueError("Reload ratio must be between 0 and 1")
+    if operations is None and duration <= 0:
+        raise ValueError("Duration must be positive")
+
+    with tempfile.TemporaryDirectory(prefix="smartpasslib-loadtest-") as tmp:
+        if path is None:
+            path = os.path.join(tmp, "passwords.json" if storage == "json" else "store")
+        config = {
+            "path": path, "storage": storage, "readers": readers, "writers": writers,
+            "derivers": derivers, "processes": processes, "duration": duration,
+            "operations": operations, "seed_records": seed_records,
+            "reload_ratio": reload_ratio, "seed": seed,
+        }
+        report = LoadTestReport(config)
+        seeds = [(seed_secret(i), SmartKeyGenerator.generate_public_key(seed_secret(i)))
+                 for i in range(seed_records)]
+        manager = open_manager(path, storage)
+        if manager.password_count:
+            manager.close()
+            raise ValueError(f"Store {path} is not empty; run the load test on a new or empty store")
+        manager._commit_batch([SmartPassword(public_key, f"seed {i}", 16)
+                               for i, (_, public_key) in enumerate(seeds)], [])
+        manager.close()
+
+        started = time.monotonic()
+        if processes == 1:
+            results = [_run_process(config, 0, seeds, started)]
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                started = time.monotonic() + 0.5  # let every process open the store first
+                futures = [pool.submit(_run_process, config, process, seeds, started)
+                           for process in range(processes)]
+                results = [future.result() for future in futures]
+        report.duration = time.monotonic() - started
+
+        for stats, expected in results:
+            for kind in KINDS:
+                report.stats[kind].merge(stats[kind])
+            report.expected.update(expected)
+        _check_store(report, path, storage, seeds)
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m smartpasslib.tools.loadtest",
+        description="Hit one smart password store with concurrent readers, writers and derivers.",
+    )
+    parser.add_argument("--store", default=None,
+                        help="new or empty store file or directory, left with the test entries "
+                             "(default: a temporary store)")
+    parser.add_argument("--storage", choices=STORAGES, default="json")
+    parser.add_argument("--readers", type=int, default=4, help="reader threads per process (default: 4)")
+    parser.add_argument("--writers", type=int, default=2, help="writer threads per process (default: 2)")
+    parser.add_argument("--derivers", type=int, default=2, help="deriver threads per process (default: 2)")
+    parser.add_argument("--processes", type=int, default=1, help="processes sharing the store (default: 1)")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds to run (default: 5)")
+    parser.add_argument("--operations", type=int, default=None,
+                        help="operations per thread instead of a fixed duration")
+    parser.add_argument("--seed-records", type=int, default=1000, help="entries created before the run")
+    parser.add_argument("--reload-ratio", type=float, default=0.05,
+                        help="fraction of reads that reload the store (default: 0.05)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the operation mix")
+    parser.add_argument("--json", default=None, help="also write the report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        report = run_load_test(args.store, args.readers, args.writers, args.derivers, args.processes,
+                               args.duration, args.operations, args.seed_records, args.storage,
+                               args.reload_ratio, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    print(report.format())
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report.to_dict(), f, indent=4)
+    return 0 if report.ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,323 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+"""Cross-implementation test-vector corpus generator and conformance checker.
+
+A corpus is a directory with a ``manifest.json`` and gzip-compressed shards.
+Each shard line holds one vector as tab-separated UTF-8 fields:
+
+    secret <TAB> length <TAB> private_key <TAB> public_key <TAB> smart_password
+
+Secrets never contain tabs or newlines, so ports can read shards with a plain
+line splitter. Vectors are produced by the v4 reference algorithm and are fully
+deterministic for a given corpus seed, so the same command always produces
+byte-identical shards.
+
+Usage:
+    python -m smartpasslib.tools.vectors generate ./corpus --count 1000000
+    python -m smartpasslib.tools.vectors verify ./corpus
+"""
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from smartpasslib.core.chars import PasswordChars
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.generators.smart import SmartPasswordGenerator
+
+FORMAT = "smartpasslib-vectors"
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+DEFAULT_SEED = "smartpasslib-v4"
+DEFAULT_SHARD_SIZE = 100_000
+
+SECRET_POOLS = (
+    ''.join(chr(c) for c in range(0x20, 0x7f)),
+    "абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ",
+    "密码短语测试安全钥匙数据中心网络世界你好",
+    "🔐🔑🗝️🐱🦛🚀✨",
+)
+
+
+def make_secret(seed: str, index: int) -> Tuple[str, int]:
+    """
+    Build the deterministic secret and password length of a vector.
+
+    Args:
+        seed: Corpus seed
+        index: Vector index
+
+    Returns:
+        Tuple[str, int]: Secret phrase (12-64 characters) and length (12-100)
+    """
+    stream = b''
+    block = 0
+    while len(stream) < 72:
+        stream += hashlib.sha256(f"{seed}:{index}:{block}".encode('utf-8')).digest()
+        block += 1
+    pool = SECRET_POOLS[0] if stream[0] < 160 else SECRET_POOLS[stream[0] % len(SECRET_POOLS)]
+    size = 12 + stream[1] % 53
+    secret = ''.join(pool[byte % len(pool)] for byte in stream[8:8 + size])
+    length = 12 + stream[2] % 89
+    return secret, length
+
+
+def reference_vector(secret: str, length: int) -> Tuple[str, str, str]:
+    """
+    Derive a vector with the reference (unoptimized) v4 algorithm.
+
+    Args:
+        secret: Secret phrase
+        length: Smart password length
+
+    Returns:
+        Tuple[str, str, str]: Private key, public key and smart password
+    """
+    keys = []
+    for min_steps, max_steps, salt in ((15, 30, "private"), (45, 60, "public")):
+        steps = SmartKeyGenerator._get_steps_from_secret(secret, min_steps, max_steps, salt=salt)
+        keys.append(SmartKeyGenerator._create_key(secret=secret, steps=steps, salt=salt))
+    private_key, public_key = keys
+
+    alphabet = PasswordChars.all()
+    result = []
+    counter = 0
+    while len(result) < length:
+        for byte in hashlib.sha256(f"{private_key}:{counter}".encode()).digest():
+            if len(result) < length:
+                result.append(alphabet[byte % len(alphabet)])
+        counter += 1
+    return private_key, public_key, ''.join(result)
+
+
+def shard_name(index: int) -> str:
+    """Get the file name of a shard."""
+    return f"vectors-{index:05d}.tsv.gz"
+
+
+def write_shard(directory: str, seed: str, index: int, start: int, count: int) -> Dict[str, object]:
+    """
+    Generate and write one shard.
+
+    Args:
+        directory: Corpus directory
+        seed: Corpus seed
+        index: Shard index
+        start: Index of the first vector in the shard
+        count: Number of vectors in the shard
+
+    Returns:
+        Dict[str, object]: Manifest entry with name, first index, count and sha256
+    """
+    name = shard_name(index)
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as raw:
+        with gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) as compressed:
+            with io.TextIOWrapper(compressed, encoding='utf-8', newline='\n') as out:
+                for vector_index in range(start, start + count):
+                    secret, length = make_secret(seed, vector_index)
+                    private_key, public_key, password = reference_vector(secret, length)
+                    out.write(f"{secret}\t{length}\t{private_key}\t{public_key}\t{password}\n")
+    return {"name": name, "start": start, "count": count, "sha256": file_sha256(path)}
+
+
+def file_sha256(path: str) -> str:
+    """Get the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def generate_corpus(directory: str, count: int, shard_size: int = DEFAULT_SHARD_SIZE,
+                    seed: str = DEFAULT_SEED, workers: Optional[int] = None) -> Dict[str, object]:
+    """
+    Generate a sharded vector corpus, one shard per worker task.
+
+    Args:
+        directory: Output directory (created if missing)
+        count: Total number of vectors
+        shard_size: Vectors per shard
+        seed: Corpus seed
+        workers: Worker processes (default: CPU count)
+
+    Returns:
+        Dict[str, object]: Written manifest
+
+    Raises:
+        ValueError: If count or shard_size is not positive
+    """
+    if count < 1:
+        raise ValueError("Vector count must be at least 1")
+    if shard_size < 1:
+        raise ValueError("Shard size must be at least 1")
+
+    os.makedirs(directory, exist_ok=True)
+    starts = list(range(0, count, shard_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        shards = list(executor.map(
+            write_shard,
+            [directory] * len(starts),
+            [seed] * len(starts),
+            range(len(starts)),
+            starts,
+            [min(shard_size, count - start) for start in starts],
+        ))
+
+    manifest = {
+        "format": FORMAT,
+        "format_version": FORMAT_VERSION,
+        "algorithm_version": 4,
+        "seed": seed,
+        "count": count,
+        "shard_size": shard_size,
+        "fields": ["secret", "length", "private_key", "public_key", "smart_password"],
+        "shards": shards,
+    }
+    with open(os.path.join(directory, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=4)
+    return manifest
+
+
+def read_manifest(directory: str) -> Dict[str, object]:
+    """
+    Read and validate a corpus manifest.
+
+    Raises:
+        ValueError: If the manifest is not a supported corpus manifest
+    """
+    with open(os.path.join(directory, MANIFEST_NAME), 'r') as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT or manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported vector corpus in {directory}")
+    return manifest
+
+
+def iter_shard(path: str) -> Iterator[Tuple[str, int, str, str, str]]:
+    """
+    Stream vectors from a shard file.
+
+    Args:
+        path: Shard file path
+
+    Returns:
+        Iterator[Tuple[str, int, str, str, str]]: secret, length, private key, public key, password
+    """
+    with gzip.open(path, 'rt', encoding='utf-8', newline='\n') as f:
+        for line in f:
+            secret, length, private_key, public_key, password = line.rstrip('\n').split('\t')
+            yield secret, int(length), private_key, public_key, password
+
+
+def verify_shard(path: str, expected_sha256: Optional[str] = None,
+                 max_failures: int = 10) -> Dict[str, object]:
+    """
+    Check SmartKeyGenerator and SmartPasswordGenerator against one shard.
+
+    Args:
+        path: Shard file path
+        expected_sha256: Checksum from the manifest (skipped if None)
+        max_failures: Maximum mismatches to report in detail
+
+    Returns:
+        Dict[str, object]: Shard name, checked count, mismatch count and failure samples
+    """
+    result = {"name": os.path.basename(path), "checked": 0, "mismatches": 0, "failures": []}
+    if expected_sha256 is not None and file_sha256(path) != expected_sha256:
+        result["failures"].append({"error": "checksum mismatch"})
+        result["mismatches"] += 1
+        return result
+
+    for line_number, (secret, length, private_key, public_key, password) in enumerate(iter_shard(path), 1):
+        actual = (
+            SmartKeyGenerator.generate_private_key(secret),
+            SmartKeyGenerator.generate_public_key(secret),
+            SmartPasswordGenerator.generate(secret, length),
+        )
+        result["checked"] += 1
+        if actual != (private_key, public_key, password):
+            result["mismatches"] += 1
+            if len(result["failures"]) < max_failures:
+                fields = ("private_key", "public_key", "smart_password")
+                result["failures"].append({
+                    "line": line_number,
+                    "fields": [field for field, a, e in zip(fields, actual, (private_key, public_key, password))
+                               if a != e],
+                })
+    return result
+
+
+def verify_corpus(directory: str, workers: Optional[int] = None, max_failures: int = 10) -> Dict[str, object]:
+    """
+    Check the library against every shard of a corpus in parallel.
+
+    Args:
+        directory: Corpus directory
+        workers: Worker processes (default: CPU count)
+        max_failures: Maximum mismatches to report in detail per shard
+
+    Returns:
+        Dict[str, object]: Summary with checked/mismatch totals and per-shard results
+    """
+    manifest = read_manifest(directory)
+    shards: List[Dict[str, object]] = manifest["shards"]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            verify_shard,
+            [os.path.join(directory, shard["name"]) for shard in shards],
+            [shard["sha256"] for shard in shards],
+            [max_failures] * len(shards),
+        ))
+    checked = sum(result["checked"] for result in results)
+    mismatches = sum(result["mismatches"] for result in results)
+    return {
+        "count": manifest["count"],
+        "checked": checked,
+        "mismatches": mismatches,
+        "ok": mismatches == 0 and checked == manifest["count"],
+        "shards": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m smartpasslib.tools.vectors",
+        description="Generate or verify a cross-implementation test-vector corpus.",
+    )
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True  # the required= argument needs Python 3.7
+
+    generate = commands.add_parser("generate", help="write a new corpus")
+    generate.add_argument("directory")
+    generate.add_argument("--count", type=int, default=1_000_000)
+    generate.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    generate.add_argument("--seed", default=DEFAULT_SEED)
+    generate.add_argument("--workers", type=int, default=None)
+
+    verify = commands.add_parser("verify", help="check this library against a corpus")
+    verify.add_argument("directory")
+    verify.add_argument("--workers", type=int, default=None)
+    verify.add_argument("--max-failures", type=int, default=10)
+
+    args = parser.parse_args(argv)
+    if args.command == "generate":
+        manifest = generate_corpus(args.directory, args.count, args.shard_size, args.seed, args.workers)
+        print(f"Wrote {manifest['count']} vectors in {len(manifest['shards'])} shards to {args.directory}")
+        return 0
+
+    report = verify_corpus(args.directory, args.workers, args.max_failures)
+    for shard in report["shards"]:
+        for failure in shard["failures"]:
+            print(f"{shard['name']}: {json.dumps(failure)}", file=sys.stderr)
+    print(f"Checked {report['checked']}/{report['count']} vectors, {report['mismatches']} mismatches")
+    return 0 if report["ok"] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+"""Authenticated encryption for stored metadata.
+
+Two ciphers are available:
+
+- "aes-256-gcm" uses the optional ``cryptography`` package.
+- "shake256-hmac" needs only the standard library: a SHAKE-256 keystream
+  (key and nonce absorbed into the sponge) XORed with the plaintext, then
+  HMAC-SHA256 over the associated data, nonce and ciphertext
+  (encrypt-then-MAC).
+
+Both take one 32-byte master key; the stdlib cipher derives separate
+encryption and MAC keys from it.
+"""
+import hashlib
+import hmac
+import os
+import struct
+
+AES_GCM = "aes-256-gcm"
+SHAKE_HMAC = "shake256-hmac"
+CIPHERS = (AES_GCM, SHAKE_HMAC)
+KEY_BYTES = 32
+
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+except ImportError:  # optional dependency
+    AESGCM = None
+
+
+class AuthenticationError(ValueError):
+    """Ciphertext or associated data failed authentication (tampered data or wrong key)."""
+
+
+def available_ciphers() -> tuple:
+    """Ciphers usable in this environment."""
+    return CIPHERS if AESGCM is not None else (SHAKE_HMAC,)
+
+
+def default_cipher() -> str:
+    """AES-256-GCM when the cryptography package is installed, the stdlib cipher otherwise."""
+    return AES_GCM if AESGCM is not None else SHAKE_HMAC
+
+
+class Aead:
+    """
+    One cipher bound to a key.
+
+    Every encrypt() call draws a fresh random nonce and returns
+    nonce + ciphertext + tag, so messages are self-contained.
+    """
+
+    def __init__(self, key: bytes, cipher: str = SHAKE_HMAC):
+        """
+        Initialize a cipher.
+
+        Args:
+            key: 32-byte master key
+            cipher: "aes-256-gcm" or "shake256-hmac"
+
+        Raises:
+            ValueError: If the cipher is unknown, unavailable or the key has the wrong size
+        """
+        if cipher not in CIPHERS:
+            raise ValueError(f"Unsupported cipher: {cipher}")
+        if len(key) != KEY_BYTES:
+            raise ValueError(f"Cipher key must be {KEY_BYTES} bytes")
+        self.cipher = cipher
+        if cipher == AES_GCM:
+            if AESGCM is None:
+                raise ValueError("aes-256-gcm requires the cryptography package")
+            self.nonce_bytes = 12
+            self._aesgcm = AESGCM(bytes(key))
+        else:
+            self.nonce_bytes = 16
+            self._enc_key = hmac.new(key, b"smartpasslib aead encryption", hashlib.sha256).digest()
+            self._mac_key = hmac.new(key, b"smartpasslib aead authentication", hashlib.sha256).digest()
+
+    @property
+    def overhead(self) -> int:
+        """Bytes added to every message (nonce and tag)."""
+        return self.nonce_bytes + 16
+
+    def _tag(self, nonce: bytes, ciphertext: bytes, associated_data: bytes) -> bytes:
+        mac = hmac.new(self._mac_key, struct.pack('>Q', len(associated_data)), hashlib.sha256)
+        mac.update(associated_data)
+        mac.update(nonce)
+        mac.update(ciphertext)
+        return mac.digest()[:16]
+
+    def _xor(self, nonce: bytes, data: bytes) -> bytes:
+        stream = hashlib.shake_256(self._enc_key + nonce).digest(len(data))
+        return (int.from_bytes(data, 'little') ^ int.from_bytes(stream, 'little')).to_bytes(len(data), 'little')
+
+    def encrypt(self, plaintext: bytes, associated_data: bytes = b'') -> bytes:
+        """
+        Encrypt and authenticate a message.
+
+        Args:
+            plaintext: Message
+            associated_data: Data authenticated but not encrypted (e.g. a record position)
+
+        Returns:
+            bytes: nonce + ciphertext + 16-byte tag
+        """
+        nonce = os.urandom(self.nonce_bytes)
+        if self.cipher == AES_GCM:
+            return nonce + self._aesgcm.encrypt(nonce, plaintext, associated_data)
+        ciphertext = self._xor(nonce, plaintext)
+        return nonce + ciphertext + self._tag(nonce, ciphertext, associated_data)
+
+    def decrypt(self, message: bytes, associated_data: bytes = b'') -> bytes:
+        """
+        Verify and decrypt a message.
+
+        Args:
+            message: Output of encrypt()
+            associated_data: Same associated data as used for encryption
+
+        Returns:
+            bytes: Plaintext
+
+        Raises:
+            AuthenticationError: If the message was modified or the key is wrong
+        """
+        if len(message) < self.overhead:
+            raise AuthenticationError("Encrypted message is truncated")
+        nonce, body = message[:self.nonce_bytes], message[self.nonce_bytes:]
+        if self.cipher == AES_GCM:
+            try:
+                return self._aesgcm.decrypt(nonce, body, associated_data)
+            except Exception:
+                raise AuthenticationError("Encrypted message failed authentication") from None
+        ciphertext, tag = body[:-16], body[-16:]
+        if not hmac.compare_digest(tag, self._tag(nonce, ciphertext, associated_data)):
+            raise AuthenticationError("Encrypted message failed authentication")
+        return self._xor(nonce, ciphertext)
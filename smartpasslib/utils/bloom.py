@@ -0,0 +1,120 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+import math
+from typing import Union
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter for string keys.
+
+    Memory is allocated once from the expected capacity and the target false
+    positive rate, and never grows. Membership answers are "definitely not
+    present" or "possibly present".
+
+    Bit positions use double hashing over one BLAKE2b digest per key.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false positive rate at capacity (0 < rate < 1)
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range
+        """
+        if capacity < 1:
+            raise ValueError("Bloom filter capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1")
+        bits = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._size = (bits + 7) // 8 * 8
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray(self._size // 8)
+        self._count = 0
+
+    @property
+    def size(self) -> int:
+        """Number of bits."""
+        return self._size
+
+    @property
+    def hashes(self) -> int:
+        """Number of bit positions per key."""
+        return self._hashes
+
+    @property
+    def count(self) -> int:
+        """Number of add() calls that set at least one new bit."""
+        return self._count
+
+    def _positions(self, key: Union[str, bytes]):
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        size = self._size
+        return [(first + i * second) % size for i in range(self._hashes)]
+
+    def add(self, key: Union[str, bytes]) -> bool:
+        """
+        Add a key.
+
+        Args:
+            key: Key to add
+
+        Returns:
+            bool: True if the key was possibly present already
+        """
+        bits = self._bits
+        present = True
+        for position in self._positions(key):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                present = False
+        if not present:
+            self._count += 1
+        return present
+
+    def __contains__(self, key: Union[str, bytes]) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the filter.
+
+        Returns:
+            bytes: Header (bit count, hash count, key count) followed by the bit array
+        """
+        return (self._size.to_bytes(8, 'big') + self._hashes.to_bytes(2, 'big')
+                + self._count.to_bytes(8, 'big') + bytes(self._bits))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        """
+        Restore a filter written by to_bytes.
+
+        Args:
+            data: Serialized filter
+
+        Returns:
+            BloomFilter: Restored filter
+
+        Raises:
+            ValueError: If the data is truncated
+        """
+        size = int.from_bytes(data[:8], 'big')
+        if not size or size % 8 or len(data) != 18 + size // 8:
+            raise ValueError("Invalid Bloom filter data")
+        bloom = cls.__new__(cls)
+        bloom._size = size
+        bloom._hashes = int.from_bytes(data[8:10], 'big')
+        bloom._count = int.from_bytes(data[10:18], 'big')
+        bloom._bits = bytearray(data[18:])
+        return bloom
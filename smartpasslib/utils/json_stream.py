@@ -0,0 +1,144 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import re
+from typing import Any, IO, Iterator, Match, Pattern, Tuple
+
+_scan = json.JSONDecoder().scan_once
+_KEY = r'"([^"\\]*(?:\\.[^"\\]*)*)"[ \t\n\r]*:[ \t\n\r]*'
+# Start of the object: "{" followed by "}" or the first key
+_FIRST = re.compile(r'[ \t\n\r]*\{[ \t\n\r]*(?:(\})|' + _KEY + ')', re.DOTALL)
+# After a value: "}" or "," followed by the next key
+_NEXT = re.compile(r'[ \t\n\r]*(?:(\})|,[ \t\n\r]*' + _KEY + ')', re.DOTALL)
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Text that could still be part of a number cut off at the end of the buffer
+_NUMBER_TAIL = re.compile(r'[0-9.eE+-]*')
+
+
+class JsonStreamError(ValueError):
+    """
+    Malformed or truncated JSON in a streamed object.
+
+    Attributes:
+        line: 1-based line where parsing stopped
+    """
+
+    def __init__(self, message: str, line: int):
+        super().__init__(f"{message} (line {line})")
+        self.line = line
+
+
+def iter_object_items(stream: IO[str], chunk_size: int = 1 << 16,
+                      max_value_size: int = 1 << 24) -> Iterator[Tuple[str, Any, int]]:
+    """
+    Stream the members of a top-level JSON object.
+
+    Only one member is decoded at a time, so memory use is bounded by the
+    largest value rather than the file size. Duplicate keys are yielded as
+    they appear (json.load would silently keep the last one).
+
+    Args:
+        stream: Text stream positioned at the start of a JSON object
+        chunk_size: Characters read per refill
+        max_value_size: Largest member (in characters) buffered before giving up,
+                        which bounds memory on malformed input
+
+    Returns:
+        Iterator[Tuple[str, Any, int]]: (key, decoded value, 1-based line of the key)
+
+    Raises:
+        JsonStreamError: If the document is not a JSON object or is malformed
+    """
+    reader = _Reader(stream, chunk_size, max_value_size)
+    pattern, error = _FIRST, "Expected '{' and a property name at start of document"
+    while True:
+        match, line = reader.match(pattern, error)
+        if match.group(1) is not None:
+            reader.expect_end()
+            return
+        key = match.group(2)
+        if '\\' in key:
+            key = json.loads(f'"{key}"')
+        yield key, reader.decode(), line
+        pattern, error = _NEXT, "Expected ',' and a property name or '}' after value"
+
+
+class _Reader:
+    """Sliding text buffer over a stream with line tracking."""
+
+    def __init__(self, stream: IO[str], chunk_size: int, max_size: int):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._max_size = max_size
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+        self.line = 1
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed text. Returns False at end of stream."""
+        if self._eof or len(self._buffer) - self._position > self._max_size:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return True
+
+    def line_at(self, position: int) -> int:
+        """Line number of a buffer position at or after the current position."""
+        return self.line + self._buffer.count('\n', self._position, position)
+
+    def commit(self, position: int) -> None:
+        """Mark everything before position as consumed."""
+        self.line = self.line_at(position)
+        self._position = position
+
+    def match(self, pattern: Pattern, error: str) -> Tuple[Match, int]:
+        """
+        Match a pattern at the current position and consume it.
+
+        Reads more input while the match could still extend past the end of the buffer.
+
+        Returns:
+            Tuple[Match, int]: The match and the line of its last group
+        """
+        while True:
+            match = pattern.match(self._buffer, self._position)
+            if match is not None and match.end() < len(self._buffer):
+                break
+            if not self._fill():
+                if match is None:
+                    raise JsonStreamError(error, self.line)
+                break
+        line = self.line_at(match.start(match.lastindex))
+        self.commit(match.end())
+        return match, line
+
+    def decode(self) -> Any:
+        """Decode the JSON value at the current position, reading more input as needed."""
+        while True:
+            try:
+                value, end = _scan(self._buffer, self._position)
+            except (StopIteration, json.JSONDecodeError) as e:
+                if self._fill():
+                    continue
+                if isinstance(e, StopIteration):
+                    raise JsonStreamError("Expecting value", self.line_at(e.value))
+                raise JsonStreamError(e.msg, self.line_at(e.pos))
+            # A number at the end of the buffer may continue in the next chunk ("94101." + "25")
+            if isinstance(value, (int, float)) and not isinstance(value, bool) \
+                    and _NUMBER_TAIL.fullmatch(self._buffer, end) and self._fill():
+                continue
+            self.commit(end)
+            return value
+
+    def expect_end(self) -> None:
+        """Check that only whitespace follows the top-level object."""
+        while True:
+            self.commit(_WHITESPACE.match(self._buffer, self._position).end())
+            if self._position < len(self._buffer):
+                raise JsonStreamError("Extra data after top-level object", self.line)
+            if not self._fill():
+                return
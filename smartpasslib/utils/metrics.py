@@ -0,0 +1,20 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import math
+from typing import List
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction (0.99 for p99)
+
+    Returns:
+        float: Percentile value (0.0 for an empty list)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = min(max(1, math.ceil(fraction * len(sorted_values))), len(sorted_values))
+    return sorted_values[rank - 1]
@@ -0,0 +1,183 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+PROCESS = "process"
+THREAD = "thread"
+AUTO = "auto"
+BACKENDS = (AUTO, PROCESS, THREAD)
+
+
+def gil_enabled() -> bool:
+    """True unless running on a free-threaded CPython build with the GIL disabled."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def default_backend() -> str:
+    """
+    Pick the pool type for derivation work.
+
+    Key derivation hashes short strings, so hashlib holds the GIL and only
+    processes run it in parallel on a standard build. Without a GIL, threads
+    do the same work without pickling arguments or starting interpreters.
+
+    Returns:
+        str: "thread" if the GIL is disabled, "process" otherwise
+    """
+    return PROCESS if gil_enabled() else THREAD
+
+
+def _run_chunk(fn: Callable, items: List[Any], star: bool, return_exceptions: bool) -> List[Any]:
+    """
+    Apply a function to a chunk of items inside a worker.
+
+    Args:
+        fn: Picklable function
+        items: Arguments (tuples when star is True)
+        star: Unpack each item into positional arguments
+        return_exceptions: Return raised exceptions as results instead of propagating
+
+    Returns:
+        List[Any]: Results in input order
+    """
+    results = []
+    for item in items:
+        try:
+            results.append(fn(*item) if star else fn(item))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
+def _chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most size items without buffering the whole input."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class DerivationExecutor:
+    """
+    Parallel backend for batch key and password derivation.
+
+    Work is sent to a process or thread pool in chunks, input is consumed
+    lazily and at most max_in_flight chunks are pending at any time, so
+    arbitrarily long streams run in bounded memory. Results come back in
+    input order. With one worker everything runs inline in the calling
+    process.
+
+    The "auto" backend uses threads on free-threaded CPython builds with the
+    GIL disabled and processes otherwise. Process workers need picklable
+    functions and arguments; thread workers do not.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 64,
+                 max_in_flight: Optional[int] = None, backend: str = AUTO):
+        """
+        Initialize executor.
+
+        Args:
+            workers: Workers (default: CPU count; 1 runs inline)
+            chunk_size: Items sent to a worker per task
+            max_in_flight: Maximum pending chunks (default: 2 per worker)
+            backend: "process", "thread" or "auto" (threads when the GIL is disabled)
+
+        Raises:
+            ValueError: If workers, chunk_size or max_in_flight is less than 1,
+                        or the backend is unknown
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("Workers count must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("Max in-flight chunks must be at least 1")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown executor backend: {backend}")
+        self.backend = default_backend() if backend == AUTO else backend
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_in_flight = max_in_flight or workers * 2
+        self._pool: Optional[Executor] = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def inline(self) -> bool:
+        """True if work runs in the calling process."""
+        return self.workers == 1
+
+    def _get_pool(self) -> Executor:
+        """Create the worker pool on first use (callers may share the executor across threads)."""
+        with self._pool_lock:
+            if self._pool is None:
+                pool_class = ThreadPoolExecutor if self.backend == THREAD else ProcessPoolExecutor
+                self._pool = pool_class(max_workers=self.workers)
+            return self._pool
+
+    def map(self, fn: Callable, iterable: Iterable[Any], return_exceptions: bool = False) -> Iterator[Any]:
+        """
+        Lazily apply fn to every item.
+
+        Args:
+            fn: Function of one argument (picklable for the process backend)
+            iterable: Input items, consumed as results are requested
+            return_exceptions: Yield per-item exceptions instead of raising
+
+        Returns:
+            Iterator[Any]: Results in input order
+        """
+        return self._map(fn, iterable, False, return_exceptions)
+
+    def starmap(self, fn: Callable, iterable: Iterable[Any], return_exceptions: bool = False) -> Iterator[Any]:
+        """
+        Lazily apply fn to every argument tuple.
+
+        Args:
+            fn: Function (picklable for the process backend)
+            iterable: Argument tuples, consumed as results are requested
+            return_exceptions: Yield per-item exceptions instead of raising
+
+        Returns:
+            Iterator[Any]: Results in input order
+        """
+        return self._map(fn, iterable, True, return_exceptions)
+
+    def _map(self, fn: Callable, iterable: Iterable[Any], star: bool, return_exceptions: bool) -> Iterator[Any]:
+        chunks = _chunked(iterable, self.chunk_size)
+        if self.inline:
+            for chunk in chunks:
+                yield from _run_chunk(fn, chunk, star, return_exceptions)
+            return
+
+        pool = self._get_pool()
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_run_chunk, fn, chunk, star, return_exceptions))
+            if len(pending) >= self.max_in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def __enter__(self) -> 'DerivationExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
@@ -0,0 +1,252 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import atexit
+import os
+import sys
+import threading
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV_VAR = 'SMARTPASSLIB_PROFILE'
+ENV_OUTPUT = 'SMARTPASSLIB_PROFILE_OUTPUT'
+
+
+class Profiler:
+    """
+    Profiler for library internals.
+
+    Only smartpasslib functions are recorded, together with the functions they
+    call directly (hashlib, json, str methods, ...), so time spent in library
+    code is split by where it goes without profiling the host application.
+    Allocations are sampled with tracemalloc and filtered to library source lines.
+
+    Work sent to worker processes is not profiled.
+    """
+
+    def __init__(self, allocations: bool = True, top: int = 20):
+        """
+        Initialize profiler.
+
+        Args:
+            allocations: Track allocations with tracemalloc
+            top: Number of allocation sites kept in the report
+        """
+        self.allocations = allocations
+        self.top = top
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.total_time: Dict[str, float] = defaultdict(float)
+        self.own_time: Dict[str, float] = defaultdict(float)
+        self.stacks: Dict[str, float] = defaultdict(float)
+        self.allocation_sites: List[Tuple[str, int, int]] = []
+        self.peak_memory = 0
+        self._names: Dict[object, Optional[str]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+        self._running = False
+
+    def _library_name(self, code) -> Optional[str]:
+        """Get 'module:function' for library code objects, None for anything else."""
+        try:
+            return self._names[code]
+        except KeyError:
+            pass
+        filename = os.path.abspath(code.co_filename)
+        name = None
+        if filename.startswith(PACKAGE_DIR + os.sep) and filename != os.path.abspath(__file__):
+            module = os.path.relpath(filename, os.path.dirname(PACKAGE_DIR))[:-3].replace(os.sep, '.')
+            name = f"{module.replace('.__init__', '')}:{getattr(code, 'co_qualname', code.co_name)}"
+        self._names[code] = name
+        return name
+
+    @staticmethod
+    def _external_name(frame) -> str:
+        """Get 'module:function' for a non-library Python function."""
+        module = frame.f_globals.get('__name__', '?')
+        return f"{module}:{getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)}"
+
+    @staticmethod
+    def _builtin_name(function) -> str:
+        """Get a readable name for a C function or method."""
+        module = getattr(function, '__module__', None)
+        qualname = getattr(function, '__qualname__', getattr(function, '__name__', repr(function)))
+        return f"{module}.{qualname}" if module else qualname
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _hook(self, frame, event, arg) -> None:
+        stack = self._stack()
+        if event == 'call':
+            name = self._library_name(frame.f_code)
+            if name is not None:
+                stack.append([frame, name, perf_counter(), 0.0, True])
+            elif stack and stack[-1][4] and stack[-1][0] is frame.f_back:
+                stack.append([frame, self._external_name(frame), perf_counter(), 0.0, False])
+        elif event == 'return':
+            if stack and stack[-1][0] is frame:
+                self._pop(stack)
+        elif event == 'c_call':
+            if stack and stack[-1][4] and stack[-1][0] is frame:
+                stack.append([(frame, arg), self._builtin_name(arg), perf_counter(), 0.0, False])
+        elif stack:
+            top = stack[-1][0]
+            if isinstance(top, tuple) and top[0] is frame and top[1] is arg:
+                self._pop(stack)
+
+    def _pop(self, stack: list) -> None:
+        _, name, start, child, _ = stack[-1]
+        elapsed = perf_counter() - start
+        path = ';'.join(entry[1] for entry in stack)
+        stack.pop()
+        if stack:
+            stack[-1][3] += elapsed
+        with self._lock:
+            self.calls[name] += 1
+            self.total_time[name] += elapsed
+            self.own_time[name] += elapsed - child
+            self.stacks[path] += elapsed - child
+
+    def start(self) -> 'Profiler':
+        """Install the profiling hooks in this and future threads."""
+        if self._running:
+            return self
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._running = True
+        threading.setprofile(self._hook)
+        sys.setprofile(self._hook)
+        return self
+
+    def stop(self) -> 'Profiler':
+        """Remove the profiling hooks and collect allocation statistics."""
+        if not self._running:
+            return self
+        sys.setprofile(None)
+        threading.setprofile(None)
+        self._running = False
+        if self.allocations and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(True, os.path.join(PACKAGE_DIR, '*')), tracemalloc.Filter(False, __file__)]
+            )
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            self.allocation_sites = [
+                (f"{os.path.relpath(stat.traceback[0].filename, os.path.dirname(PACKAGE_DIR))}:"
+                 f"{stat.traceback[0].lineno}", stat.count, stat.size)
+                for stat in snapshot.statistics('lineno')[:self.top]
+            ]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        return self
+
+    def collapsed(self) -> Iterator[str]:
+        """
+        Iterate over collapsed-stack lines ("frame;frame;frame microseconds").
+
+        The format is accepted by flamegraph.pl, inferno and speedscope.
+        """
+        for path, seconds in sorted(self.stacks.items()):
+            microseconds = int(round(seconds * 1_000_000))
+            if microseconds > 0:
+                yield f"{path} {microseconds}"
+
+    def write_collapsed(self, path: str) -> None:
+        """
+        Write the collapsed-stack file.
+
+        Args:
+            path: Output file path
+        """
+        with open(path, 'w') as f:
+            for line in self.collapsed():
+                f.write(line + '\n')
+
+    def summary(self, limit: int = 30) -> str:
+        """
+        Render the per-function timing and allocation summary.
+
+        Args:
+            limit: Maximum number of functions listed
+
+        Returns:
+            str: Plain-text table
+        """
+        total_own = sum(self.own_time.values()) or 1.0
+        rows = sorted(self.own_time, key=self.own_time.get, reverse=True)[:limit]
+        width = max([len(name) for name in rows] + [8])
+        lines = [
+            f"{'function':<{width}}  {'calls':>9}  {'total ms':>10}  {'own ms':>10}  {'own %':>6}",
+            '-' * (width + 45),
+        ]
+        for name in rows:
+            lines.append(
+                f"{name:<{width}}  {self.calls[name]:>9}  {self.total_time[name] * 1000:>10.3f}  "
+                f"{self.own_time[name] * 1000:>10.3f}  {self.own_time[name] * 100 / total_own:>6.1f}"
+            )
+        if self.allocation_sites:
+            lines += ['', f"allocations (live at stop, peak traced {self.peak_memory} bytes)"]
+            site_width = max(len(site) for site, _, _ in self.allocation_sites)
+            lines.append(f"{'site':<{site_width}}  {'blocks':>9}  {'bytes':>10}")
+            lines.append('-' * (site_width + 23))
+            for site, count, size in self.allocation_sites:
+                lines.append(f"{site:<{site_width}}  {count:>9}  {size:>10}")
+        return '\n'.join(lines)
+
+
+@contextmanager
+def profile(collapsed_path: Optional[str] = None, summary_path: Optional[str] = None,
+            allocations: bool = True) -> Iterator[Profiler]:
+    """
+    Profile library internals inside a with block.
+
+    Args:
+        collapsed_path: Write a flame-graph collapsed-stack file here on exit
+        summary_path: Write the summary table here on exit
+        allocations: Track allocations with tracemalloc
+
+    Returns:
+        Iterator[Profiler]: The running profiler (inspect it after the block)
+    """
+    profiler = Profiler(allocations=allocations).start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        if collapsed_path:
+            profiler.write_collapsed(collapsed_path)
+        if summary_path:
+            with open(summary_path, 'w') as f:
+                f.write(profiler.summary() + '\n')
+
+
+def install_from_env() -> Optional[Profiler]:
+    """
+    Start process-wide profiling when SMARTPASSLIB_PROFILE=1.
+
+    At exit the collapsed stacks are written to SMARTPASSLIB_PROFILE_OUTPUT
+    (default: smartpasslib-profile.folded) and the summary table to stderr.
+
+    Returns:
+        Optional[Profiler]: The installed profiler, or None if profiling is disabled
+    """
+    if os.environ.get(ENV_VAR, '').lower() not in ('1', 'true', 'yes', 'on'):
+        return None
+    profiler = Profiler().start()
+    output = os.environ.get(ENV_OUTPUT, 'smartpasslib-profile.folded')
+
+    def report():
+        profiler.stop()
+        profiler.write_collapsed(output)
+        print(profiler.summary(), file=sys.stderr)
+        print(f"smartpasslib profile written to {output}", file=sys.stderr)
+
+    atexit.register(report)
+    return profiler
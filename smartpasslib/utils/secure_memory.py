@@ -0,0 +1,66 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+"""Helpers for handling secrets in mutable buffers.
+
+Python str and bytes objects are immutable, so every copy of a secret made
+through them stays in memory until the allocator reuses it. The buffer APIs
+of the generators accept a bytearray or memoryview holding the UTF-8 secret,
+keep intermediates in bytearrays and zero them before returning.
+
+Digests returned by hashlib are still short-lived bytes objects; they are
+released as soon as the next round replaces them.
+"""
+from typing import Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def wipe(*buffers: Union[bytearray, memoryview]) -> None:
+    """
+    Overwrite mutable buffers with zeros.
+
+    Read-only buffers and None are skipped.
+
+    Args:
+        *buffers: bytearray or writable memoryview objects
+    """
+    for buffer in buffers:
+        if buffer is None:
+            continue
+        view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+        if view.readonly:
+            continue
+        view = view.cast('B')
+        view[:] = bytes(len(view))
+
+
+def as_view(buffer: Buffer) -> memoryview:
+    """
+    Get a flat read-only byte view of a buffer without copying it.
+
+    Args:
+        buffer: bytes, bytearray or memoryview
+
+    Returns:
+        memoryview: Unsigned byte view
+
+    Raises:
+        TypeError: If the object does not support the buffer protocol or is a str
+    """
+    if isinstance(buffer, str):
+        raise TypeError("Secret buffer must be bytes-like, not str")
+    return memoryview(buffer).cast('B').toreadonly()
+
+
+def utf8_length(buffer: Buffer) -> int:
+    """
+    Count UTF-8 characters in a buffer without decoding it.
+
+    Args:
+        buffer: UTF-8 encoded bytes
+
+    Returns:
+        int: Number of characters (bytes that are not continuation bytes)
+    """
+    if isinstance(buffer, (bytes, bytearray)) and max(buffer, default=0) < 0x80:
+        return len(buffer)
+    return sum(1 for byte in as_view(buffer) if byte & 0xC0 != 0x80)
@@ -0,0 +1,138 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+
+import pytest
+
+from smartpasslib.generators.chain import HashChain
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.generators.smart import SmartPasswordGenerator
+
+# (secret, private_key, public_key, password_12, password_33, password_100)
+# produced by the v4 reference implementation shared with the C#/JS/Go/Kotlin ports.
+VECTORS = [
+    (
+        'MyCatHippo2026',
+        '53c948f5c66f36f2fc26e8c4a58d547550299ea767a41b7acd21e41e429e7e87',
+        '857b9433f5815a267ef31b9d830b1b4a714195fd7bbb419ea32be4af1f3431d8',
+        'A-UrF0mcpQ:,',
+        'A-UrF0mcpQ:,V2E^twgW+FqEK4*MtAFP0',
+        'A-UrF0mcpQ:,V2E^twgW+FqEK4*MtAFP0(:H!v(e3^*YBDY/CFMdihMK}[@XPQrhQ^6nzD#R{0NCIXJ}w1[/nh)SOF?QN!NkBA5g',
+    ),
+    (
+        'TestSecret2026!',
+        '171366946dd237c3de395f0b7f92c9b46bab6f5c6ae3968431550d2d3c0533bb',
+        '5b7b61e01ba34cdbab8d9b31bb99b125e33a361c38a80c583c11b292b2260510',
+        'ECfA05bxCyi@',
+        'ECfA05bxCyi@f&XbEx2=QH!m32CWRC%+X',
+        'ECfA05bxCyi@f&XbEx2=QH!m32CWRC%+X}bP(3;!u9X:oTJ;<-6fbbnS)+t&XVQUf3qh4l05.#KI(O}xP{nEAB8{@M#6FEgsVHW[',
+    ),
+    (
+        'secret123secret123',
+        '1ba2104b72e1431f84542a5b095fcaea95f36df6275a28becdabcca3f17e71ef',
+        '3191b322c22042afd0fcf33dd5251450535546add21832d7a6da6dc3dc534a78',
+        'dR0Vb}OOAJ@q',
+        'dR0Vb}OOAJ@q^C>gn9Gh<K(/@[!BmcsgS',
+        'dR0Vb}OOAJ@q^C>gn9Gh<K(/@[!BmcsgSHlD4VzBiSpFz%qvnzg=45c^=#g0e+IWwjTK9Vz5E9L,8sN/Kwf)Jjp=b]!^/YbQ5nVm',
+    ),
+    (
+        'correct horse battery staple',
+        '0c6bf22b0514eb4a924befd6376f8667045f0867f6c635de26ee4fc5f5cff59a',
+        '4806d37929f54710b8ec862cae4aabb7364fedd70a31bcc876d2336547e4cff2',
+        'Agcy0N!>onac',
+        'Agcy0N!>onacui4hVO/TyFt]K:}SC:8+*',
+        'Agcy0N!>onacui4hVO/TyFt]K:}SC:8+*,-;K%}QP<Y<^bf>CrCy**WLzUMJ0fX6pPo-:#JW)fBO[>EZ.1c?ptr182W:;@0X<$Tj',
+    ),
+    (
+        'Пароль-секрет-2026',
+        '1598b3ae2c216483bffba1572e71e4b1e66a7e4638d9d38176fbd57acfb525e0',
+        '34de4f3d3cb5a5ca89a44b651201d10f38323677576120055246ec518c8cdd58',
+        '?_.T^:(.-_KV',
+        '?_.T^:(.-_KVAeH>L{p<}.!g6lCI*2>$y',
+        '?_.T^:(.-_KVAeH>L{p<}.!g6lCI*2>$ysx2kMb!_gJM-noc2L8&sJ7}/K-+dHt^tcZhJNZ2I&]R&+D]7tw$Hop7z]-)d?rwKY]$',
+    ),
+    (
+        '密码短语测试密码短语测试',
+        '3f757c4a97b5bdeba9c935f131e9b59b8fc3249c30521b0f7ba0d1c366825e07',
+        'c3008d140898b45472da242c4cfa750bfc13d2e8bf1204cdb295cca4ec1888cd',
+        '_@V(!o#X<v=D',
+        '_@V(!o#X<v=D::s$gIWts=qLe&aBA4T9b',
+        '_@V(!o#X<v=D::s$gIWts=qLe&aBA4T9bUn]K)ESezt??{VFJ#R:I:^!U$;!lAy>;)IL2b-t{^R/{o^M>IDJAc0!R-KkofE+x8l6',
+    ),
+    (
+        '🔐emoji🔑secret🗝️',
+        'cacfbfdfc100f7a0516c410dabf4e988310304936d2d7f8dd997a2bf8ebf64a1',
+        '67b505918ff1615bfa68af9eeb2bdfe8734f25272bbf5ae985e362abc3b79269',
+        'g>8^=e]MA4hO',
+        'g>8^=e]MA4hO$rWAc8^QnrM_5Kjnk+A_{',
+        'g>8^=e]MA4hO$rWAc8^QnrM_5Kjnk+A_{QGrEFG6p7pg$%h5ImC/4Oyt:L;2?<gibcz^/T9B26fiQ;=Fcem{CFTZ,080P6.3c+]E',
+    ),
+    (
+        'xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx',
+        'cf66ba9ca6e3e947c1b89a61445cc6f5244207af6b1a80f5d78c2b84f61eddd8',
+        '2947b0cb18496c6a699c266f15455a82749115ca9db7ad240ee0325ba0d0734b',
+        '}CSC+njKBBne',
+        '}CSC+njKBBneS@c2pxH>ADQl0Jy^S3*>/',
+        '}CSC+njKBBneS@c2pxH>ADQl0Jy^S3*>/a7iynSr}e<=LY&QYCLd7oh,),V(a4h=s,gv:]$/)2z4u!5i/>&KQ$bHlzTc4jB:l/2c',
+    ),
+    (
+        '  spaces  around  ',
+        '389792b63b6dcfac686d1c68d7c9a12fe1d2d9c3156e5ce4e45a8acf999d4d11',
+        '530d305843164399eab4872cfc75ea5f1223584cca02989127f444f7bfd183e5',
+        ':h_]#)V}A/:C',
+        ':h_]#)V}A/:CE%/kdmD)qa3JC+)+K72Bx',
+        ':h_]#)V}A/:CE%/kdmD)qa3JC+)+K72Bx[wM;9r;CJgp0}Ci6LO-X*^_T/9OtQ?&Y5-}j^z4G{EbY3YA,z4irpr%p&i{z[ln=cw4',
+    ),
+    (
+        'tab\tand\nnewline!!',
+        '0746077fb61ebb5372bb8c3027e725ea7ce32bf6568ef99c62548d60c793ee6b',
+        '9d713ee53e5726923072c7e79238ac9a2792bf79211bfef21fbd731eb283e820',
+        '+:;H;,?8J(Um',
+        '+:;H;,?8J(Umb}?O?x;QJh>Yk^(B+-_Hf',
+        '+:;H;,?8J(Umb}?O?x;QJh>Yk^(B+-_Hf6HBe$c*H!7o5dzfHF>i[WLT!N#Ps4eV^P1AEm0/2!)eHmUXv%e%aJ]L=-+3fYVH1Ohy',
+    ),
+]
+
+
+def reference_key(secret, min_steps, max_steps, salt):
+    steps = SmartKeyGenerator._get_steps_from_secret(secret, min_steps, max_steps, salt=salt)
+    return SmartKeyGenerator._create_key(secret=secret, steps=steps, salt=salt)
+
+
+class TestHashChain:
+    @pytest.mark.parametrize("vector", VECTORS, ids=lambda vector: repr(vector[0][:16]))
+    def test_vectors(self, vector):
+        secret, private_key, public_key, password_12, password_33, password_100 = vector
+        assert SmartKeyGenerator.generate_private_key(secret) == private_key
+        assert SmartKeyGenerator.generate_public_key(secret) == public_key
+        assert SmartPasswordGenerator.generate(secret, 12) == password_12
+        assert SmartPasswordGenerator.generate(secret, 33) == password_33
+        assert SmartPasswordGenerator.generate(secret, 100) == password_100
+
+    @pytest.mark.parametrize("vector", VECTORS, ids=lambda vector: repr(vector[0][:16]))
+    def test_reference_matches_vectors(self, vector):
+        secret, private_key, public_key = vector[:3]
+        assert reference_key(secret, 15, 30, "private") == private_key
+        assert reference_key(secret, 45, 60, "public") == public_key
+
+    def test_matches_reference_corpus(self):
+        for i in range(300):
+            secret = f"corpus-secret-{i:05d}-" + "\u00e9" * (i % 7)
+            for min_steps, max_steps, salt in ((15, 30, "private"), (45, 60, "public"), (0, 0, "")):
+                assert HashChain.derive(secret, min_steps, max_steps, salt) == \
+                    reference_key(secret, min_steps, max_steps, salt)
+
+    def test_long_chain_beyond_suffix_cache(self):
+        secret = "long-chain-secret"
+        assert HashChain.derive(secret, 200, 260, "x") == reference_key(secret, 200, 260, "x")
+
+    def test_steps_from_digest(self):
+        for i in range(100):
+            secret = f"steps-{i}"
+            digest = HashChain.seed_digest(secret, "public")
+            assert HashChain.steps_from_digest(digest, 45, 60) == \
+                SmartKeyGenerator._get_steps_from_secret(secret, 45, 60, salt="public")
+
+    def test_blocks(self):
+        key = SmartKeyGenerator.generate_private_key("block-secret-123")
+        blocks = HashChain.blocks(key.encode('ascii'), 4)
+        assert blocks == [hashlib.sha256(f"{key}:{i}".encode()).digest() for i in range(4)]
@@ -0,0 +1,117 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import string
+
+import pytest
+
+from smartpasslib.generators.code import CodeGenerator
+from smartpasslib.generators.compiled import (
+    CompiledCodeGenerator,
+    CompiledSmartPasswordGenerator,
+    CompiledStrongPasswordGenerator,
+)
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.generators.smart import SmartPasswordGenerator
+from smartpasslib.generators.strong import StrongPasswordGenerator
+
+
+class TestCompiledSmartPasswordGenerator:
+    def test_matches_generate(self, test_secret):
+        for length in (12, 32, 33, 64, 100):
+            generator = SmartPasswordGenerator.compile(length=length)
+            assert generator(test_secret) == SmartPasswordGenerator.generate(test_secret, length)
+
+    def test_cross_platform_value(self):
+        assert SmartPasswordGenerator.compile(16)("MyCatHippo2026") == "A-UrF0mcpQ:,V2E^"
+
+    def test_derive_from_private_key(self, test_secret):
+        generator = SmartPasswordGenerator.compile(20)
+        private_key = SmartKeyGenerator.generate_private_key(test_secret)
+        assert generator.derive(private_key) == generator(test_secret)
+
+    def test_custom_alphabet(self, test_secret):
+        generator = SmartPasswordGenerator.compile(length=40, alphabet="0123456789")
+        password = generator(test_secret)
+        assert len(password) == 40
+        assert set(password) <= set(string.digits)
+        assert generator(test_secret) == password
+
+    def test_non_ascii_alphabet(self, test_secret):
+        generator = CompiledSmartPasswordGenerator(24, alphabet="αβγδεζηθ")
+        password = generator(test_secret)
+        assert len(password) == 24
+        assert set(password) <= set("αβγδεζηθ")
+
+    def test_invalid_length(self):
+        with pytest.raises(ValueError, match="Password length must be at least 12 characters"):
+            SmartPasswordGenerator.compile(8)
+        with pytest.raises(ValueError, match="Password length cannot exceed 100 characters"):
+            SmartPasswordGenerator.compile(101)
+
+    def test_invalid_alphabet(self):
+        with pytest.raises(ValueError, match="Alphabet must contain at least 2 characters"):
+            SmartPasswordGenerator.compile(12, alphabet="a")
+        with pytest.raises(ValueError, match="Alphabet must not contain duplicate characters"):
+            SmartPasswordGenerator.compile(12, alphabet="abca")
+
+    def test_invalid_secret(self):
+        with pytest.raises(ValueError, match="Secret phrase must be at least 12 characters"):
+            SmartPasswordGenerator.compile(12)("short")
+
+    def test_immutable(self):
+        generator = SmartPasswordGenerator.compile(24)
+        with pytest.raises(AttributeError, match="is immutable"):
+            generator._length = 30
+        with pytest.raises(AttributeError, match="is immutable"):
+            del generator._length
+        assert generator.length == 24
+        assert generator.alphabet == SmartPasswordGenerator.all()
+
+
+class TestCompiledStrongPasswordGenerator:
+    def test_generate(self):
+        generator = StrongPasswordGenerator.compile(16)
+        assert isinstance(generator, CompiledStrongPasswordGenerator)
+        for _ in range(20):
+            password = generator()
+            assert len(password) == 16
+            assert any(c in string.ascii_lowercase for c in password)
+            assert any(c in string.ascii_uppercase for c in password)
+            assert any(c in string.digits for c in password)
+            assert any(c in StrongPasswordGenerator.symbols for c in password)
+
+    def test_custom_alphabet_groups(self):
+        generator = StrongPasswordGenerator.compile(12, alphabet="abcXYZ")
+        for _ in range(20):
+            password = generator()
+            assert set(password) <= set("abcXYZ")
+            assert set(password) & set("abc")
+            assert set(password) & set("XYZ")
+
+    def test_invalid_length(self):
+        with pytest.raises(ValueError, match="Password length must be at least 12 characters"):
+            StrongPasswordGenerator.compile(4)
+        with pytest.raises(ValueError, match="Password length cannot exceed 100 characters"):
+            StrongPasswordGenerator.compile(101)
+
+
+class TestCompiledCodeGenerator:
+    def test_generate(self):
+        generator = CodeGenerator.compile(4)
+        assert isinstance(generator, CompiledCodeGenerator)
+        for _ in range(20):
+            code = generator()
+            assert len(code) == 4
+            assert any(c in string.ascii_lowercase for c in code)
+            assert any(c in string.ascii_uppercase for c in code)
+            assert any(c in string.digits for c in code)
+            assert any(c in CodeGenerator.symbols for c in code)
+
+    def test_digits_only(self):
+        code = CodeGenerator.compile(6, alphabet=string.digits)()
+        assert len(code) == 6 and code.isdigit()
+
+    def test_invalid_length(self):
+        with pytest.raises(ValueError, match="The code length must be at least 4 characters"):
+            CodeGenerator.compile(3)
+        with pytest.raises(ValueError, match="The code length cannot exceed 100 characters"):
+            CodeGenerator.compile(101)
@@ -0,0 +1,95 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+
+import pytest
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.masters.smart_password_master import SmartPasswordMaster
+
+
+@pytest.fixture
+def fast_scrypt():
+    return KdfParams(KdfParams.SCRYPT, salt="00" * 16, n=16, r=1, p=1)
+
+
+class TestKdfParams:
+    def test_scrypt_derive(self, fast_scrypt, test_secret):
+        expected = hashlib.scrypt(f"{test_secret}:public".encode(), salt=bytes(16), n=16, r=1, p=1, dklen=32).hex()
+        assert fast_scrypt.derive(test_secret) == expected
+
+    def test_pbkdf2_derive(self, test_secret):
+        params = KdfParams(KdfParams.PBKDF2, salt="01" * 16, iterations=1000)
+        expected = hashlib.pbkdf2_hmac('sha256', f"{test_secret}:public".encode(), b"\x01" * 16, 1000).hex()
+        assert params.derive(test_secret) == expected
+
+    def test_random_salt(self):
+        first = KdfParams(n=16, r=1)
+        assert len(first.salt) == 32
+        assert first.salt != first.with_new_salt().salt
+
+    def test_round_trip(self, fast_scrypt):
+        data = fast_scrypt.to_dict()
+        assert data == {"version": 1, "algorithm": "scrypt", "salt": "00" * 16, "n": 16, "r": 1, "p": 1}
+        assert KdfParams.from_dict(data) == fast_scrypt
+
+        pbkdf2 = KdfParams(KdfParams.PBKDF2, iterations=1000)
+        assert KdfParams.from_dict(pbkdf2.to_dict()) == pbkdf2
+
+    def test_hashable(self, fast_scrypt):
+        copy = KdfParams.from_dict(fast_scrypt.to_dict())
+        assert hash(copy) == hash(fast_scrypt)
+        assert len({fast_scrypt, copy, fast_scrypt.with_new_salt(), KdfParams(KdfParams.PBKDF2, iterations=1000)}) == 3
+        assert {fast_scrypt: "stored"}[copy] == "stored"
+
+    def test_unsupported_version(self, fast_scrypt):
+        data = dict(fast_scrypt.to_dict(), version=99)
+        with pytest.raises(ValueError, match="Unsupported KDF parameters version: 99"):
+            KdfParams.from_dict(data)
+
+    def test_invalid_params(self):
+        with pytest.raises(ValueError, match="Unsupported KDF algorithm: md5"):
+            KdfParams("md5")
+        with pytest.raises(ValueError, match="scrypt n must be a power of 2 greater than 1"):
+            KdfParams(n=1000)
+        with pytest.raises(ValueError, match="scrypt r and p must be at least 1"):
+            KdfParams(n=16, r=0)
+        with pytest.raises(ValueError, match="PBKDF2 iterations must be at least 1"):
+            KdfParams(KdfParams.PBKDF2, iterations=0)
+
+    def test_calibrate_scrypt(self):
+        params = KdfParams.calibrate(target_ms=1, max_memory=1 << 20, r=1)
+        assert params.algorithm == KdfParams.SCRYPT
+        assert params.memory <= 1 << 20
+
+    def test_calibrate_memory_cap(self):
+        params = KdfParams.calibrate(target_ms=10_000, max_memory=256 * 1024, r=1)
+        assert params.n == 1024
+
+    def test_calibrate_pbkdf2(self):
+        params = KdfParams.calibrate(target_ms=5, algorithm=KdfParams.PBKDF2)
+        assert params.algorithm == KdfParams.PBKDF2
+        assert params.iterations >= 1000
+
+    def test_calibrate_invalid_target(self):
+        with pytest.raises(ValueError, match="Target latency must be positive"):
+            KdfParams.calibrate(target_ms=0)
+
+    def test_key_generator_integration(self, fast_scrypt, test_secret):
+        public_key = SmartKeyGenerator.generate_public_key(test_secret, kdf=fast_scrypt)
+        assert public_key != SmartKeyGenerator.generate_public_key(test_secret)
+        assert SmartKeyGenerator.check_key(test_secret, public_key, kdf=fast_scrypt)
+        assert not SmartKeyGenerator.check_key(test_secret, public_key)
+        assert not SmartKeyGenerator.check_key("wrong_secret_phrase", public_key, kdf=fast_scrypt)
+
+    def test_master_integration(self, fast_scrypt, test_secret):
+        public_key = SmartPasswordMaster.generate_public_key(test_secret, kdf=fast_scrypt)
+        assert SmartPasswordMaster.check_public_key(test_secret, public_key, kdf=fast_scrypt)
+        assert isinstance(SmartPasswordMaster.calibrate_kdf(target_ms=1, algorithm=KdfParams.PBKDF2), KdfParams)
+
+    def test_derive_key(self, fast_scrypt, test_secret):
+        key = fast_scrypt.derive_key(test_secret, "storage")
+        assert len(key) == 32
+        assert key == fast_scrypt.derive_key(bytearray(test_secret.encode()), "storage")
+        assert key != fast_scrypt.derive_key(test_secret, "backup")
+        assert key.hex() != fast_scrypt.derive(test_secret)
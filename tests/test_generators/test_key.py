@@ -51,3 +51,28 @@ class TestSmartKeyGenerator:
         key1 = SmartKeyGenerator.generate_private_key(test_secret)
         key2 = SmartKeyGenerator.generate_private_key(test_secret)
         assert key1 == key2
+
+    def test_buffer_keys_match_str(self, test_secret):
+        secret = bytearray(test_secret.encode())
+        assert SmartKeyGenerator.generate_public_key_buffer(secret).decode() == \
+            SmartKeyGenerator.generate_public_key(test_secret)
+        assert SmartKeyGenerator.generate_private_key_buffer(memoryview(secret)).decode() == \
+            SmartKeyGenerator.generate_private_key(test_secret)
+
+    def test_buffer_key_into_out(self, test_secret):
+        out = bytearray(70)
+        result = SmartKeyGenerator.generate_private_key_buffer(test_secret.encode(), out=out)
+        assert result is out
+        assert out[:64].decode() == SmartKeyGenerator.generate_private_key(test_secret)
+        assert out[64:] == bytes(6)
+
+    def test_check_key_buffer(self, test_secret):
+        public_key = SmartKeyGenerator.generate_public_key(test_secret)
+        assert SmartKeyGenerator.check_key_buffer(bytearray(test_secret.encode()), public_key)
+        assert not SmartKeyGenerator.check_key_buffer(b"wrong_secret_phrase", public_key)
+
+    def test_buffer_secret_length_counts_characters(self):
+        with pytest.raises(ValueError, match="Secret phrase must be at least 12 characters"):
+            SmartKeyGenerator.generate_public_key_buffer("ключключ".encode())
+        assert SmartKeyGenerator.generate_public_key_buffer("ключ-ключ-ключ".encode()).decode() == \
+            SmartKeyGenerator.generate_public_key("ключ-ключ-ключ")
@@ -82,3 +82,47 @@ class TestSmartPasswordGenerator:
         password = SmartPasswordGenerator.generate(secret, length=16)
         expected = "ECfA05bxCyi@f&Xb"
         assert password == expected
+
+    def test_generate_buffer_matches_str(self, test_secret):
+        for length in (12, 32, 33, 100):
+            password = SmartPasswordGenerator.generate_buffer(bytearray(test_secret.encode()), length)
+            assert isinstance(password, bytearray)
+            assert password.decode() == SmartPasswordGenerator.generate(test_secret, length)
+
+    def test_generate_buffer_cross_platform(self):
+        assert SmartPasswordGenerator.generate_buffer(memoryview(b"MyCatHippo2026"), 16) == b"A-UrF0mcpQ:,V2E^"
+        assert SmartPasswordGenerator.generate_buffer("пароль-секрет".encode(), 16).decode() == \
+            SmartPasswordGenerator.generate("пароль-секрет", 16)
+
+    def test_generate_buffer_keeps_secret(self, test_secret):
+        secret = bytearray(test_secret.encode())
+        SmartPasswordGenerator.generate_buffer(secret, 16)
+        assert secret == test_secret.encode()
+
+    def test_generate_buffer_validation(self, test_secret):
+        with pytest.raises(ValueError, match="Password length must be at least 12 characters"):
+            SmartPasswordGenerator.generate_buffer(test_secret.encode(), 11)
+        with pytest.raises(ValueError, match="Secret phrase must be at least 12 characters"):
+            SmartPasswordGenerator.generate_buffer("пароль".encode(), 16)
+        with pytest.raises(TypeError, match="Secret buffer must be bytes-like"):
+            SmartPasswordGenerator.generate_buffer(test_secret, 16)
+
+    def test_every_length_is_prefix_of_max(self, test_secret):
+        for secret in (test_secret, "MyCatHippo2026", "TestSecret2026!", "пароль-секрет-2026"):
+            longest = SmartPasswordGenerator.generate_max(secret)
+            assert len(longest) == 100
+            for length in range(12, 101):
+                assert SmartPasswordGenerator.generate(secret, length) == longest[:length]
+
+    def test_generate_prefixes(self):
+        passwords = SmartPasswordGenerator.generate_prefixes("MyCatHippo2026", [16, 12, 16, 40])
+        assert list(passwords) == [12, 16, 40]
+        assert passwords[16] == "A-UrF0mcpQ:,V2E^"
+        assert passwords[12] == "A-UrF0mcpQ:,"
+        assert SmartPasswordGenerator.generate_prefixes("MyCatHippo2026", []) == {}
+
+    def test_generate_prefixes_validation(self, test_secret):
+        with pytest.raises(ValueError, match="Password length must be at least 12 characters"):
+            SmartPasswordGenerator.generate_prefixes(test_secret, [11, 20])
+        with pytest.raises(ValueError, match="Password length cannot exceed 100 characters"):
+            SmartPasswordGenerator.generate_prefixes(test_secret, [20, 101])
@@ -0,0 +1,150 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+
+import pytest
+
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.managers.audit import audit_store, check_record
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.storage.encrypted import EncryptedFileStorage
+from smartpasslib.storage.memory import MemoryStorage
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
+from smartpasslib.utils.parallel import DerivationExecutor
+
+KEYS = [SmartKeyGenerator.generate_public_key(f"audit-secret-{i:03d}") for i in range(20)]
+
+
+def record(key, length=16):
+    return {"public_key": key, "description": "service", "length": length}
+
+
+@pytest.fixture
+def inline():
+    return DerivationExecutor(workers=1, chunk_size=4)
+
+
+class TestCheckRecord:
+    def test_valid(self):
+        assert check_record(KEYS[0], record(KEYS[0])) is None
+
+    @pytest.mark.parametrize("value,codes", [
+        ([1], ["not_object"]),
+        ({"public_key": KEYS[0]}, ["missing_field"]),
+        (record("ABC"), ["invalid_public_key", "key_mismatch"]),
+        (record(KEYS[1]), ["key_mismatch"]),
+        (record(KEYS[0], length=101), ["invalid_length"]),
+        (record(KEYS[0], length=True), ["invalid_length"]),
+        (dict(record(KEYS[0]), description=5), ["invalid_description"]),
+        (dict(record(KEYS[0]), kdf={"version": 9}), ["invalid_kdf"]),
+    ])
+    def test_invalid(self, value, codes):
+        assert [code for code, _ in check_record(KEYS[0], value)] == codes
+
+
+class TestAuditStore:
+    def test_clean_store(self, temp_file, inline):
+        manager = SmartPasswordManager(filename=temp_file)
+        for key in KEYS:
+            manager.add_smart_password(SmartPassword(key, "service", 16))
+        report = manager.audit(executor=inline)
+        assert report.ok
+        assert report.records == len(KEYS)
+
+    def test_compressed_store(self, tmp_path, inline):
+        path = str(tmp_path / "passwords.json.z")
+        CompressedFileStorage(path, block_records=4).save({key: SmartPassword(key, "service", 16) for key in KEYS})
+        report = SmartPasswordManager(filename=path).audit(executor=inline)
+        assert report.ok, report.counts
+        assert report.records == len(KEYS)
+        report = SmartPasswordManager(storage=CompressedFileStorage(path)).audit(executor=inline)
+        assert report.ok and report.records == len(KEYS)
+
+    def test_corrupt_compressed_store(self, tmp_path, inline):
+        path = tmp_path / "passwords.json.z"
+        CompressedFileStorage(str(path)).save({KEYS[0]: SmartPassword(KEYS[0], "service", 16)})
+        path.write_bytes(path.read_bytes()[:-4])
+        report = audit_store(path, executor=inline)
+        assert report.counts == {"unreadable": 1}
+
+    def test_encrypted_store(self, tmp_path, inline):
+        path = str(tmp_path / "passwords.enc")
+        storage = EncryptedFileStorage(path, "audit passphrase", kdf=KdfParams(n=16, r=1), cipher="shake256-hmac")
+        manager = SmartPasswordManager(storage=storage)
+        for key in KEYS:
+            manager.add_smart_password(SmartPassword(key, "service", 16))
+        report = manager.audit(executor=inline)
+        assert report.ok, report.counts
+        assert report.records == len(KEYS)
+        with pytest.raises(ValueError, match="encrypted store"):
+            audit_store(path, executor=inline)
+
+    def test_tampered_encrypted_store(self, tmp_path, inline):
+        path = tmp_path / "passwords.enc"
+        storage = EncryptedFileStorage(str(path), "audit passphrase", kdf=KdfParams(n=16, r=1),
+                                       cipher="shake256-hmac")
+        storage.put(SmartPassword(KEYS[0], "service", 16))
+        header, line = path.read_text().splitlines(keepends=True)
+        path.write_text(header + line[:-6] + ("A" if line[-6] != "A" else "B") + line[-5:])
+        report = audit_store(path, executor=inline, storage=storage)
+        assert report.counts == {"unreadable": 1}
+
+    def test_issues_and_duplicates(self, tmp_path, inline):
+        path = tmp_path / "passwords.json"
+        body = ",\n".join(
+            [f'"{key}": {json.dumps(record(key))}' for key in KEYS[:5]]
+            + [f'"{KEYS[2]}": {json.dumps(record(KEYS[2]))}',
+               f'"{KEYS[5]}": {json.dumps(record(KEYS[5], length=5))}',
+               f'"{KEYS[6]}": {json.dumps(record(KEYS[7]))}']
+        )
+        path.write_text("{\n" + body + "\n}\n")
+        report_path = tmp_path / "report.ndjson"
+        report = audit_store(path, report_path=report_path, executor=inline, expected_records=10)
+
+        assert report.records == 8
+        assert dict(report.counts) == {"duplicate": 1, "invalid_length": 1, "key_mismatch": 1}
+        duplicate = next(issue for issue in report.issues if issue.code == "duplicate")
+        assert (duplicate.key, duplicate.line) == (KEYS[2], 7)
+        assert f"{path}:4" in duplicate.message
+
+        lines = [json.loads(line) for line in report_path.read_text().splitlines()]
+        assert [line["type"] for line in lines] == ["issue"] * 3 + ["summary"]
+        assert lines[-1]["counts"] == {"duplicate": 1, "invalid_length": 1, "key_mismatch": 1}
+        assert lines[-1]["ok"] is False
+
+    def test_invalid_json(self, tmp_path, inline):
+        path = tmp_path / "passwords.json"
+        path.write_text('{\n"%s": %s,\n"broken": \n}' % (KEYS[0], json.dumps(record(KEYS[0]))))
+        report = audit_store(path, executor=inline)
+        assert report.records == 1
+        assert [(issue.code, issue.line) for issue in report.issues] == [("invalid_json", 4)]
+
+    def test_missing_file(self, tmp_path, inline):
+        report = audit_store(tmp_path / "missing.json", executor=inline)
+        assert report.ok and report.records == 0 and report.sources == 0
+
+    def test_sharded_store(self, tmp_path, inline):
+        storage = ShardedDirectoryStorage(tmp_path / "store", prefix_length=1)
+        storage.put_many(SmartPassword(key, "service", 16) for key in KEYS)
+        shard = storage.shard_name(KEYS[0])
+        other = next(name for name in storage.shard_names() if name != shard)
+        data = json.loads(open(storage.shard_path(other)).read())
+        data[KEYS[0]] = record(KEYS[0])
+        open(storage.shard_path(other), 'w').write(json.dumps(data, indent=4))
+
+        report = audit_store(storage.path, executor=inline)
+        assert report.records == len(KEYS) + 1
+        assert dict(report.counts) == {"duplicate": 1, "wrong_shard": 1}
+
+    def test_parallel(self, temp_file):
+        manager = SmartPasswordManager(filename=temp_file)
+        for key in KEYS:
+            manager.add_smart_password(SmartPassword(key, "service", 16))
+        with DerivationExecutor(workers=2, chunk_size=3) as executor:
+            assert manager.audit(executor=executor).records == len(KEYS)
+
+    def test_memory_storage_cannot_be_audited(self):
+        with pytest.raises(ValueError, match="no files to audit"):
+            SmartPasswordManager(storage=MemoryStorage()).audit()
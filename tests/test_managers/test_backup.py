@@ -0,0 +1,150 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+
+import pytest
+
+from smartpasslib.managers.backup import StoreBackup, split_chunks
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
+
+
+def entries(count, start=0):
+    return [SmartPassword(f"{i:064x}", f"service {i}", 12 + i % 20) for i in range(start, start + count)]
+
+
+def backdate(path):
+    """Make files look older than the next snapshot's trust window."""
+    for directory, _, names in os.walk(path) if os.path.isdir(path) else [(os.path.dirname(path), None,
+                                                                            [os.path.basename(path)])]:
+        for name in names:
+            old = os.stat(os.path.join(directory, name)).st_mtime - 10
+            os.utime(os.path.join(directory, name), (old, old))
+
+
+class TestSplitChunks:
+    def test_chunks_concatenate(self):
+        data = b''.join(b"line %d\n" % i for i in range(5000)) + b"tail without newline"
+        chunks = list(split_chunks(data, 256, 2048))
+        assert b''.join(chunks) == data
+        assert all(len(chunk) <= 2048 for chunk in chunks)
+        assert all(len(chunk) >= 256 for chunk in chunks[:-1])
+
+    def test_boundaries_survive_insertion(self):
+        data = b''.join(b"record %d\n" % i for i in range(20000))
+        edited = data.replace(b"record 100\n", b"record 100\ninserted\n")
+        before, after = set(split_chunks(data, 512, 8192)), list(split_chunks(edited, 512, 8192))
+        assert sum(chunk not in before for chunk in after) == 1
+
+    def test_data_without_newlines(self):
+        data = os.urandom(10000).replace(b'\n', b' ')
+        assert [len(chunk) for chunk in split_chunks(data, 100, 4096)] == [4096, 4096, 1808]
+
+
+class TestStoreBackup:
+    def test_incremental_snapshot_and_restore(self, tmp_path):
+        manager = SmartPasswordManager(filename=str(tmp_path / "passwords.json"))
+        manager._commit_batch(entries(3000), [])
+        backup = StoreBackup(tmp_path / "backups", manager, min_chunk=1024, max_chunk=16384)
+        first = backup.snapshot(label="initial")
+        assert first.new_chunks > 20 and first.label == "initial"
+
+        manager.update_smart_password(f"{1500:064x}", description="changed")
+        second = backup.snapshot()
+        assert second.new_chunks <= 2
+        assert second.new_bytes < first.new_bytes / 10
+        assert backup.stats()["snapshots"] == 2
+
+        manager.clear()
+        backup.restore(first.id)
+        assert manager.password_count == 3000
+        assert manager.get_smart_password(f"{1500:064x}").description == "service 1500"
+        backup.restore()
+        assert manager.get_smart_password(f"{1500:064x}").description == "changed"
+        assert backup.verify() == []
+
+    def test_unchanged_files_are_not_read(self, tmp_path, monkeypatch):
+        store = tmp_path / "shards"
+        manager = SmartPasswordManager(storage=ShardedDirectoryStorage(store, prefix_length=1))
+        manager._commit_batch(entries(200), [])
+        backdate(store)
+        backup = StoreBackup(tmp_path / "backups", store)
+        backup.snapshot()
+        manager.add_smart_password(SmartPassword("f" * 64, "new", 20))
+        read = []
+        original = backup._store_chunks
+        monkeypatch.setattr(backup, "_store_chunks", lambda data: read.append(data) or original(data))
+        snapshot = backup.snapshot()
+        assert len(read) == 1 and snapshot.directory
+        assert set(snapshot.files) == {f"{c}.json" for c in "0f"}
+
+    def test_directory_restore_removes_extra_files(self, tmp_path):
+        store = tmp_path / "shards"
+        manager = SmartPasswordManager(storage=ShardedDirectoryStorage(store, prefix_length=1))
+        manager._commit_batch(entries(10), [])
+        backup = StoreBackup(tmp_path / "backups", store)
+        snapshot = backup.snapshot()
+        manager.add_smart_password(SmartPassword("e" * 64, "later", 20))
+        backup.restore(snapshot.id)
+        assert sorted(os.listdir(store)) == ["0.json"]
+        copy = tmp_path / "copy"
+        backup.restore(snapshot.id, destination=copy)
+        assert SmartPasswordManager(storage=ShardedDirectoryStorage(copy, prefix_length=1)).password_count == 10
+
+    def test_directory_restore_keeps_unrelated_files(self, tmp_path):
+        store = tmp_path / "shards"
+        manager = SmartPasswordManager(storage=ShardedDirectoryStorage(store, prefix_length=1))
+        manager._commit_batch(entries(10), [])
+        backup = StoreBackup(tmp_path / "backups", store)
+        snapshot = backup.snapshot()
+        (tmp_path / "home" / "documents").mkdir(parents=True)
+        (tmp_path / "home" / "notes.txt").write_text("keep me")
+        with pytest.raises(ValueError, match="non-empty directory"):
+            backup.restore(snapshot.id, destination=tmp_path / "home")
+        assert sorted(os.listdir(tmp_path / "home")) == ["documents", "notes.txt"]
+        backup.restore(snapshot.id, destination=str(store))
+        assert manager.password_count == 10
+
+    def test_retention_and_garbage_collection(self, tmp_path):
+        path = tmp_path / "passwords.json"
+        manager = SmartPasswordManager(filename=str(path))
+        backup = StoreBackup(tmp_path / "backups", path, min_chunk=256, max_chunk=4096)
+        ids = []
+        for round_ in range(5):
+            manager._commit_batch(entries(50, start=round_ * 50), [])
+            ids.append(backup.snapshot().id)
+        stored = backup.stats()["chunks"]
+        removed = backup.prune(keep_last=2)
+        assert removed == ids[2::-1]
+        assert [snapshot.id for snapshot in backup.snapshots()] == ids[3:]
+        assert backup.stats()["chunks"] < stored
+        assert backup.verify() == []
+        backup.restore(ids[3])
+        assert SmartPasswordManager(filename=str(path)).password_count == 200
+
+    def test_prune_by_period(self, tmp_path, monkeypatch):
+        path = tmp_path / "passwords.json"
+        SmartPasswordManager(filename=str(path)).add_smart_password(entries(1)[0])
+        backup = StoreBackup(tmp_path / "backups", path)
+        clock = iter([0.0, 1800.0, 3600.0, 5400.0, 90000.0])
+        monkeypatch.setattr("smartpasslib.managers.backup.time.time", lambda: next(clock))
+        ids = [backup.snapshot().id for _ in range(5)]
+        assert backup.prune(keep_hourly=2) == [ids[2], ids[1], ids[0]]
+        assert backup.prune(keep_daily=1) == [ids[3]]
+
+    def test_errors(self, tmp_path):
+        path = tmp_path / "passwords.json"
+        backup = StoreBackup(tmp_path / "backups", path)
+        with pytest.raises(KeyError):
+            backup.restore()
+        with pytest.raises(KeyError):
+            backup.get("missing")
+        with pytest.raises(ValueError, match="retention rule"):
+            backup.prune()
+        SmartPasswordManager(filename=str(path)).add_smart_password(entries(1)[0])
+        snapshot = backup.snapshot()
+        digest = snapshot.files["passwords.json"]["chunks"][0]
+        os.remove(backup._chunk_path(digest))
+        assert len(backup.verify()) == 1
+        with pytest.raises(ValueError, match="chunk missing"):
+            backup.restore(snapshot.id)
@@ -0,0 +1,158 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import time
+
+import pytest
+
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.managers.events import EXTERNAL, LOCAL
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.memory import MemoryStorage
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
+
+KEYS = [SmartKeyGenerator.generate_public_key(f"events-secret-{i:03d}") for i in range(4)]
+
+
+def record(password):
+    if password is None:
+        return None
+    data = password.to_dict()
+    data.pop("modified")
+    return data
+
+
+def summary(events):
+    return [(e.type, e.public_key, record(e.old), record(e.new), e.origin) for e in events]
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestChangeFeed:
+    def test_local_events(self, temp_file):
+        manager = SmartPasswordManager(filename=temp_file)
+        events = []
+        manager.subscribe(events.append)
+
+        manager.add_smart_password(SmartPassword(KEYS[0], "one", 12))
+        manager.update_smart_password(KEYS[0], description="uno", length=20)
+        manager.update_smart_password(KEYS[0], description="uno")
+        manager.add_smart_password(SmartPassword(KEYS[0], "replaced", 14))
+        manager.delete_smart_password(KEYS[0])
+
+        one = {"public_key": KEYS[0], "description": "one", "length": 12, "version": 1}
+        uno = {"public_key": KEYS[0], "description": "uno", "length": 20, "version": 2}
+        replaced = {"public_key": KEYS[0], "description": "replaced", "length": 14, "version": 3}
+        assert summary(events) == [
+            ("added", KEYS[0], None, one, LOCAL),
+            ("updated", KEYS[0], one, uno, LOCAL),
+            ("updated", KEYS[0], uno, replaced, LOCAL),
+            ("deleted", KEYS[0], replaced, None, LOCAL),
+        ]
+
+    def test_clear(self):
+        manager = SmartPasswordManager(storage=MemoryStorage())
+        for key in KEYS[:2]:
+            manager.add_smart_password(SmartPassword(key, "d", 12))
+        events = []
+        manager.subscribe(events.append)
+        manager.clear()
+        assert [(e.type, e.public_key) for e in events] == [
+            ("deleted", KEYS[0]), ("deleted", KEYS[1]), ("cleared", None)
+        ]
+
+    def test_filter_and_unsubscribe(self):
+        manager = SmartPasswordManager(storage=MemoryStorage())
+        events = []
+        subscription = manager.subscribe(events.append, types=["deleted"])
+        manager.add_smart_password(SmartPassword(KEYS[0], "d", 12))
+        manager.delete_smart_password(KEYS[0])
+        subscription.unsubscribe()
+        manager.add_smart_password(SmartPassword(KEYS[0], "d", 12))
+        manager.delete_smart_password(KEYS[0])
+        assert [e.type for e in events] == ["deleted"]
+        with pytest.raises(ValueError, match="Unknown event type: renamed"):
+            manager.subscribe(events.append, types=["renamed"])
+
+    def test_failing_subscriber(self):
+        manager = SmartPasswordManager(storage=MemoryStorage())
+        events = []
+        manager.subscribe(lambda event: 1 / 0)
+        manager.subscribe(events.append)
+        with pytest.warns(UserWarning, match="failed"):
+            manager.add_smart_password(SmartPassword(KEYS[0], "d", 12))
+        assert len(events) == 1
+        assert manager.get_smart_password(KEYS[0]) is not None
+
+    def test_reload_emits_diff(self, temp_file):
+        manager = SmartPasswordManager(filename=temp_file)
+        manager.add_smart_password(SmartPassword(KEYS[0], "keep", 12))
+        manager.add_smart_password(SmartPassword(KEYS[1], "change", 12))
+        manager.add_smart_password(SmartPassword(KEYS[2], "remove", 12))
+        other = SmartPasswordManager(filename=temp_file)
+        other.update_smart_password(KEYS[1], length=30)
+        other.delete_smart_password(KEYS[2])
+        other.add_smart_password(SmartPassword(KEYS[3], "new", 16))
+
+        events = []
+        manager.subscribe(events.append)
+        assert manager.reload() == 3
+        assert [(e.type, e.public_key, e.origin) for e in events] == [
+            ("deleted", KEYS[2], EXTERNAL), ("updated", KEYS[1], EXTERNAL),
+            ("added", KEYS[3], EXTERNAL), ("reloaded", None, EXTERNAL),
+        ]
+        assert manager.reload() == 0
+        assert len(events) == 4
+
+    def test_reload_keeps_state_on_partial_file(self, temp_file):
+        manager = SmartPasswordManager(filename=temp_file)
+        manager.add_smart_password(SmartPassword(KEYS[0], "keep", 12))
+        with open(temp_file, 'w') as f:
+            f.write('{"truncated": ')
+        with pytest.raises(ValueError):
+            manager.reload()
+        assert list(manager.passwords) == [KEYS[0]]
+
+
+class TestStoreWatcher:
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_external_changes(self, temp_file, use_inotify):
+        manager = SmartPasswordManager(filename=temp_file)
+        manager.add_smart_password(SmartPassword(KEYS[0], "d", 12))
+        events = []
+        manager.subscribe(events.append)
+        with manager.watch(interval=0.05, use_inotify=use_inotify) as watcher:
+            if not use_inotify:
+                assert watcher.mode == "polling"
+            manager.add_smart_password(SmartPassword(KEYS[1], "own write", 12))
+            SmartPasswordManager(filename=temp_file).add_smart_password(SmartPassword(KEYS[2], "external", 12))
+            assert wait_for(lambda: any(e.type == "reloaded" for e in events))
+        assert [(e.type, e.public_key, e.origin) for e in events] == [
+            ("added", KEYS[1], LOCAL), ("added", KEYS[2], EXTERNAL), ("reloaded", None, EXTERNAL)
+        ]
+
+    def test_sharded_check(self, tmp_path):
+        storage = ShardedDirectoryStorage(tmp_path / "store")
+        manager = SmartPasswordManager(storage=storage)
+        manager.add_smart_password(SmartPassword(KEYS[0], "d", 12))
+        watcher = manager.watch(use_inotify=False)
+        try:
+            path = storage.shard_path(storage.shard_name(KEYS[1]))
+            with open(path, 'w') as f:
+                json.dump({KEYS[1]: {"public_key": KEYS[1], "description": "x", "length": 12}}, f)
+            assert watcher.check() == 1
+            assert watcher.check() == 0
+            assert manager.get_smart_password(KEYS[1]).description == "x"
+        finally:
+            watcher.stop()
+
+    def test_watch_requires_files(self):
+        with pytest.raises(ValueError, match="no files to watch"):
+            SmartPasswordManager(storage=MemoryStorage()).watch()
@@ -0,0 +1,138 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+
+import pytest
+
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.managers.history import EntryHistory
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.memory import MemoryStorage
+
+KEYS = [SmartKeyGenerator.generate_public_key(f"history-secret-{i:03d}") for i in range(3)]
+
+
+def stamp_times(history, *times):
+    """Rewrite the log's modification times (tests cannot wait between edits)."""
+    with open(history.path) as f:
+        lines = f.readlines()
+    for i, t in enumerate(times, start=1):
+        line = json.loads(lines[i])
+        line["modified"] = t
+        lines[i] = json.dumps(line) + '\n'
+    with open(history.path, 'w') as f:
+        f.writelines(lines)
+
+
+@pytest.fixture
+def manager(temp_file):
+    return SmartPasswordManager(filename=temp_file)
+
+
+class TestEntryHistory:
+    def test_records_versions(self, manager):
+        history = EntryHistory(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "one", 12))
+        manager.update_smart_password(KEYS[0], description="two")
+        manager.update_smart_password(KEYS[0], length=20)
+        manager.delete_smart_password(KEYS[0])
+
+        entries = history.entries(KEYS[0])
+        assert [e.version for e in entries] == [1, 2, 3, 4]
+        assert [e.record for e in entries] == [
+            {"description": "one", "length": 12},
+            {"description": "two", "length": 12},
+            {"description": "two", "length": 20},
+            None,
+        ]
+        assert entries[-1].deleted
+
+    def test_log_is_delta_encoded(self, manager):
+        history = EntryHistory(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "one", 12))
+        manager.update_smart_password(KEYS[0], length=30)
+        history.close()
+        with open(history.path) as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[0] == {"format": "smartpasslib-history", "version": 1}
+        assert lines[1]["set"] == {"description": "one", "length": 12}
+        assert lines[2]["set"] == {"length": 30}
+
+    def test_baseline_for_existing_entries(self, manager):
+        manager.add_smart_password(SmartPassword(KEYS[0], "before", 12))
+        history = EntryHistory(manager)
+        manager.update_smart_password(KEYS[0], description="after")
+        assert [e.record["description"] for e in history.entries(KEYS[0])] == ["before", "after"]
+
+    def test_rollback_by_version(self, manager):
+        history = EntryHistory(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "one", 12))
+        manager.update_smart_password(KEYS[0], description="two", length=16)
+
+        restored = history.rollback(KEYS[0], version=1)
+        assert (restored.description, restored.length, restored.version) == ("one", 12, 3)
+        assert history.entries(KEYS[0])[-1].version == 3
+
+    def test_rollback_restores_deleted_entry(self, manager):
+        history = EntryHistory(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "one", 12))
+        manager.delete_smart_password(KEYS[0])
+        assert history.rollback(KEYS[0], version=1).description == "one"
+        assert SmartPasswordManager(filename=manager.file_path).get_smart_password(KEYS[0]) is not None
+
+    def test_rollback_errors(self, manager):
+        history = EntryHistory(manager)
+        with pytest.raises(ValueError, match="Specify either version or as_of"):
+            history.rollback(KEYS[0])
+        with pytest.raises(ValueError, match="Version 5 of entry"):
+            history.rollback(KEYS[0], version=5)
+
+    def test_rollback_store_as_of(self, manager):
+        history = EntryHistory(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "a", 12))
+        manager.add_smart_password(SmartPassword(KEYS[1], "b", 12))
+        manager.update_smart_password(KEYS[0], description="a2")
+        manager.add_smart_password(SmartPassword(KEYS[2], "c", 12))
+        stamp_times(history, 100.0, 100.0, 200.0, 200.0)
+
+        assert history.states_at(150.0) == {
+            KEYS[0]: {"description": "a", "length": 12},
+            KEYS[1]: {"description": "b", "length": 12},
+            KEYS[2]: None,
+        }
+        assert history.rollback(KEYS[0], as_of=150.0).description == "a"
+        manager.update_smart_password(KEYS[0], description="a3")
+        assert history.rollback_store(as_of=150.0) == 2
+        assert {k: p.description for k, p in manager.passwords.items()} == {KEYS[0]: "a", KEYS[1]: "b"}
+
+    def test_survives_restart(self, manager):
+        history = EntryHistory(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "one", 12))
+        history.close()
+        reopened_manager = SmartPasswordManager(filename=manager.file_path)
+        reopened = EntryHistory(reopened_manager)
+        reopened_manager.update_smart_password(KEYS[0], description="two")
+        with open(reopened.path, 'a') as f:
+            f.write('{"public_key": "torn')
+        assert [e.record["description"] for e in reopened.entries(KEYS[0])] == ["one", "two"]
+
+    def test_prune(self, manager):
+        history = EntryHistory(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "a", 12))
+        manager.update_smart_password(KEYS[0], description="a2")
+        manager.add_smart_password(SmartPassword(KEYS[1], "b", 12))
+        manager.delete_smart_password(KEYS[1])
+        manager.update_smart_password(KEYS[0], description="a3")
+        stamp_times(history, 100.0, 110.0, 100.0, 110.0, 300.0)
+
+        assert history.prune(older_than=200.0) == 3
+        assert [e.record["description"] for e in history.entries(KEYS[0])] == ["a2", "a3"]
+        assert history.entries(KEYS[1]) == []
+        manager.update_smart_password(KEYS[0], description="a4")
+        assert history.entries(KEYS[0])[-1].record["description"] == "a4"
+
+    def test_memory_store_requires_path(self, tmp_path):
+        manager = SmartPasswordManager(storage=MemoryStorage())
+        with pytest.raises(ValueError, match="History requires a log path"):
+            EntryHistory(manager)
+        assert EntryHistory(manager, path=str(tmp_path / "log")).path.endswith("log")
@@ -0,0 +1,115 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import base64
+import json
+
+import pytest
+
+from smartpasslib.managers.index import EntryIndex
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.memory import MemoryStorage
+
+
+def make_manager(count=50):
+    manager = SmartPasswordManager(storage=MemoryStorage())
+    manager._commit_batch([SmartPassword(f"key{i:03d}", f"{'Service' if i % 2 else 'service'} {i % 7}",
+                                         12 + i % 5) for i in range(count)], [])
+    return manager
+
+
+def expected(manager, order_by):
+    if order_by == "description":
+        key = lambda sp: (sp.description.casefold(), sp.description, sp.public_key)  # noqa: E731
+    else:
+        key = lambda sp: (sp.length, sp.description.casefold(), sp.description, sp.public_key)  # noqa: E731
+    return [sp.public_key for sp in sorted(manager.passwords.values(), key=key)]
+
+
+def paged(manager, order_by, limit, descending=False):
+    keys, cursor = [], None
+    while True:
+        page = list(manager.iter_entries(order_by, cursor, limit, descending))
+        keys.extend(sp.public_key for _, sp in page)
+        if len(page) < limit:
+            return keys
+        cursor = page[-1][0]
+
+
+class TestEntryIndex:
+    @pytest.mark.parametrize("order_by", ["description", "length"])
+    def test_pages_follow_sorted_order(self, order_by):
+        manager = make_manager()
+        assert paged(manager, order_by, 7) == expected(manager, order_by)
+        assert paged(manager, order_by, 7, descending=True) == expected(manager, order_by)[::-1]
+        assert [sp.public_key for _, sp in manager.iter_entries(order_by)] == expected(manager, order_by)
+
+    def test_index_follows_mutations(self, tmp_path):
+        manager = make_manager()
+        list(manager.iter_entries(limit=1))
+        manager.add_smart_password(SmartPassword("new", "AAA first", 40))
+        manager.update_smart_password("key010", description="zzz last", length=99)
+        manager.delete_smart_password("key011")
+        manager._commit_batch([SmartPassword("batch", "mid", 20)], ["key012"])
+        for order_by in ("description", "length"):
+            assert paged(manager, order_by, 6) == expected(manager, order_by)
+        assert manager.entry_stats() == EntryIndex(manager.passwords.values()).stats()
+        manager.clear()
+        assert list(manager.iter_entries()) == []
+        assert manager.entry_stats().total == 0
+
+    def test_cursor_survives_concurrent_changes(self):
+        manager = make_manager()
+        first = list(manager.iter_entries(limit=10))
+        manager.delete_smart_password(first[-1][1].public_key)
+        manager.add_smart_password(SmartPassword("early", "aaa", 12))
+        rest = [sp.public_key for _, sp in manager.iter_entries(cursor=first[-1][0])]
+        assert rest == expected(manager, "description")[10:]  # "early" sorts first
+
+    def test_reload_updates_index(self, temp_file):
+        manager = SmartPasswordManager(filename=temp_file)
+        manager.add_smart_password(SmartPassword("a", "beta", 12))
+        assert manager.entry_stats().total == 1
+        with open(temp_file, 'w') as f:
+            json.dump({key: SmartPassword(key, key, 30).to_dict() for key in ("x", "y")}, f)
+        manager.reload()
+        assert [sp.public_key for _, sp in manager.iter_entries()] == ["x", "y"]
+        assert manager.entry_stats().by_length == {30: 2}
+
+    def test_write_data_rebuilds_index(self):
+        manager = make_manager(3)
+        assert manager.entry_stats().total == 3
+        manager.smart_passwords["direct"] = SmartPassword("direct", "d", 12)
+        manager._write_data()
+        assert manager.entry_stats().total == 4
+
+    def test_stats_buckets(self):
+        manager = make_manager()
+        assert manager.entry_stats() == (50, {12: 10, 13: 10, 14: 10, 15: 10, 16: 10})
+        assert manager.entry_stats(bucket=5).by_length == {10: 30, 15: 20}
+
+    def test_invalid_arguments(self):
+        manager = make_manager(3)
+        with pytest.raises(ValueError, match="Unknown order"):
+            list(manager.iter_entries("public_key"))
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            list(manager.iter_entries(cursor="not a cursor"))
+        cursor = next(manager.iter_entries("length"))[0]
+        with pytest.raises(ValueError, match="belongs to order"):
+            list(manager.iter_entries("description", cursor))
+        with pytest.raises(ValueError, match="Bucket"):
+            manager.entry_stats(bucket=0)
+
+    @pytest.mark.parametrize("order_by,payload", [
+        ("description", ["description", 5]),
+        ("description", ["description", [1, 2]]),
+        ("description", ["description", ["a", "a"]]),
+        ("length", ["length", ["12", "a", "a", "k"]]),
+        ("description", {"order": "description"}),
+        ("description", 7),
+    ])
+    def test_malformed_cursor(self, order_by, payload):
+        manager = make_manager(3)
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+        for descending in (False, True):
+            with pytest.raises(ValueError, match="Invalid cursor"):
+                list(manager.iter_entries(order_by, cursor, descending=descending))
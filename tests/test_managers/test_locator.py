@@ -0,0 +1,142 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import os
+
+import pytest
+
+from smartpasslib.managers.locator import StoreLocator
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.storage.json_file import JsonFileStorage
+from smartpasslib.utils.parallel import DerivationExecutor
+
+
+def key(number):
+    return f"{number:064x}"
+
+
+def write_store(path, numbers, storage=JsonFileStorage):
+    storage(str(path)).save({key(n): SmartPassword(key(n), f"entry {n}", 12) for n in numbers})
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def stores(tmp_path):
+    for user in range(20):
+        write_store(tmp_path / f"user{user}.json", range(user * 10, user * 10 + 10))
+    return tmp_path
+
+
+class TestStoreLocator:
+    def test_locates_keys(self, stores):
+        locator = StoreLocator(stores)
+        assert locator.locate(key(0)) == [str(stores / "user0.json")]
+        assert locator.locate(key(199)) == [str(stores / "user19.json")]
+        assert locator.locate(key(5000)) == []
+        assert key(42) in locator
+        assert len(locator) == 20
+
+    def test_bloom_rejects_missing_keys(self, stores):
+        locator = StoreLocator(stores, refresh_interval=None)
+        locator.refresh()
+        for number in range(1000, 2000):
+            assert locator.locate(key(number)) == []
+        stats = locator.stats()
+        assert stats["rejected"] + stats["false_positives"] == 1000
+        assert stats["false_positives"] < 20
+
+    def test_persistent_index(self, stores):
+        StoreLocator(stores).refresh()
+        assert os.path.isfile(stores / ".locator")
+        reopened = StoreLocator(stores, refresh_interval=None)
+        assert len(reopened) == 20
+        assert reopened._keys is None  # key map not read yet
+        assert reopened.locate(key(7777)) == []
+        assert reopened.locate(key(123)) == [str(stores / "user12.json")]
+
+    def test_refresh_follows_changes(self, stores):
+        locator = StoreLocator(stores, refresh_interval=None)
+        assert locator.refresh() == (20, 20, 0, 0)
+        assert locator.refresh() == (20, 0, 0, 0)
+        write_store(stores / "user3.json", [30, 500])
+        write_store(stores / "new.json", [600])
+        os.remove(stores / "user4.json")
+        reopened = StoreLocator(stores, refresh_interval=None)
+        assert reopened.refresh() == (20, 1, 1, 1)
+        assert reopened.locate(key(31)) == []
+        assert reopened.locate(key(500)) == [str(stores / "user3.json")]
+        assert reopened.locate(key(600)) == [str(stores / "new.json")]
+        assert reopened.locate(key(40)) == []
+
+    def test_located_store_is_rechecked(self, stores):
+        locator = StoreLocator(stores, refresh_interval=None)
+        locator.refresh()
+        write_store(stores / "user1.json", [11])
+        assert locator.locate(key(10)) == []
+        assert locator.locate(key(11)) == [str(stores / "user1.json")]
+
+    def test_key_in_several_stores(self, stores):
+        write_store(stores / "shared.json", [5])
+        locator = StoreLocator(stores)
+        assert sorted(locator.locate(key(5))) == [str(stores / "shared.json"), str(stores / "user0.json")]
+
+    def test_update_and_compressed_stores(self, stores):
+        locator = StoreLocator(stores, refresh_interval=None)
+        locator.refresh()
+        write_store(stores / "packed.json", [900, 901], storage=CompressedFileStorage)
+        assert locator.locate(key(900)) == []
+        locator.update(stores / "packed.json")
+        assert locator.locate(key(901)) == [str(stores / "packed.json")]
+
+    def test_parallel_rebuild(self, stores):
+        with DerivationExecutor(workers=2, chunk_size=4) as executor:
+            locator = StoreLocator(stores, executor=executor, parallel_threshold=1)
+            assert locator.rebuild() == (20, 20, 0, 0)
+        assert locator.locate(key(77)) == [str(stores / "user7.json")]
+
+    def test_bloom_grows_and_drops_removed_keys(self, tmp_path):
+        write_store(tmp_path / "big.json", range(3000))
+        locator = StoreLocator(tmp_path, refresh_interval=None)
+        locator.refresh()
+        assert locator.stats()["bloom_capacity"] >= 3000
+        write_store(tmp_path / "big.json", range(10))
+        locator.refresh()
+        assert locator._stale == 0
+        assert locator.stats()["bloom_capacity"] == 1024
+
+    def test_recursive_and_unreadable_stores(self, tmp_path):
+        (tmp_path / "team").mkdir()
+        write_store(tmp_path / "team" / "alice.json", [1])
+        (tmp_path / "broken.json").write_text("[1, 2")
+        with pytest.warns(UserWarning):
+            locator = StoreLocator(tmp_path, recursive=True)
+            assert locator.locate(key(1)) == [str(tmp_path / "team" / "alice.json")]
+        with pytest.warns(UserWarning):
+            assert StoreLocator(tmp_path, index_path=tmp_path / "flat.idx").locate(key(1)) == []
+
+    def test_corrupt_index_is_rebuilt(self, stores):
+        (stores / ".locator").write_bytes(b"garbage")
+        with pytest.warns(UserWarning):
+            locator = StoreLocator(stores)
+        assert locator.locate(key(15)) == [str(stores / "user1.json")]
+
+    def test_corrupt_key_map_rebuilds_every_store(self, stores):
+        StoreLocator(stores).refresh()
+        with open(stores / ".locator", 'rb') as f:
+            header = f.readline()
+            size = json.loads(header)
+            head = header + f.read(size["bloom_size"] + size["stores_size"])
+        (stores / ".locator").write_bytes(head + b"{truncated")
+        write_store(stores / "user3.json", [30, 500])
+        locator = StoreLocator(stores, refresh_interval=None)
+        with pytest.warns(UserWarning):
+            locator.refresh()
+        assert len(locator) == 20
+        assert locator.locate(key(15)) == [str(stores / "user1.json")]
+        assert locator.locate(key(500)) == [str(stores / "user3.json")]
+        assert StoreLocator(stores, refresh_interval=None).locate(key(199)) == [str(stores / "user19.json")]
+
+    def test_invalid_error_rate(self, tmp_path):
+        with pytest.raises(ValueError):
+            StoreLocator(tmp_path, error_rate=1)
@@ -5,6 +5,10 @@ from pathlib import Path
 import pytest
 
 from smartpasslib import SmartPassword
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.storage.json_file import JsonFileStorage
+from smartpasslib.storage.memory import MemoryStorage
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
 from smartpasslib.managers.smart_password_manager import SmartPasswordManager
 
 
@@ -349,3 +353,52 @@ class TestSmartPasswordManager:
         manager = SmartPasswordManager()
         assert manager.file_path == str(config_dir / 'passwords.json')
         assert config_dir.exists()
+
+    def test_default_storage_is_json_file(self, temp_file):
+        manager = SmartPasswordManager(filename=temp_file)
+        assert isinstance(manager.storage, JsonFileStorage)
+        assert manager.storage.path == temp_file
+
+    def test_memory_storage(self, test_password):
+        storage = MemoryStorage()
+        manager = SmartPasswordManager(storage=storage)
+        assert manager.file_path is None
+        manager.add_smart_password(test_password)
+        assert storage.get(test_password.public_key) is test_password
+        manager.update_smart_password(test_password.public_key, length=30)
+        assert storage.get(test_password.public_key).length == 30
+        manager.delete_smart_password(test_password.public_key)
+        assert storage.count() == 0
+
+    def test_sharded_storage(self, tmp_path, test_password):
+        manager = SmartPasswordManager(storage=ShardedDirectoryStorage(tmp_path))
+        manager.add_smart_password(test_password)
+        manager2 = SmartPasswordManager(storage=ShardedDirectoryStorage(tmp_path))
+        assert manager2.get_smart_password(test_password.public_key).description == test_password.description
+        manager2.clear()
+        assert SmartPasswordManager(storage=ShardedDirectoryStorage(tmp_path)).password_count == 0
+
+    def test_write_data_saves_whole_mapping(self, temp_file, test_password):
+        manager = SmartPasswordManager(filename=temp_file)
+        manager.smart_passwords[test_password.public_key] = test_password
+        manager._write_data()
+        assert SmartPasswordManager(filename=temp_file).password_count == 1
+
+    def test_verify_secret_with_kdf(self, temp_file, test_secret):
+        kdf = KdfParams(n=16, r=1)
+        public_key = SmartPasswordManager.generate_public_key(test_secret, kdf=kdf)
+        manager = SmartPasswordManager(filename=temp_file)
+        manager.add_smart_password(SmartPassword(public_key=public_key, description="kdf", kdf=kdf))
+
+        reloaded = SmartPasswordManager(filename=temp_file)
+        assert reloaded.get_smart_password(public_key).kdf == kdf
+        assert reloaded.verify_secret(public_key, test_secret) is True
+        assert reloaded.verify_secret(public_key, "wrong_secret_phrase") is False
+        assert reloaded.verify_secret("missing", test_secret) is False
+        assert SmartPasswordManager.check_public_key(test_secret, public_key, kdf=kdf) is True
+
+    def test_verify_secret_v4_chain(self, temp_file, test_secret):
+        public_key = SmartPasswordManager.generate_public_key(test_secret)
+        manager = SmartPasswordManager(filename=temp_file)
+        manager.add_smart_password(SmartPassword(public_key=public_key, description="v4"))
+        assert manager.verify_secret(public_key, test_secret) is True
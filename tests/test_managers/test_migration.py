@@ -0,0 +1,146 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+import json
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.managers.migration import migrate_store, migrate_stores
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.utils.parallel import DerivationExecutor
+
+SECRETS = {f"service-{i}": f"migration-secret-{i:03d}" for i in range(5)}
+
+
+def legacy_key(secret):
+    return hashlib.sha256(f"legacy:{secret}".encode()).hexdigest()
+
+
+def write_legacy(path, entries):
+    data = {}
+    for description, length in entries:
+        key = legacy_key(SECRETS.get(description, description))
+        data[key] = {"public_key": key, "description": description, "length": length}
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=4)
+    return data
+
+
+def provider(record):
+    return SECRETS.get(record["description"])
+
+
+class TestMigration:
+    def test_migrates_store(self, tmp_path):
+        source, destination = str(tmp_path / "v3.json"), str(tmp_path / "v4.json")
+        write_legacy(source, [("service-0", 12), ("service-1", 20)])
+
+        report = migrate_store(source, destination, provider, executor=DerivationExecutor(workers=1))
+        assert report.ok and report.written and report.migrated == 2
+
+        manager = SmartPasswordManager(filename=destination)
+        password = manager.get_smart_password(SmartKeyGenerator.generate_public_key(SECRETS["service-1"]))
+        assert (password.description, password.length, password.version) == ("service-1", 20, 1)
+        assert manager.verify_secret(password.public_key, SECRETS["service-1"])
+
+    def test_failures_are_reported(self, tmp_path):
+        source, destination = str(tmp_path / "v3.json"), str(tmp_path / "v4.json")
+        write_legacy(source, [("service-0", 12), ("service-2", 8), ("unknown", 16)])
+        with open(source) as f:
+            data = json.load(f)
+        data["broken"] = "not a record"
+        data["short"] = {"public_key": "short", "description": "short", "length": 16}
+        with open(source, 'w') as f:
+            json.dump(data, f)
+
+        def short_provider(record):
+            return "too short" if record["description"] == "short" else provider(record)
+
+        report = migrate_store(source, destination, short_provider, executor=DerivationExecutor(workers=1))
+        assert report.migrated == 1 and report.skipped == 1
+        assert sorted(f.code for f in report.failures) == ["invalid_length", "invalid_secret", "not_object"]
+        assert report.to_dict()["failures"][0]["source"] == source
+        assert SmartPasswordManager(filename=destination).password_count == 1
+
+    def test_duplicate_secret(self, tmp_path):
+        source = str(tmp_path / "v3.json")
+        with open(source, 'w') as f:
+            json.dump({
+                "a" * 64: {"public_key": "a" * 64, "login": "mail", "length": 16},
+                "b" * 64: {"public_key": "b" * 64, "description": "mail again", "length": 16},
+            }, f)
+        report = migrate_store(source, str(tmp_path / "v4.json"), lambda record: SECRETS["service-0"],
+                               executor=DerivationExecutor(workers=1))
+        assert report.migrated == 1
+        assert [f.code for f in report.failures] == ["duplicate_key"]
+
+    def test_legacy_verifier(self, tmp_path):
+        source = str(tmp_path / "v3.json")
+        write_legacy(source, [("service-0", 12), ("service-1", 12)])
+
+        def wrong_provider(record):
+            return SECRETS["service-0"]
+
+        report = migrate_store(source, str(tmp_path / "v4.json"), wrong_provider,
+                               executor=DerivationExecutor(workers=1),
+                               legacy_verifier=lambda secret, key: legacy_key(secret) == key)
+        assert report.migrated == 1
+        assert [f.code for f in report.failures] == ["secret_mismatch"]
+
+    def test_unreadable_store_is_not_written(self, tmp_path):
+        source, destination = str(tmp_path / "v3.json"), str(tmp_path / "v4.json")
+        write_legacy(source, [("service-0", 12)])
+        with open(source, 'a') as f:
+            f.write("{")
+        report = migrate_store(source, destination, provider, executor=DerivationExecutor(workers=1))
+        assert not report.written
+        assert [f.code for f in report.failures] == ["unreadable"]
+        assert not (tmp_path / "v4.json").exists()
+
+    def test_compressed_destination_keeps_its_records(self, tmp_path):
+        source, destination = str(tmp_path / "v3.json"), str(tmp_path / "v4.store")
+        write_legacy(source, [("service-0", 12)])
+        CompressedFileStorage(destination).put(SmartPassword("c" * 64, "existing", 12))
+        report = migrate_store(source, destination, provider, executor=DerivationExecutor(workers=1))
+        assert report.ok and report.written
+        assert CompressedFileStorage.detect(destination)
+        assert sorted(sp.description for sp in CompressedFileStorage(destination).load().values()) == \
+            ["existing", "service-0"]
+
+    def test_corrupt_destination_is_not_overwritten(self, tmp_path):
+        source, destination = str(tmp_path / "v3.json"), tmp_path / "v4.json"
+        write_legacy(source, [("service-0", 12)])
+        destination.write_text("{not json")
+        report = migrate_store(source, str(destination), provider, executor=DerivationExecutor(workers=1))
+        assert not report.written
+        assert [f.code for f in report.failures] == ["destination_unreadable"]
+        assert destination.read_text() == "{not json"
+
+    def test_fleet_in_parallel(self, tmp_path):
+        jobs = []
+        for i in range(4):
+            source = str(tmp_path / f"user{i}.v3.json")
+            write_legacy(source, [(f"service-{j}", 12 + i) for j in range(i + 1)])
+            jobs.append((source, str(tmp_path / f"user{i}.json")))
+        jobs.append((str(tmp_path / "missing.json"), str(tmp_path / "missing.v4.json")))
+
+        with DerivationExecutor(workers=2, chunk_size=2) as executor:
+            reports = list(migrate_stores(jobs, lambda source, record: provider(record), executor=executor))
+
+        assert [r.source for r in reports] == [source for source, _ in jobs]
+        assert [r.migrated for r in reports] == [1, 2, 3, 4, 0]
+        assert reports[-1].failures[0].code == "unreadable"
+        assert SmartPasswordManager(filename=jobs[3][1]).password_count == 4
+
+    def test_manager_destination_and_kdf(self, tmp_path, temp_file):
+        source = str(tmp_path / "v3.json")
+        write_legacy(source, [("service-0", 14)])
+        manager = SmartPasswordManager(filename=temp_file)
+        manager.add_smart_password(SmartPassword("c" * 64, "existing", 12))
+        kdf = KdfParams(n=16, r=1)
+        report = migrate_store(source, manager, provider, executor=DerivationExecutor(workers=1), kdf=kdf)
+        assert report.written and manager.password_count == 2
+        migrated = next(p for p in manager.passwords.values() if p.description == "service-0")
+        assert migrated.kdf is not None and migrated.kdf.salt != kdf.salt
+        assert manager.verify_secret(migrated.public_key, SECRETS["service-0"])
@@ -0,0 +1,144 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import threading
+import time
+
+import pytest
+
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.managers import pool as pool_module
+from smartpasslib.managers.pool import StorePool
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.utils.parallel import DerivationExecutor
+
+SECRET = "pool-secret-phrase-0001"
+KEY = SmartKeyGenerator.generate_public_key(SECRET)
+
+
+class TestStorePool:
+    def test_reuses_open_store(self, tmp_path):
+        opened = []
+
+        def factory(tenant):
+            opened.append(tenant)
+            return SmartPasswordManager(filename=str(tmp_path / f"{tenant}.json"))
+
+        with StorePool(factory=factory) as pool:
+            with pool.session("alice") as manager:
+                manager.add_smart_password(SmartPassword(KEY, "mail", 12))
+            with pool.session("alice") as manager:
+                assert manager.password_count == 1
+            assert opened == ["alice"]
+            assert pool.stats()["hits"] == 1 and pool.stats()["misses"] == 1
+
+    def test_root_directory(self, tmp_path):
+        with StorePool(root=str(tmp_path)) as pool:
+            with pool.session("bob") as manager:
+                manager.add_smart_password(SmartPassword(KEY, "bank", 14))
+        assert SmartPasswordManager(filename=str(tmp_path / "bob.json")).password_count == 1
+
+    def test_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError, match="Specify either root or factory"):
+            StorePool()
+        with pytest.raises(ValueError, match="Max concurrency must be at least 1"):
+            StorePool(root=str(tmp_path), max_concurrency=0)
+        pool = StorePool(root=str(tmp_path))
+        with pytest.raises(ValueError, match="Invalid tenant id"):
+            with pool.session("../etc"):
+                pass
+        assert len(pool) == 0
+
+    def test_max_stores_evicts_lru(self, tmp_path):
+        with StorePool(root=str(tmp_path), max_stores=2) as pool:
+            for tenant in ("a", "b", "a", "c"):
+                with pool.session(tenant):
+                    pass
+            assert "b" not in pool and "a" in pool and "c" in pool
+            assert pool.evictions == 1
+
+    def test_memory_budget(self, tmp_path):
+        budget = 3 * pool_module.STORE_BYTES + 5 * pool_module.RECORD_BYTES
+        with StorePool(root=str(tmp_path), memory_budget=budget) as pool:
+            with pool.session("big") as manager:
+                for i in range(10):
+                    manager.add_smart_password(SmartPassword(f"{i:064x}", f"entry {i}", 12))
+            for tenant in ("x", "y"):
+                with pool.session(tenant):
+                    pass
+            assert "big" not in pool
+            assert pool.memory <= budget
+
+    def test_store_in_use_is_not_evicted(self, tmp_path):
+        with StorePool(root=str(tmp_path), max_stores=1) as pool:
+            with pool.session("a") as a:
+                with pool.session("b"):
+                    pass
+                assert "a" in pool and "b" not in pool
+                assert a.password_count == 0
+
+    def test_idle_timeout(self, tmp_path):
+        with StorePool(root=str(tmp_path), idle_timeout=0.01) as pool:
+            with pool.session("a") as manager:
+                manager.add_smart_password(SmartPassword(KEY, "mail", 12))
+            time.sleep(0.02)
+            assert pool.evict_idle() == 1
+            assert len(pool) == 0
+            with pool.session("a") as manager:
+                assert manager.password_count == 1
+
+    def test_concurrency_limit(self, tmp_path):
+        with StorePool(root=str(tmp_path), max_concurrency=1, acquire_timeout=0.05) as pool:
+            entered = threading.Event()
+            release = threading.Event()
+
+            def hold():
+                with pool.session("a"):
+                    entered.set()
+                    release.wait()
+
+            thread = threading.Thread(target=hold)
+            thread.start()
+            entered.wait()
+            try:
+                with pytest.raises(TimeoutError, match="Tenant a is at its concurrency limit"):
+                    with pool.session("a"):
+                        pass
+                with pool.session("b"):
+                    pass
+            finally:
+                release.set()
+                thread.join()
+            with pool.session("a"):
+                pass
+
+    def test_concurrent_first_open(self, tmp_path):
+        opened = []
+
+        def factory(tenant):
+            opened.append(tenant)
+            time.sleep(0.02)
+            return SmartPasswordManager(filename=str(tmp_path / f"{tenant}.json"))
+
+        pool = StorePool(factory=factory)
+        managers = []
+
+        def use():
+            with pool.session("a") as manager:
+                managers.append(manager)
+
+        threads = [threading.Thread(target=use) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert opened == ["a"]
+        assert len({id(m) for m in managers}) == 1
+
+    def test_rotate_uses_shared_executor(self, tmp_path):
+        executor = DerivationExecutor(workers=1)
+        with StorePool(root=str(tmp_path), executor=executor) as pool:
+            assert pool.executor is executor
+            with pool.session("a") as manager:
+                manager.add_smart_password(SmartPassword(KEY, "mail", 12))
+            results = pool.rotate("a", lambda p: True, new_length=20, secret_provider=lambda p: SECRET)
+            assert [r.length for r in results] == [20]
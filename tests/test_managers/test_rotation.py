@@ -0,0 +1,147 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+
+import pytest
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.generators.smart import SmartPasswordGenerator
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.utils.parallel import DerivationExecutor
+
+SECRETS = [f"rotation-secret-{i:03d}" for i in range(6)]
+
+
+@pytest.fixture
+def manager(temp_file):
+    manager = SmartPasswordManager(filename=temp_file)
+    for i, secret in enumerate(SECRETS):
+        manager.add_smart_password(SmartPassword(
+            public_key=SmartKeyGenerator.generate_public_key(secret),
+            description=f"service-{i}",
+            length=12 + i,
+        ))
+    return manager
+
+
+def secrets_by_key():
+    return {SmartKeyGenerator.generate_public_key(secret): secret for secret in SECRETS}
+
+
+class TestRotate:
+    def test_rotate_length(self, manager, temp_file):
+        secrets = secrets_by_key()
+        results = list(manager.rotate(
+            lambda sp: sp.description in ("service-1", "service-3"),
+            new_length=24,
+            secret_provider=lambda sp: secrets[sp.public_key],
+            executor=DerivationExecutor(workers=1),
+        ))
+        assert [result.description for result in results] == ["service-1", "service-3"]
+        for result in results:
+            assert result.ok
+            assert result.length == 24
+            assert result.password == SmartPasswordGenerator.generate(secrets[result.public_key], 24)
+
+        reloaded = SmartPasswordManager(filename=temp_file)
+        assert sorted(sp.length for sp in reloaded.passwords.values()) == [12, 14, 16, 17, 24, 24]
+
+    def test_single_batched_write(self, manager, monkeypatch):
+        secrets = secrets_by_key()
+        writes = []
+        monkeypatch.setattr(manager.storage, "_write", lambda: writes.append(1))
+        results = manager.rotate(lambda sp: True, new_length=30, secret_provider=lambda sp: secrets[sp.public_key],
+                                 executor=DerivationExecutor(workers=1))
+        assert writes == []
+        assert len(list(results)) == 6
+        assert writes == [1]
+
+    def test_wrong_secret_not_committed(self, manager):
+        results = list(manager.rotate(
+            lambda sp: sp.description == "service-0",
+            new_length=40,
+            secret_provider=lambda sp: "not-the-right-secret",
+            executor=DerivationExecutor(workers=1),
+        ))
+        assert results[0].error == "Secret does not match public key"
+        assert not results[0].ok
+        assert results[0].password is None
+        assert manager.get_smart_password(results[0].public_key).length == 12
+
+    def test_rotate_secret(self, manager, temp_file):
+        old_secret = SECRETS[2]
+        old_key = SmartKeyGenerator.generate_public_key(old_secret)
+        new_secret = "brand-new-rotation-secret"
+        results = list(manager.rotate(
+            lambda sp: sp.public_key == old_key,
+            secret_provider=lambda sp: (old_secret, new_secret),
+            executor=DerivationExecutor(workers=1),
+        ))
+        new_key = SmartKeyGenerator.generate_public_key(new_secret)
+        assert results[0].new_public_key == new_key
+        assert results[0].password == SmartPasswordGenerator.generate(new_secret, 14)
+
+        with open(temp_file) as f:
+            data = json.load(f)
+        assert old_key not in data
+        assert data[new_key]["description"] == "service-2"
+        assert manager.get_smart_password(old_key) is None
+
+    def test_rotate_secret_onto_existing_entry(self, manager, temp_file):
+        key_a, key_b = (SmartKeyGenerator.generate_public_key(secret) for secret in SECRETS[:2])
+        results = list(manager.rotate(
+            lambda sp: sp.public_key == key_a,
+            secret_provider=lambda sp: (SECRETS[0], SECRETS[1]),
+            executor=DerivationExecutor(workers=1),
+        ))
+        assert results[0].error == "New public key is already used by another entry"
+        assert results[0].password is None
+        for reader in (manager, SmartPasswordManager(filename=temp_file)):
+            assert reader.get_smart_password(key_a).description == "service-0"
+            entry_b = reader.get_smart_password(key_b)
+            assert (entry_b.description, entry_b.length) == ("service-1", 13)
+
+    def test_two_entries_rotated_to_one_secret(self, manager):
+        keys = [SmartKeyGenerator.generate_public_key(secret) for secret in SECRETS[:2]]
+        secrets = secrets_by_key()
+        results = list(manager.rotate(
+            lambda sp: sp.public_key in keys,
+            secret_provider=lambda sp: (secrets[sp.public_key], "shared-new-rotation-secret"),
+            executor=DerivationExecutor(workers=1),
+        ))
+        assert [result.ok for result in results] == [True, False]
+        assert manager.password_count == 6
+        assert manager.get_smart_password(results[1].public_key) is not None
+
+    def test_rotate_secret_with_kdf(self, temp_file):
+        kdf = KdfParams(n=16, r=1)
+        manager = SmartPasswordManager(filename=temp_file)
+        old_key = SmartKeyGenerator.generate_public_key(SECRETS[0], kdf=kdf)
+        manager.add_smart_password(SmartPassword(old_key, "kdf", kdf=kdf))
+        result = next(manager.rotate(lambda sp: True, secret_provider=lambda sp: (SECRETS[0], SECRETS[1]),
+                                     executor=DerivationExecutor(workers=1)))
+        rotated = manager.get_smart_password(result.new_public_key)
+        assert rotated.kdf.salt != kdf.salt
+        assert manager.verify_secret(result.new_public_key, SECRETS[1])
+
+    def test_partial_consumption_commits_yielded(self, manager):
+        secrets = secrets_by_key()
+        results = manager.rotate(lambda sp: True, new_length=50, secret_provider=lambda sp: secrets[sp.public_key],
+                                 executor=DerivationExecutor(workers=1, chunk_size=1, max_in_flight=1))
+        first = next(results)
+        results.close()
+        lengths = sorted(sp.length for sp in manager.passwords.values())
+        assert manager.get_smart_password(first.public_key).length == 50
+        assert lengths.count(50) == 1
+
+    def test_process_pool(self, manager):
+        secrets = secrets_by_key()
+        results = list(manager.rotate(lambda sp: True, new_length=20, secret_provider=lambda sp: secrets[sp.public_key],
+                                      executor=DerivationExecutor(workers=2, chunk_size=2)))
+        assert all(result.ok for result in results)
+        assert {sp.length for sp in manager.passwords.values()} == {20}
+
+    def test_invalid_length(self, manager):
+        with pytest.raises(ValueError, match="Password length cannot exceed 100 characters"):
+            manager.rotate(lambda sp: True, new_length=101, secret_provider=lambda sp: "")
@@ -0,0 +1,109 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import asyncio
+import threading
+
+import pytest
+
+from smartpasslib.masters.batcher import MicroBatcher
+from smartpasslib.masters.smart_password_master import SmartPasswordMaster
+from smartpasslib.utils.parallel import THREAD, DerivationExecutor, gil_enabled
+
+
+@pytest.fixture
+def batcher():
+    with MicroBatcher(DerivationExecutor(workers=1), window=0.02, max_batch=16) as batcher:
+        yield batcher
+
+
+class TestMicroBatcher:
+    def test_results_match_master(self, batcher, test_secret):
+        public_key = SmartPasswordMaster.generate_public_key(test_secret)
+        assert batcher.generate_public_key(test_secret) == public_key
+        assert batcher.check_public_key(test_secret, public_key)
+        assert not batcher.check_public_key(test_secret + "x", public_key)
+        assert batcher.generate_smart_password(test_secret, 20) == \
+            SmartPasswordMaster.generate_smart_password(test_secret, 20)
+
+    def test_concurrent_calls_share_batches(self, batcher, test_secret):
+        results = {}
+        start = threading.Barrier(12)
+
+        def call(length):
+            start.wait()
+            results[length] = batcher.generate_smart_password(test_secret, length)
+
+        threads = [threading.Thread(target=call, args=(length,)) for length in range(12, 24)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == {length: SmartPasswordMaster.generate_smart_password(test_secret, length)
+                           for length in range(12, 24)}
+        metrics = batcher.metrics()
+        assert metrics["requests"] == 12
+        assert metrics["batches"] < 12
+        assert metrics["max_batch_size"] > 1
+
+    def test_max_batch_size(self, test_secret):
+        with MicroBatcher(DerivationExecutor(workers=1), window=0.05, max_batch=3, max_in_flight=1) as batcher:
+            futures = [batcher.submit("generate_smart_password", test_secret, 12) for _ in range(7)]
+            assert len({future.result() for future in futures}) == 1
+            assert batcher.metrics()["max_batch_size"] <= 3
+
+    def test_errors_go_to_their_callers(self, batcher, test_secret):
+        good = batcher.submit("generate_smart_password", test_secret, 12)
+        bad = batcher.submit("generate_smart_password", "", 12)
+        assert good.result() == SmartPasswordMaster.generate_smart_password(test_secret, 12)
+        with pytest.raises(ValueError):
+            bad.result()
+        assert batcher.metrics()["errors"] == 1
+
+    def test_unknown_operation(self, batcher):
+        with pytest.raises(ValueError):
+            batcher.submit("generate_private_key", "secret")
+
+    def test_asyncio(self, batcher, test_secret):
+        public_key = SmartPasswordMaster.generate_public_key(test_secret)
+
+        async def main():
+            return await asyncio.gather(
+                batcher.check_public_key_async(test_secret, public_key),
+                batcher.generate_public_key_async(test_secret),
+                *(batcher.generate_smart_password_async(test_secret, length) for length in (12, 16)),
+            )
+
+        checked, key, *passwords = asyncio.run(main())
+        assert checked
+        assert key == public_key
+        assert passwords == [SmartPasswordMaster.generate_smart_password(test_secret, length) for length in (12, 16)]
+
+    def test_metrics(self, batcher, test_secret):
+        empty = batcher.metrics()
+        assert empty["requests"] == 0 and empty["latency_p99_ms"] == 0
+        batcher.generate_public_key(test_secret)
+        metrics = batcher.metrics()
+        assert metrics["requests"] == metrics["batches"] == 1
+        assert metrics["mean_batch_size"] == 1
+        assert 0 <= metrics["wait_p50_ms"] <= metrics["latency_p50_ms"] <= metrics["latency_p99_ms"]
+
+    def test_close_finishes_queued_calls(self, test_secret):
+        batcher = MicroBatcher(DerivationExecutor(workers=1), window=0.05)
+        futures = [batcher.submit("generate_public_key", test_secret) for _ in range(5)]
+        batcher.close()
+        assert all(future.done() for future in futures)
+        with pytest.raises(RuntimeError):
+            batcher.submit("generate_public_key", test_secret)
+        batcher.close()
+
+    def test_default_executor_avoids_processes(self, test_secret):
+        with MicroBatcher() as batcher:
+            assert batcher.executor.inline if gil_enabled() else batcher.executor.backend == THREAD
+            assert batcher.generate_public_key(test_secret) == SmartPasswordMaster.generate_public_key(test_secret)
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            MicroBatcher(window=-1)
+        with pytest.raises(ValueError):
+            MicroBatcher(max_batch=0)
+        with pytest.raises(ValueError):
+            MicroBatcher(max_in_flight=0)
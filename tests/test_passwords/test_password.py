@@ -1,6 +1,7 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 import pytest
 
+from smartpasslib.generators.kdf import KdfParams
 from smartpasslib.smart_passwords.smart_password import SmartPassword
 
 
@@ -72,3 +73,33 @@ class TestSmartPassword:
         assert sp.public_key == test_public_key
         assert sp.description == test_description
         assert sp.length == test_length
+
+    def test_kdf_round_trip(self, test_description, test_public_key):
+        kdf = KdfParams(n=16, r=1)
+        sp = SmartPassword(public_key=test_public_key, description=test_description, kdf=kdf)
+        data = sp.to_dict()
+        assert data["kdf"] == kdf.to_dict()
+        assert SmartPassword.from_dict(data).kdf == kdf
+
+    def test_no_kdf_keeps_format(self, test_password):
+        assert test_password.kdf is None
+        assert set(test_password.to_dict()) == {"public_key", "description", "length"}
+
+    def test_touch_stamps(self, test_password):
+        assert test_password.stamp == (0.0, 0)
+        test_password.touch(modified=100.0)
+        assert test_password.stamp == (100.0, 1)
+        test_password.touch(modified=101.0, base_version=5)
+        assert test_password.stamp == (101.0, 6)
+        data = test_password.to_dict()
+        assert data["version"] == 6 and data["modified"] == 101.0
+        assert SmartPassword.from_dict(data).stamp == (101.0, 6)
+        assert test_password.copy().stamp == (101.0, 6)
+
+    def test_revision_counts_changes(self, test_password):
+        assert test_password.revision == 0
+        test_password.update()
+        assert test_password.revision == 0
+        test_password.update(description="new")
+        test_password.touch()
+        assert test_password.revision == 2
@@ -0,0 +1,123 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import warnings
+
+import pytest
+
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage import compressed
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.storage.json_file import JsonFileStorage
+
+
+def records(count):
+    return {f"{i * 7919 % 1000:03d}key": SmartPassword(f"{i * 7919 % 1000:03d}key", f"service {i}", 12 + i % 30)
+            for i in range(count)}
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "passwords.json.z")
+
+
+@pytest.fixture
+def decompressions(monkeypatch):
+    calls = []
+    original = compressed._decompress
+    monkeypatch.setattr(compressed, "_decompress", lambda codec, data: calls.append(codec) or original(codec, data))
+    return calls
+
+
+class TestCompressedFileStorage:
+    @pytest.mark.parametrize("codec", compressed.CODECS)
+    def test_round_trip(self, path, codec):
+        data = records(300)
+        CompressedFileStorage(path, codec=codec, block_records=32).save(data)
+        storage = CompressedFileStorage(path)
+        assert storage.codec == codec
+        loaded = storage.load()
+        assert {k: v.to_dict() for k, v in loaded.items()} == {k: v.to_dict() for k, v in data.items()}
+        assert list(loaded) == sorted(data)
+        with open(path, 'rb') as f:
+            assert json.loads(f.readline())["format"] == "smartpasslib-compressed"
+
+    def test_lookup_decompresses_one_block(self, path, decompressions):
+        CompressedFileStorage(path, block_records=16).save(records(400))
+        decompressions.clear()
+        storage = CompressedFileStorage(path)
+        assert storage.get("595key").description == "service 5"
+        assert storage.get("missing") is None
+        assert len(decompressions) == 3  # index, then one block per lookup
+        assert storage.count() == 400
+        assert len(decompressions) == 3
+
+    def test_update_rewrites_only_touched_block(self, path, monkeypatch):
+        CompressedFileStorage(path, block_records=16).save(records(400))
+        compressions = []
+        original = compressed._compress
+        monkeypatch.setattr(compressed, "_compress", lambda codec, data: compressions.append(data) or original(codec, data))
+        storage = CompressedFileStorage(path)
+        storage.put(SmartPassword("595key", "changed", 40))
+        assert len(compressions) == 2  # the block and the index
+        assert storage.delete("514key") is True
+        assert storage.delete("514key") is False
+        reopened = CompressedFileStorage(path)
+        assert reopened.get("595key").description == "changed"
+        assert reopened.get("514key") is None
+        assert reopened.count() == 399
+
+    def test_blocks_split_and_empty_blocks_are_dropped(self, path):
+        storage = CompressedFileStorage(path, block_records=4)
+        storage.put_many(records(50).values())
+        assert all(len(block.records) < 8 for block in storage.blocks)
+        storage.delete_many(list(records(50))[:40])
+        assert CompressedFileStorage(path).count() == 10
+        assert sorted(CompressedFileStorage(path)) == sorted(list(records(50))[40:])
+        storage.clear()
+        assert CompressedFileStorage(path).load() == {}
+
+    def test_small_blocks_are_merged(self, path):
+        CompressedFileStorage(path, block_records=8).save(records(64))
+        storage = CompressedFileStorage(path)
+        assert storage.block_records == 8 and len(storage.blocks) == 8
+        keys = sorted(records(64))
+        storage.delete_many(keys[8:13])
+        assert len(storage.blocks) == 7
+        assert all(4 <= block.count < 16 for block in storage.blocks)
+        storage.delete_many(keys[::2])
+        reopened = CompressedFileStorage(path)
+        assert sorted(reopened) == [key for key in keys[1::2] if key not in keys[8:13]]
+        assert all(block.count >= 4 for block in reopened.blocks)
+
+    def test_manager_detects_compressed_store(self, path, test_password):
+        CompressedFileStorage(path).save({test_password.public_key: test_password})
+        manager = SmartPasswordManager(filename=path)
+        assert isinstance(manager.storage, CompressedFileStorage)
+        manager.add_smart_password(SmartPassword("other", "other service"))
+        assert CompressedFileStorage.detect(path)
+        assert SmartPasswordManager(filename=path).password_count == 2
+
+    def test_plain_json_is_not_detected(self, temp_file, test_password):
+        JsonFileStorage(temp_file).put(test_password)
+        assert not CompressedFileStorage.detect(temp_file)
+        assert isinstance(SmartPasswordManager(filename=temp_file).storage, JsonFileStorage)
+
+    def test_corrupt_file(self, path):
+        CompressedFileStorage(path).save(records(10))
+        with open(path, 'rb') as f:
+            header = f.readline()
+        with open(path, 'wb') as f:
+            f.write(header + b"garbage")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert CompressedFileStorage(path).load() == {}
+        assert "Failed to load passwords" in str(caught[0].message)
+        with pytest.raises(ValueError, match="Corrupt compressed store"):
+            CompressedFileStorage(path).reload()
+
+    def test_invalid_arguments(self, path):
+        with pytest.raises(ValueError, match="Unsupported codec"):
+            CompressedFileStorage(path, codec="bz2")
+        with pytest.raises(ValueError, match="Block size"):
+            CompressedFileStorage(path, block_records=0)
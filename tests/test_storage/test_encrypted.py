@@ -0,0 +1,225 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import threading
+
+import pytest
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.encrypted import EncryptedFileStorage
+from smartpasslib.utils.aead import SHAKE_HMAC, AuthenticationError
+
+FAST_KDF = KdfParams(n=16, r=1)
+PASSPHRASE = "correct horse battery staple"
+
+
+def make_password(public_key, description="service"):
+    return SmartPassword(public_key=public_key, description=description)
+
+
+def open_store(path, passphrase=PASSPHRASE, **kwargs):
+    return EncryptedFileStorage(path, passphrase, kdf=FAST_KDF.with_new_salt(), cipher=SHAKE_HMAC, **kwargs)
+
+
+class TestEncryptedFileStorage:
+    def test_round_trip(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put_many(make_password(f"{i:02x}" + "0" * 62, f"mail {i}") for i in range(40))
+        reopened = EncryptedFileStorage(temp_file, PASSPHRASE)
+        assert reopened.count() == 40
+        assert reopened.get("05" + "0" * 62).description == "mail 5"
+        assert reopened.cipher == SHAKE_HMAC and reopened.kdf.n == 16
+
+    def test_file_hides_descriptions(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put(make_password("ab" + "0" * 62, "bank account alice"))
+        with open(temp_file) as f:
+            content = f.read()
+        assert "bank account" not in content and "0" * 62 not in content
+        assert json.loads(content.splitlines()[0])["format"] == "smartpasslib-encrypted"
+
+    def test_lookup_decrypts_one_chunk(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put_many(make_password(f"{i:02x}" + "0" * 62) for i in range(10))
+        reopened = EncryptedFileStorage(temp_file, PASSPHRASE)
+        reopened.get("03" + "0" * 62)
+        assert list(reopened._chunks) == ["03"]
+
+    def test_update_appends_one_chunk(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put_many(make_password(f"{i:02x}" + "0" * 62) for i in range(10))
+        with open(temp_file) as f:
+            before = f.readlines()
+        storage.put(make_password("03" + "0" * 62, "changed"))
+        with open(temp_file) as f:
+            after = f.readlines()
+        assert len(after[0]) == len(before[0])  # header rewritten in place
+        assert after[1:-1] == before[1:]
+        assert after[-1].startswith("03 ")
+        assert EncryptedFileStorage(temp_file, PASSPHRASE).get("03" + "0" * 62).description == "changed"
+
+    def test_compaction(self, temp_file):
+        storage = open_store(temp_file)
+        for i in range(100):
+            storage.put(make_password("aa" + "0" * 62, f"v{i}"))
+        with open(temp_file) as f:
+            assert len(f.readlines()) < 70
+        storage.delete("aa" + "0" * 62)
+        storage.compact()
+        with open(temp_file) as f:
+            assert len(f.readlines()) == 1
+
+    def test_wrong_passphrase(self, temp_file):
+        open_store(temp_file).put(make_password("aa" + "0" * 62))
+        with pytest.raises(ValueError, match="Wrong passphrase for encrypted store"):
+            EncryptedFileStorage(temp_file, "not the passphrase")
+
+    def test_tampered_chunk(self, temp_file):
+        open_store(temp_file).put(make_password("aa" + "0" * 62))
+        with open(temp_file) as f:
+            header, line = f.readlines()
+        with open(temp_file, 'w') as f:
+            f.write(header + "bb" + line[2:])
+        with pytest.raises(AuthenticationError):
+            EncryptedFileStorage(temp_file, PASSPHRASE).load()
+
+    def test_torn_append_is_ignored(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put(make_password("aa" + "0" * 62, "first"))
+        with open(temp_file, 'a') as f:
+            f.write('aa AAAA')
+        reopened = EncryptedFileStorage(temp_file, PASSPHRASE)
+        assert reopened.get("aa" + "0" * 62).description == "first"
+        reopened.put(make_password("bb" + "0" * 62))
+        assert EncryptedFileStorage(temp_file, PASSPHRASE).count() == 2
+
+    def test_dropped_final_line_is_detected(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put(make_password("aa" + "0" * 62, "old"))
+        storage.put(make_password("aa" + "0" * 62, "new"))
+        assert storage.sequence == 2
+        with open(temp_file) as f:
+            lines = f.readlines()
+        with open(temp_file, 'w') as f:
+            f.writelines(lines[:-1])
+        with pytest.raises(ValueError, match="truncated or rolled back"):
+            EncryptedFileStorage(temp_file, PASSPHRASE).load()
+
+    def test_missing_or_replayed_line_is_detected(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put(make_password("aa" + "0" * 62, "v1"))
+        storage.put(make_password("aa" + "0" * 62, "v2"))
+        storage.put(make_password("bb" + "0" * 62, "v3"))
+        with open(temp_file) as f:
+            header, first, second, third = f.readlines()
+        for body in ([first, third], [first, second, third, second]):
+            with open(temp_file, 'w') as f:
+                f.writelines([header] + body)
+            with pytest.raises(ValueError, match="out of sequence"):
+                EncryptedFileStorage(temp_file, PASSPHRASE).load()
+
+    def test_header_state_is_authenticated(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put(make_password("aa" + "0" * 62))
+        storage.put(make_password("aa" + "0" * 62, "changed"))
+        with open(temp_file) as f:
+            content = f.read()
+        with open(temp_file, 'w') as f:
+            f.write(content.replace('"sequence": 2', '"sequence": 1', 1))
+        with pytest.raises(ValueError, match="header failed authentication"):
+            EncryptedFileStorage(temp_file, PASSPHRASE).load()
+
+    def test_sequence_survives_compaction(self, temp_file):
+        storage = open_store(temp_file)
+        for i in range(80):
+            storage.put(make_password("aa" + "0" * 62, f"v{i}"))
+        reopened = EncryptedFileStorage(temp_file, PASSPHRASE)
+        assert reopened.sequence == 80
+        assert reopened.get("aa" + "0" * 62).description == "v79"
+
+    def test_corrupt_line(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put(make_password("aa" + "0" * 62))
+        storage.put(make_password("bb" + "0" * 62))
+        with open(temp_file) as f:
+            lines = f.readlines()
+        lines[1] = "garbage\n"
+        with open(temp_file, 'w') as f:
+            f.writelines(lines)
+        with pytest.raises(ValueError, match="Corrupt encrypted store line 2"):
+            EncryptedFileStorage(temp_file, PASSPHRASE).load()
+
+    def test_not_an_encrypted_store(self, temp_file):
+        with open(temp_file, 'w') as f:
+            json.dump({}, f)
+        with pytest.raises(ValueError, match="Not an encrypted store"):
+            EncryptedFileStorage(temp_file, PASSPHRASE)
+
+    def test_change_passphrase(self, temp_file):
+        storage = open_store(temp_file)
+        storage.put(make_password("aa" + "0" * 62))
+        storage.change_passphrase(bytearray(b"new passphrase 2026"))
+        assert EncryptedFileStorage(temp_file, b"new passphrase 2026").count() == 1
+        with pytest.raises(ValueError, match="Wrong passphrase"):
+            EncryptedFileStorage(temp_file, PASSPHRASE)
+
+    def test_save_clear_and_delete_many(self, temp_file):
+        storage = open_store(temp_file)
+        storage.save({"ee" + "0" * 62: make_password("ee" + "0" * 62), "ef" + "0" * 62: make_password("ef" + "0" * 62)})
+        assert storage.delete_many(["ee" + "0" * 62, "missing"]) == 1
+        assert list(EncryptedFileStorage(temp_file, PASSPHRASE)) == ["ef" + "0" * 62]
+        storage.clear()
+        assert EncryptedFileStorage(temp_file, PASSPHRASE).count() == 0
+
+    def test_with_manager(self, temp_file):
+        manager = SmartPasswordManager(storage=open_store(temp_file))
+        manager.add_smart_password(make_password("12" + "0" * 62, "work"))
+        manager.update_smart_password("12" + "0" * 62, description="home")
+        reopened = SmartPasswordManager(storage=EncryptedFileStorage(temp_file, PASSPHRASE))
+        assert reopened.get_smart_password("12" + "0" * 62).description == "home"
+        assert reopened.reload() == 0
+
+    def test_writers_sharing_a_file(self, temp_file):
+        first = open_store(temp_file)
+        first.put(make_password("aa" + "0" * 62))
+        second = EncryptedFileStorage(temp_file, PASSPHRASE)
+        assert second.count() == 1
+        first.put(make_password("aa" + "1" * 62))
+        second.put(make_password("aa" + "2" * 62))
+        first.delete("aa" + "0" * 62)
+        reopened = EncryptedFileStorage(temp_file, PASSPHRASE)
+        assert sorted(reopened) == ["aa" + "1" * 62, "aa" + "2" * 62]
+        assert reopened.sequence == 4
+
+    def test_concurrent_writers(self, temp_file):
+        open_store(temp_file).clear()
+        start = threading.Barrier(4)
+
+        def write(worker):
+            storage = EncryptedFileStorage(temp_file, PASSPHRASE)
+            start.wait()
+            for number in range(10):
+                storage.put(make_password(f"{worker:x}{number:x}" + "0" * 62))
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        reopened = EncryptedFileStorage(temp_file, PASSPHRASE)
+        assert reopened.count() == 40
+        assert reopened.sequence == 40
+
+    def test_manager_without_passphrase_refuses_store(self, temp_file):
+        open_store(temp_file).put(make_password("34" + "0" * 62))
+        with open(temp_file, 'rb') as f:
+            content = f.read()
+        with pytest.raises(ValueError, match="encrypted store"):
+            SmartPasswordManager(filename=temp_file)
+        with open(temp_file, 'rb') as f:
+            assert f.read() == content
+
+    def test_invalid_chunk_depth(self, temp_file):
+        with pytest.raises(ValueError, match="Chunk depth must be between 1 and 4"):
+            open_store(temp_file, chunk_depth=5)
@@ -0,0 +1,94 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+import warnings
+
+import pytest
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.json_file import JsonFileStorage
+
+
+class TestJsonFileStorage:
+    def test_put_writes_file(self, temp_file, test_password):
+        storage = JsonFileStorage(temp_file)
+        storage.put(test_password)
+        with open(temp_file) as f:
+            data = json.load(f)
+        assert data == {test_password.public_key: test_password.to_dict()}
+
+    def test_file_format_is_pretty_printed(self, temp_file, test_password):
+        storage = JsonFileStorage(temp_file)
+        storage.put(test_password)
+        with open(temp_file) as f:
+            content = f.read()
+        assert content == json.dumps({test_password.public_key: test_password.to_dict()}, indent=4)
+
+    def test_reload(self, temp_file, test_password):
+        JsonFileStorage(temp_file).put(test_password)
+        storage = JsonFileStorage(temp_file)
+        assert storage.get(test_password.public_key).description == test_password.description
+        assert storage.count() == 1
+
+    def test_bulk_operations(self, temp_file):
+        storage = JsonFileStorage(temp_file)
+        storage.put_many(SmartPassword(public_key=f"key{i}", description=f"d{i}") for i in range(4))
+        assert JsonFileStorage(temp_file).count() == 4
+        assert storage.delete_many(["key0", "key3"]) == 2
+        assert sorted(JsonFileStorage(temp_file)) == ["key1", "key2"]
+
+    def test_delete_missing(self, temp_file):
+        assert JsonFileStorage(temp_file).delete("missing") is False
+
+    def test_clear(self, temp_file, test_password):
+        storage = JsonFileStorage(temp_file)
+        storage.put(test_password)
+        storage.clear()
+        assert JsonFileStorage(temp_file).count() == 0
+
+    def test_corrupted_file(self, temp_file):
+        with open(temp_file, 'w') as f:
+            f.write("not json")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert JsonFileStorage(temp_file).load() == {}
+        assert "Failed to load passwords" in str(caught[0].message)
+
+    def test_unparseable_file_is_not_overwritten(self, temp_file, test_password):
+        with open(temp_file, 'w') as f:
+            f.write("not json")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            storage = JsonFileStorage(temp_file)
+            storage.load()
+        with pytest.raises(ValueError, match="Refusing to overwrite"):
+            storage.put(test_password)
+        with open(temp_file) as f:
+            assert f.read() == "not json"
+        with pytest.raises(ValueError):
+            storage.reload()
+
+    def test_rewrite_encodes_only_changed_records(self, temp_file):
+        storage = JsonFileStorage(temp_file)
+        records = [SmartPassword(f"key{i}", f"d{i}", 12 + i) for i in range(5)]
+        records.append(SmartPassword("kdf-key", "Ünïcode \"quoted\"\n", 20, KdfParams(KdfParams.PBKDF2, "00ff")))
+        records[0].touch(modified=1.5)
+        storage.put_many(records)
+        assert storage._fragments.encoded == 6
+        records[2].update(description="changed")
+        storage.put(records[2])
+        assert storage._fragments.encoded == 1
+        storage.delete("key4")
+        assert storage._fragments.encoded == 0
+        storage.put(SmartPassword("key1", "replaced"))
+        assert storage._fragments.encoded == 1
+        with open(temp_file) as f:
+            content = f.read()
+        assert content == json.dumps({key: sp.to_dict() for key, sp in storage.data.items()}, indent=4)
+
+    def test_empty_store_format(self, temp_file, test_password):
+        storage = JsonFileStorage(temp_file)
+        storage.put(test_password)
+        storage.delete(test_password.public_key)
+        with open(temp_file) as f:
+            assert f.read() == json.dumps({}, indent=4)
@@ -0,0 +1,49 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.memory import MemoryStorage
+
+
+class TestMemoryStorage:
+    def test_put_get(self, test_password):
+        storage = MemoryStorage()
+        storage.put(test_password)
+        assert storage.get(test_password.public_key) is test_password
+        assert test_password.public_key in storage
+
+    def test_get_missing(self):
+        assert MemoryStorage().get("missing") is None
+
+    def test_delete(self, test_password):
+        storage = MemoryStorage()
+        storage.put(test_password)
+        assert storage.delete(test_password.public_key) is True
+        assert storage.delete(test_password.public_key) is False
+        assert storage.count() == 0
+
+    def test_bulk_operations(self):
+        storage = MemoryStorage()
+        records = [SmartPassword(public_key=f"key{i}", description=f"d{i}") for i in range(5)]
+        storage.put_many(records)
+        assert storage.count() == 5
+        assert len(storage) == 5
+        assert sorted(storage) == [f"key{i}" for i in range(5)]
+        assert storage.delete_many(["key0", "key1", "missing"]) == 2
+        assert storage.count() == 3
+
+    def test_items_and_load(self, test_password):
+        storage = MemoryStorage({test_password.public_key: test_password})
+        assert list(storage.items()) == [(test_password.public_key, test_password)]
+        assert storage.load() == {test_password.public_key: test_password}
+
+    def test_save_replaces_content(self, test_password):
+        storage = MemoryStorage()
+        storage.put(SmartPassword(public_key="old", description="old"))
+        storage.save({test_password.public_key: test_password})
+        assert storage.get("old") is None
+        assert storage.count() == 1
+
+    def test_clear(self, test_password):
+        storage = MemoryStorage()
+        storage.put(test_password)
+        storage.clear()
+        assert storage.count() == 0
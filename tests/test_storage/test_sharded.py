@@ -0,0 +1,67 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+
+import pytest
+
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
+
+
+def make_password(public_key, description="service"):
+    return SmartPassword(public_key=public_key, description=description)
+
+
+class TestShardedDirectoryStorage:
+    def test_shard_name(self, tmp_path):
+        storage = ShardedDirectoryStorage(tmp_path)
+        assert storage.shard_name("ABcdef") == "ab"
+        assert storage.shard_name("test_key") == "_"
+        assert storage.shard_name("a") == "_"
+
+    def test_invalid_prefix_length(self, tmp_path):
+        with pytest.raises(ValueError, match="Shard prefix length must be between 1 and 4"):
+            ShardedDirectoryStorage(tmp_path, prefix_length=0)
+
+    def test_put_writes_only_one_shard(self, tmp_path):
+        storage = ShardedDirectoryStorage(tmp_path)
+        storage.put(make_password("aa" + "0" * 62))
+        storage.put(make_password("bb" + "0" * 62))
+        mtime = os.stat(storage.shard_path("aa")).st_mtime_ns
+        storage.put(make_password("bb" + "1" * 62))
+        assert os.stat(storage.shard_path("aa")).st_mtime_ns == mtime
+        assert sorted(os.listdir(tmp_path)) == ["aa.json", "bb.json"]
+
+    def test_reload(self, tmp_path):
+        storage = ShardedDirectoryStorage(tmp_path)
+        storage.put_many(make_password(f"{i:02x}" + "0" * 62, f"d{i}") for i in range(20))
+        reloaded = ShardedDirectoryStorage(tmp_path)
+        assert reloaded.count() == 20
+        assert reloaded.get("05" + "0" * 62).description == "d5"
+
+    def test_delete_removes_empty_shard(self, tmp_path):
+        storage = ShardedDirectoryStorage(tmp_path)
+        key = "cc" + "0" * 62
+        storage.put(make_password(key))
+        assert storage.delete(key) is True
+        assert storage.delete(key) is False
+        assert not os.path.exists(storage.shard_path("cc"))
+
+    def test_delete_many(self, tmp_path):
+        storage = ShardedDirectoryStorage(tmp_path)
+        storage.put_many(make_password(f"{i:02x}" + "0" * 62) for i in range(4))
+        assert storage.delete_many(["00" + "0" * 62, "01" + "0" * 62, "missing"]) == 2
+        assert ShardedDirectoryStorage(tmp_path).count() == 2
+
+    def test_save_and_clear(self, tmp_path):
+        storage = ShardedDirectoryStorage(tmp_path)
+        storage.put(make_password("dd" + "0" * 62))
+        storage.save({"ee" + "0" * 62: make_password("ee" + "0" * 62)})
+        assert list(ShardedDirectoryStorage(tmp_path)) == ["ee" + "0" * 62]
+        storage.clear()
+        assert os.listdir(tmp_path) == []
+        assert storage.count() == 0
+
+    def test_missing_directory(self, tmp_path):
+        storage = ShardedDirectoryStorage(tmp_path / "missing")
+        assert storage.count() == 0
+        assert storage.get("aa") is None
@@ -0,0 +1,44 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import hashlib
+
+import pytest
+
+from smartpasslib.sync.merkle import EMPTY_LEAF, BucketTree, bucket_of
+
+
+class TestBucketOf:
+    def test_hex_prefix(self):
+        assert bucket_of("AbCdef", 3) == "abc"
+
+    def test_non_hex_key(self):
+        assert bucket_of("test_public_key", 2) == hashlib.sha256(b"test_public_key").hexdigest()[:2]
+
+
+class TestBucketTree:
+    def test_invalid_depth(self):
+        with pytest.raises(ValueError, match="Bucket depth must be between 1 and 4"):
+            BucketTree(5)
+
+    def test_equal_content_equal_root(self):
+        a, b = BucketTree(2), BucketTree(2)
+        assert a.root == b.root
+        a.set_leaf("3f", b"x" * 32)
+        assert a.root != b.root
+        b.set_leaf("3f", b"x" * 32)
+        assert a.root == b.root
+
+    def test_clearing_leaf_restores_root(self):
+        tree = BucketTree(2)
+        empty = tree.root
+        tree.set_leaf("a0", b"y" * 32)
+        tree.set_leaf("a0", None)
+        assert tree.root == empty
+        assert tree.node("a0") == EMPTY_LEAF
+
+    def test_diff_descends_to_changed_bucket(self):
+        a, b = BucketTree(3), BucketTree(3)
+        a.set_leaf("12f", b"z" * 32)
+        frontier = ['']
+        while len(frontier[0]) < 3:
+            frontier = BucketTree.diff(a.children(frontier), b.children(frontier))
+        assert frontier == ["12f"]
@@ -0,0 +1,189 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+
+import pytest
+
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.memory import MemoryStorage
+from smartpasslib.storage.sharded import ShardedDirectoryStorage
+from smartpasslib.sync.replica import SyncReplica, wins
+from smartpasslib.sync.transport import FileTransport, LocalTransport
+
+KEYS = [SmartKeyGenerator.generate_public_key(f"sync-secret-{i:03d}") for i in range(6)]
+
+
+def pair(tmp_path):
+    local = SmartPasswordManager(filename=str(tmp_path / "local.json"))
+    remote = SmartPasswordManager(filename=str(tmp_path / "remote.json"))
+    return local, SyncReplica(local), remote, SyncReplica(remote)
+
+
+def records(manager):
+    return {k: v.to_dict() for k, v in manager.passwords.items()}
+
+
+class TestWins:
+    def test_newer_stamp_wins(self):
+        old = {"public_key": "k", "version": 1, "modified": 10.0}
+        new = {"public_key": "k", "version": 2, "modified": 11.0}
+        assert wins(new, old) and not wins(old, new)
+        assert wins(old, None) and not wins(None, old)
+
+    def test_tie_is_deterministic(self):
+        a = {"public_key": "k", "description": "a", "version": 1, "modified": 10.0}
+        b = {"public_key": "k", "description": "b", "version": 1, "modified": 10.0}
+        assert wins(a, b) != wins(b, a)
+
+
+class TestSync:
+    def test_sync_both_directions(self, tmp_path):
+        local, replica, remote, peer = pair(tmp_path)
+        local.add_smart_password(SmartPassword(KEYS[0], "local", 12))
+        remote.add_smart_password(SmartPassword(KEYS[1], "remote", 14))
+
+        result = replica.sync(LocalTransport(peer))
+        assert (result.pulled, result.pushed) == (1, 1)
+        assert records(local) == records(remote)
+        assert replica.info()["root"] == peer.info()["root"]
+        assert replica.sync(LocalTransport(peer)).round_trips == 1
+
+    def test_newer_edit_wins(self, tmp_path):
+        local, replica, remote, peer = pair(tmp_path)
+        local.add_smart_password(SmartPassword(KEYS[0], "first", 12))
+        replica.sync(LocalTransport(peer))
+        remote.update_smart_password(KEYS[0], description="second")
+
+        replica.sync(LocalTransport(peer))
+        assert local.get_smart_password(KEYS[0]).description == "second"
+        assert local.get_smart_password(KEYS[0]).version == 2
+
+    def test_deletion_propagates(self, tmp_path):
+        local, replica, remote, peer = pair(tmp_path)
+        for key in KEYS[:3]:
+            local.add_smart_password(SmartPassword(key, "entry", 12))
+        replica.sync(LocalTransport(peer))
+        local.delete_smart_password(KEYS[1])
+
+        result = replica.sync(LocalTransport(peer))
+        assert result.pushed == 1
+        assert set(remote.passwords) == {KEYS[0], KEYS[2]}
+        assert KEYS[1] in peer.tombstones
+        assert replica.sync(LocalTransport(peer)).round_trips == 1
+
+    def test_readded_entry_beats_tombstone(self, tmp_path):
+        local, replica, remote, peer = pair(tmp_path)
+        local.add_smart_password(SmartPassword(KEYS[0], "entry", 12))
+        replica.sync(LocalTransport(peer))
+        remote.delete_smart_password(KEYS[0])
+        replica.sync(LocalTransport(peer))
+        assert local.get_smart_password(KEYS[0]) is None
+
+        local.add_smart_password(SmartPassword(KEYS[0], "back", 12))
+        replica.sync(LocalTransport(peer))
+        assert remote.get_smart_password(KEYS[0]).description == "back"
+        assert not replica.tombstones and not peer.tombstones
+
+    def test_transfers_only_changed_buckets(self, tmp_path):
+        local, replica, remote, peer = pair(tmp_path)
+        for i in range(200):
+            key = SmartKeyGenerator.generate_public_key(f"bulk-secret-{i:04d}")
+            local.add_smart_password(SmartPassword(key, f"entry {i}", 12))
+        replica.sync(LocalTransport(peer))
+        local.update_smart_password(next(iter(local.passwords)), description="changed")
+
+        transport = LocalTransport(peer)
+        result = replica.sync(transport)
+        assert (result.pulled, result.pushed, result.buckets) == (0, 1, 1)
+        assert transport.records_received <= 1
+        assert result.round_trips == 1 + replica.depth + 2
+
+    def test_depth_mismatch(self, tmp_path):
+        local, replica, remote, _ = pair(tmp_path)
+        with pytest.raises(ValueError, match="Bucket depth mismatch: local 3, remote 2"):
+            replica.sync(LocalTransport(SyncReplica(remote, depth=2, state_path=None)))
+
+    def test_memory_store_has_no_state_file(self):
+        replica = SyncReplica(SmartPasswordManager(storage=MemoryStorage()))
+        assert replica.state_path is None
+
+
+class TestTombstoneLog:
+    def test_tombstones_survive_restart(self, tmp_path):
+        path = str(tmp_path / "store.json")
+        manager = SmartPasswordManager(filename=path)
+        replica = SyncReplica(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "a", 12))
+        manager.add_smart_password(SmartPassword(KEYS[1], "b", 12))
+        manager.delete_smart_password(KEYS[0])
+        manager.delete_smart_password(KEYS[1])
+        manager.add_smart_password(SmartPassword(KEYS[1], "b again", 12))
+
+        with open(path + '.sync') as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[0]["format"] == "smartpasslib-sync"
+        assert len(lines) == 4
+
+        reopened = SyncReplica(SmartPasswordManager(filename=path))
+        assert set(reopened.tombstones) == {KEYS[0]}
+        assert reopened.info()["root"] == replica.info()["root"]
+
+    def test_torn_line_is_ignored(self, tmp_path):
+        path = str(tmp_path / "store.json")
+        manager = SmartPasswordManager(filename=path)
+        replica = SyncReplica(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "a", 12))
+        manager.delete_smart_password(KEYS[0])
+        with open(path + '.sync', 'a') as f:
+            f.write('{"public_key": "tor')
+        assert set(SyncReplica(SmartPasswordManager(filename=path)).tombstones) == {KEYS[0]}
+        replica.close()
+
+    def test_close_compacts(self, tmp_path):
+        path = str(tmp_path / "store.json")
+        manager = SmartPasswordManager(filename=path)
+        replica = SyncReplica(manager)
+        for _ in range(3):
+            manager.add_smart_password(SmartPassword(KEYS[0], "a", 12))
+            manager.delete_smart_password(KEYS[0])
+        replica.close()
+        with open(path + '.sync') as f:
+            assert len(f.readlines()) == 2
+
+    def test_prune(self, tmp_path):
+        manager = SmartPasswordManager(filename=str(tmp_path / "store.json"))
+        replica = SyncReplica(manager)
+        manager.add_smart_password(SmartPassword(KEYS[0], "a", 12))
+        manager.delete_smart_password(KEYS[0])
+        assert replica.prune_tombstones(older_than=0) == 0
+        assert replica.prune_tombstones(older_than=float('inf')) == 1
+        assert not replica.tombstones
+
+    def test_unsupported_version(self, tmp_path):
+        path = str(tmp_path / "store.json")
+        with open(path + '.sync', 'w') as f:
+            f.write(json.dumps({"format": "smartpasslib-sync", "version": 9}) + '\n')
+        with pytest.raises(ValueError, match="Unsupported sync state version: 9"):
+            SyncReplica(SmartPasswordManager(filename=path))
+
+
+class TestFileTransport:
+    def test_sync_with_file(self, tmp_path):
+        local = SmartPasswordManager(filename=str(tmp_path / "local.json"))
+        replica = SyncReplica(local)
+        local.add_smart_password(SmartPassword(KEYS[0], "entry", 12))
+        target = str(tmp_path / "copy.json")
+        with FileTransport(target) as transport:
+            assert replica.sync(transport).pushed == 1
+        assert SmartPasswordManager(filename=target).get_smart_password(KEYS[0]).description == "entry"
+
+    def test_sync_with_shard_directory(self, tmp_path):
+        local = SmartPasswordManager(filename=str(tmp_path / "local.json"))
+        replica = SyncReplica(local)
+        local.add_smart_password(SmartPassword(KEYS[0], "entry", 12))
+        (tmp_path / "shards").mkdir()
+        with FileTransport(str(tmp_path / "shards")) as transport:
+            replica.sync(transport)
+        remote = SmartPasswordManager(storage=ShardedDirectoryStorage(str(tmp_path / "shards")))
+        assert remote.get_smart_password(KEYS[0]).description == "entry"
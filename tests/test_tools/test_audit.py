@@ -0,0 +1,44 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+
+import pytest
+
+from smartpasslib.generators.kdf import KdfParams
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.storage.compressed import CompressedFileStorage
+from smartpasslib.storage.encrypted import EncryptedFileStorage
+from smartpasslib.tools.audit import main
+
+KEY = SmartKeyGenerator.generate_public_key("audit-cli-secret")
+
+
+class TestAuditCli:
+    def test_clean(self, tmp_path, capsys):
+        path = tmp_path / "passwords.json"
+        path.write_text(json.dumps({KEY: {"public_key": KEY, "description": "d", "length": 12}}))
+        assert main([str(path), "--workers", "1"]) == 0
+        assert "Audited 1 records in 1 file(s), 0 issue(s)" in capsys.readouterr().out
+
+    def test_issues(self, tmp_path, capsys):
+        path = tmp_path / "passwords.json"
+        report = tmp_path / "report.ndjson"
+        path.write_text(json.dumps({KEY: {"public_key": KEY, "description": "d", "length": 8}}))
+        assert main([str(path), "--workers", "1", "--report", str(report)]) == 1
+        assert "invalid_length" in capsys.readouterr().err
+        assert json.loads(report.read_text().splitlines()[-1])["issues"] == 1
+
+    def test_compressed_store(self, tmp_path, capsys):
+        path = tmp_path / "passwords.json.z"
+        CompressedFileStorage(str(path)).save({KEY: SmartPassword(KEY, "d", 12)})
+        assert main([str(path), "--workers", "1"]) == 0
+        assert "Audited 1 records in 1 file(s), 0 issue(s)" in capsys.readouterr().out
+
+    def test_encrypted_store_is_refused(self, tmp_path, capsys):
+        path = tmp_path / "passwords.enc"
+        EncryptedFileStorage(str(path), "cli passphrase", kdf=KdfParams(n=16, r=1),
+                             cipher="shake256-hmac").put(SmartPassword(KEY, "d", 12))
+        with pytest.raises(SystemExit) as exit_info:
+            main([str(path), "--workers", "1"])
+        assert exit_info.value.code == 2
+        assert "encrypted store" in capsys.readouterr().err
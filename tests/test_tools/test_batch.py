@@ -0,0 +1,95 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import csv
+import io
+import json
+
+from smartpasslib.masters.smart_password_master import SmartPasswordMaster
+from smartpasslib.tools import batch
+from smartpasslib.utils.parallel import DerivationExecutor
+
+SECRET = "MyCatHippo2026"
+
+
+def run(text, **kwargs):
+    out = io.StringIO()
+    kwargs.setdefault("executor", DerivationExecutor(workers=1))
+    failures = batch.run(io.StringIO(text), out, **kwargs)
+    return failures, out.getvalue()
+
+
+def ndjson(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+class TestBatch:
+    def test_password_tsv(self):
+        failures, out = run(f"{SECRET}\t16\n{SECRET}\n")
+        assert failures == 0
+        assert ndjson(out) == [
+            {"line": 1, "length": 16, "password": "A-UrF0mcpQ:,V2E^"},
+            {"line": 2, "length": 12, "password": "A-UrF0mcpQ:,"},
+        ]
+
+    def test_default_length(self):
+        _, out = run(f"{SECRET}\n", length=20)
+        assert ndjson(out)[0]["password"] == SmartPasswordMaster.generate_smart_password(SECRET, 20)
+
+    def test_public_key_ndjson_with_id(self):
+        _, out = run(json.dumps({"id": "a1", "secret": SECRET}) + "\n", mode="public-key", input_format="ndjson")
+        assert ndjson(out) == [{"line": 1, "id": "a1", "public_key": SmartPasswordMaster.generate_public_key(SECRET)}]
+
+    def test_verify_csv(self):
+        public_key = SmartPasswordMaster.generate_public_key(SECRET)
+        text = f"id,secret,public_key\nx,{SECRET},{public_key}\ny,{SECRET},{'0' * 64}\n"
+        failures, out = run(text, mode="verify", input_format="csv", output_format="csv")
+        assert failures == 0
+        rows = list(csv.DictReader(io.StringIO(out)))
+        assert [(row["id"], row["valid"]) for row in rows] == [("x", "True"), ("y", "False")]
+
+    def test_errors_are_reported_in_order(self):
+        text = "short\n" + f"{SECRET}\tabc\n" + f"{SECRET}\t200\n" + f"{SECRET}\n"
+        failures, out = run(text)
+        rows = ndjson(out)
+        assert failures == 3
+        assert rows[0]["error"] == "Secret phrase must be at least 12 characters"
+        assert rows[1]["error"] == "Invalid length: abc"
+        assert rows[2]["error"] == "Password length cannot exceed 100 characters"
+        assert rows[3]["password"] == "A-UrF0mcpQ:,"
+
+    def test_invalid_ndjson(self):
+        failures, out = run("not json\n[1]\n{}\n", input_format="ndjson")
+        rows = ndjson(out)
+        assert failures == 3
+        assert rows[0]["error"].startswith("Invalid JSON")
+        assert rows[1]["error"] == "Record must be a JSON object"
+        assert rows[2]["error"] == "Missing secret"
+
+    def test_verify_missing_public_key(self):
+        failures, out = run(f"{SECRET}\n", mode="verify")
+        assert failures == 1
+        assert ndjson(out)[0]["error"] == "Missing public_key"
+
+    def test_process_pool(self):
+        text = "".join(f"batch-secret-{i:04d}\t{12 + i % 20}\n" for i in range(50))
+        failures, out = run(text, executor=DerivationExecutor(workers=2, chunk_size=8))
+        rows = ndjson(out)
+        assert failures == 0
+        assert [row["line"] for row in rows] == list(range(1, 51))
+        assert rows[7]["password"] == SmartPasswordMaster.generate_smart_password("batch-secret-0007", 19)
+
+    def test_thread_pool(self):
+        text = "".join(f"batch-secret-{i:04d}\t16\n" for i in range(20))
+        failures, out = run(text, executor=DerivationExecutor(workers=2, chunk_size=4, backend="thread"))
+        assert failures == 0
+        assert ndjson(out)[3]["password"] == SmartPasswordMaster.generate_smart_password("batch-secret-0003", 16)
+
+    def test_main_files(self, tmp_path, capsys):
+        source = tmp_path / "in.tsv"
+        target = tmp_path / "out.csv"
+        source.write_text(f"{SECRET}\t16\nshort\n")
+        code = batch.main(["--input", str(source), "--output", str(target), "--output-format", "csv",
+                           "--workers", "1"])
+        assert code == 1
+        assert "1 record(s) failed" in capsys.readouterr().err
+        rows = list(csv.DictReader(io.StringIO(target.read_text())))
+        assert rows[0]["password"] == "A-UrF0mcpQ:,V2E^"
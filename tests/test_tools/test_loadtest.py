@@ -0,0 +1,66 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import json
+
+import pytest
+
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.tools.loadtest import LoadTestReport, _check_store, main, percentile, run_load_test, seed_secret
+
+
+class TestLoadTest:
+    def test_percentile(self):
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([], 0.5) == 0.0
+
+    @pytest.mark.parametrize("storage", ["json", "sharded"])
+    def test_threads_keep_store_consistent(self, tmp_path, storage):
+        path = str(tmp_path / ("passwords.json" if storage == "json" else "store"))
+        report = run_load_test(path, readers=2, writers=2, derivers=1, operations=30,
+                               seed_records=20, storage=storage, reload_ratio=0.2)
+        assert report.ok, report.format()
+        assert [report.stats[kind].operations for kind in ("reader", "writer", "deriver")] == [60, 60, 30]
+        live = sum(1 for state in report.expected.values() if state is not None)
+        assert report.records == 20 + live
+
+    def test_detects_lost_writes(self, tmp_path):
+        path = tmp_path / "passwords.json"
+        report = run_load_test(str(path), readers=0, writers=1, derivers=0, operations=20, seed_records=5)
+        assert report.ok
+        lost = next(key for key, state in report.expected.items() if state is not None)
+        data = json.loads(path.read_text())
+        del data[lost]
+        path.write_text(json.dumps(data))
+        check = LoadTestReport({})
+        check.expected = report.expected
+        seeds = [(seed_secret(i), SmartKeyGenerator.generate_public_key(seed_secret(i))) for i in range(5)]
+        _check_store(check, str(path), "json", seeds)
+        assert not check.ok
+        assert any("lost write" in issue for issue in check.issues)
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError, match="Unknown storage"):
+            run_load_test(storage="sqlite")
+        with pytest.raises(ValueError, match="At least one worker"):
+            run_load_test(readers=0, writers=0, derivers=0)
+
+    def test_refuses_non_empty_store(self, tmp_path, capsys):
+        path = tmp_path / "passwords.json"
+        key = SmartKeyGenerator.generate_public_key("load-test-existing-secret")
+        original = json.dumps({key: {"public_key": key, "description": "real entry", "length": 16}})
+        path.write_text(original)
+        with pytest.raises(ValueError, match="not empty"):
+            run_load_test(str(path), readers=1, writers=1, derivers=0, operations=5, seed_records=5)
+        with pytest.raises(SystemExit):
+            main(["--store", str(path), "--operations", "5", "--seed-records", "5"])
+        assert "not empty" in capsys.readouterr().err
+        assert path.read_text() == original
+
+    def test_cli_json_report(self, tmp_path, capsys):
+        output = tmp_path / "report.json"
+        assert main(["--readers", "1", "--writers", "1", "--derivers", "1", "--operations", "10",
+                     "--seed-records", "10", "--json", str(output)]) == 0
+        assert "OK" in capsys.readouterr().out
+        summary = json.loads(output.read_text())
+        assert summary["ok"] and summary["workers"]["writer"]["operations"] == 10
@@ -0,0 +1,76 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import gzip
+import os
+
+import pytest
+
+from smartpasslib.generators.key import SmartKeyGenerator
+from smartpasslib.generators.smart import SmartPasswordGenerator
+from smartpasslib.tools import vectors
+
+
+class TestVectors:
+    def test_make_secret_deterministic(self):
+        for i in range(200):
+            secret, length = vectors.make_secret("seed", i)
+            assert (secret, length) == vectors.make_secret("seed", i)
+            assert 12 <= len(secret) <= 64
+            assert 12 <= length <= 100
+            assert "\t" not in secret and "\n" not in secret
+
+    def test_reference_vector_matches_library(self):
+        for i in range(20):
+            secret, length = vectors.make_secret("seed", i)
+            private_key, public_key, password = vectors.reference_vector(secret, length)
+            assert SmartKeyGenerator.generate_private_key(secret) == private_key
+            assert SmartKeyGenerator.generate_public_key(secret) == public_key
+            assert SmartPasswordGenerator.generate(secret, length) == password
+
+    def test_reference_vector_known_value(self):
+        assert vectors.reference_vector("MyCatHippo2026", 16)[2] == "A-UrF0mcpQ:,V2E^"
+
+    def test_generate_and_verify(self, tmp_path):
+        manifest = vectors.generate_corpus(str(tmp_path), count=25, shard_size=10, workers=2)
+        assert [shard["count"] for shard in manifest["shards"]] == [10, 10, 5]
+        assert sum(1 for _ in vectors.iter_shard(str(tmp_path / vectors.shard_name(2)))) == 5
+
+        report = vectors.verify_corpus(str(tmp_path), workers=2)
+        assert report["ok"] is True
+        assert report["checked"] == 25
+
+    def test_generation_is_byte_identical(self, tmp_path):
+        first = vectors.generate_corpus(str(tmp_path / "a"), count=5, shard_size=5, workers=1)
+        second = vectors.generate_corpus(str(tmp_path / "b"), count=5, shard_size=5, workers=1)
+        assert first["shards"] == second["shards"]
+
+    def test_verify_detects_mismatch(self, tmp_path):
+        vectors.generate_corpus(str(tmp_path), count=3, shard_size=3, workers=1)
+        path = str(tmp_path / vectors.shard_name(0))
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            lines = f.readlines()
+        fields = lines[1].split("\t")
+        fields[3] = "0" * 64
+        lines[1] = "\t".join(fields)
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.writelines(lines)
+
+        result = vectors.verify_shard(path)
+        assert result["mismatches"] == 1
+        assert result["failures"] == [{"line": 2, "fields": ["public_key"]}]
+
+        report = vectors.verify_corpus(str(tmp_path), workers=1)
+        assert report["ok"] is False
+        assert report["shards"][0]["failures"] == [{"error": "checksum mismatch"}]
+
+    def test_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError, match="Vector count must be at least 1"):
+            vectors.generate_corpus(str(tmp_path), count=0)
+        with pytest.raises(ValueError, match="Shard size must be at least 1"):
+            vectors.generate_corpus(str(tmp_path), count=1, shard_size=0)
+
+    def test_main(self, tmp_path, capsys):
+        directory = str(tmp_path / "corpus")
+        assert vectors.main(["generate", directory, "--count", "4", "--shard-size", "2", "--workers", "1"]) == 0
+        assert os.path.exists(os.path.join(directory, vectors.MANIFEST_NAME))
+        assert vectors.main(["verify", directory, "--workers", "1"]) == 0
+        assert "Checked 4/4 vectors, 0 mismatches" in capsys.readouterr().out
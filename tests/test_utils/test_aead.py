@@ -0,0 +1,50 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import pytest
+
+from smartpasslib.utils import aead
+from smartpasslib.utils.aead import AES_GCM, SHAKE_HMAC, Aead, AuthenticationError
+
+KEY = bytes(range(32))
+
+
+@pytest.fixture(params=aead.available_ciphers())
+def cipher(request):
+    return Aead(KEY, request.param)
+
+
+class TestAead:
+    def test_round_trip(self, cipher):
+        for size in (0, 1, 100, 70000):
+            message = cipher.encrypt(b"x" * size, b"chunk-1")
+            assert len(message) == size + cipher.overhead
+            assert cipher.decrypt(message, b"chunk-1") == b"x" * size
+
+    def test_nonces_differ(self, cipher):
+        assert cipher.encrypt(b"same") != cipher.encrypt(b"same")
+
+    def test_tampering_detected(self, cipher):
+        message = bytearray(cipher.encrypt(b"secret metadata", b"aad"))
+        with pytest.raises(AuthenticationError):
+            cipher.decrypt(bytes(message), b"other aad")
+        message[-20] ^= 1
+        with pytest.raises(AuthenticationError):
+            cipher.decrypt(bytes(message), b"aad")
+        with pytest.raises(AuthenticationError, match="truncated"):
+            cipher.decrypt(b"short", b"aad")
+
+    def test_wrong_key(self, cipher):
+        message = cipher.encrypt(b"data")
+        with pytest.raises(AuthenticationError):
+            Aead(bytes(32), cipher.cipher).decrypt(message)
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError, match="Unsupported cipher: rot13"):
+            Aead(KEY, "rot13")
+        with pytest.raises(ValueError, match="Cipher key must be 32 bytes"):
+            Aead(b"short", SHAKE_HMAC)
+
+    def test_aes_gcm_requires_cryptography(self, monkeypatch):
+        monkeypatch.setattr(aead, "AESGCM", None)
+        assert aead.default_cipher() == SHAKE_HMAC
+        with pytest.raises(ValueError, match="aes-256-gcm requires the cryptography package"):
+            Aead(KEY, AES_GCM)
@@ -0,0 +1,38 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import pytest
+
+from smartpasslib.utils.bloom import BloomFilter
+
+
+class TestBloomFilter:
+    def test_add_and_contains(self):
+        bloom = BloomFilter(1000, 0.01)
+        assert not bloom.add("alpha")
+        assert bloom.add("alpha")
+        assert "alpha" in bloom
+        assert b"alpha" in bloom
+        assert "beta" not in bloom
+        assert bloom.count == 1
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(5000, 0.01)
+        for i in range(5000):
+            bloom.add(f"key-{i}")
+        assert all(f"key-{i}" in bloom for i in range(5000))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_round_trip(self):
+        bloom = BloomFilter(100)
+        bloom.add("alpha")
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+        assert "alpha" in restored
+        assert (restored.size, restored.hashes, restored.count) == (bloom.size, bloom.hashes, 1)
+        with pytest.raises(ValueError, match="Invalid Bloom filter data"):
+            BloomFilter.from_bytes(bloom.to_bytes()[:-1])
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="capacity must be at least 1"):
+            BloomFilter(0)
+        with pytest.raises(ValueError, match="error rate must be between 0 and 1"):
+            BloomFilter(10, 1.5)
@@ -0,0 +1,55 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import io
+import json
+
+import pytest
+
+from smartpasslib.utils.json_stream import JsonStreamError, iter_object_items
+
+
+def items(text, chunk_size=7):
+    return list(iter_object_items(io.StringIO(text), chunk_size=chunk_size))
+
+
+class TestIterObjectItems:
+    def test_matches_json_load(self):
+        data = {f"key{i}": {"n": i * 1000003, "s": "x\n\"y\"" * i, "l": [1.5, None, True]} for i in range(50)}
+        text = json.dumps(data, indent=4)
+        for chunk_size in (1, 3, 64, 1 << 16):
+            result = items(text, chunk_size)
+            assert [(key, value) for key, value, _ in result] == list(data.items())
+
+    def test_lines(self):
+        result = items('{\n  "a": 1,\n\n  "b": {\n "c": 2\n },\n  "d": 3\n}\n')
+        assert [(key, line) for key, _, line in result] == [("a", 2), ("b", 4), ("d", 7)]
+
+    def test_numbers_split_across_chunks(self):
+        assert items('{"a": 1234567890123}', chunk_size=2) == [("a", 1234567890123, 1)]
+        text = '{"a": {"length": 16}, "k": 94101.25, "z": {"length": 20}}'
+        for chunk_size in range(1, len(text) + 1):
+            assert [(key, value) for key, value, _ in items(text, chunk_size)] == list(json.loads(text).items())
+
+    def test_empty_object_and_escaped_keys(self):
+        assert items(' { } ') == []
+        assert items('{"a\\"b\\u00e9": 1}') == [('a"bé', 1, 1)]
+
+    def test_duplicate_keys_are_kept(self):
+        assert [key for key, _, _ in items('{"a": 1, "a": 2}')] == ["a", "a"]
+
+    @pytest.mark.parametrize("text,line", [
+        ('[1, 2]', 1),
+        ('{"a": 1,\n "b": }', 2),
+        ('{"a": 1\n\n "b": 2}', 1),
+        ('{"a": 1} x', 1),
+        ('{"a": {"b": 1', 1),
+        ('', 1),
+    ])
+    def test_malformed(self, text, line):
+        with pytest.raises(JsonStreamError) as info:
+            items(text)
+        assert info.value.line == line
+
+    def test_value_size_limit(self):
+        text = '{"a": "' + 'x' * 1000
+        with pytest.raises(JsonStreamError):
+            list(iter_object_items(io.StringIO(text), chunk_size=10, max_value_size=100))
@@ -0,0 +1,72 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import pytest
+
+from smartpasslib.generators.smart import SmartPasswordGenerator
+from smartpasslib.utils import parallel
+from smartpasslib.utils.parallel import DerivationExecutor
+
+
+def fail_on_odd(value):
+    if value % 2:
+        raise ValueError(f"odd: {value}")
+    return value
+
+
+class TestDerivationExecutor:
+    def test_inline_map(self):
+        executor = DerivationExecutor(workers=1, chunk_size=3)
+        assert executor.inline
+        assert list(executor.map(abs, range(-5, 5))) == [abs(i) for i in range(-5, 5)]
+
+    def test_process_pool_starmap_preserves_order(self, test_secret):
+        items = [(test_secret, length) for length in range(12, 40)]
+        with DerivationExecutor(workers=2, chunk_size=4, max_in_flight=2) as executor:
+            results = list(executor.starmap(SmartPasswordGenerator.generate, items))
+        assert results == [SmartPasswordGenerator.generate(*item) for item in items]
+
+    def test_lazy_input_consumption(self):
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = DerivationExecutor(workers=1, chunk_size=10).map(abs, source())
+        assert next(results) == 0
+        assert len(consumed) == 10
+
+    def test_return_exceptions(self):
+        results = list(DerivationExecutor(workers=1).map(fail_on_odd, range(4), return_exceptions=True))
+        assert results[0] == 0 and results[2] == 2
+        assert isinstance(results[1], ValueError)
+
+    def test_exceptions_propagate(self):
+        with DerivationExecutor(workers=2, chunk_size=2) as executor:
+            with pytest.raises(ValueError, match="odd: 1"):
+                list(executor.map(fail_on_odd, range(4)))
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="Workers count must be at least 1"):
+            DerivationExecutor(workers=-1)
+        with pytest.raises(ValueError, match="Chunk size must be at least 1"):
+            DerivationExecutor(chunk_size=0)
+        with pytest.raises(ValueError, match="Max in-flight chunks must be at least 1"):
+            DerivationExecutor(max_in_flight=0)
+        with pytest.raises(ValueError, match="Unknown executor backend: fiber"):
+            DerivationExecutor(backend="fiber")
+
+    def test_thread_pool_accepts_closures(self, test_secret):
+        lengths = range(12, 30)
+        with DerivationExecutor(workers=3, chunk_size=2, backend="thread") as executor:
+            results = list(executor.map(lambda length: SmartPasswordGenerator.generate(test_secret, length), lengths))
+        assert results == [SmartPasswordGenerator.generate(test_secret, length) for length in lengths]
+
+    def test_auto_backend_follows_gil(self, monkeypatch):
+        monkeypatch.setattr(parallel.sys, "_is_gil_enabled", lambda: False, raising=False)
+        assert not parallel.gil_enabled()
+        assert DerivationExecutor(workers=2).backend == "thread"
+        monkeypatch.setattr(parallel.sys, "_is_gil_enabled", lambda: True, raising=False)
+        assert DerivationExecutor(workers=2).backend == "process"
+        monkeypatch.delattr(parallel.sys, "_is_gil_enabled", raising=False)
+        assert parallel.default_backend() == "process"
@@ -0,0 +1,80 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import sys
+import threading
+
+import smartpasslib
+from smartpasslib.generators.smart import SmartPasswordGenerator
+from smartpasslib.managers.smart_password_manager import SmartPasswordManager
+from smartpasslib.smart_passwords.smart_password import SmartPassword
+from smartpasslib.utils import profiling
+
+
+def user_code():
+    return sum(range(10))
+
+
+class TestProfiler:
+    def test_records_library_functions_only(self, test_secret):
+        with smartpasslib.profile(allocations=False) as profiler:
+            SmartPasswordGenerator.generate(test_secret, 20)
+            user_code()
+        assert sys.getprofile() is None
+        assert profiler.calls["smartpasslib.generators.smart:SmartPasswordGenerator.generate"] == 1
+        assert profiler.calls["smartpasslib.generators.chain:HashChain.run"] == 1
+        assert profiler.calls["_hashlib.openssl_sha256"] > 15
+        assert not any("user_code" in name for name in profiler.calls)
+
+    def test_external_callees_and_collapsed_stacks(self, temp_file, test_password):
+        with smartpasslib.profile(allocations=False) as profiler:
+            SmartPasswordManager(filename=temp_file).add_smart_password(test_password)
+        assert profiler.calls["json:dumps"] == 2
+        lines = list(profiler.collapsed())
+        assert any(line.startswith(
+            "smartpasslib.managers.smart_password_manager:SmartPasswordManager.add_smart_password;"
+            "smartpasslib.storage.json_file:JsonFileStorage.put;"
+            "smartpasslib.storage.json_file:JsonFileStorage._write;"
+            "smartpasslib.storage.base:FragmentCache.encode;json:dumps "
+        ) for line in lines)
+        for line in lines:
+            path, value = line.rsplit(" ", 1)
+            assert int(value) > 0
+
+    def test_threads_are_profiled(self, test_secret):
+        with smartpasslib.profile(allocations=False) as profiler:
+            thread = threading.Thread(target=SmartPasswordGenerator.generate, args=(test_secret, 12))
+            thread.start()
+            thread.join()
+        assert profiler.calls["smartpasslib.generators.smart:SmartPasswordGenerator.generate"] == 1
+
+    def test_outputs(self, tmp_path, test_secret):
+        collapsed = tmp_path / "profile.folded"
+        summary = tmp_path / "summary.txt"
+        with smartpasslib.profile(collapsed_path=str(collapsed), summary_path=str(summary)):
+            for i in range(5):
+                SmartPassword(public_key=f"key{i}", description="d").to_dict()
+                SmartPasswordGenerator.generate(test_secret, 12)
+        assert "HashChain.run" in collapsed.read_text()
+        text = summary.read_text()
+        assert text.startswith("function")
+        assert "allocations (live at stop" in text
+
+    def test_install_from_env_disabled(self, monkeypatch):
+        monkeypatch.delenv(profiling.ENV_VAR, raising=False)
+        assert profiling.install_from_env() is None
+
+    def test_install_from_env(self, monkeypatch, tmp_path, test_secret, capsys):
+        output = tmp_path / "env.folded"
+        registered = []
+        monkeypatch.setenv(profiling.ENV_VAR, "1")
+        monkeypatch.setenv(profiling.ENV_OUTPUT, str(output))
+        monkeypatch.setattr(profiling.atexit, "register", registered.append)
+
+        profiler = profiling.install_from_env()
+        try:
+            SmartPasswordGenerator.generate(test_secret, 12)
+        finally:
+            registered[0]()
+        assert sys.getprofile() is None
+        assert profiler.calls["smartpasslib.generators.smart:SmartPasswordGenerator.generate"] == 1
+        assert output.exists()
+        assert f"smartpasslib profile written to {output}" in capsys.readouterr().err
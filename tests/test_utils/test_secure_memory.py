@@ -0,0 +1,26 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import pytest
+
+from smartpasslib.utils.secure_memory import as_view, utf8_length, wipe
+
+
+class TestSecureMemory:
+    def test_wipe(self):
+        data = bytearray(b"secret phrase")
+        view = memoryview(bytearray(b"other"))
+        wipe(data, view, None, b"readonly")
+        assert data == bytes(13)
+        assert view.tobytes() == bytes(5)
+
+    def test_as_view(self):
+        data = bytearray(b"abc")
+        view = as_view(data)
+        assert view.readonly
+        assert view.tobytes() == b"abc"
+        with pytest.raises(TypeError):
+            as_view("abc")
+
+    def test_utf8_length(self):
+        assert utf8_length(b"abc") == 3
+        assert utf8_length("ключ€".encode()) == 5
+        assert utf8_length(memoryview("ab😀".encode())) == 3